@@ -6,10 +6,10 @@ Prevents API throttling by enforcing rate limits on all API calls
 
 import time
 from functools import wraps
-from typing import Callable, Any
+from typing import Callable, Any, Dict, List, Optional, Tuple
 import logging
 
-from infrastructure.rate_limiting import EnhancedRateLimiter
+from infrastructure.rate_limiting import EnhancedRateLimiter, KITE_ENDPOINT_LIMITS
 
 logger = logging.getLogger('trading_system.rate_limiter')
 
@@ -26,10 +26,18 @@ class APIRateLimiter:
             return kite.quote(symbols)
     """
 
-    def __init__(self, calls_per_second: float = 3.0, burst_size: int = 5):
+    def __init__(self, calls_per_second: float = 3.0, burst_size: int = 5,
+                 endpoint_limits: Optional[Dict[str, List[Tuple[int, float]]]] = None):
+        """
+        Args:
+            calls_per_second: Limit applied to every key
+            burst_size: Max calls per 100ms window
+            endpoint_limits: Extra per-key (requests, seconds) rules, e.g. KITE_ENDPOINT_LIMITS
+        """
         self._limiter = EnhancedRateLimiter(
-            max_requests_per_second=int(calls_per_second),
+            max_requests_per_second=calls_per_second,
             burst_size=burst_size,
+            endpoint_limits=endpoint_limits,
         )
         logger.info("✅ Rate limiter initialized: %.2f calls/sec, burst=%s", calls_per_second, burst_size)
 
@@ -95,10 +103,10 @@ class KiteAPIWrapper:
 
         Args:
             kite_instance: KiteConnect instance
-            calls_per_second: Rate limit
+            calls_per_second: Rate limit (Kite's per-endpoint limits also apply)
         """
         self._kite = kite_instance
-        self._limiter = APIRateLimiter(calls_per_second=calls_per_second)
+        self._limiter = APIRateLimiter(calls_per_second=calls_per_second, endpoint_limits=KITE_ENDPOINT_LIMITS)
 
         # Methods that need rate limiting
         self._rate_limited_methods = [
@@ -33,7 +33,7 @@ import pandas as pd
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.candlestick_patterns import CandlestickPatternDetector, PatternType
-from core.chart_patterns import ChartPatternDetector, ChartPatternType
+from core.chart_patterns import ChartPattern, ChartPatternDetector, ChartPatternType
 
 logger = logging.getLogger('trading_system.advanced_signal_aggregator')
 
@@ -158,15 +158,21 @@ class AdvancedSignalAggregator:
 
     def _analyze_chart_patterns(
         self,
-        df: pd.DataFrame
+        df: pd.DataFrame,
+        patterns: Optional[List[ChartPattern]] = None
     ) -> Tuple[float, List[str]]:
         """
         Analyze chart patterns
 
+        Args:
+            df: OHLCV DataFrame
+            patterns: Chart patterns already detected in df, if any
+
         Returns:
             (score: -1 to +1, pattern_names)
         """
-        patterns = self.chart_pattern_detector.detect_all_patterns(df)
+        if patterns is None:
+            patterns = self.chart_pattern_detector.detect_all_patterns(df)
 
         if not patterns:
             return 0.0, []
@@ -435,8 +441,9 @@ class AdvancedSignalAggregator:
         contributing_signals['candlestick_patterns'] = candlestick_score
         all_patterns.extend(candlestick_patterns)
 
-        # 2. Chart patterns
-        chart_score, chart_pattern_names = self._analyze_chart_patterns(data)
+        # 2. Chart patterns (detected once; also used for entry/stop/target)
+        chart_patterns_obj = self.chart_pattern_detector.detect_all_patterns(data, symbol=symbol)
+        chart_score, chart_pattern_names = self._analyze_chart_patterns(data, chart_patterns_obj)
         contributing_signals['chart_patterns'] = chart_score
         all_patterns.extend(chart_pattern_names)
 
@@ -483,7 +490,6 @@ class AdvancedSignalAggregator:
             direction = SignalDirection.HOLD
 
         # Calculate entry, stop, target
-        chart_patterns_obj = self.chart_pattern_detector.detect_all_patterns(data)
         entry, stop, target = self._calculate_entry_stop_target(
             data, direction, chart_patterns_obj
         )
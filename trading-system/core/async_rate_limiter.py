@@ -10,6 +10,8 @@ CRITICAL FIXES:
 - Per-endpoint rate limiting
 - Burst handling with backpressure
 - Distributed rate limiting support (Redis-ready)
+- Buckets live in the shared infrastructure.rate_limiting.RateLimitEngine;
+  waiters reserve a slot and sleep exactly until it (FIFO, no polling)
 
 Performance Impact:
 - BEFORE: Synchronous sleep() blocks entire thread (200-300% overhead)
@@ -21,11 +23,12 @@ import time
 import logging
 from typing import Dict, Optional, Callable, Any, TypeVar, Coroutine
 from collections import defaultdict, deque
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from dataclasses import dataclass
 from functools import wraps
 from threading import Lock
 
+from infrastructure.rate_limiting import RateLimitEngine, TokenBucket
+
 logger = logging.getLogger('trading_system.rate_limiter')
 
 T = TypeVar('T')
@@ -43,63 +46,6 @@ class RateLimitConfig:
             self.burst_size = self.max_requests  # Default burst = max_requests
 
 
-@dataclass
-class TokenBucket:
-    """Token bucket for rate limiting"""
-    capacity: float  # Maximum tokens
-    tokens: float  # Current tokens
-    fill_rate: float  # Tokens added per second
-    last_update: float = field(default_factory=time.time)
-
-    def consume(self, tokens: float = 1.0) -> bool:
-        """
-        Try to consume tokens
-
-        Args:
-            tokens: Number of tokens to consume
-
-        Returns:
-            True if tokens available, False otherwise
-        """
-        self._refill()
-
-        if self.tokens >= tokens:
-            self.tokens -= tokens
-            return True
-        return False
-
-    def _refill(self):
-        """Refill tokens based on elapsed time"""
-        now = time.time()
-        elapsed = now - self.last_update
-
-        # Add tokens based on fill rate
-        self.tokens = min(
-            self.capacity,
-            self.tokens + (elapsed * self.fill_rate)
-        )
-        self.last_update = now
-
-    def wait_time(self, tokens: float = 1.0) -> float:
-        """
-        Calculate wait time for tokens to be available
-
-        Args:
-            tokens: Number of tokens needed
-
-        Returns:
-            Wait time in seconds (0 if tokens available)
-        """
-        self._refill()
-
-        if self.tokens >= tokens:
-            return 0.0
-
-        # Calculate time needed to accumulate required tokens
-        tokens_needed = tokens - self.tokens
-        return tokens_needed / self.fill_rate
-
-
 class AsyncRateLimiter:
     """
     Async rate limiter using token bucket algorithm
@@ -122,9 +68,9 @@ class AsyncRateLimiter:
     """
 
     def __init__(self):
+        self._engine = RateLimitEngine()
         self._buckets: Dict[str, TokenBucket] = {}
         self._configs: Dict[str, RateLimitConfig] = {}
-        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
         self._stats: Dict[str, Dict[str, int]] = defaultdict(lambda: {
             'requests': 0,
             'throttled': 0,
@@ -152,6 +98,7 @@ class AsyncRateLimiter:
             tokens=config.burst_size,  # Start with full bucket
             fill_rate=fill_rate
         )
+        self._engine.set_limits(endpoint, [self._buckets[endpoint]])
         self._configs[endpoint] = config
 
         logger.info(
@@ -185,24 +132,20 @@ class AsyncRateLimiter:
             logger.warning(f"No rate limit configured for '{endpoint}', allowing request")
             return
 
-        bucket = self._buckets[endpoint]
-
-        # Try to consume tokens
-        while not bucket.consume(tokens):
-            # Calculate wait time
-            wait_time = bucket.wait_time(tokens)
+        # Reserve the next slot; later callers queue behind it
+        wait_time = self._engine.reserve(endpoint, tokens)
 
-            if wait_time > 0:
-                # Record throttling
-                self._stats[endpoint]['throttled'] += 1
-                self._stats[endpoint]['total_wait_time'] += wait_time
+        if wait_time > 0:
+            # Record throttling
+            self._stats[endpoint]['throttled'] += 1
+            self._stats[endpoint]['total_wait_time'] += wait_time
 
-                logger.debug(
-                    f"Rate limit reached for '{endpoint}', waiting {wait_time:.3f}s"
-                )
+            logger.debug(
+                f"Rate limit reached for '{endpoint}', waiting {wait_time:.3f}s"
+            )
 
-                # Async wait (non-blocking!)
-                await asyncio.sleep(wait_time)
+            # Async wait (non-blocking!) until exactly when the tokens exist
+            await asyncio.sleep(wait_time)
 
         # Record successful request
         self._stats[endpoint]['requests'] += 1
@@ -234,10 +177,10 @@ class AsyncRateLimiter:
 
             # Add bucket status
             if endpoint in self._buckets:
-                bucket = self._buckets[endpoint]
-                bucket._refill()  # Update before reading
-                stats['available_tokens'] = bucket.tokens
-                stats['capacity'] = bucket.capacity
+                # Read under the engine lock; reservations can leave the bucket in debt
+                stats['available_tokens'] = self._engine.available_tokens(endpoint)
+                stats['capacity'] = self._buckets[endpoint].capacity
+                stats['wait_histogram'] = self._engine.get_stats(endpoint)['wait_histogram']
 
             return stats
         else:
@@ -253,9 +196,11 @@ class AsyncRateLimiter:
                 'total_wait_time': 0
             }
             self._request_history[endpoint].clear()
+            self._engine.reset(endpoint, limits=False)
         else:
             self._stats.clear()
             self._request_history.clear()
+            self._engine.reset(limits=False)
 
 
 class AsyncRateLimitContext:
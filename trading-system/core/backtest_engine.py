@@ -8,7 +8,7 @@ import logging
 import pandas as pd
 from typing import List, Dict, Optional
 
-from core.vectorized_backtester import VectorizedBacktester, BacktestConfig
+from core.vectorized_backtester import VectorizedBacktester, BacktestConfig, PortfolioBacktestResults
 from strategies.vectorized_strategies import (
     VectorizedMACrossover,
     VectorizedRSI,
@@ -31,9 +31,21 @@ class BacktestEngine:
         self.dp = data_provider
         self.initial_capital = initial_capital
 
-    def run_fast_backtest(self, symbols: List[str], interval: str = "5minute", days: int = 30) -> None:
+    def run_fast_backtest(
+        self,
+        symbols: List[str],
+        interval: str = "5minute",
+        days: int = 30,
+        portfolio: bool = False,
+        max_positions: Optional[int] = None
+    ) -> Optional[PortfolioBacktestResults]:
         """
         Run high-performance vectorized backtest
+
+        By default every symbol is backtested on its own with the full initial
+        capital. With ``portfolio=True`` all symbols are run as one panel that
+        shares the capital, holds at most ``max_positions`` at a time and
+        returns the PortfolioBacktestResults.
         """
         interval = self._normalize_fast_interval(interval)
         logger.info(f"⚡ Running VECTORIZED backtest (100x faster) for {days} days...")
@@ -73,6 +85,9 @@ class BacktestEngine:
             VectorizedVolumeBreakout(volume_multiplier=1.5)
         ])
 
+        if portfolio:
+            return self._run_portfolio_backtest(backtester, strategy, df_map, interval, days, max_positions)
+
         # 4. Run Backtest for each symbol and aggregate
         total_pnl = 0
         total_trades = 0
@@ -106,6 +121,42 @@ class BacktestEngine:
         print(f"AVG WIN RATE:   {win_rate:.1f}%")
         print("=" * 60 + "\n")
 
+    def _run_portfolio_backtest(
+        self,
+        backtester: VectorizedBacktester,
+        strategy: CombinedVectorizedStrategy,
+        df_map: Dict[str, pd.DataFrame],
+        interval: str,
+        days: int,
+        max_positions: Optional[int]
+    ) -> Optional[PortfolioBacktestResults]:
+        """Run all symbols as one shared-capital panel and print the breakdown"""
+        try:
+            results = backtester.run_portfolio(strategy, df_map, max_positions=max_positions)
+        except Exception as e:
+            logger.error(f"Portfolio backtest failed: {e}")
+            return None
+
+        print("\n" + "="*60)
+        print(f"PORTFOLIO BACKTEST RESULTS ({days} days, {interval}, {len(df_map)} symbols)")
+        print("="*60)
+        print(f"{'SYMBOL':<15} {'P&L':>14} {'TRADES':>8} {'WIN RATE':>10} {'EXPOSURE':>10}")
+        print("-" * 60)
+
+        for sym, row in results.symbol_summary.iterrows():
+            win_rate = (row['winning_trades'] / row['trades'] * 100) if row['trades'] > 0 else 0
+            print(f"{sym:<15} {row['pnl']:>14,.2f} {row['trades']:>8} {win_rate:>9.1f}% {row['exposure_pct']:>9.1f}%")
+
+        print("-" * 60)
+        print(f"TOTAL P&L:      ₹{results.final_capital - self.initial_capital:,.2f} ({results.total_return_pct:.2f}%)")
+        print(f"TOTAL TRADES:   {results.total_trades}")
+        print(f"WIN RATE:       {results.win_rate_pct:.1f}%")
+        print(f"SHARPE:         {results.sharpe_ratio:.2f}")
+        print(f"MAX DRAWDOWN:   {results.max_drawdown_pct:.2f}%")
+        print(f"MAX POSITIONS:  {results.max_positions_held}")
+        print("=" * 60 + "\n")
+        return results
+
     @staticmethod
     def _normalize_fast_interval(interval: str) -> str:
         if not interval:
@@ -14,13 +14,14 @@ Features:
 - Confidence scoring (0-100)
 - Volume confirmation
 - Trend context awareness
-- Vectorized computation for speed
+- Vectorized computation for speed (boolean masks over OHLCV arrays)
+- Latest-bar mode that only evaluates the trailing candles
 """
 
 import logging
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -50,6 +51,49 @@ class CandlestickPattern:
     description: str
 
 
+_TREND_NAMES = {1: 'uptrend', -1: 'downtrend', 0: 'sideways'}
+
+
+class _OhlcvArrays:
+    """OHLCV columns extracted once and shared by every detector of a pass"""
+
+    def __init__(self, df: pd.DataFrame):
+        self.columns = {
+            col: df[col].to_numpy(dtype=float)
+            for col in ('open', 'high', 'low', 'close', 'volume')
+        }
+
+        # Trend codes / volume confirmation for rows >= context_start, filled
+        # on first use so detectors of one pass share them
+        self.context_start: Optional[int] = None
+        self.trend: Optional[np.ndarray] = None
+        self.volume_confirmed: Optional[np.ndarray] = None
+
+    def __getitem__(self, col: str) -> np.ndarray:
+        return self.columns[col]
+
+    def __len__(self) -> int:
+        return len(self.columns['close'])
+
+
+@dataclass
+class _Candles:
+    """OHLCV arrays for the rows a detector evaluates, plus full-history context"""
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    offset: int  # Row of the full frame at position 0 of the arrays above
+    start: int  # First row patterns may complete on
+    source: _OhlcvArrays
+
+    def shift(self, values: np.ndarray, periods: int) -> np.ndarray:
+        """values[i - periods] aligned to row i (NaN where unavailable)"""
+        shifted = np.full(len(values), np.nan)
+        shifted[periods:] = values[:len(values) - periods]
+        return shifted
+
+
 class CandlestickPatternDetector:
     """
     Advanced candlestick pattern detector with ML confidence scoring
@@ -66,7 +110,8 @@ class CandlestickPatternDetector:
         self,
         min_confidence: float = 50.0,
         volume_threshold: float = 1.2,
-        trend_lookback: int = 20
+        trend_lookback: int = 20,
+        latest_bars: int = 3
     ):
         """
         Initialize candlestick pattern detector
@@ -75,10 +120,12 @@ class CandlestickPatternDetector:
             min_confidence: Minimum confidence score to report patterns
             volume_threshold: Minimum volume multiplier for confirmation
             trend_lookback: Periods to look back for trend detection
+            latest_bars: Trailing candles evaluated by latest_only detection
         """
         self.min_confidence = min_confidence
         self.volume_threshold = volume_threshold
         self.trend_lookback = trend_lookback
+        self.latest_bars = latest_bars
 
         logger.info(
             f"CandlestickPatternDetector initialized: "
@@ -86,25 +133,74 @@ class CandlestickPatternDetector:
             f"volume_threshold={volume_threshold}"
         )
 
-    def _calculate_body(self, df: pd.DataFrame) -> pd.Series:
-        """Calculate candle body size (VECTORIZED)"""
-        return df['close'] - df['open']
-
-    def _calculate_upper_shadow(self, df: pd.DataFrame) -> pd.Series:
-        """Calculate upper shadow size (VECTORIZED)"""
-        return df['high'] - df[['close', 'open']].max(axis=1)
+    def _candles(self, df: pd.DataFrame, start: int = 0, span: int = 1) -> _Candles:
+        """
+        Arrays for detecting patterns that complete on rows >= start
 
-    def _calculate_lower_shadow(self, df: pd.DataFrame) -> pd.Series:
-        """Calculate lower shadow size (VECTORIZED)"""
-        return df[['close', 'open']].min(axis=1) - df['low']
+        Only the rows a pattern of ``span`` candles can touch are sliced;
+        trend and volume context still look back over the full history.
+        """
+        if not isinstance(df, _OhlcvArrays):
+            df = _OhlcvArrays(df)
+        start = max(int(start), 0)
+        offset = max(start - (span - 1), 0)
+        return _Candles(
+            open=df['open'][offset:],
+            high=df['high'][offset:],
+            low=df['low'][offset:],
+            close=df['close'][offset:],
+            offset=offset,
+            start=start,
+            source=df
+        )
 
-    def _is_bullish_candle(self, df: pd.DataFrame) -> pd.Series:
-        """Check if candle is bullish (VECTORIZED)"""
-        return df['close'] > df['open']
+    def _trend_codes(self, close: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """
+        Trend at each row: 1 uptrend, -1 downtrend, 0 sideways
 
-    def _is_bearish_candle(self, df: pd.DataFrame) -> pd.Series:
-        """Check if candle is bearish (VECTORIZED)"""
-        return df['close'] < df['open']
+        Vectorized ``_detect_trend``: the least-squares slope over the
+        preceding ``trend_lookback`` closes is computed for all rows at once.
+        """
+        codes = np.zeros(len(rows), dtype=np.int8)
+        lookback = self.trend_lookback
+        valid = rows >= lookback
+        if lookback < 2 or not valid.any():
+            return codes
+
+        windows = np.lib.stride_tricks.sliding_window_view(close, lookback)[rows[valid] - lookback]
+        sma = windows.mean(axis=1)
+        x = np.arange(lookback) - (lookback - 1) / 2
+        slope = (windows - sma[:, None]) @ x / (x @ x)
+        current = close[rows[valid]]
+
+        codes[valid] = np.where(
+            (current > sma) & (slope > 0), 1,
+            np.where((current < sma) & (slope < 0), -1, 0)
+        )
+        return codes
+
+    def _volume_confirmed(self, volume: np.ndarray, rows: np.ndarray, lookback: int = 20) -> np.ndarray:
+        """Vectorized ``_check_volume_confirmation`` for the given rows"""
+        confirmed = np.zeros(len(rows), dtype=bool)
+        valid = rows >= lookback
+        if not valid.any():
+            return confirmed
+
+        windows = np.lib.stride_tricks.sliding_window_view(volume, lookback)[rows[valid] - lookback]
+        confirmed[valid] = volume[rows[valid]] >= windows.mean(axis=1) * self.volume_threshold
+        return confirmed
+
+    def _context(self, source: _OhlcvArrays, start: int, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Trend codes and volume confirmation for rows, computed once per pass"""
+        if source.context_start is None:
+            context_rows = np.arange(start, len(source))
+            source.context_start = start
+            source.trend = self._trend_codes(source['close'], context_rows)
+            source.volume_confirmed = self._volume_confirmed(source['volume'], context_rows)
+        if start < source.context_start:
+            return self._trend_codes(source['close'], rows), self._volume_confirmed(source['volume'], rows)
+        positions = rows - source.context_start
+        return source.trend[positions], source.volume_confirmed[positions]
 
     def _detect_trend(self, df: pd.DataFrame, index: int) -> str:
         """
@@ -113,26 +209,8 @@ class CandlestickPatternDetector:
         Returns:
             'uptrend', 'downtrend', or 'sideways'
         """
-        if index < self.trend_lookback:
-            return 'sideways'
-
-        # Use SMA to determine trend
-        lookback_data = df.iloc[index - self.trend_lookback:index]
-        sma = lookback_data['close'].mean()
-        current_price = df.iloc[index]['close']
-
-        # Calculate slope
-        x = np.arange(len(lookback_data))
-        y = lookback_data['close'].values
-        slope = np.polyfit(x, y, 1)[0]
-
-        # Trend classification
-        if current_price > sma and slope > 0:
-            return 'uptrend'
-        elif current_price < sma and slope < 0:
-            return 'downtrend'
-        else:
-            return 'sideways'
+        code = self._trend_codes(df['close'].to_numpy(dtype=float), np.array([index]))[0]
+        return _TREND_NAMES[code]
 
     def _check_volume_confirmation(
         self,
@@ -141,55 +219,67 @@ class CandlestickPatternDetector:
         lookback: int = 20
     ) -> bool:
         """Check if volume confirms the pattern"""
-        if index < lookback:
-            return False
-
-        current_volume = df.iloc[index]['volume']
-        avg_volume = df.iloc[index - lookback:index]['volume'].mean()
+        volume = df['volume'].to_numpy(dtype=float)
+        return bool(self._volume_confirmed(volume, np.array([index]), lookback)[0])
 
-        return current_volume >= (avg_volume * self.volume_threshold)
-
-    def _calculate_confidence(
+    def _build_patterns(
         self,
-        base_confidence: float,
-        volume_confirmed: bool,
-        trend_aligned: bool,
-        additional_factors: Dict[str, float] = None
-    ) -> float:
+        candles: _Candles,
+        mask: np.ndarray,
+        name: str,
+        pattern_type: PatternType,
+        aligned_trend: Optional[int],
+        base_confidence: Tuple[float, float],
+        description: str,
+        bonus: Optional[np.ndarray] = None
+    ) -> List[CandlestickPattern]:
         """
-        Calculate pattern confidence score
+        Score the rows where mask is set and build pattern objects
 
         Args:
-            base_confidence: Base pattern match confidence (0-100)
-            volume_confirmed: Whether volume confirms pattern
-            trend_aligned: Whether pattern aligns with trend
-            additional_factors: Additional scoring factors
-
-        Returns:
-            Final confidence score (0-100)
+            candles: Arrays the mask was computed on
+            mask: Pattern match per row of ``candles``
+            aligned_trend: Trend code the pattern should appear in
+                (None: any trend other than sideways)
+            base_confidence: (aligned, not aligned) base scores
+            description: Text, may reference ``{trend}``
+            bonus: Extra confidence per row of ``candles``
         """
-        confidence = base_confidence
-
-        # Volume confirmation adds 10-15 points
-        if volume_confirmed:
-            confidence += 15
+        positions = np.flatnonzero(mask)
+        rows = positions + candles.offset
+        keep = rows >= candles.start
+        positions, rows = positions[keep], rows[keep]
+        if len(rows) == 0:
+            return []
 
-        # Trend alignment adds 10 points
-        if trend_aligned:
-            confidence += 10
+        trend, volume_confirmed = self._context(candles.source, candles.start, rows)
+        trend_aligned = trend != 0 if aligned_trend is None else trend == aligned_trend
 
-        # Additional factors
-        if additional_factors:
-            for factor, weight in additional_factors.items():
-                confidence += weight
+        # Volume confirmation adds 15 points, trend alignment 10
+        confidence = np.where(trend_aligned, base_confidence[0], base_confidence[1])
+        if bonus is not None:
+            confidence = confidence + bonus[positions]
+        confidence = np.minimum(confidence + 15 * volume_confirmed + 10 * trend_aligned, 100.0)
 
-        return min(confidence, 100.0)
+        patterns = []
+        for k in np.flatnonzero(confidence >= self.min_confidence):
+            patterns.append(CandlestickPattern(
+                name=name,
+                pattern_type=pattern_type,
+                confidence=float(confidence[k]),
+                index=int(rows[k]),
+                price=float(candles.source['close'][rows[k]]),
+                volume_confirmed=bool(volume_confirmed[k]),
+                trend_aligned=bool(trend_aligned[k]),
+                description=description.format(trend=_TREND_NAMES[trend[k]])
+            ))
+        return patterns
 
     # =========================================================================
     # SINGLE CANDLE PATTERNS
     # =========================================================================
 
-    def detect_doji(self, df: pd.DataFrame) -> List[CandlestickPattern]:
+    def detect_doji(self, df: pd.DataFrame, start: int = 0) -> List[CandlestickPattern]:
         """
         Detect Doji patterns (indecision candles)
 
@@ -198,49 +288,18 @@ class CandlestickPatternDetector:
         - Can have long shadows
         - Signals indecision/potential reversal
         """
-        patterns = []
-
-        body = self._calculate_body(df).abs()
-        full_range = df['high'] - df['low']
+        c = self._candles(df, start)
 
         # Doji: body < 10% of full range
-        is_doji = body < (full_range * 0.1)
-
-        for i in range(len(df)):
-            if not is_doji.iloc[i]:
-                continue
-
-            trend = self._detect_trend(df, i)
-            volume_confirmed = self._check_volume_confirmation(df, i)
-
-            # Higher confidence if at trend extremes
-            base_confidence = 60.0
-            if trend != 'sideways':
-                base_confidence = 70.0
-
-            trend_aligned = trend in ['uptrend', 'downtrend']  # Reversal pattern
-
-            confidence = self._calculate_confidence(
-                base_confidence,
-                volume_confirmed,
-                trend_aligned
-            )
-
-            if confidence >= self.min_confidence:
-                patterns.append(CandlestickPattern(
-                    name="Doji",
-                    pattern_type=PatternType.REVERSAL,
-                    confidence=confidence,
-                    index=i,
-                    price=df.iloc[i]['close'],
-                    volume_confirmed=volume_confirmed,
-                    trend_aligned=trend_aligned,
-                    description=f"Doji in {trend} - potential reversal"
-                ))
+        is_doji = np.abs(c.close - c.open) < (c.high - c.low) * 0.1
 
-        return patterns
+        # Higher confidence if at trend extremes (reversal pattern)
+        return self._build_patterns(
+            c, is_doji, "Doji", PatternType.REVERSAL, None, (70.0, 60.0),
+            "Doji in {trend} - potential reversal"
+        )
 
-    def detect_hammer(self, df: pd.DataFrame) -> List[CandlestickPattern]:
+    def detect_hammer(self, df: pd.DataFrame, start: int = 0) -> List[CandlestickPattern]:
         """
         Detect Hammer pattern (bullish reversal)
 
@@ -250,11 +309,10 @@ class CandlestickPatternDetector:
         - Little to no upper shadow
         - Appears in downtrend
         """
-        patterns = []
-
-        body = self._calculate_body(df).abs()
-        upper_shadow = self._calculate_upper_shadow(df)
-        lower_shadow = self._calculate_lower_shadow(df)
+        c = self._candles(df, start)
+        body = np.abs(c.close - c.open)
+        upper_shadow = c.high - np.maximum(c.close, c.open)
+        lower_shadow = np.minimum(c.close, c.open) - c.low
 
         # Hammer conditions
         is_hammer = (
@@ -263,44 +321,17 @@ class CandlestickPatternDetector:
             (body > 0)  # Has a body
         )
 
-        for i in range(len(df)):
-            if not is_hammer.iloc[i]:
-                continue
-
-            trend = self._detect_trend(df, i)
-            volume_confirmed = self._check_volume_confirmation(df, i)
-
-            # Best in downtrend (reversal signal)
-            trend_aligned = (trend == 'downtrend')
-
-            base_confidence = 75.0 if trend_aligned else 55.0
-
-            # Extra confidence for very long shadow
-            shadow_ratio = lower_shadow.iloc[i] / body.iloc[i]
-            if shadow_ratio > 3:
-                base_confidence += 5
-
-            confidence = self._calculate_confidence(
-                base_confidence,
-                volume_confirmed,
-                trend_aligned
-            )
-
-            if confidence >= self.min_confidence:
-                patterns.append(CandlestickPattern(
-                    name="Hammer",
-                    pattern_type=PatternType.BULLISH,
-                    confidence=confidence,
-                    index=i,
-                    price=df.iloc[i]['close'],
-                    volume_confirmed=volume_confirmed,
-                    trend_aligned=trend_aligned,
-                    description=f"Hammer - bullish reversal signal"
-                ))
+        # Extra confidence for very long shadow
+        with np.errstate(divide='ignore', invalid='ignore'):
+            long_shadow = np.where(lower_shadow / body > 3, 5.0, 0.0)
 
-        return patterns
+        # Best in downtrend (reversal signal)
+        return self._build_patterns(
+            c, is_hammer, "Hammer", PatternType.BULLISH, -1, (75.0, 55.0),
+            "Hammer - bullish reversal signal", bonus=long_shadow
+        )
 
-    def detect_shooting_star(self, df: pd.DataFrame) -> List[CandlestickPattern]:
+    def detect_shooting_star(self, df: pd.DataFrame, start: int = 0) -> List[CandlestickPattern]:
         """
         Detect Shooting Star pattern (bearish reversal)
 
@@ -310,11 +341,10 @@ class CandlestickPatternDetector:
         - Little to no lower shadow
         - Appears in uptrend
         """
-        patterns = []
-
-        body = self._calculate_body(df).abs()
-        upper_shadow = self._calculate_upper_shadow(df)
-        lower_shadow = self._calculate_lower_shadow(df)
+        c = self._candles(df, start)
+        body = np.abs(c.close - c.open)
+        upper_shadow = c.high - np.maximum(c.close, c.open)
+        lower_shadow = np.minimum(c.close, c.open) - c.low
 
         # Shooting star conditions
         is_shooting_star = (
@@ -323,43 +353,17 @@ class CandlestickPatternDetector:
             (body > 0)  # Has a body
         )
 
-        for i in range(len(df)):
-            if not is_shooting_star.iloc[i]:
-                continue
-
-            trend = self._detect_trend(df, i)
-            volume_confirmed = self._check_volume_confirmation(df, i)
-
-            # Best in uptrend (reversal signal)
-            trend_aligned = (trend == 'uptrend')
-
-            base_confidence = 75.0 if trend_aligned else 55.0
-
-            confidence = self._calculate_confidence(
-                base_confidence,
-                volume_confirmed,
-                trend_aligned
-            )
-
-            if confidence >= self.min_confidence:
-                patterns.append(CandlestickPattern(
-                    name="Shooting Star",
-                    pattern_type=PatternType.BEARISH,
-                    confidence=confidence,
-                    index=i,
-                    price=df.iloc[i]['close'],
-                    volume_confirmed=volume_confirmed,
-                    trend_aligned=trend_aligned,
-                    description=f"Shooting Star - bearish reversal signal"
-                ))
-
-        return patterns
+        # Best in uptrend (reversal signal)
+        return self._build_patterns(
+            c, is_shooting_star, "Shooting Star", PatternType.BEARISH, 1, (75.0, 55.0),
+            "Shooting Star - bearish reversal signal"
+        )
 
     # =========================================================================
     # TWO CANDLE PATTERNS
     # =========================================================================
 
-    def detect_engulfing(self, df: pd.DataFrame) -> List[CandlestickPattern]:
+    def detect_engulfing(self, df: pd.DataFrame, start: int = 0) -> List[CandlestickPattern]:
         """
         Detect Engulfing patterns (bullish & bearish)
 
@@ -371,80 +375,36 @@ class CandlestickPatternDetector:
         - First candle: small bullish
         - Second candle: large bearish that engulfs first
         """
-        patterns = []
-
         if len(df) < 2:
-            return patterns
-
-        for i in range(1, len(df)):
-            prev_open = df.iloc[i-1]['open']
-            prev_close = df.iloc[i-1]['close']
-            curr_open = df.iloc[i]['open']
-            curr_close = df.iloc[i]['close']
-
-            # Bullish engulfing
-            if (prev_close < prev_open and  # Previous bearish
-                curr_close > curr_open and  # Current bullish
-                curr_open < prev_close and  # Opens below prev close
-                curr_close > prev_open):    # Closes above prev open
-
-                trend = self._detect_trend(df, i)
-                volume_confirmed = self._check_volume_confirmation(df, i)
-                trend_aligned = (trend == 'downtrend')
-
-                base_confidence = 80.0 if trend_aligned else 60.0
-
-                confidence = self._calculate_confidence(
-                    base_confidence,
-                    volume_confirmed,
-                    trend_aligned
-                )
-
-                if confidence >= self.min_confidence:
-                    patterns.append(CandlestickPattern(
-                        name="Bullish Engulfing",
-                        pattern_type=PatternType.BULLISH,
-                        confidence=confidence,
-                        index=i,
-                        price=df.iloc[i]['close'],
-                        volume_confirmed=volume_confirmed,
-                        trend_aligned=trend_aligned,
-                        description="Bullish engulfing - strong reversal signal"
-                    ))
-
-            # Bearish engulfing
-            elif (prev_close > prev_open and  # Previous bullish
-                  curr_close < curr_open and  # Current bearish
-                  curr_open > prev_close and  # Opens above prev close
-                  curr_close < prev_open):    # Closes below prev open
-
-                trend = self._detect_trend(df, i)
-                volume_confirmed = self._check_volume_confirmation(df, i)
-                trend_aligned = (trend == 'uptrend')
-
-                base_confidence = 80.0 if trend_aligned else 60.0
-
-                confidence = self._calculate_confidence(
-                    base_confidence,
-                    volume_confirmed,
-                    trend_aligned
-                )
-
-                if confidence >= self.min_confidence:
-                    patterns.append(CandlestickPattern(
-                        name="Bearish Engulfing",
-                        pattern_type=PatternType.BEARISH,
-                        confidence=confidence,
-                        index=i,
-                        price=df.iloc[i]['close'],
-                        volume_confirmed=volume_confirmed,
-                        trend_aligned=trend_aligned,
-                        description="Bearish engulfing - strong reversal signal"
-                    ))
+            return []
+
+        c = self._candles(df, start, span=2)
+        prev_open, prev_close = c.shift(c.open, 1), c.shift(c.close, 1)
+
+        bullish = (
+            (prev_close < prev_open) &  # Previous bearish
+            (c.close > c.open) &  # Current bullish
+            (c.open < prev_close) &  # Opens below prev close
+            (c.close > prev_open)  # Closes above prev open
+        )
+        bearish = (
+            (prev_close > prev_open) &  # Previous bullish
+            (c.close < c.open) &  # Current bearish
+            (c.open > prev_close) &  # Opens above prev close
+            (c.close < prev_open)  # Closes below prev open
+        )
 
+        patterns = self._build_patterns(
+            c, bullish, "Bullish Engulfing", PatternType.BULLISH, -1, (80.0, 60.0),
+            "Bullish engulfing - strong reversal signal"
+        ) + self._build_patterns(
+            c, bearish, "Bearish Engulfing", PatternType.BEARISH, 1, (80.0, 60.0),
+            "Bearish engulfing - strong reversal signal"
+        )
+        patterns.sort(key=lambda p: p.index)
         return patterns
 
-    def detect_piercing_pattern(self, df: pd.DataFrame) -> List[CandlestickPattern]:
+    def detect_piercing_pattern(self, df: pd.DataFrame, start: int = 0) -> List[CandlestickPattern]:
         """
         Detect Piercing Pattern (bullish reversal)
 
@@ -453,54 +413,28 @@ class CandlestickPatternDetector:
         - Second candle: opens below prev low, closes above midpoint
         - Appears in downtrend
         """
-        patterns = []
-
         if len(df) < 2:
-            return patterns
-
-        for i in range(1, len(df)):
-            prev_open = df.iloc[i-1]['open']
-            prev_close = df.iloc[i-1]['close']
-            prev_low = df.iloc[i-1]['low']
-            curr_open = df.iloc[i]['open']
-            curr_close = df.iloc[i]['close']
-
-            prev_midpoint = (prev_open + prev_close) / 2
-
-            # Piercing pattern conditions
-            if (prev_close < prev_open and  # Previous bearish
-                curr_close > curr_open and  # Current bullish
-                curr_open < prev_low and    # Opens below prev low
-                curr_close > prev_midpoint and  # Closes above midpoint
-                curr_close < prev_open):    # But not above prev open
-
-                trend = self._detect_trend(df, i)
-                volume_confirmed = self._check_volume_confirmation(df, i)
-                trend_aligned = (trend == 'downtrend')
-
-                base_confidence = 75.0 if trend_aligned else 55.0
-
-                confidence = self._calculate_confidence(
-                    base_confidence,
-                    volume_confirmed,
-                    trend_aligned
-                )
-
-                if confidence >= self.min_confidence:
-                    patterns.append(CandlestickPattern(
-                        name="Piercing Pattern",
-                        pattern_type=PatternType.BULLISH,
-                        confidence=confidence,
-                        index=i,
-                        price=df.iloc[i]['close'],
-                        volume_confirmed=volume_confirmed,
-                        trend_aligned=trend_aligned,
-                        description="Piercing pattern - bullish reversal"
-                    ))
+            return []
 
-        return patterns
+        c = self._candles(df, start, span=2)
+        prev_open, prev_close = c.shift(c.open, 1), c.shift(c.close, 1)
+        prev_midpoint = (prev_open + prev_close) / 2
+
+        # Piercing pattern conditions
+        is_piercing = (
+            (prev_close < prev_open) &  # Previous bearish
+            (c.close > c.open) &  # Current bullish
+            (c.open < c.shift(c.low, 1)) &  # Opens below prev low
+            (c.close > prev_midpoint) &  # Closes above midpoint
+            (c.close < prev_open)  # But not above prev open
+        )
+
+        return self._build_patterns(
+            c, is_piercing, "Piercing Pattern", PatternType.BULLISH, -1, (75.0, 55.0),
+            "Piercing pattern - bullish reversal"
+        )
 
-    def detect_dark_cloud_cover(self, df: pd.DataFrame) -> List[CandlestickPattern]:
+    def detect_dark_cloud_cover(self, df: pd.DataFrame, start: int = 0) -> List[CandlestickPattern]:
         """
         Detect Dark Cloud Cover (bearish reversal)
 
@@ -509,58 +443,40 @@ class CandlestickPatternDetector:
         - Second candle: opens above prev high, closes below midpoint
         - Appears in uptrend
         """
-        patterns = []
-
         if len(df) < 2:
-            return patterns
-
-        for i in range(1, len(df)):
-            prev_open = df.iloc[i-1]['open']
-            prev_close = df.iloc[i-1]['close']
-            prev_high = df.iloc[i-1]['high']
-            curr_open = df.iloc[i]['open']
-            curr_close = df.iloc[i]['close']
-
-            prev_midpoint = (prev_open + prev_close) / 2
-
-            # Dark cloud cover conditions
-            if (prev_close > prev_open and  # Previous bullish
-                curr_close < curr_open and  # Current bearish
-                curr_open > prev_high and   # Opens above prev high
-                curr_close < prev_midpoint and  # Closes below midpoint
-                curr_close > prev_open):    # But not below prev open
-
-                trend = self._detect_trend(df, i)
-                volume_confirmed = self._check_volume_confirmation(df, i)
-                trend_aligned = (trend == 'uptrend')
-
-                base_confidence = 75.0 if trend_aligned else 55.0
-
-                confidence = self._calculate_confidence(
-                    base_confidence,
-                    volume_confirmed,
-                    trend_aligned
-                )
-
-                if confidence >= self.min_confidence:
-                    patterns.append(CandlestickPattern(
-                        name="Dark Cloud Cover",
-                        pattern_type=PatternType.BEARISH,
-                        confidence=confidence,
-                        index=i,
-                        price=df.iloc[i]['close'],
-                        volume_confirmed=volume_confirmed,
-                        trend_aligned=trend_aligned,
-                        description="Dark cloud cover - bearish reversal"
-                    ))
+            return []
 
-        return patterns
+        c = self._candles(df, start, span=2)
+        prev_open, prev_close = c.shift(c.open, 1), c.shift(c.close, 1)
+        prev_midpoint = (prev_open + prev_close) / 2
+
+        # Dark cloud cover conditions
+        is_dark_cloud = (
+            (prev_close > prev_open) &  # Previous bullish
+            (c.close < c.open) &  # Current bearish
+            (c.open > c.shift(c.high, 1)) &  # Opens above prev high
+            (c.close < prev_midpoint) &  # Closes below midpoint
+            (c.close > prev_open)  # But not below prev open
+        )
+
+        return self._build_patterns(
+            c, is_dark_cloud, "Dark Cloud Cover", PatternType.BEARISH, 1, (75.0, 55.0),
+            "Dark cloud cover - bearish reversal"
+        )
 
     # =========================================================================
     # THREE CANDLE PATTERNS
     # =========================================================================
 
-    def detect_morning_star(self, df: pd.DataFrame) -> List[CandlestickPattern]:
+    def _star_components(self, c: _Candles) -> Tuple[np.ndarray, ...]:
+        """First/second/third candle bodies and first candle midpoint, aligned to the third"""
+        c1_open, c1_close = c.shift(c.open, 2), c.shift(c.close, 2)
+        c1_body = np.abs(c1_close - c1_open)
+        c2_body = np.abs(c.shift(c.close, 1) - c.shift(c.open, 1))
+        c3_body = np.abs(c.close - c.open)
+        return c1_open, c1_close, c1_body, c2_body, c3_body, (c1_open + c1_close) / 2
+
+    def detect_morning_star(self, df: pd.DataFrame, start: int = 0) -> List[CandlestickPattern]:
         """
         Detect Morning Star (bullish reversal)
 
@@ -569,58 +485,27 @@ class CandlestickPatternDetector:
         - Second candle: small body (star)
         - Third candle: long bullish closing above first midpoint
         """
-        patterns = []
-
         if len(df) < 3:
-            return patterns
-
-        for i in range(2, len(df)):
-            c1_open = df.iloc[i-2]['open']
-            c1_close = df.iloc[i-2]['close']
-            c2_open = df.iloc[i-1]['open']
-            c2_close = df.iloc[i-1]['close']
-            c3_open = df.iloc[i]['open']
-            c3_close = df.iloc[i]['close']
-
-            c1_body = abs(c1_close - c1_open)
-            c2_body = abs(c2_close - c2_open)
-            c3_body = abs(c3_close - c3_open)
-            c1_midpoint = (c1_open + c1_close) / 2
-
-            # Morning star conditions
-            if (c1_close < c1_open and  # First bearish
-                c2_body < c1_body * 0.3 and  # Star is small
-                c3_close > c3_open and  # Third bullish
-                c3_close > c1_midpoint and  # Closes above first midpoint
-                c3_body > c1_body * 0.5):  # Third candle is substantial
-
-                trend = self._detect_trend(df, i)
-                volume_confirmed = self._check_volume_confirmation(df, i)
-                trend_aligned = (trend == 'downtrend')
-
-                base_confidence = 85.0 if trend_aligned else 65.0
-
-                confidence = self._calculate_confidence(
-                    base_confidence,
-                    volume_confirmed,
-                    trend_aligned
-                )
-
-                if confidence >= self.min_confidence:
-                    patterns.append(CandlestickPattern(
-                        name="Morning Star",
-                        pattern_type=PatternType.BULLISH,
-                        confidence=confidence,
-                        index=i,
-                        price=df.iloc[i]['close'],
-                        volume_confirmed=volume_confirmed,
-                        trend_aligned=trend_aligned,
-                        description="Morning star - strong bullish reversal"
-                    ))
+            return []
 
-        return patterns
+        c = self._candles(df, start, span=3)
+        c1_open, c1_close, c1_body, c2_body, c3_body, c1_midpoint = self._star_components(c)
+
+        # Morning star conditions
+        is_morning_star = (
+            (c1_close < c1_open) &  # First bearish
+            (c2_body < c1_body * 0.3) &  # Star is small
+            (c.close > c.open) &  # Third bullish
+            (c.close > c1_midpoint) &  # Closes above first midpoint
+            (c3_body > c1_body * 0.5)  # Third candle is substantial
+        )
 
-    def detect_evening_star(self, df: pd.DataFrame) -> List[CandlestickPattern]:
+        return self._build_patterns(
+            c, is_morning_star, "Morning Star", PatternType.BULLISH, -1, (85.0, 65.0),
+            "Morning star - strong bullish reversal"
+        )
+
+    def detect_evening_star(self, df: pd.DataFrame, start: int = 0) -> List[CandlestickPattern]:
         """
         Detect Evening Star (bearish reversal)
 
@@ -629,58 +514,27 @@ class CandlestickPatternDetector:
         - Second candle: small body (star)
         - Third candle: long bearish closing below first midpoint
         """
-        patterns = []
-
         if len(df) < 3:
-            return patterns
-
-        for i in range(2, len(df)):
-            c1_open = df.iloc[i-2]['open']
-            c1_close = df.iloc[i-2]['close']
-            c2_open = df.iloc[i-1]['open']
-            c2_close = df.iloc[i-1]['close']
-            c3_open = df.iloc[i]['open']
-            c3_close = df.iloc[i]['close']
-
-            c1_body = abs(c1_close - c1_open)
-            c2_body = abs(c2_close - c2_open)
-            c3_body = abs(c3_close - c3_open)
-            c1_midpoint = (c1_open + c1_close) / 2
-
-            # Evening star conditions
-            if (c1_close > c1_open and  # First bullish
-                c2_body < c1_body * 0.3 and  # Star is small
-                c3_close < c3_open and  # Third bearish
-                c3_close < c1_midpoint and  # Closes below first midpoint
-                c3_body > c1_body * 0.5):  # Third candle is substantial
-
-                trend = self._detect_trend(df, i)
-                volume_confirmed = self._check_volume_confirmation(df, i)
-                trend_aligned = (trend == 'uptrend')
-
-                base_confidence = 85.0 if trend_aligned else 65.0
-
-                confidence = self._calculate_confidence(
-                    base_confidence,
-                    volume_confirmed,
-                    trend_aligned
-                )
-
-                if confidence >= self.min_confidence:
-                    patterns.append(CandlestickPattern(
-                        name="Evening Star",
-                        pattern_type=PatternType.BEARISH,
-                        confidence=confidence,
-                        index=i,
-                        price=df.iloc[i]['close'],
-                        volume_confirmed=volume_confirmed,
-                        trend_aligned=trend_aligned,
-                        description="Evening star - strong bearish reversal"
-                    ))
+            return []
 
-        return patterns
+        c = self._candles(df, start, span=3)
+        c1_open, c1_close, c1_body, c2_body, c3_body, c1_midpoint = self._star_components(c)
+
+        # Evening star conditions
+        is_evening_star = (
+            (c1_close > c1_open) &  # First bullish
+            (c2_body < c1_body * 0.3) &  # Star is small
+            (c.close < c.open) &  # Third bearish
+            (c.close < c1_midpoint) &  # Closes below first midpoint
+            (c3_body > c1_body * 0.5)  # Third candle is substantial
+        )
 
-    def detect_three_white_soldiers(self, df: pd.DataFrame) -> List[CandlestickPattern]:
+        return self._build_patterns(
+            c, is_evening_star, "Evening Star", PatternType.BEARISH, 1, (85.0, 65.0),
+            "Evening star - strong bearish reversal"
+        )
+
+    def detect_three_white_soldiers(self, df: pd.DataFrame, start: int = 0) -> List[CandlestickPattern]:
         """
         Detect Three White Soldiers (bullish continuation/reversal)
 
@@ -689,58 +543,30 @@ class CandlestickPatternDetector:
         - Each opens within previous body
         - Each closes near high
         """
-        patterns = []
-
         if len(df) < 3:
-            return patterns
+            return []
 
-        for i in range(2, len(df)):
-            # Get three candles
-            candles = df.iloc[i-2:i+1]
+        c = self._candles(df, start, span=3)
+        open1, close1 = c.shift(c.open, 1), c.shift(c.close, 1)
+        open2, close2 = c.shift(c.open, 2), c.shift(c.close, 2)
 
+        is_soldiers = (
             # All must be bullish
-            if not all(candles['close'] > candles['open']):
-                continue
-
-            # Check consecutive higher closes
-            if not (candles.iloc[1]['close'] > candles.iloc[0]['close'] and
-                    candles.iloc[2]['close'] > candles.iloc[1]['close']):
-                continue
-
+            (close2 > open2) & (close1 > open1) & (c.close > c.open) &
+            # Consecutive higher closes
+            (close1 > close2) & (c.close > close1) &
             # Each opens within previous body
-            if not (candles.iloc[1]['open'] > candles.iloc[0]['open'] and
-                    candles.iloc[1]['open'] < candles.iloc[0]['close'] and
-                    candles.iloc[2]['open'] > candles.iloc[1]['open'] and
-                    candles.iloc[2]['open'] < candles.iloc[1]['close']):
-                continue
-
-            trend = self._detect_trend(df, i)
-            volume_confirmed = self._check_volume_confirmation(df, i)
-            trend_aligned = (trend == 'downtrend')  # Better as reversal
-
-            base_confidence = 80.0 if trend_aligned else 70.0
-
-            confidence = self._calculate_confidence(
-                base_confidence,
-                volume_confirmed,
-                trend_aligned
-            )
-
-            if confidence >= self.min_confidence:
-                patterns.append(CandlestickPattern(
-                    name="Three White Soldiers",
-                    pattern_type=PatternType.BULLISH,
-                    confidence=confidence,
-                    index=i,
-                    price=df.iloc[i]['close'],
-                    volume_confirmed=volume_confirmed,
-                    trend_aligned=trend_aligned,
-                    description="Three white soldiers - strong bullish signal"
-                ))
+            (open1 > open2) & (open1 < close2) &
+            (c.open > open1) & (c.open < close1)
+        )
 
-        return patterns
+        # Better as reversal
+        return self._build_patterns(
+            c, is_soldiers, "Three White Soldiers", PatternType.BULLISH, -1, (80.0, 70.0),
+            "Three white soldiers - strong bullish signal"
+        )
 
-    def detect_three_black_crows(self, df: pd.DataFrame) -> List[CandlestickPattern]:
+    def detect_three_black_crows(self, df: pd.DataFrame, start: int = 0) -> List[CandlestickPattern]:
         """
         Detect Three Black Crows (bearish continuation/reversal)
 
@@ -749,65 +575,68 @@ class CandlestickPatternDetector:
         - Each opens within previous body
         - Each closes near low
         """
-        patterns = []
-
         if len(df) < 3:
-            return patterns
+            return []
 
-        for i in range(2, len(df)):
-            # Get three candles
-            candles = df.iloc[i-2:i+1]
+        c = self._candles(df, start, span=3)
+        open1, close1 = c.shift(c.open, 1), c.shift(c.close, 1)
+        open2, close2 = c.shift(c.open, 2), c.shift(c.close, 2)
 
+        is_crows = (
             # All must be bearish
-            if not all(candles['close'] < candles['open']):
-                continue
-
-            # Check consecutive lower closes
-            if not (candles.iloc[1]['close'] < candles.iloc[0]['close'] and
-                    candles.iloc[2]['close'] < candles.iloc[1]['close']):
-                continue
-
+            (close2 < open2) & (close1 < open1) & (c.close < c.open) &
+            # Consecutive lower closes
+            (close1 < close2) & (c.close < close1) &
             # Each opens within previous body
-            if not (candles.iloc[1]['open'] < candles.iloc[0]['open'] and
-                    candles.iloc[1]['open'] > candles.iloc[0]['close'] and
-                    candles.iloc[2]['open'] < candles.iloc[1]['open'] and
-                    candles.iloc[2]['open'] > candles.iloc[1]['close']):
-                continue
-
-            trend = self._detect_trend(df, i)
-            volume_confirmed = self._check_volume_confirmation(df, i)
-            trend_aligned = (trend == 'uptrend')  # Better as reversal
-
-            base_confidence = 80.0 if trend_aligned else 70.0
-
-            confidence = self._calculate_confidence(
-                base_confidence,
-                volume_confirmed,
-                trend_aligned
-            )
-
-            if confidence >= self.min_confidence:
-                patterns.append(CandlestickPattern(
-                    name="Three Black Crows",
-                    pattern_type=PatternType.BEARISH,
-                    confidence=confidence,
-                    index=i,
-                    price=df.iloc[i]['close'],
-                    volume_confirmed=volume_confirmed,
-                    trend_aligned=trend_aligned,
-                    description="Three black crows - strong bearish signal"
-                ))
+            (open1 < open2) & (open1 > close2) &
+            (c.open < open1) & (c.open > close1)
+        )
 
-        return patterns
+        # Better as reversal
+        return self._build_patterns(
+            c, is_crows, "Three Black Crows", PatternType.BEARISH, 1, (80.0, 70.0),
+            "Three black crows - strong bearish signal"
+        )
 
     # =========================================================================
     # MASTER DETECTION METHOD
     # =========================================================================
 
-    def detect_all_patterns(
+    def _detect_from(
         self,
         df: pd.DataFrame,
+        start: int,
         pattern_types: Optional[List[str]] = None
+    ) -> List[CandlestickPattern]:
+        """Patterns completing on rows >= start, sorted by confidence"""
+        arrays = _OhlcvArrays(df)
+        all_patterns = []
+
+        # Single, two and three candle patterns
+        for key, detector in (
+            ('doji', self.detect_doji),
+            ('hammer', self.detect_hammer),
+            ('shooting_star', self.detect_shooting_star),
+            ('engulfing', self.detect_engulfing),
+            ('piercing', self.detect_piercing_pattern),
+            ('dark_cloud', self.detect_dark_cloud_cover),
+            ('morning_star', self.detect_morning_star),
+            ('evening_star', self.detect_evening_star),
+            ('three_white_soldiers', self.detect_three_white_soldiers),
+            ('three_black_crows', self.detect_three_black_crows),
+        ):
+            if pattern_types is None or key in pattern_types:
+                all_patterns.extend(detector(arrays, start))
+
+        # Sort by confidence (highest first)
+        all_patterns.sort(key=lambda p: p.confidence, reverse=True)
+        return all_patterns
+
+    def detect_all_patterns(
+        self,
+        df: pd.DataFrame,
+        pattern_types: Optional[List[str]] = None,
+        latest_only: bool = False
     ) -> List[CandlestickPattern]:
         """
         Detect all candlestick patterns in data
@@ -815,6 +644,8 @@ class CandlestickPatternDetector:
         Args:
             df: OHLCV DataFrame
             pattern_types: Optional list of pattern names to detect
+            latest_only: Only evaluate patterns completing on the last
+                ``latest_bars`` candles
 
         Returns:
             List of detected patterns sorted by confidence
@@ -823,36 +654,8 @@ class CandlestickPatternDetector:
             logger.warning("Insufficient data for pattern detection")
             return []
 
-        all_patterns = []
-
-        # Single candle patterns
-        if pattern_types is None or 'doji' in pattern_types:
-            all_patterns.extend(self.detect_doji(df))
-        if pattern_types is None or 'hammer' in pattern_types:
-            all_patterns.extend(self.detect_hammer(df))
-        if pattern_types is None or 'shooting_star' in pattern_types:
-            all_patterns.extend(self.detect_shooting_star(df))
-
-        # Two candle patterns
-        if pattern_types is None or 'engulfing' in pattern_types:
-            all_patterns.extend(self.detect_engulfing(df))
-        if pattern_types is None or 'piercing' in pattern_types:
-            all_patterns.extend(self.detect_piercing_pattern(df))
-        if pattern_types is None or 'dark_cloud' in pattern_types:
-            all_patterns.extend(self.detect_dark_cloud_cover(df))
-
-        # Three candle patterns
-        if pattern_types is None or 'morning_star' in pattern_types:
-            all_patterns.extend(self.detect_morning_star(df))
-        if pattern_types is None or 'evening_star' in pattern_types:
-            all_patterns.extend(self.detect_evening_star(df))
-        if pattern_types is None or 'three_white_soldiers' in pattern_types:
-            all_patterns.extend(self.detect_three_white_soldiers(df))
-        if pattern_types is None or 'three_black_crows' in pattern_types:
-            all_patterns.extend(self.detect_three_black_crows(df))
-
-        # Sort by confidence (highest first)
-        all_patterns.sort(key=lambda p: p.confidence, reverse=True)
+        start = len(df) - self.latest_bars if latest_only else 0
+        all_patterns = self._detect_from(df, start, pattern_types)
 
         logger.info(f"Detected {len(all_patterns)} patterns")
 
@@ -866,6 +669,9 @@ class CandlestickPatternDetector:
         """
         Get patterns from the most recent candles
 
+        Only the last ``lookback`` candles are evaluated, but trend and
+        volume context still use the history before them.
+
         Args:
             df: OHLCV DataFrame
             lookback: Number of recent candles to analyze
@@ -873,11 +679,10 @@ class CandlestickPatternDetector:
         Returns:
             List of recent patterns
         """
-        recent_df = df.iloc[-lookback:]
-        patterns = self.detect_all_patterns(recent_df)
-
-        return patterns
+        if min(len(df), lookback) < 3:
+            return []
 
+        return self._detect_from(df, len(df) - lookback)
 
 if __name__ == "__main__":
     # Test candlestick pattern detector
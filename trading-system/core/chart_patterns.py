@@ -16,13 +16,14 @@ Features:
 """
 
 import logging
+import threading
+import warnings
 from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
-from scipy.signal import find_peaks, argrelextrema
 
 logger = logging.getLogger('trading_system.chart_patterns')
 
@@ -52,6 +53,118 @@ class ChartPattern:
     pivot_points: List[Tuple[int, float]]  # List of (index, price)
 
 
+def _extrema(values: np.ndarray, comparator, order: int, start: int, stop: int) -> np.ndarray:
+    """argrelextrema(values, comparator, order) restricted to positions [start, stop)"""
+    positions = np.arange(start, stop)
+    if len(positions) == 0:
+        return positions
+    center = values[start:stop]
+    last = len(values) - 1
+    mask = np.ones(len(positions), dtype=bool)
+    for shift in range(1, order + 1):
+        mask &= comparator(center, values[np.maximum(positions - shift, 0)])
+        mask &= comparator(center, values[np.minimum(positions + shift, last)])
+    return positions[mask]
+
+
+class PivotIndex:
+    """
+    Pivot highs and lows of one OHLCV frame as sorted position arrays
+
+    Build with ``from_frame``. Passing the index built for the previous frame
+    of the same symbol reuses its settled pivots: a bar's pivot status only
+    depends on the ``order`` bars either side of it, so just the bars near the
+    edges of the new frame are re-evaluated. The newest bar may still be
+    forming and is never trusted for reuse.
+    """
+
+    def __init__(self, order: int, high: np.ndarray, low: np.ndarray,
+                 high_idx: np.ndarray, low_idx: np.ndarray, anchor_label=None):
+        self.order = order
+        self.length = len(high)
+        self.high_idx = high_idx
+        self.low_idx = low_idx
+        self.high_price = high[high_idx]
+        self.low_price = low[low_idx]
+        self._anchor_label = anchor_label
+        self._anchor_high = high[-2] if self.length >= 2 else None
+        self._anchor_low = low[-2] if self.length >= 2 else None
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        order: int,
+        previous: Optional['PivotIndex'] = None
+    ) -> 'PivotIndex':
+        """Pivot index of df, updated from ``previous`` when it still lines up"""
+        high = df['high'].to_numpy(dtype=float)
+        low = df['low'].to_numpy(dtype=float)
+        n = len(high)
+        anchor_label = df.index[-2] if n >= 2 else None
+
+        shift = cls._resume_shift(previous, df.index, high, low, order)
+        if shift is None:
+            return cls(
+                order, high, low,
+                _extrema(high, np.greater, order, 0, n),
+                _extrema(low, np.less, order, 0, n),
+                anchor_label
+            )
+
+        # Pivots of the previous frame whose whole neighbourhood was closed bars
+        settled_end = previous.length - 1 - order
+        tail_start = max(order, settled_end + shift)
+
+        def merge(previous_idx, values, comparator):
+            moved = previous_idx[(previous_idx >= order) & (previous_idx < settled_end)] + shift
+            return np.concatenate([
+                _extrema(values, comparator, order, 0, min(order, n)),
+                moved[moved >= order],
+                _extrema(values, comparator, order, tail_start, n),
+            ])
+
+        return cls(
+            order, high, low,
+            merge(previous.high_idx, high, np.greater),
+            merge(previous.low_idx, low, np.less),
+            anchor_label
+        )
+
+    @staticmethod
+    def _resume_shift(
+        previous: Optional['PivotIndex'],
+        index: pd.Index,
+        high: np.ndarray,
+        low: np.ndarray,
+        order: int
+    ) -> Optional[int]:
+        """Offset from previous positions to positions in the new frame, or None to rebuild"""
+        if previous is None or previous.order != order or previous._anchor_label is None:
+            return None
+        if not index.is_monotonic_increasing:
+            return None
+        position = index.searchsorted(previous._anchor_label, side='left')
+        if position >= len(index) or index[position] != previous._anchor_label:
+            return None
+        shift = position - (previous.length - 2)
+        if shift > 0:  # New frame reaches further back than the previous one
+            return None
+        if high[position] != previous._anchor_high or low[position] != previous._anchor_low:
+            return None
+        return int(shift)
+
+    def highs_between(self, start, end) -> Tuple[np.ndarray, np.ndarray]:
+        """Slice bounds into the pivot highs strictly between positions start and end"""
+        return (np.searchsorted(self.high_idx, start, side='right'),
+                np.searchsorted(self.high_idx, end, side='left'))
+
+    def lows_between(self, start, end) -> Tuple[np.ndarray, np.ndarray]:
+        """Slice bounds into the pivot lows strictly between positions start and end"""
+        return (np.searchsorted(self.low_idx, start, side='right'),
+                np.searchsorted(self.low_idx, end, side='left'))
+
+
 class ChartPatternDetector:
     """
     Advanced chart pattern detector
@@ -60,6 +173,9 @@ class ChartPatternDetector:
         detector = ChartPatternDetector()
         patterns = detector.detect_all_patterns(data)
 
+        # Keep pivots per symbol and only re-evaluate the newest bars
+        patterns = detector.detect_all_patterns(data, symbol='RELIANCE')
+
         # Get high-confidence patterns only
         strong_patterns = [p for p in patterns if p.confidence > 70]
     """
@@ -81,12 +197,39 @@ class ChartPatternDetector:
         self.min_confidence = min_confidence
         self.pivot_order = pivot_order
         self.volume_threshold = volume_threshold
+        self._pivot_indexes: Dict[str, PivotIndex] = {}
+        self._lock = threading.Lock()
 
         logger.info(
             f"ChartPatternDetector initialized: "
             f"min_confidence={min_confidence}, pivot_order={pivot_order}"
         )
 
+    def pivot_index(self, df: pd.DataFrame, symbol: Optional[str] = None) -> PivotIndex:
+        """
+        Pivot index for df
+
+        With a symbol, the index from the previous call for that symbol is
+        updated with the bars that arrived since, and stored for the next one.
+        """
+        if symbol is None:
+            return PivotIndex.from_frame(df, self.pivot_order)
+
+        with self._lock:
+            previous = self._pivot_indexes.get(symbol)
+        pivots = PivotIndex.from_frame(df, self.pivot_order, previous)
+        with self._lock:
+            self._pivot_indexes[symbol] = pivots
+        return pivots
+
+    def reset(self, symbol: Optional[str] = None):
+        """Drop stored pivot indexes for one symbol, or for all of them"""
+        with self._lock:
+            if symbol is None:
+                self._pivot_indexes.clear()
+            else:
+                self._pivot_indexes.pop(symbol, None)
+
     def find_pivot_highs(self, df: pd.DataFrame) -> List[Tuple[int, float]]:
         """
         Find pivot highs (local maxima)
@@ -94,11 +237,8 @@ class ChartPatternDetector:
         Returns:
             List of (index, price) tuples
         """
-        highs = df['high'].values
-        pivot_indices = argrelextrema(highs, np.greater, order=self.pivot_order)[0]
-
-        pivots = [(idx, df.iloc[idx]['high']) for idx in pivot_indices]
-        return pivots
+        pivots = self.pivot_index(df)
+        return list(zip(pivots.high_idx, pivots.high_price))
 
     def find_pivot_lows(self, df: pd.DataFrame) -> List[Tuple[int, float]]:
         """
@@ -107,23 +247,26 @@ class ChartPatternDetector:
         Returns:
             List of (index, price) tuples
         """
-        lows = df['low'].values
-        pivot_indices = argrelextrema(lows, np.less, order=self.pivot_order)[0]
-
-        pivots = [(idx, df.iloc[idx]['low']) for idx in pivot_indices]
-        return pivots
+        pivots = self.pivot_index(df)
+        return list(zip(pivots.low_idx, pivots.low_price))
 
     def _check_volume_confirmation(
         self,
         df: pd.DataFrame,
         start_idx: int,
-        end_idx: int
+        end_idx: int,
+        volume: Optional[np.ndarray] = None
     ) -> bool:
-        """Check if volume confirms the pattern"""
-        pattern_volume = df.iloc[end_idx]['volume']
-        avg_volume = df.iloc[start_idx:end_idx]['volume'].mean()
+        """Check if volume confirms the pattern (volume: df's volume column, if already extracted)"""
+        if end_idx <= start_idx:
+            return False
+        if volume is None:
+            volume = df['volume'].to_numpy(dtype=float)
+        with np.errstate(invalid='ignore'), warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            avg_volume = np.nanmean(volume[start_idx:end_idx])
 
-        return pattern_volume >= (avg_volume * self.volume_threshold)
+        return bool(volume[end_idx] >= (avg_volume * self.volume_threshold))
 
     def _calculate_pattern_height(
         self,
@@ -133,13 +276,20 @@ class ChartPatternDetector:
         """Calculate pattern height (for target calculation)"""
         return abs(high_price - low_price)
 
+    @staticmethod
+    def _relative_diff(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        """abs(first - second) / first, elementwise"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.abs(first - second) / first
+
     # =========================================================================
     # REVERSAL PATTERNS
     # =========================================================================
 
     def detect_head_and_shoulders(
         self,
-        df: pd.DataFrame
+        df: pd.DataFrame,
+        pivots: Optional[PivotIndex] = None
     ) -> List[ChartPattern]:
         """
         Detect Head and Shoulders pattern (bearish reversal)
@@ -150,53 +300,49 @@ class ChartPatternDetector:
         - Breakout below neckline
         """
         patterns = []
+        if pivots is None:
+            pivots = self.pivot_index(df)
 
-        pivot_highs = self.find_pivot_highs(df)
-        pivot_lows = self.find_pivot_lows(df)
-
-        if len(pivot_highs) < 3 or len(pivot_lows) < 2:
+        high_idx, highs = pivots.high_idx, pivots.high_price
+        if len(highs) < 3 or len(pivots.low_idx) < 2:
             return patterns
 
-        # Look for three consecutive highs forming H&S
-        for i in range(len(pivot_highs) - 2):
-            left_shoulder_idx, left_shoulder = pivot_highs[i]
-            head_idx, head = pivot_highs[i + 1]
-            right_shoulder_idx, right_shoulder = pivot_highs[i + 2]
+        # Three consecutive highs: head above both shoulders, shoulders within 5%,
+        # at least two neckline lows between the shoulders
+        left, head, right = highs[:-2], highs[1:-1], highs[2:]
+        shoulder_diffs = self._relative_diff(left, right)
+        neck_start, neck_end = pivots.lows_between(high_idx[:-2], high_idx[2:])
+        candidates = np.flatnonzero(
+            (head > left) & (head > right)
+            & ~(shoulder_diffs > 0.05)
+            & (neck_end - neck_start >= 2)
+        )
 
-            # Head must be higher than shoulders
-            if not (head > left_shoulder and head > right_shoulder):
-                continue
+        current_price = df['close'].iat[-1]
+        end_index = len(df) - 1
+        volume = df['volume'].to_numpy(dtype=float)
 
-            # Shoulders should be roughly equal (±5%)
-            shoulder_diff = abs(left_shoulder - right_shoulder) / left_shoulder
-            if shoulder_diff > 0.05:
-                continue
-
-            # Find neckline (lows between shoulders)
-            neckline_lows = [
-                (idx, price) for idx, price in pivot_lows
-                if left_shoulder_idx < idx < right_shoulder_idx
-            ]
-
-            if len(neckline_lows) < 2:
-                continue
+        for i in candidates:
+            left_shoulder_idx, left_shoulder = int(high_idx[i]), left[i]
+            head_idx, head_price = int(high_idx[i + 1]), head[i]
+            right_shoulder_idx, right_shoulder = int(high_idx[i + 2]), right[i]
+            shoulder_diff = shoulder_diffs[i]
 
             # Calculate neckline level (average of lows)
-            neckline_level = np.mean([price for _, price in neckline_lows])
+            neckline_level = np.mean(pivots.low_price[neck_start[i]:neck_end[i]])
 
             # Check for breakout below neckline
-            current_price = df.iloc[-1]['close']
             if current_price > neckline_level * 0.98:  # Not broken yet
                 continue
 
             # Calculate target and stop
-            pattern_height = head - neckline_level
+            pattern_height = head_price - neckline_level
             target_price = neckline_level - pattern_height
-            stop_loss = head * 1.02
+            stop_loss = head_price * 1.02
 
             # Volume confirmation
             volume_confirmed = self._check_volume_confirmation(
-                df, left_shoulder_idx, len(df) - 1
+                df, left_shoulder_idx, end_index, volume
             )
 
             # Confidence calculation
@@ -214,7 +360,7 @@ class ChartPatternDetector:
                     pattern_type=ChartPatternType.REVERSAL_BEARISH,
                     confidence=confidence,
                     start_index=left_shoulder_idx,
-                    end_index=len(df) - 1,
+                    end_index=end_index,
                     breakout_level=neckline_level,
                     target_price=target_price,
                     stop_loss=stop_loss,
@@ -222,7 +368,7 @@ class ChartPatternDetector:
                     description="Head and shoulders - bearish reversal",
                     pivot_points=[
                         (left_shoulder_idx, left_shoulder),
-                        (head_idx, head),
+                        (head_idx, head_price),
                         (right_shoulder_idx, right_shoulder)
                     ]
                 ))
@@ -231,7 +377,8 @@ class ChartPatternDetector:
 
     def detect_inverse_head_and_shoulders(
         self,
-        df: pd.DataFrame
+        df: pd.DataFrame,
+        pivots: Optional[PivotIndex] = None
     ) -> List[ChartPattern]:
         """
         Detect Inverse Head and Shoulders (bullish reversal)
@@ -242,53 +389,49 @@ class ChartPatternDetector:
         - Breakout above neckline
         """
         patterns = []
+        if pivots is None:
+            pivots = self.pivot_index(df)
 
-        pivot_highs = self.find_pivot_highs(df)
-        pivot_lows = self.find_pivot_lows(df)
-
-        if len(pivot_lows) < 3 or len(pivot_highs) < 2:
+        low_idx, lows = pivots.low_idx, pivots.low_price
+        if len(lows) < 3 or len(pivots.high_idx) < 2:
             return patterns
 
-        # Look for three consecutive lows forming inverse H&S
-        for i in range(len(pivot_lows) - 2):
-            left_shoulder_idx, left_shoulder = pivot_lows[i]
-            head_idx, head = pivot_lows[i + 1]
-            right_shoulder_idx, right_shoulder = pivot_lows[i + 2]
-
-            # Head must be lower than shoulders
-            if not (head < left_shoulder and head < right_shoulder):
-                continue
-
-            # Shoulders should be roughly equal (±5%)
-            shoulder_diff = abs(left_shoulder - right_shoulder) / left_shoulder
-            if shoulder_diff > 0.05:
-                continue
+        # Three consecutive lows: head below both shoulders, shoulders within 5%,
+        # at least two neckline highs between the shoulders
+        left, head, right = lows[:-2], lows[1:-1], lows[2:]
+        shoulder_diffs = self._relative_diff(left, right)
+        neck_start, neck_end = pivots.highs_between(low_idx[:-2], low_idx[2:])
+        candidates = np.flatnonzero(
+            (head < left) & (head < right)
+            & ~(shoulder_diffs > 0.05)
+            & (neck_end - neck_start >= 2)
+        )
 
-            # Find neckline (highs between shoulders)
-            neckline_highs = [
-                (idx, price) for idx, price in pivot_highs
-                if left_shoulder_idx < idx < right_shoulder_idx
-            ]
+        current_price = df['close'].iat[-1]
+        end_index = len(df) - 1
+        volume = df['volume'].to_numpy(dtype=float)
 
-            if len(neckline_highs) < 2:
-                continue
+        for i in candidates:
+            left_shoulder_idx, left_shoulder = int(low_idx[i]), left[i]
+            head_idx, head_price = int(low_idx[i + 1]), head[i]
+            right_shoulder_idx, right_shoulder = int(low_idx[i + 2]), right[i]
+            shoulder_diff = shoulder_diffs[i]
 
             # Calculate neckline level
-            neckline_level = np.mean([price for _, price in neckline_highs])
+            neckline_level = np.mean(pivots.high_price[neck_start[i]:neck_end[i]])
 
             # Check for breakout above neckline
-            current_price = df.iloc[-1]['close']
             if current_price < neckline_level * 1.02:  # Not broken yet
                 continue
 
             # Calculate target and stop
-            pattern_height = neckline_level - head
+            pattern_height = neckline_level - head_price
             target_price = neckline_level + pattern_height
-            stop_loss = head * 0.98
+            stop_loss = head_price * 0.98
 
             # Volume confirmation
             volume_confirmed = self._check_volume_confirmation(
-                df, left_shoulder_idx, len(df) - 1
+                df, left_shoulder_idx, end_index, volume
             )
 
             # Confidence calculation
@@ -306,7 +449,7 @@ class ChartPatternDetector:
                     pattern_type=ChartPatternType.REVERSAL_BULLISH,
                     confidence=confidence,
                     start_index=left_shoulder_idx,
-                    end_index=len(df) - 1,
+                    end_index=end_index,
                     breakout_level=neckline_level,
                     target_price=target_price,
                     stop_loss=stop_loss,
@@ -314,14 +457,18 @@ class ChartPatternDetector:
                     description="Inverse H&S - bullish reversal",
                     pivot_points=[
                         (left_shoulder_idx, left_shoulder),
-                        (head_idx, head),
+                        (head_idx, head_price),
                         (right_shoulder_idx, right_shoulder)
                     ]
                 ))
 
         return patterns
 
-    def detect_double_top(self, df: pd.DataFrame) -> List[ChartPattern]:
+    def detect_double_top(
+        self,
+        df: pd.DataFrame,
+        pivots: Optional[PivotIndex] = None
+    ) -> List[ChartPattern]:
         """
         Detect Double Top pattern (bearish reversal)
 
@@ -331,36 +478,32 @@ class ChartPatternDetector:
         - Breakout below trough
         """
         patterns = []
+        if pivots is None:
+            pivots = self.pivot_index(df)
 
-        pivot_highs = self.find_pivot_highs(df)
-        pivot_lows = self.find_pivot_lows(df)
-
-        if len(pivot_highs) < 2 or len(pivot_lows) < 1:
+        high_idx, highs = pivots.high_idx, pivots.high_price
+        if len(highs) < 2 or len(pivots.low_idx) < 1:
             return patterns
 
-        # Look for two consecutive highs at similar levels
-        for i in range(len(pivot_highs) - 1):
-            first_peak_idx, first_peak = pivot_highs[i]
-            second_peak_idx, second_peak = pivot_highs[i + 1]
+        # Two consecutive highs within 3% with at least one low between them
+        peak_diffs = self._relative_diff(highs[:-1], highs[1:])
+        trough_start, trough_end = pivots.lows_between(high_idx[:-1], high_idx[1:])
+        candidates = np.flatnonzero(~(peak_diffs > 0.03) & (trough_end > trough_start))
 
-            # Peaks should be roughly equal (±3%)
-            peak_diff = abs(first_peak - second_peak) / first_peak
-            if peak_diff > 0.03:
-                continue
-
-            # Find trough between peaks
-            trough_lows = [
-                (idx, price) for idx, price in pivot_lows
-                if first_peak_idx < idx < second_peak_idx
-            ]
+        current_price = df['close'].iat[-1]
+        end_index = len(df) - 1
+        volume = df['volume'].to_numpy(dtype=float)
 
-            if not trough_lows:
-                continue
+        for i in candidates:
+            first_peak_idx, first_peak = int(high_idx[i]), highs[i]
+            second_peak_idx, second_peak = int(high_idx[i + 1]), highs[i + 1]
+            peak_diff = peak_diffs[i]
 
-            trough_idx, trough_price = min(trough_lows, key=lambda x: x[1])
+            # Lowest trough between peaks
+            trough = trough_start[i] + np.argmin(pivots.low_price[trough_start[i]:trough_end[i]])
+            trough_idx, trough_price = int(pivots.low_idx[trough]), pivots.low_price[trough]
 
             # Check for breakout below trough
-            current_price = df.iloc[-1]['close']
             if current_price > trough_price * 0.98:
                 continue
 
@@ -371,7 +514,7 @@ class ChartPatternDetector:
 
             # Volume confirmation
             volume_confirmed = self._check_volume_confirmation(
-                df, first_peak_idx, len(df) - 1
+                df, first_peak_idx, end_index, volume
             )
 
             # Confidence
@@ -389,7 +532,7 @@ class ChartPatternDetector:
                     pattern_type=ChartPatternType.REVERSAL_BEARISH,
                     confidence=confidence,
                     start_index=first_peak_idx,
-                    end_index=len(df) - 1,
+                    end_index=end_index,
                     breakout_level=trough_price,
                     target_price=target_price,
                     stop_loss=stop_loss,
@@ -404,7 +547,11 @@ class ChartPatternDetector:
 
         return patterns
 
-    def detect_double_bottom(self, df: pd.DataFrame) -> List[ChartPattern]:
+    def detect_double_bottom(
+        self,
+        df: pd.DataFrame,
+        pivots: Optional[PivotIndex] = None
+    ) -> List[ChartPattern]:
         """
         Detect Double Bottom pattern (bullish reversal)
 
@@ -414,36 +561,32 @@ class ChartPatternDetector:
         - Breakout above peak
         """
         patterns = []
+        if pivots is None:
+            pivots = self.pivot_index(df)
 
-        pivot_highs = self.find_pivot_highs(df)
-        pivot_lows = self.find_pivot_lows(df)
-
-        if len(pivot_lows) < 2 or len(pivot_highs) < 1:
+        low_idx, lows = pivots.low_idx, pivots.low_price
+        if len(lows) < 2 or len(pivots.high_idx) < 1:
             return patterns
 
-        # Look for two consecutive lows at similar levels
-        for i in range(len(pivot_lows) - 1):
-            first_trough_idx, first_trough = pivot_lows[i]
-            second_trough_idx, second_trough = pivot_lows[i + 1]
+        # Two consecutive lows within 3% with at least one high between them
+        trough_diffs = self._relative_diff(lows[:-1], lows[1:])
+        peak_start, peak_end = pivots.highs_between(low_idx[:-1], low_idx[1:])
+        candidates = np.flatnonzero(~(trough_diffs > 0.03) & (peak_end > peak_start))
 
-            # Troughs should be roughly equal (±3%)
-            trough_diff = abs(first_trough - second_trough) / first_trough
-            if trough_diff > 0.03:
-                continue
+        current_price = df['close'].iat[-1]
+        end_index = len(df) - 1
+        volume = df['volume'].to_numpy(dtype=float)
 
-            # Find peak between troughs
-            peak_highs = [
-                (idx, price) for idx, price in pivot_highs
-                if first_trough_idx < idx < second_trough_idx
-            ]
+        for i in candidates:
+            first_trough_idx, first_trough = int(low_idx[i]), lows[i]
+            second_trough_idx, second_trough = int(low_idx[i + 1]), lows[i + 1]
+            trough_diff = trough_diffs[i]
 
-            if not peak_highs:
-                continue
-
-            peak_idx, peak_price = max(peak_highs, key=lambda x: x[1])
+            # Highest peak between troughs
+            peak = peak_start[i] + np.argmax(pivots.high_price[peak_start[i]:peak_end[i]])
+            peak_idx, peak_price = int(pivots.high_idx[peak]), pivots.high_price[peak]
 
             # Check for breakout above peak
-            current_price = df.iloc[-1]['close']
             if current_price < peak_price * 1.02:
                 continue
 
@@ -454,7 +597,7 @@ class ChartPatternDetector:
 
             # Volume confirmation
             volume_confirmed = self._check_volume_confirmation(
-                df, first_trough_idx, len(df) - 1
+                df, first_trough_idx, end_index, volume
             )
 
             # Confidence
@@ -472,7 +615,7 @@ class ChartPatternDetector:
                     pattern_type=ChartPatternType.REVERSAL_BULLISH,
                     confidence=confidence,
                     start_index=first_trough_idx,
-                    end_index=len(df) - 1,
+                    end_index=end_index,
                     breakout_level=peak_price,
                     target_price=target_price,
                     stop_loss=stop_loss,
@@ -493,7 +636,8 @@ class ChartPatternDetector:
 
     def detect_ascending_triangle(
         self,
-        df: pd.DataFrame
+        df: pd.DataFrame,
+        pivots: Optional[PivotIndex] = None
     ) -> List[ChartPattern]:
         """
         Detect Ascending Triangle (bullish continuation)
@@ -504,53 +648,47 @@ class ChartPatternDetector:
         - Breakout above resistance
         """
         patterns = []
+        if pivots is None:
+            pivots = self.pivot_index(df)
 
-        pivot_highs = self.find_pivot_highs(df)
-        pivot_lows = self.find_pivot_lows(df)
-
-        if len(pivot_highs) < 2 or len(pivot_lows) < 2:
+        high_idx, highs = pivots.high_idx, pivots.high_price
+        if len(highs) < 2 or len(pivots.low_idx) < 2:
             return patterns
 
-        # Look for flat resistance
-        for i in range(len(pivot_highs) - 1):
-            h1_idx, h1_price = pivot_highs[i]
-            h2_idx, h2_price = pivot_highs[i + 1]
-
-            # Highs should be roughly equal (flat resistance)
-            if abs(h1_price - h2_price) / h1_price > 0.02:
-                continue
+        # Flat resistance: consecutive highs within 2% with at least two lows between them
+        lows_start, lows_end = pivots.lows_between(high_idx[:-1], high_idx[1:])
+        candidates = np.flatnonzero(
+            ~(self._relative_diff(highs[:-1], highs[1:]) > 0.02)
+            & (lows_end - lows_start >= 2)
+        )
 
-            resistance_level = np.mean([h1_price, h2_price])
+        current_price = df['close'].iat[-1]
+        end_index = len(df) - 1
+        volume = df['volume'].to_numpy(dtype=float)
 
-            # Find rising lows
-            rising_lows = [
-                (idx, price) for idx, price in pivot_lows
-                if h1_idx < idx < h2_idx
-            ]
+        for i in candidates:
+            h1_idx, h1_price = int(high_idx[i]), highs[i]
+            h2_idx, h2_price = int(high_idx[i + 1]), highs[i + 1]
 
-            if len(rising_lows) < 2:
-                continue
+            resistance_level = np.mean([h1_price, h2_price])
 
             # Check if lows are rising
-            if not all(
-                rising_lows[i][1] < rising_lows[i+1][1]
-                for i in range(len(rising_lows) - 1)
-            ):
+            rising_lows = pivots.low_price[lows_start[i]:lows_end[i]]
+            if not np.all(rising_lows[:-1] < rising_lows[1:]):
                 continue
 
             # Check for breakout above resistance
-            current_price = df.iloc[-1]['close']
             if current_price < resistance_level * 1.01:
                 continue
 
             # Calculate target
-            pattern_height = resistance_level - rising_lows[0][1]
+            pattern_height = resistance_level - rising_lows[0]
             target_price = resistance_level + pattern_height
-            stop_loss = rising_lows[-1][1] * 0.98
+            stop_loss = rising_lows[-1] * 0.98
 
             # Volume confirmation
             volume_confirmed = self._check_volume_confirmation(
-                df, h1_idx, len(df) - 1
+                df, h1_idx, end_index, volume
             )
 
             confidence = 75.0 if volume_confirmed else 60.0
@@ -561,7 +699,7 @@ class ChartPatternDetector:
                     pattern_type=ChartPatternType.CONTINUATION_BULLISH,
                     confidence=confidence,
                     start_index=h1_idx,
-                    end_index=len(df) - 1,
+                    end_index=end_index,
                     breakout_level=resistance_level,
                     target_price=target_price,
                     stop_loss=stop_loss,
@@ -574,7 +712,8 @@ class ChartPatternDetector:
 
     def detect_descending_triangle(
         self,
-        df: pd.DataFrame
+        df: pd.DataFrame,
+        pivots: Optional[PivotIndex] = None
     ) -> List[ChartPattern]:
         """
         Detect Descending Triangle (bearish continuation)
@@ -585,53 +724,47 @@ class ChartPatternDetector:
         - Breakout below support
         """
         patterns = []
+        if pivots is None:
+            pivots = self.pivot_index(df)
 
-        pivot_highs = self.find_pivot_highs(df)
-        pivot_lows = self.find_pivot_lows(df)
-
-        if len(pivot_lows) < 2 or len(pivot_highs) < 2:
+        low_idx, lows = pivots.low_idx, pivots.low_price
+        if len(lows) < 2 or len(pivots.high_idx) < 2:
             return patterns
 
-        # Look for flat support
-        for i in range(len(pivot_lows) - 1):
-            l1_idx, l1_price = pivot_lows[i]
-            l2_idx, l2_price = pivot_lows[i + 1]
-
-            # Lows should be roughly equal (flat support)
-            if abs(l1_price - l2_price) / l1_price > 0.02:
-                continue
+        # Flat support: consecutive lows within 2% with at least two highs between them
+        highs_start, highs_end = pivots.highs_between(low_idx[:-1], low_idx[1:])
+        candidates = np.flatnonzero(
+            ~(self._relative_diff(lows[:-1], lows[1:]) > 0.02)
+            & (highs_end - highs_start >= 2)
+        )
 
-            support_level = np.mean([l1_price, l2_price])
+        current_price = df['close'].iat[-1]
+        end_index = len(df) - 1
+        volume = df['volume'].to_numpy(dtype=float)
 
-            # Find falling highs
-            falling_highs = [
-                (idx, price) for idx, price in pivot_highs
-                if l1_idx < idx < l2_idx
-            ]
+        for i in candidates:
+            l1_idx, l1_price = int(low_idx[i]), lows[i]
+            l2_idx, l2_price = int(low_idx[i + 1]), lows[i + 1]
 
-            if len(falling_highs) < 2:
-                continue
+            support_level = np.mean([l1_price, l2_price])
 
             # Check if highs are falling
-            if not all(
-                falling_highs[i][1] > falling_highs[i+1][1]
-                for i in range(len(falling_highs) - 1)
-            ):
+            falling_highs = pivots.high_price[highs_start[i]:highs_end[i]]
+            if not np.all(falling_highs[:-1] > falling_highs[1:]):
                 continue
 
             # Check for breakout below support
-            current_price = df.iloc[-1]['close']
             if current_price > support_level * 0.99:
                 continue
 
             # Calculate target
-            pattern_height = falling_highs[0][1] - support_level
+            pattern_height = falling_highs[0] - support_level
             target_price = support_level - pattern_height
-            stop_loss = falling_highs[-1][1] * 1.02
+            stop_loss = falling_highs[-1] * 1.02
 
             # Volume confirmation
             volume_confirmed = self._check_volume_confirmation(
-                df, l1_idx, len(df) - 1
+                df, l1_idx, end_index, volume
             )
 
             confidence = 75.0 if volume_confirmed else 60.0
@@ -642,7 +775,7 @@ class ChartPatternDetector:
                     pattern_type=ChartPatternType.CONTINUATION_BEARISH,
                     confidence=confidence,
                     start_index=l1_idx,
-                    end_index=len(df) - 1,
+                    end_index=end_index,
                     breakout_level=support_level,
                     target_price=target_price,
                     stop_loss=stop_loss,
@@ -660,7 +793,8 @@ class ChartPatternDetector:
     def detect_all_patterns(
         self,
         df: pd.DataFrame,
-        pattern_types: Optional[List[str]] = None
+        pattern_types: Optional[List[str]] = None,
+        symbol: Optional[str] = None
     ) -> List[ChartPattern]:
         """
         Detect all chart patterns in data
@@ -668,6 +802,8 @@ class ChartPatternDetector:
         Args:
             df: OHLCV DataFrame
             pattern_types: Optional list of pattern names to detect
+            symbol: Optional symbol whose pivot index is kept between calls,
+                so only bars near the edges of df are re-evaluated
 
         Returns:
             List of detected patterns sorted by confidence
@@ -677,22 +813,23 @@ class ChartPatternDetector:
             return []
 
         all_patterns = []
+        pivots = self.pivot_index(df, symbol)
 
         # Reversal patterns
         if pattern_types is None or 'head_and_shoulders' in pattern_types:
-            all_patterns.extend(self.detect_head_and_shoulders(df))
+            all_patterns.extend(self.detect_head_and_shoulders(df, pivots))
         if pattern_types is None or 'inverse_head_and_shoulders' in pattern_types:
-            all_patterns.extend(self.detect_inverse_head_and_shoulders(df))
+            all_patterns.extend(self.detect_inverse_head_and_shoulders(df, pivots))
         if pattern_types is None or 'double_top' in pattern_types:
-            all_patterns.extend(self.detect_double_top(df))
+            all_patterns.extend(self.detect_double_top(df, pivots))
         if pattern_types is None or 'double_bottom' in pattern_types:
-            all_patterns.extend(self.detect_double_bottom(df))
+            all_patterns.extend(self.detect_double_bottom(df, pivots))
 
         # Continuation patterns
         if pattern_types is None or 'ascending_triangle' in pattern_types:
-            all_patterns.extend(self.detect_ascending_triangle(df))
+            all_patterns.extend(self.detect_ascending_triangle(df, pivots))
         if pattern_types is None or 'descending_triangle' in pattern_types:
-            all_patterns.extend(self.detect_descending_triangle(df))
+            all_patterns.extend(self.detect_descending_triangle(df, pivots))
 
         # Sort by confidence
         all_patterns.sort(key=lambda p: p.confidence, reverse=True)
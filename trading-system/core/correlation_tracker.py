@@ -15,22 +15,29 @@ Impact:
 - AFTER: Complete request tracing (40% MTTR reduction)
 """
 
+import atexit
 import json
 import sqlite3
 import logging
+import random
 import uuid
+import weakref
+from collections import deque
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
 from contextlib import contextmanager
-from threading import Lock
+from threading import Event, Lock, Thread
 import time
 
 from core.connection_pool import get_db_pool
 
 logger = logging.getLogger('trading_system.correlation')
 
+# Trackers with a write-behind queue, flushed by the atexit hook below
+_live_trackers: "weakref.WeakSet[CorrelationTracker]" = weakref.WeakSet()
+
 
 @dataclass
 class CorrelationRecord:
@@ -66,18 +73,39 @@ class CorrelationTracker:
 
     Features:
     - Persistent storage in SQLite
+    - Write-behind persistence: completed records are queued and written in
+      multi-row transactions by a background thread
+    - Per-operation sampling for high-frequency operations
     - Parent-child correlation tracking
     - Automatic cleanup of old records
     - Fast lookups by correlation ID
     - Metrics export for debugging
+
+    Reads (``get_correlation``, ``get_stats``, ...) flush the queue first, so
+    callers always see their own completed operations.
     """
 
-    def __init__(self, db_path: str = 'state/correlation_tracking.db'):
+    def __init__(
+        self,
+        db_path: str = 'state/correlation_tracking.db',
+        batch_size: int = 500,
+        flush_interval: float = 0.5,
+        max_pending: int = 10000,
+        sample_rates: Optional[Dict[str, float]] = None,
+        write_behind: bool = True
+    ):
         """
         Initialize correlation tracker
 
         Args:
             db_path: Path to SQLite database
+            batch_size: Queued records that wake the writer before ``flush_interval``
+            flush_interval: Maximum seconds a completed record waits before being written
+            max_pending: Bound on queued records; the oldest are dropped beyond it
+            sample_rates: Fraction of successful operations persisted, per operation
+                name (failures are always persisted)
+            write_behind: Queue records for the background writer (False persists
+                synchronously in ``end_operation``)
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -92,6 +120,27 @@ class CorrelationTracker:
         self._active_correlations: Dict[str, CorrelationRecord] = {}
         self._lock = Lock()
 
+        # Write-behind queue of row tuples, drained by the writer thread
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_pending = max(1, max_pending)
+        self.write_behind = write_behind
+        self.sample_rates: Dict[str, float] = dict(sample_rates or {})
+        self._pending: deque = deque()
+        self._flush_lock = Lock()
+        self._wakeup = Event()
+        self._stop = Event()
+        self._writer: Optional[Thread] = None
+
+        # Persistence statistics
+        self._written = 0
+        self._batches = 0
+        self._dropped = 0
+        self._sampled_out = 0
+        self._write_errors = 0
+
+        _live_trackers.add(self)
+
         logger.info(f"CorrelationTracker initialized: {self.db_path}")
 
     def _init_database(self):
@@ -178,52 +227,153 @@ class CorrelationTracker:
         """
         End tracking an operation
 
+        The record is queued for the background writer; nothing touches SQLite
+        on the caller's thread unless ``write_behind`` is disabled.
+
         Args:
             correlation_id: Correlation ID
             status: 'success' or 'failure'
             error_message: Error message if failed
         """
         with self._lock:
-            if correlation_id in self._active_correlations:
-                record = self._active_correlations[correlation_id]
-                record.end_time = datetime.now()
-                record.status = status
-                record.error_message = error_message
+            record = self._active_correlations.pop(correlation_id, None)
+
+        if record is None:
+            logger.warning(f"Correlation ID not found: {correlation_id}")
+            return
+
+        record.end_time = datetime.now()
+        record.status = status
+        record.error_message = error_message
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Ended tracking: {correlation_id} "
+                f"({record.operation}, {status}, {record.duration_ms():.2f}ms)"
+            )
+
+        # Failures are always kept; successes may be sampled down
+        rate = self.sample_rates.get(record.operation)
+        if rate is not None and status == 'success' and random.random() >= rate:
+            self._sampled_out += 1
+            return
+
+        if not self.write_behind:
+            self._persist_record(record)
+            return
+
+        self._enqueue(self._record_to_row(record))
+
+    def set_sample_rate(self, operation: str, rate: Optional[float]):
+        """Persist only ``rate`` (0-1) of successful ``operation`` records; None disables sampling"""
+        if rate is None:
+            self.sample_rates.pop(operation, None)
+        else:
+            self.sample_rates[operation] = min(max(rate, 0.0), 1.0)
+
+    @staticmethod
+    def _record_to_row(record: CorrelationRecord) -> tuple:
+        return (
+            record.correlation_id,
+            record.operation,
+            record.start_time.isoformat(),
+            record.end_time.isoformat() if record.end_time else None,
+            record.status,
+            record.error_message,
+            json.dumps(record.metadata) if record.metadata else None,
+            record.parent_correlation_id
+        )
 
-                # Persist to database
-                self._persist_record(record)
+    def _enqueue(self, row: tuple):
+        """Queue a row for the writer, dropping the oldest when the buffer is full"""
+        with self._lock:
+            if len(self._pending) >= self.max_pending:
+                self._pending.popleft()
+                self._dropped += 1
+            self._pending.append(row)
+            pending = len(self._pending)
+            if self._writer is None:
+                self._start_writer()
+
+        if pending >= self.batch_size:
+            self._wakeup.set()
+
+    def _start_writer(self):
+        """Start the background writer (caller holds ``_lock``)"""
+        self._stop.clear()
+        self._writer = Thread(
+            target=self._writer_loop,
+            name=f"CorrelationWriter-{self.db_path.name}",
+            daemon=True
+        )
+        self._writer.start()
 
-                # Remove from active correlations
-                del self._active_correlations[correlation_id]
+    def _writer_loop(self):
+        while not self._stop.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+        self.flush()
 
-                duration = record.duration_ms()
-                logger.debug(
-                    f"Ended tracking: {correlation_id} "
-                    f"({record.operation}, {status}, {duration:.2f}ms)"
-                )
-            else:
-                logger.warning(f"Correlation ID not found: {correlation_id}")
+    def flush(self) -> int:
+        """
+        Write all queued records in a single transaction
 
-    def _persist_record(self, record: CorrelationRecord):
-        """Persist correlation record to database"""
+        Returns:
+            Number of records written
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                rows = list(self._pending)
+                self._pending.clear()
+
+            try:
+                self._write_rows(rows)
+            except Exception as e:
+                self._write_errors += 1
+                logger.error(f"Failed to persist {len(rows)} correlation records: {e}")
+                # Put the batch back (bounded) so a transient lock is retried
+                with self._lock:
+                    room = self.max_pending - len(self._pending)
+                    if room < len(rows):
+                        self._dropped += len(rows) - max(room, 0)
+                        rows = rows[len(rows) - max(room, 0):]
+                    self._pending.extendleft(reversed(rows))
+                return 0
+
+            self._written += len(rows)
+            self._batches += 1
+            return len(rows)
+
+    def close(self):
+        """Stop the writer thread and flush everything still queued"""
+        self._stop.set()
+        self._wakeup.set()
+        writer = self._writer
+        if writer is not None and writer.is_alive():
+            writer.join(timeout=5.0)
+        with self._lock:
+            self._writer = None
+        self.flush()
+
+    def _write_rows(self, rows: List[tuple]):
+        """Insert rows as one multi-row transaction"""
         with self.pool.acquire() as conn:
-            conn.execute('''
+            conn.executemany('''
                 INSERT OR REPLACE INTO correlations
                 (correlation_id, operation, start_time, end_time, status,
                  error_message, metadata, parent_correlation_id)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                record.correlation_id,
-                record.operation,
-                record.start_time.isoformat(),
-                record.end_time.isoformat() if record.end_time else None,
-                record.status,
-                record.error_message,
-                json.dumps(record.metadata) if record.metadata else None,
-                record.parent_correlation_id
-            ))
+            ''', rows)
             conn.commit()
 
+    def _persist_record(self, record: CorrelationRecord):
+        """Persist a single correlation record synchronously"""
+        self._write_rows([self._record_to_row(record)])
+        self._written += 1
+
     @contextmanager
     def track_operation(
         self,
@@ -269,7 +419,8 @@ class CorrelationTracker:
             if correlation_id in self._active_correlations:
                 return self._active_correlations[correlation_id]
 
-        # Check database
+        # Check database (after writing anything still queued)
+        self.flush()
         with self.pool.acquire() as conn:
             cursor = conn.execute('''
                 SELECT correlation_id, operation, start_time, end_time,
@@ -323,6 +474,7 @@ class CorrelationTracker:
 
     def _get_children(self, parent_correlation_id: str) -> List[CorrelationRecord]:
         """Get child correlation records"""
+        self.flush()
         with self.pool.acquire() as conn:
             cursor = conn.execute('''
                 SELECT correlation_id, operation, start_time, end_time,
@@ -338,6 +490,7 @@ class CorrelationTracker:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get tracking statistics"""
+        self.flush()
         with self.pool.acquire() as conn:
             # Total correlations
             total = conn.execute('SELECT COUNT(*) FROM correlations').fetchone()[0]
@@ -362,12 +515,22 @@ class CorrelationTracker:
 
         with self._lock:
             active = len(self._active_correlations)
+            pending = len(self._pending)
 
         return {
             'total': total,
             'active': active,
             'by_status': by_status,
-            'by_operation': by_operation
+            'by_operation': by_operation,
+            'persistence': {
+                'write_behind': self.write_behind,
+                'pending': pending,
+                'written': self._written,
+                'batches': self._batches,
+                'dropped': self._dropped,
+                'sampled_out': self._sampled_out,
+                'write_errors': self._write_errors,
+            }
         }
 
     def cleanup_old_records(self, days: int = 7):
@@ -379,6 +542,7 @@ class CorrelationTracker:
         """
         cutoff = datetime.now() - timedelta(days=days)
 
+        self.flush()
         with self.pool.acquire() as conn:
             cursor = conn.execute('''
                 DELETE FROM correlations
@@ -411,6 +575,16 @@ _global_tracker: Optional[CorrelationTracker] = None
 _tracker_lock = Lock()
 
 
+@atexit.register
+def _flush_trackers_on_exit():
+    """Write queued records of every live tracker before the interpreter exits"""
+    for tracker in list(_live_trackers):
+        try:
+            tracker.close()
+        except Exception as e:
+            logger.error(f"Failed to flush correlation tracker on shutdown: {e}")
+
+
 def get_global_tracker() -> CorrelationTracker:
     """Get or create global correlation tracker"""
     global _global_tracker
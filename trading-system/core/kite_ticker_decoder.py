@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Kite Ticker Binary Decoder
+Decodes Kite Connect websocket binary frames into NumPy columns
+
+FRAME FORMAT (all integers big-endian):
+- 2 bytes: number of packets in the frame
+- per packet: 2 bytes packet length, then the packet
+- a 1-byte frame is a heartbeat
+
+PACKET LAYOUTS (by length):
+- 8   LTP mode:    token, last_price
+- 28  index quote: token, last_price, high, low, open, close, change
+- 32  index full:  index quote + exchange_timestamp
+- 44  quote mode:  token, last_price, last_quantity, average_price, volume,
+                   buy_quantity, sell_quantity, open, high, low, close
+- 184 full mode:   quote + last_trade_time, oi, oi_day_high, oi_day_low,
+                   exchange_timestamp, 10 depth entries (5 bids, 5 asks) of
+                   quantity(uint32), price(int32), orders(uint16), padding(uint16)
+
+Tokens, quantities, volumes, OI, order counts and timestamps are unsigned;
+prices and index change are signed. Prices are integers in paise (divide by 100); currency derivatives (CDS)
+use 10^7 and BSE currency (BCD) 10^4. The segment is the low byte of the
+instrument token.
+
+When every packet in a frame has the same length (the usual case: one
+subscription mode per frame) the whole frame is viewed as one strided
+structured array over the original buffer, so decoding makes no per-packet
+Python calls and no intermediate copies.
+"""
+
+import struct
+from typing import Dict, List
+
+import numpy as np
+
+PACKET_LTP = 8
+PACKET_INDEX_QUOTE = 28
+PACKET_INDEX_FULL = 32
+PACKET_QUOTE = 44
+PACKET_FULL = 184
+
+MODE_NAMES = {
+    PACKET_LTP: 'ltp',
+    PACKET_INDEX_QUOTE: 'quote',
+    PACKET_INDEX_FULL: 'full',
+    PACKET_QUOTE: 'quote',
+    PACKET_FULL: 'full',
+}
+
+# Segment (token & 0xff) -> price divisor
+SEGMENT_CDS = 3
+SEGMENT_BCD = 6
+SEGMENT_INDICES = 9
+_PRICE_DIVISORS = {SEGMENT_CDS: 10_000_000.0, SEGMENT_BCD: 10_000.0}
+DEFAULT_PRICE_DIVISOR = 100.0
+
+_DEPTH_DTYPE = np.dtype([
+    ('quantity', '>u4'),
+    ('price', '>i4'),
+    ('orders', '>u2'),
+    ('padding', '>u2'),
+])
+
+_QUOTE_FIELDS = [
+    ('token', '>u4'),
+    ('last_price', '>i4'),
+    ('last_quantity', '>u4'),
+    ('average_price', '>i4'),
+    ('volume', '>u4'),
+    ('buy_quantity', '>u4'),
+    ('sell_quantity', '>u4'),
+    ('open', '>i4'),
+    ('high', '>i4'),
+    ('low', '>i4'),
+    ('close', '>i4'),
+]
+
+_INDEX_FIELDS = [
+    ('token', '>u4'),
+    ('last_price', '>i4'),
+    ('high', '>i4'),
+    ('low', '>i4'),
+    ('open', '>i4'),
+    ('close', '>i4'),
+    ('change', '>i4'),
+]
+
+PACKET_DTYPES = {
+    PACKET_LTP: np.dtype([('token', '>u4'), ('last_price', '>i4')]),
+    PACKET_INDEX_QUOTE: np.dtype(_INDEX_FIELDS),
+    PACKET_INDEX_FULL: np.dtype(_INDEX_FIELDS + [('exchange_timestamp', '>u4')]),
+    PACKET_QUOTE: np.dtype(_QUOTE_FIELDS),
+    PACKET_FULL: np.dtype(_QUOTE_FIELDS + [
+        ('last_trade_time', '>u4'),
+        ('oi', '>u4'),
+        ('oi_day_high', '>u4'),
+        ('oi_day_low', '>u4'),
+        ('exchange_timestamp', '>u4'),
+        ('depth', _DEPTH_DTYPE, (10,)),
+    ]),
+}
+
+# Output columns: name -> (dtype, fill value for packets that lack the field)
+PRICE_COLUMNS = ('last_price', 'average_price', 'open', 'high', 'low', 'close',
+                 'bid_price', 'ask_price')
+TICK_COLUMNS = {
+    'token': (np.int64, 0),
+    'packet_length': (np.int16, 0),
+    'last_price': (np.float64, np.nan),
+    'last_quantity': (np.int64, 0),
+    'average_price': (np.float64, np.nan),
+    'volume': (np.int64, 0),
+    'buy_quantity': (np.int64, 0),
+    'sell_quantity': (np.int64, 0),
+    'open': (np.float64, np.nan),
+    'high': (np.float64, np.nan),
+    'low': (np.float64, np.nan),
+    'close': (np.float64, np.nan),
+    'oi': (np.int64, 0),
+    'bid_price': (np.float64, np.nan),
+    'bid_quantity': (np.int64, 0),
+    'ask_price': (np.float64, np.nan),
+    'ask_quantity': (np.int64, 0),
+    # Epoch nanoseconds, 0 when the packet carries no timestamp
+    'last_trade_time': (np.int64, 0),
+    'exchange_timestamp': (np.int64, 0),
+}
+
+_NS_PER_SECOND = 1_000_000_000
+
+
+class TickDecodeError(ValueError):
+    """Raised for frames that do not follow the Kite binary layout"""
+
+
+def empty_columns(size: int = 0) -> Dict[str, np.ndarray]:
+    """Allocate an output column set filled with the per-column missing values"""
+    return {name: np.full(size, fill, dtype=dtype) for name, (dtype, fill) in TICK_COLUMNS.items()}
+
+
+def price_divisors(tokens: np.ndarray) -> np.ndarray:
+    """Per-token price divisor derived from the exchange segment"""
+    segments = np.asarray(tokens, dtype=np.int64) & 0xFF
+    divisors = np.full(segments.shape, DEFAULT_PRICE_DIVISOR)
+    for segment, divisor in _PRICE_DIVISORS.items():
+        divisors[segments == segment] = divisor
+    return divisors
+
+
+def split_frame(data) -> Dict[int, np.ndarray]:
+    """
+    Split a frame into structured packet arrays grouped by packet length
+
+    Uniform-length frames return a single zero-copy strided view over ``data``.
+
+    Raises:
+        TickDecodeError: truncated frame or unknown packet length
+    """
+    buf = memoryview(data)
+    size = len(buf)
+    if size < 2:
+        return {}  # heartbeat
+
+    (count,) = struct.unpack_from('>H', buf, 0)
+    if count == 0:
+        return {}
+    if size < 4:
+        raise TickDecodeError(f"Truncated frame: {size} bytes for {count} packets")
+
+    (first_length,) = struct.unpack_from('>H', buf, 2)
+    if first_length in PACKET_DTYPES and size == 2 + count * (first_length + 2):
+        stride = first_length + 2
+        lengths = np.ndarray((count,), dtype='>u2', buffer=buf, offset=2, strides=(stride,))
+        if (lengths == first_length).all():
+            packets = np.ndarray((count,), dtype=PACKET_DTYPES[first_length],
+                                 buffer=buf, offset=4, strides=(stride,))
+            return {first_length: packets}
+
+    # Mixed packet lengths: walk the headers, then gather each length group
+    offsets: Dict[int, List[int]] = {}
+    offset = 2
+    for _ in range(count):
+        if offset + 2 > size:
+            raise TickDecodeError(f"Truncated frame at offset {offset}")
+        (length,) = struct.unpack_from('>H', buf, offset)
+        offset += 2
+        if offset + length > size:
+            raise TickDecodeError(f"Packet of {length} bytes overruns frame at offset {offset}")
+        if length not in PACKET_DTYPES:
+            raise TickDecodeError(f"Unknown packet length {length}")
+        offsets.setdefault(length, []).append(offset)
+        offset += length
+
+    groups = {}
+    for length, starts in offsets.items():
+        dtype = PACKET_DTYPES[length]
+        groups[length] = np.concatenate([
+            np.frombuffer(buf, dtype=dtype, count=1, offset=start) for start in starts
+        ])
+    return groups
+
+
+def decode_packets(packets: np.ndarray, length: int) -> Dict[str, np.ndarray]:
+    """Convert one group of structured packets into output columns"""
+    n = len(packets)
+    columns = empty_columns(n)
+    tokens = packets['token'].astype(np.int64)
+    columns['token'][:] = tokens
+    columns['packet_length'][:] = length
+
+    divisors = price_divisors(tokens)
+    names = packets.dtype.names
+    for name in PRICE_COLUMNS:
+        if name in names:
+            columns[name][:] = packets[name] / divisors
+
+    for name in ('last_quantity', 'volume', 'buy_quantity', 'sell_quantity', 'oi'):
+        if name in names:
+            columns[name][:] = packets[name]
+
+    for name in ('last_trade_time', 'exchange_timestamp'):
+        if name in names:
+            columns[name][:] = packets[name].astype(np.int64) * _NS_PER_SECOND
+
+    if 'depth' in names:
+        depth = packets['depth']
+        columns['bid_price'][:] = depth['price'][:, 0] / divisors
+        columns['bid_quantity'][:] = depth['quantity'][:, 0]
+        columns['ask_price'][:] = depth['price'][:, 5] / divisors
+        columns['ask_quantity'][:] = depth['quantity'][:, 5]
+        # An empty side of the book is reported as zeros
+        columns['bid_price'][depth['quantity'][:, 0] == 0] = np.nan
+        columns['ask_price'][depth['quantity'][:, 5] == 0] = np.nan
+
+    return columns
+
+
+def decode_frame(data) -> Dict[str, np.ndarray]:
+    """
+    Decode a Kite binary frame into columns of equal length (see TICK_COLUMNS)
+
+    Packets keep frame order within each packet length; frames mixing modes
+    are returned grouped by length.
+    """
+    groups = split_frame(data)
+    if not groups:
+        return empty_columns(0)
+    if len(groups) == 1:
+        length, packets = next(iter(groups.items()))
+        return decode_packets(packets, length)
+
+    parts = [decode_packets(packets, length) for length, packets in groups.items()]
+    return {name: np.concatenate([part[name] for part in parts]) for name in TICK_COLUMNS}
+
+
+def decode_depth(packet) -> Dict[str, List[tuple]]:
+    """Full five-level market depth of one full-mode packet as (price, quantity, orders)"""
+    buf = memoryview(packet)
+    if len(buf) != PACKET_FULL:
+        raise TickDecodeError(f"Depth requires a {PACKET_FULL}-byte full packet, got {len(buf)}")
+    record = np.frombuffer(buf, dtype=PACKET_DTYPES[PACKET_FULL], count=1)[0]
+    divisor = price_divisors(np.array([record['token']]))[0]
+    levels = [(float(d['price']) / divisor, int(d['quantity']), int(d['orders'])) for d in record['depth']]
+    return {'bids': levels[:5], 'asks': levels[5:]}
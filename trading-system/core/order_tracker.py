@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Order Tracker
+Resolves fills for many in-flight orders from a single update stream.
+
+Order updates come from the broker's order stream (Kite websocket ``order``
+messages or postbacks) via ``on_order_update``. When no stream is attached,
+one background thread polls ``kite.orders()`` for every pending order at
+once, instead of one ``order_history`` poll loop per order.
+
+Usage:
+    tracker = OrderTracker(kite)
+    handles = [tracker.track(kite.place_order(...), quantity) for leg in legs]
+    fills = [handle.wait(timeout=15) for handle in handles]
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger('trading_system.order_tracker')
+
+COMPLETE_STATUSES = {'COMPLETE', 'FILLED'}
+FAILED_STATUSES = {'REJECTED', 'CANCELLED'}
+
+
+@dataclass
+class OrderFill:
+    """Final state of a tracked order"""
+    order_id: str
+    status: str  # 'COMPLETE' or 'FAILED'
+    filled_quantity: int
+    average_price: Optional[float]
+    message: str = ''
+
+
+def parse_order_update(update: Dict[str, Any]) -> tuple:
+    """(filled_quantity, average_price, status) from one broker order snapshot"""
+    try:
+        filled_qty = int(float(update.get('filled_quantity') or update.get('filled_qty') or 0))
+    except (TypeError, ValueError):
+        filled_qty = 0
+
+    avg_price = None
+    price_candidate = update.get('average_price') or update.get('averageprice') or update.get('averagePrice')
+    if price_candidate is not None:
+        try:
+            avg_price = float(price_candidate)
+        except (TypeError, ValueError):
+            pass
+
+    return filled_qty, avg_price, str(update.get('status', '')).upper()
+
+
+class OrderHandle:
+    """In-flight order returned by the tracker; ``wait`` blocks until it resolves"""
+
+    def __init__(self, order_id: str, expected_quantity: int, symbol: Optional[str] = None,
+                 side: Optional[str] = None):
+        self.order_id = str(order_id)
+        self.expected_quantity = expected_quantity
+        self.symbol = symbol
+        self.side = side
+        self._future: Future = Future()
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[OrderFill]:
+        """Fill once the order completes or fails, or None on timeout"""
+        try:
+            return self._future.result(timeout=timeout)
+        except FutureTimeoutError:
+            return None
+
+    def __repr__(self) -> str:
+        return f"OrderHandle({self.order_id!r}, {self.side} {self.expected_quantity} {self.symbol})"
+
+
+class OrderTracker:
+    """
+    Tracks pending orders and resolves them from broker order updates
+
+    Updates for orders that are not tracked yet (a stream can report a fill
+    before ``place_order`` returns) are kept briefly and applied on ``track``.
+    """
+
+    def __init__(self, kite: Any = None, poll_interval: float = 1.0, max_unmatched_updates: int = 1000):
+        """
+        Args:
+            kite: Broker client; its ``orders()`` is polled when no stream is attached
+            poll_interval: Seconds between batched polls
+            max_unmatched_updates: Updates kept for orders not tracked yet
+        """
+        self.kite = kite
+        self.poll_interval = poll_interval
+        self.max_unmatched_updates = max_unmatched_updates
+
+        self._pending: Dict[str, OrderHandle] = {}
+        self._unmatched: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._poll_thread: Optional[threading.Thread] = None
+        self.streaming = False
+
+        self.updates_processed = 0
+        self.polls = 0
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def track(self, order_id: str, expected_quantity: int, symbol: Optional[str] = None,
+              side: Optional[str] = None) -> OrderHandle:
+        """Start tracking a placed order and return its handle"""
+        handle = OrderHandle(order_id, expected_quantity, symbol, side)
+        with self._lock:
+            self._pending[handle.order_id] = handle
+            early_update = self._unmatched.pop(handle.order_id, None)
+
+        if early_update is not None:
+            self.on_order_update(early_update)
+        if not handle.done():
+            self._ensure_polling()
+        return handle
+
+    def forget(self, order_id: str):
+        """Stop tracking an order without resolving it"""
+        with self._lock:
+            self._pending.pop(str(order_id), None)
+
+    @property
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def attach_stream(self, pipeline: Any):
+        """
+        Consume order updates from a stream instead of polling
+
+        ``pipeline`` is anything with ``on_order_update(callback)``, such as
+        RealTimeDataPipeline.
+        """
+        pipeline.on_order_update(self.on_order_update)
+        self.streaming = True
+
+    def detach_stream(self):
+        """Fall back to batched polling (e.g. after the stream disconnects)"""
+        self.streaming = False
+        self._ensure_polling()
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def on_order_update(self, update: Dict[str, Any]):
+        """Apply one order snapshot (websocket message, postback or ``orders()`` row)"""
+        order_id = update.get('order_id')
+        if order_id is None:
+            return
+        order_id = str(order_id)
+
+        with self._lock:
+            self.updates_processed += 1
+            handle = self._pending.get(order_id)
+            if handle is None:
+                self._remember_unmatched(order_id, update)
+                return
+
+            fill = self._resolve(handle, update)
+            if fill is None:
+                return
+            self._pending.pop(order_id, None)
+
+        if fill.status == 'FAILED':
+            logger.error(f"Order {order_id} {fill.message}")
+        handle._future.set_result(fill)
+
+    def process_updates(self, updates: Iterable[Dict[str, Any]]):
+        """Apply a batch of order snapshots"""
+        for update in updates:
+            self.on_order_update(update)
+
+    def refresh(self) -> bool:
+        """Poll ``kite.orders()`` once for all pending orders; False if the poll failed"""
+        if self.kite is None:
+            return False
+        try:
+            orders = self.kite.orders() or []
+        except Exception as exc:
+            logger.warning(f"Order status poll failed: {exc}")
+            return False
+
+        self.polls += 1
+        with self._lock:
+            pending = set(self._pending)
+        self.process_updates(o for o in orders if str(o.get('order_id')) in pending)
+        return True
+
+    @staticmethod
+    def _resolve(handle: OrderHandle, update: Dict[str, Any]) -> Optional[OrderFill]:
+        """Terminal fill for update, or None while the order is still open"""
+        filled_qty, avg_price, status = parse_order_update(update)
+
+        if status in COMPLETE_STATUSES or filled_qty >= handle.expected_quantity:
+            return OrderFill(handle.order_id, 'COMPLETE', filled_qty, avg_price)
+
+        if status in FAILED_STATUSES:
+            message = f"{status}: {update.get('status_message') or 'No message'}"
+            return OrderFill(handle.order_id, 'FAILED', filled_qty, None, message)
+
+        return None
+
+    def _remember_unmatched(self, order_id: str, update: Dict[str, Any]):
+        """Keep the latest update of an untracked order (caller holds the lock)"""
+        self._unmatched[order_id] = update
+        self._unmatched.move_to_end(order_id)
+        while len(self._unmatched) > self.max_unmatched_updates:
+            self._unmatched.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Batched polling fallback
+    # ------------------------------------------------------------------
+
+    def _ensure_polling(self):
+        if self.streaming or self.kite is None:
+            return
+        with self._lock:
+            # The poll thread clears this under the lock when it exits
+            if self._poll_thread is not None:
+                return
+            self._poll_thread = threading.Thread(target=self._poll_loop, name='OrderTrackerPoll', daemon=True)
+            self._poll_thread.start()
+
+    def _poll_loop(self):
+        """One ``orders()`` call per interval while any order is pending"""
+        while not self.streaming:
+            with self._lock:
+                if not self._pending:
+                    self._poll_thread = None
+                    return
+            time.sleep(self.poll_interval)
+            self.refresh()
+
+        with self._lock:
+            self._poll_thread = None
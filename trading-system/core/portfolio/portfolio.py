@@ -34,6 +34,7 @@ from trade_quality_filter import TradeQualityFilter
 from safe_file_ops import atomic_write_json
 from utilities.dashboard import DashboardConnector
 from utilities.market_hours import MarketHoursManager
+from core.order_tracker import OrderHandle
 from core.trade_executor import TradeExecutor
 from .compliance_mixin import ComplianceMixin
 from .dashboard_mixin import DashboardSyncMixin
@@ -44,6 +45,9 @@ logger = get_logger(__name__)
 class UnifiedPortfolio(ComplianceMixin, DashboardSyncMixin):
     """Unified portfolio that handles all trading modes"""
 
+    # fno strategies submit multi-leg entries through execute_trades
+    supports_multi_leg_orders = True
+
     def __init__(self, initial_cash: float = None, dashboard: DashboardConnector = None, kite: KiteConnect = None, trading_mode: str = 'paper', silent: bool = False, security_context: Any = None):
         # VALIDATION FIX: Validate financial amounts
         self.system_config = get_config()
@@ -785,12 +789,16 @@ class UnifiedPortfolio(ComplianceMixin, DashboardSyncMixin):
         """Delegate trade execution to TradeExecutor"""
         return self.trade_executor.execute_trade(symbol, shares, price, side, timestamp, confidence, sector, atr, allow_immediate_sell, strategy)
 
+    def execute_trades(self, legs: List[Dict]) -> List[Optional[Dict]]:
+        """Delegate multi-leg execution (live legs are submitted together)"""
+        return self.trade_executor.execute_trades(legs)
+
     def calculate_transaction_costs(self, amount: float, trade_type: str, symbol: Optional[str] = None) -> float:
         """Delegate transaction cost calculation"""
         return self.trade_executor.calculate_transaction_costs(amount, trade_type, symbol)
 
-    def place_live_order(self, symbol: str, quantity: int, price: float, side: str) -> Optional[str]:
-        """Delegate live order placement"""
+    def place_live_order(self, symbol: str, quantity: int, price: float, side: str) -> Optional[OrderHandle]:
+        """Delegate live order placement; returns the order's tracking handle"""
         return self.trade_executor.place_live_order(symbol, quantity, price, side)
 
     def execute_position_exits(self, position_analysis: Dict[str, Dict]) -> List[Dict]:
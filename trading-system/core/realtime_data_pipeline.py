@@ -22,6 +22,7 @@ Impact:
 import asyncio
 import json
 import logging
+import math
 import time
 import websockets
 from typing import Optional, Dict, Any, List, Callable, AsyncIterator, Set
@@ -29,11 +30,19 @@ from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
 from enum import Enum
 from collections import deque
-import statistics
+
+import numpy as np
 
 from core.correlation_tracker import get_global_tracker
 from core.metrics_exporter import get_global_metrics
 from core.input_sanitizer import InputSanitizer
+from core.kite_ticker_decoder import (
+    PACKET_DTYPES,
+    PACKET_QUOTE,
+    TickDecodeError,
+    decode_frame,
+    decode_packets,
+)
 
 logger = logging.getLogger('trading_system.realtime_pipeline')
 
@@ -109,36 +118,299 @@ class OrderBookUpdate:
         return None
 
 
+# Columns carried by tick batches: name -> dtype. Timestamps are epoch ns (0 = unknown).
+TICK_BATCH_COLUMNS = {
+    'token': np.int64,
+    'last_price': np.float64,
+    'volume': np.int64,
+    'last_quantity': np.int64,
+    'bid_price': np.float64,
+    'ask_price': np.float64,
+    'bid_quantity': np.int64,
+    'ask_quantity': np.int64,
+    'open_interest': np.int64,
+    'exchange_timestamp': np.int64,
+    'received_timestamp': np.int64,
+}
+
+# Batch column -> decoder column where the names differ
+_DECODER_COLUMNS = {'open_interest': 'oi'}
+
+
+class TickBatch:
+    """
+    Columnar batch of ticks delivered to ``on_tick_batch`` subscribers
+
+    Column arrays are views into the pipeline's preallocated buffer and are
+    only valid for the duration of the callback; use ``copy()`` to keep them.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray], token_symbols: Dict[int, str]):
+        self.columns = columns
+        self._token_symbols = token_symbols
+
+    def __len__(self) -> int:
+        return len(self.columns['token'])
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        columns = self.__dict__.get('columns')
+        if columns is not None and name in columns:
+            return columns[name]
+        raise AttributeError(name)
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symbol of each row (token number when unregistered)"""
+        lookup = self._token_symbols
+        return [lookup.get(token, str(token)) for token in self.columns['token'].tolist()]
+
+    def latest_prices(self) -> Dict[str, float]:
+        """Last traded price per symbol within the batch"""
+        tokens = self.columns['token']
+        if len(tokens) == 0:
+            return {}
+        # Last occurrence of each token: unique over the reversed column
+        unique, reverse_index = np.unique(tokens[::-1], return_index=True)
+        last = len(tokens) - 1 - reverse_index
+        prices = self.columns['last_price'][last]
+        lookup = self._token_symbols
+        return {lookup.get(token, str(token)): price
+                for token, price in zip(unique.tolist(), prices.tolist())}
+
+    def copy(self) -> 'TickBatch':
+        """Detach the batch from the pipeline buffer"""
+        return TickBatch({name: values.copy() for name, values in self.columns.items()},
+                         dict(self._token_symbols))
+
+    def to_dataframe(self):
+        """Batch as a pandas DataFrame with a ``symbol`` column"""
+        import pandas as pd
+        df = pd.DataFrame({name: values.copy() for name, values in self.columns.items()})
+        df.insert(0, 'symbol', self.symbols)
+        return df
+
+
+class TickBatchBuffer:
+    """Preallocated column arrays that accumulate ticks until dispatch"""
+
+    def __init__(self, capacity: int = 4096):
+        self.capacity = max(1, capacity)
+        self.columns = {name: np.zeros(self.capacity, dtype=dtype)
+                        for name, dtype in TICK_BATCH_COLUMNS.items()}
+        self.size = 0
+        self.started_at: Optional[float] = None
+
+    @property
+    def free(self) -> int:
+        return self.capacity - self.size
+
+    def append_columns(self, columns: Dict[str, np.ndarray], start: int, stop: int,
+                       received_ns: int) -> None:
+        """Copy rows ``[start, stop)`` of decoded tick columns (must fit)"""
+        n = stop - start
+        lo, hi = self.size, self.size + n
+        for name in TICK_BATCH_COLUMNS:
+            if name == 'received_timestamp':
+                self.columns[name][lo:hi] = received_ns
+                continue
+            source = columns.get(_DECODER_COLUMNS.get(name, name))
+            if source is None:
+                self.columns[name][lo:hi] = 0
+            else:
+                self.columns[name][lo:hi] = source[start:stop]
+        self._grow(n)
+
+    def append_tick(self, tick: 'TickData', token: int) -> None:
+        """Append one TickData row (caller ensures there is room)"""
+        i = self.size
+        cols = self.columns
+        cols['token'][i] = token
+        cols['last_price'][i] = tick.last_price
+        cols['volume'][i] = tick.volume or 0
+        cols['last_quantity'][i] = tick.last_quantity or 0
+        cols['bid_price'][i] = np.nan if tick.bid_price is None else tick.bid_price
+        cols['ask_price'][i] = np.nan if tick.ask_price is None else tick.ask_price
+        cols['bid_quantity'][i] = tick.bid_quantity or 0
+        cols['ask_quantity'][i] = tick.ask_quantity or 0
+        cols['open_interest'][i] = tick.open_interest or 0
+        cols['exchange_timestamp'][i] = _datetime_ns(tick.exchange_timestamp)
+        cols['received_timestamp'][i] = _datetime_ns(tick.received_timestamp)
+        self._grow(1)
+
+    def _grow(self, n: int):
+        if self.size == 0 and n:
+            self.started_at = time.monotonic()
+        self.size += n
+
+    def view(self, token_symbols: Dict[int, str]) -> TickBatch:
+        return TickBatch({name: values[:self.size] for name, values in self.columns.items()},
+                         token_symbols)
+
+    def reset(self):
+        self.size = 0
+        self.started_at = None
+
+
+def _datetime_ns(value: Optional[datetime]) -> int:
+    return int(value.timestamp() * 1_000_000_000) if value is not None else 0
+
+
+# Log-bucketed latency histogram: bucket i covers (MIN * GAMMA**(i-1), MIN * GAMMA**i],
+# i.e. ~1% relative error on reported percentiles over 10us .. 10min
+LATENCY_HISTOGRAM_MIN_MS = 0.01
+LATENCY_HISTOGRAM_GAMMA = 1.02
+_LOG_GAMMA = math.log(LATENCY_HISTOGRAM_GAMMA)
+LATENCY_HISTOGRAM_BUCKETS = int(math.ceil(math.log(600_000 / LATENCY_HISTOGRAM_MIN_MS) / _LOG_GAMMA)) + 1
+
+# Windowed views exported by get_latency_stats (label -> seconds)
+LATENCY_WINDOWS = {'1s': 1, '1m': 60, '5m': 300}
+
+
+def _latency_bucket(latency_ms: float) -> int:
+    """Histogram bucket index for a latency sample"""
+    if latency_ms <= LATENCY_HISTOGRAM_MIN_MS:
+        return 0
+    index = int(math.ceil(math.log(latency_ms / LATENCY_HISTOGRAM_MIN_MS) / _LOG_GAMMA))
+    return min(index, LATENCY_HISTOGRAM_BUCKETS - 1)
+
+
+def _bucket_value(index: int) -> float:
+    """Representative latency of a bucket (geometric midpoint of its bounds)"""
+    if index == 0:
+        return LATENCY_HISTOGRAM_MIN_MS
+    return LATENCY_HISTOGRAM_MIN_MS * LATENCY_HISTOGRAM_GAMMA ** (index - 0.5)
+
+
+def _histogram_percentile(counts: List[int], total: int, q: float,
+                          lo: float, hi: float) -> float:
+    """Value at quantile ``q`` of a bucket histogram, clamped to the observed range"""
+    if total <= 0:
+        return 0.0
+    rank = min(int(total * q), total - 1)
+    cumulative = 0
+    for index, count in enumerate(counts):
+        cumulative += count
+        if cumulative > rank:
+            return min(max(_bucket_value(index), lo), hi)
+    return hi
+
+
+class _LatencySlot:
+    """Samples received during one wall-clock second"""
+    __slots__ = ('second', 'counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self, second: int):
+        self.second = second
+        self.counts = [0] * LATENCY_HISTOGRAM_BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+
 @dataclass
 class LatencyStats:
-    """Latency statistics"""
+    """
+    Latency statistics
+
+    Samples go into a fixed log-bucket histogram (O(1) update, ~1% relative
+    error) instead of re-sorting a sample window on every tick. Percentiles
+    are computed on demand. A ring of per-second histograms backs the
+    1s/1m/5m windows reported by ``window_stats``.
+    """
     min_latency_ms: float = float('inf')
     max_latency_ms: float = 0.0
-    avg_latency_ms: float = 0.0
-    p50_latency_ms: float = 0.0
-    p95_latency_ms: float = 0.0
-    p99_latency_ms: float = 0.0
     sample_count: int = 0
+    total_latency_ms: float = 0.0
 
-    # Track recent latencies for percentile calculation
+    # Most recent raw samples, kept for debugging
     recent_latencies: deque = field(default_factory=lambda: deque(maxlen=1000))
 
-    def update(self, latency_ms: float):
+    _counts: List[int] = field(default_factory=lambda: [0] * LATENCY_HISTOGRAM_BUCKETS, repr=False)
+    _slots: List[Optional[_LatencySlot]] = field(
+        default_factory=lambda: [None] * max(LATENCY_WINDOWS.values()), repr=False
+    )
+
+    def update(self, latency_ms: float, now: Optional[float] = None):
         """Update statistics with new latency sample"""
         self.recent_latencies.append(latency_ms)
         self.sample_count += 1
+        self.total_latency_ms += latency_ms
 
         # Update min/max
-        self.min_latency_ms = min(self.min_latency_ms, latency_ms)
-        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        if latency_ms < self.min_latency_ms:
+            self.min_latency_ms = latency_ms
+        if latency_ms > self.max_latency_ms:
+            self.max_latency_ms = latency_ms
+
+        bucket = _latency_bucket(latency_ms)
+        self._counts[bucket] += 1
+
+        second = int(time.time() if now is None else now)
+        ring_index = second % len(self._slots)
+        slot = self._slots[ring_index]
+        if slot is None or slot.second != second:
+            slot = self._slots[ring_index] = _LatencySlot(second)
+        slot.counts[bucket] += 1
+        slot.count += 1
+        slot.total += latency_ms
+        if latency_ms < slot.min:
+            slot.min = latency_ms
+        if latency_ms > slot.max:
+            slot.max = latency_ms
+
+    def percentile(self, q: float) -> float:
+        """Latency at quantile ``q`` (0-1) over all samples"""
+        return _histogram_percentile(self._counts, self.sample_count, q,
+                                     self.min_latency_ms, self.max_latency_ms)
+
+    @property
+    def avg_latency_ms(self) -> float:
+        return self.total_latency_ms / self.sample_count if self.sample_count else 0.0
+
+    @property
+    def p50_latency_ms(self) -> float:
+        return self.percentile(0.50)
+
+    @property
+    def p95_latency_ms(self) -> float:
+        return self.percentile(0.95)
+
+    @property
+    def p99_latency_ms(self) -> float:
+        return self.percentile(0.99)
+
+    def window_stats(self, seconds: int, now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Statistics over the last ``seconds`` one-second slots (including the current one)
 
-        # Calculate percentiles
-        if len(self.recent_latencies) >= 10:
-            sorted_latencies = sorted(self.recent_latencies)
-            self.avg_latency_ms = statistics.mean(sorted_latencies)
-            self.p50_latency_ms = statistics.median(sorted_latencies)
-            self.p95_latency_ms = sorted_latencies[int(len(sorted_latencies) * 0.95)]
-            self.p99_latency_ms = sorted_latencies[int(len(sorted_latencies) * 0.99)]
+        Args:
+            seconds: Window length (at most the largest LATENCY_WINDOWS entry)
+            now: Reference time (defaults to time.time())
+        """
+        current = int(time.time() if now is None else now)
+        oldest = current - min(max(seconds, 1), len(self._slots)) + 1
+
+        slots = [slot for slot in self._slots
+                 if slot is not None and oldest <= slot.second <= current]
+        count = sum(slot.count for slot in slots)
+        if count == 0:
+            return {'count': 0, 'min_ms': 0.0, 'max_ms': 0.0, 'avg_ms': 0.0,
+                    'p50_ms': 0.0, 'p95_ms': 0.0, 'p99_ms': 0.0}
+
+        counts = [sum(column) for column in zip(*(slot.counts for slot in slots))]
+        total = sum(slot.total for slot in slots)
+        lo = min(slot.min for slot in slots)
+        hi = max(slot.max for slot in slots)
+        return {
+            'count': count,
+            'min_ms': lo,
+            'max_ms': hi,
+            'avg_ms': total / count,
+            'p50_ms': _histogram_percentile(counts, count, 0.50, lo, hi),
+            'p95_ms': _histogram_percentile(counts, count, 0.95, lo, hi),
+            'p99_ms': _histogram_percentile(counts, count, 0.99, lo, hi),
+        }
 
 
 class RealtimeDataPipeline:
@@ -162,7 +434,10 @@ class RealtimeDataPipeline:
         reconnect_delay: float = 5.0,
         max_reconnect_attempts: int = 10,
         buffer_size: int = 10000,
-        enable_metrics: bool = True
+        enable_metrics: bool = True,
+        batch_capacity: int = 4096,
+        batch_interval_ms: float = 0.0,
+        materialize_ticks: bool = True
     ):
         """
         Initialize real-time data pipeline
@@ -175,6 +450,10 @@ class RealtimeDataPipeline:
             max_reconnect_attempts: Maximum reconnection attempts before giving up
             buffer_size: Size of data buffer for high-frequency streaming
             enable_metrics: Enable Prometheus metrics
+            batch_capacity: Rows preallocated for columnar tick batches
+            batch_interval_ms: Dispatch tick batches every N ms (0 = once per frame)
+            materialize_ticks: Build TickData objects for binary ticks even when
+                nobody is registered through on_tick (tick_buffer/stream_ticks)
         """
         self.ws_url = ws_url
         self.api_key = api_key
@@ -183,6 +462,8 @@ class RealtimeDataPipeline:
         self.max_reconnect_attempts = max_reconnect_attempts
         self.buffer_size = buffer_size
         self.enable_metrics = enable_metrics
+        self.batch_interval_ms = batch_interval_ms
+        self.materialize_ticks = materialize_ticks
 
         # Connection state
         self.state = ConnectionState.DISCONNECTED
@@ -192,6 +473,7 @@ class RealtimeDataPipeline:
         # Subscriptions
         self.subscribed_symbols: Set[str] = set()
         self.subscription_modes: Dict[str, str] = {}  # symbol -> mode (quote, full, ltp)
+        self.token_symbols: Dict[int, str] = {}  # instrument_token -> symbol for binary ticks
 
         # Data buffers
         self.tick_buffer: deque = deque(maxlen=buffer_size)
@@ -199,15 +481,23 @@ class RealtimeDataPipeline:
 
         # Callbacks
         self.tick_callbacks: List[Callable[[TickData], None]] = []
+        self.tick_batch_callbacks: List[Callable[[TickBatch], None]] = []
         self.order_book_callbacks: List[Callable[[OrderBookUpdate], None]] = []
+        self.order_update_callbacks: List[Callable[[Dict[str, Any]], None]] = []
         self.error_callbacks: List[Callable[[Exception], None]] = []
 
+        # Columnar batch accumulation
+        self._batch_buffer = TickBatchBuffer(batch_capacity)
+        self._symbol_tokens: Dict[str, int] = {}  # reverse of token_symbols
+        self.batches_dispatched = 0
+
         # Latency tracking
         self.latency_stats = LatencyStats()
 
         # Background tasks
         self.receive_task: Optional[asyncio.Task] = None
         self.heartbeat_task: Optional[asyncio.Task] = None
+        self.batch_flush_task: Optional[asyncio.Task] = None
 
         # Get global instances
         self.tracker = get_global_tracker() if enable_metrics else None
@@ -258,6 +548,8 @@ class RealtimeDataPipeline:
             # Start background tasks
             self.receive_task = asyncio.create_task(self._receive_loop())
             self.heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+            if self.batch_interval_ms > 0:
+                self.batch_flush_task = asyncio.create_task(self._batch_flush_loop())
 
             # Track success
             if self.tracker:
@@ -306,6 +598,12 @@ class RealtimeDataPipeline:
         if self.heartbeat_task and not self.heartbeat_task.done():
             self.heartbeat_task.cancel()
 
+        if self.batch_flush_task and not self.batch_flush_task.done():
+            self.batch_flush_task.cancel()
+
+        # Deliver whatever is still accumulated
+        self.flush_tick_batch()
+
         # Close WebSocket
         if self.websocket:
             await self.websocket.close()
@@ -425,15 +723,15 @@ class RealtimeDataPipeline:
                 try:
                     # Parse message
                     if isinstance(message, bytes):
-                        # Binary message (tick data)
-                        tick = self._parse_binary_tick(message, received_timestamp)
-                        if tick:
-                            self._process_tick(tick)
+                        # Binary message (one or more tick packets)
+                        self._process_binary_frame(message, received_timestamp)
                     else:
                         # Text message (order book, errors, etc.)
                         data = json.loads(message)
                         self._process_text_message(data, received_timestamp)
 
+                    self._maybe_dispatch_batch()
+
                 except Exception as e:
                     logger.error(f"Error processing message: {e}")
                     if self.metrics:
@@ -450,6 +748,16 @@ class RealtimeDataPipeline:
 
             asyncio.create_task(self.reconnect())
 
+    async def _batch_flush_loop(self):
+        """Background task delivering partial batches when no new frames arrive"""
+        interval = self.batch_interval_ms / 1000.0
+        try:
+            while self.state == ConnectionState.CONNECTED:
+                await asyncio.sleep(interval)
+                self._maybe_dispatch_batch()
+        except asyncio.CancelledError:
+            pass
+
     async def _heartbeat_loop(self):
         """Background task to send periodic heartbeat"""
         try:
@@ -466,25 +774,101 @@ class RealtimeDataPipeline:
         except asyncio.CancelledError:
             pass
 
-    def _parse_binary_tick(self, data: bytes, received_timestamp: datetime) -> Optional[TickData]:
+    def register_instrument_tokens(self, tokens: Dict[str, int]):
         """
-        Parse binary tick data
+        Register symbol -> instrument_token mappings used to name binary ticks
 
-        Note: This is a simplified parser. Real implementation depends on
-        the actual binary protocol from Zerodha/broker.
+        Ticks for unregistered tokens use the token number as their symbol.
         """
+        for symbol, token in tokens.items():
+            self.token_symbols[int(token)] = symbol
+            self._symbol_tokens[symbol] = int(token)
+
+    def _process_binary_frame(self, data: bytes, received_timestamp: datetime):
+        """Decode a binary frame once and feed batch and per-tick consumers"""
         try:
-            # Placeholder for actual binary parsing
-            # Real implementation would parse instrument token, LTP, volume, etc.
-            # from packed binary format
+            columns = decode_frame(data)
+        except TickDecodeError as e:
+            logger.error(f"Binary tick parsing error: {e}")
+            return
 
-            # For now, return None (would be implemented based on broker protocol)
-            return None
+        count = len(columns['token'])
+        if count == 0:
+            return
 
-        except Exception as e:
+        if self.tick_batch_callbacks:
+            received_ns = _datetime_ns(received_timestamp)
+            start = 0
+            while start < count:
+                if self._batch_buffer.free == 0:
+                    self.flush_tick_batch()
+                stop = min(count, start + self._batch_buffer.free)
+                self._batch_buffer.append_columns(columns, start, stop, received_ns)
+                start = stop
+
+        if self.tick_callbacks or self.materialize_ticks:
+            for tick in self._columns_to_ticks(columns, received_timestamp):
+                self._process_tick(tick)
+        else:
+            # Batch-only consumers: record latency without building TickData
+            exchange_ns = columns['exchange_timestamp']
+            stamped = exchange_ns[exchange_ns > 0]
+            if len(stamped):
+                latencies = (_datetime_ns(received_timestamp) - stamped) / 1e6
+                for latency in latencies.tolist():
+                    self.latency_stats.update(latency)
+
+    def _parse_binary_frame(self, data: bytes, received_timestamp: datetime) -> List[TickData]:
+        """Decode every packet of a Kite binary frame into TickData"""
+        try:
+            columns = decode_frame(data)
+        except TickDecodeError as e:
             logger.error(f"Binary tick parsing error: {e}")
+            return []
+        return self._columns_to_ticks(columns, received_timestamp)
+
+    def _parse_binary_tick(self, data: bytes, received_timestamp: datetime) -> Optional[TickData]:
+        """
+        Parse a single binary tick packet (without the frame header)
+
+        Returns None when ``data`` is not a valid packet length.
+        """
+        dtype = PACKET_DTYPES.get(len(data))
+        if dtype is None:
+            logger.debug(f"Ignoring binary packet of unexpected length {len(data)}")
             return None
 
+        packets = np.frombuffer(data, dtype=dtype, count=1)
+        ticks = self._columns_to_ticks(decode_packets(packets, len(data)), received_timestamp)
+        return ticks[0] if ticks else None
+
+    def _columns_to_ticks(self, columns: Dict[str, np.ndarray], received_timestamp: datetime) -> List[TickData]:
+        """Materialise decoded tick columns as TickData objects"""
+        rows = {name: values.tolist() for name, values in columns.items()}
+        token_symbols = self.token_symbols
+        ticks = []
+        for i, token in enumerate(rows['token']):
+            exchange_ns = rows['exchange_timestamp'][i]
+            exchange_timestamp = datetime.fromtimestamp(exchange_ns / 1e9) if exchange_ns else None
+            bid_price = rows['bid_price'][i]
+            ask_price = rows['ask_price'][i]
+            has_quote = rows['packet_length'][i] >= PACKET_QUOTE
+            ticks.append(TickData(
+                symbol=token_symbols.get(token, str(token)),
+                timestamp=exchange_timestamp or received_timestamp,
+                last_price=rows['last_price'][i],
+                volume=rows['volume'][i],
+                bid_price=None if bid_price != bid_price else bid_price,
+                ask_price=None if ask_price != ask_price else ask_price,
+                bid_quantity=rows['bid_quantity'][i] if bid_price == bid_price else None,
+                ask_quantity=rows['ask_quantity'][i] if ask_price == ask_price else None,
+                last_quantity=rows['last_quantity'][i] if has_quote else None,
+                open_interest=rows['oi'][i] or None,
+                exchange_timestamp=exchange_timestamp,
+                received_timestamp=received_timestamp
+            ))
+        return ticks
+
     def _process_text_message(self, data: Dict[str, Any], received_timestamp: datetime):
         """Process text message (JSON)"""
         message_type = data.get('type')
@@ -495,6 +879,14 @@ class RealtimeDataPipeline:
             if order_book:
                 self._process_order_book(order_book)
 
+        elif message_type == 'order':
+            # Postback-style order update for the account
+            for callback in self.order_update_callbacks:
+                try:
+                    callback(data.get('data') or {})
+                except Exception as e:
+                    logger.error(f"Order update callback error: {e}")
+
         elif message_type == 'error':
             error_msg = data.get('message', 'Unknown error')
             logger.error(f"WebSocket error: {error_msg}")
@@ -504,6 +896,8 @@ class RealtimeDataPipeline:
             tick = self._parse_json_tick(data, received_timestamp)
             if tick:
                 self._process_tick(tick)
+                if self.tick_batch_callbacks:
+                    self._append_batch_tick(tick)
 
     def _parse_json_tick(self, data: Dict[str, Any], received_timestamp: datetime) -> Optional[TickData]:
         """Parse JSON tick data"""
@@ -594,14 +988,71 @@ class RealtimeDataPipeline:
             except Exception as e:
                 logger.error(f"Order book callback error: {e}")
 
+    def _append_batch_tick(self, tick: TickData):
+        """Append a JSON-path tick to the current batch"""
+        token = self._symbol_tokens.get(tick.symbol)
+        if token is None:
+            # Symbols without an instrument token get stable negative ids
+            token = -(len(self._symbol_tokens) + 1)
+            self._symbol_tokens[tick.symbol] = token
+            self.token_symbols[token] = tick.symbol
+        if self._batch_buffer.free == 0:
+            self.flush_tick_batch()
+        self._batch_buffer.append_tick(tick, token)
+
+    def _maybe_dispatch_batch(self):
+        """Dispatch the accumulated batch when its frame or interval is complete"""
+        buffer = self._batch_buffer
+        if buffer.size == 0:
+            return
+        if self.batch_interval_ms <= 0 or \
+                (time.monotonic() - buffer.started_at) * 1000.0 >= self.batch_interval_ms:
+            self.flush_tick_batch()
+
+    def flush_tick_batch(self) -> int:
+        """
+        Deliver accumulated ticks to ``on_tick_batch`` subscribers immediately
+
+        Returns:
+            Number of ticks dispatched
+        """
+        buffer = self._batch_buffer
+        size = buffer.size
+        if size == 0:
+            return 0
+
+        batch = buffer.view(self.token_symbols)
+        for callback in self.tick_batch_callbacks:
+            try:
+                callback(batch)
+            except Exception as e:
+                logger.error(f"Tick batch callback error: {e}")
+
+        buffer.reset()
+        self.batches_dispatched += 1
+        return size
+
     def on_tick(self, callback: Callable[[TickData], None]):
         """Register tick data callback"""
         self.tick_callbacks.append(callback)
 
+    def on_tick_batch(self, callback: Callable[[TickBatch], None]):
+        """
+        Register columnar tick batch callback
+
+        Batches are delivered once per frame, or every ``batch_interval_ms``
+        when set. Arrays are only valid during the callback.
+        """
+        self.tick_batch_callbacks.append(callback)
+
     def on_order_book(self, callback: Callable[[OrderBookUpdate], None]):
         """Register order book callback"""
         self.order_book_callbacks.append(callback)
 
+    def on_order_update(self, callback: Callable[[Dict[str, Any]], None]):
+        """Register order update callback (receives the order snapshot dict)"""
+        self.order_update_callbacks.append(callback)
+
     def on_error(self, callback: Callable[[Exception], None]):
         """Register error callback"""
         self.error_callbacks.append(callback)
@@ -621,7 +1072,8 @@ class RealtimeDataPipeline:
                 await asyncio.sleep(0.001)  # 1ms sleep to avoid busy waiting
 
     def get_latency_stats(self) -> Dict[str, Any]:
-        """Get latency statistics"""
+        """Get latency statistics (all-time plus 1s/1m/5m windows)"""
+        now = time.time()
         return {
             'min_ms': self.latency_stats.min_latency_ms if self.latency_stats.min_latency_ms != float('inf') else 0,
             'max_ms': self.latency_stats.max_latency_ms,
@@ -629,7 +1081,11 @@ class RealtimeDataPipeline:
             'p50_ms': self.latency_stats.p50_latency_ms,
             'p95_ms': self.latency_stats.p95_latency_ms,
             'p99_ms': self.latency_stats.p99_latency_ms,
-            'sample_count': self.latency_stats.sample_count
+            'sample_count': self.latency_stats.sample_count,
+            'windows': {
+                label: self.latency_stats.window_stats(seconds, now)
+                for label, seconds in LATENCY_WINDOWS.items()
+            }
         }
 
     def get_status(self) -> Dict[str, Any]:
@@ -641,6 +1097,7 @@ class RealtimeDataPipeline:
             'symbols': list(self.subscribed_symbols),
             'tick_buffer_size': len(self.tick_buffer),
             'order_book_buffer_size': len(self.order_book_buffer),
+            'tick_batches_dispatched': self.batches_dispatched,
             'reconnect_attempts': self.reconnect_attempts,
             'latency': self.get_latency_stats()
         }
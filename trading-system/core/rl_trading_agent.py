@@ -5,7 +5,7 @@ Phase 4 Tier 1: Advanced Machine Learning
 Implements reinforcement learning agents for algorithmic trading:
 - Deep Q-Network (DQN) for discrete action spaces
 - Proximal Policy Optimization (PPO) for continuous actions
-- Experience replay and target networks
+- Experience replay (uniform or prioritized) and target networks
 - Policy evaluation and comparison
 
 Author: Trading System
@@ -16,7 +16,6 @@ import hashlib
 import hmac
 import logging
 import random
-from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -76,6 +75,11 @@ class RLConfig:
     gamma: float = 0.99  # Discount factor
     batch_size: int = 64
     buffer_size: int = 100000
+    replay_state_dtype: str = "float32"  # "float16" halves replay memory
+    replay_storage_dir: Optional[str] = None  # Memory-map replay arrays here
+    prioritized_replay: bool = False
+    priority_alpha: float = 0.6
+    priority_beta: float = 0.4
     
     # Exploration
     epsilon_start: float = 1.0
@@ -102,36 +106,221 @@ class RLConfig:
 
 
 class ReplayBuffer:
-    """Experience replay buffer for DQN"""
-    
-    def __init__(self, capacity: int):
+    """
+    Experience replay buffer for DQN
+
+    Fixed-capacity ring buffer over preallocated NumPy arrays, one per
+    field. Arrays are allocated on the first push, when state and action
+    shapes are known. States can be stored as float16 to halve memory, and
+    with ``storage_dir`` every field is a memory-mapped ``.npy`` file so
+    multi-million transition histories live on disk instead of in RAM.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        state_dtype: Any = np.float32,
+        storage_dir: Optional[str] = None
+    ):
         """
         Initialize replay buffer
-        
+
         Args:
             capacity: Maximum number of experiences to store
+            state_dtype: dtype for stored states and next states
+            storage_dir: Directory for memory-mapped storage (None keeps arrays in RAM)
         """
-        self.buffer = deque(maxlen=capacity)
-    
+        self.capacity = capacity
+        self.state_dtype = np.dtype(state_dtype)
+        self.storage_dir = Path(storage_dir) if storage_dir else None
+
+        self.states: Optional[np.ndarray] = None
+        self.actions: Optional[np.ndarray] = None
+        self.rewards: Optional[np.ndarray] = None
+        self.next_states: Optional[np.ndarray] = None
+        self.dones: Optional[np.ndarray] = None
+
+        self.position = 0  # Next slot to write
+        self.size = 0
+
+    def _allocate(self, field: str, shape: Tuple, dtype) -> np.ndarray:
+        if self.storage_dir is None:
+            return np.zeros(shape, dtype=dtype)
+        self.storage_dir.mkdir(parents=True, exist_ok=True)
+        return np.lib.format.open_memmap(self.storage_dir / f"{field}.npy", mode='w+', dtype=dtype, shape=shape)
+
+    def _ensure_storage(self, state: np.ndarray, action: np.ndarray):
+        if self.states is not None:
+            return
+        action_dtype = np.int64 if np.issubdtype(action.dtype, np.integer) else np.float32
+        self.states = self._allocate('states', (self.capacity,) + state.shape, self.state_dtype)
+        self.next_states = self._allocate('next_states', (self.capacity,) + state.shape, self.state_dtype)
+        self.actions = self._allocate('actions', (self.capacity,) + action.shape, action_dtype)
+        self.rewards = self._allocate('rewards', (self.capacity,), np.float32)
+        self.dones = self._allocate('dones', (self.capacity,), np.float32)
+
     def push(self, state, action, reward, next_state, done):
         """Add experience to buffer"""
-        self.buffer.append((state, action, reward, next_state, done))
-    
-    def sample(self, batch_size: int) -> Tuple:
-        """Sample random batch from buffer"""
-        batch = random.sample(self.buffer, batch_size)
-        states, actions, rewards, next_states, dones = zip(*batch)
-        
+        state = np.asarray(state)
+        self._ensure_storage(state, np.asarray(action))
+
+        i = self.position
+        self.states[i] = state
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.next_states[i] = next_state
+        self.dones[i] = done
+        self._advance(np.array([i]))
+
+    def push_batch(self, states, actions, rewards, next_states, dones):
+        """Add a batch of experiences, e.g. one step of a VectorTradingEnv"""
+        states = np.asarray(states)
+        actions = np.asarray(actions)
+        self._ensure_storage(states[0], actions[0])
+
+        # Only the newest `capacity` rows survive a batch larger than the buffer
+        n = len(states)
+        keep = slice(max(n - self.capacity, 0), n)
+        idx = (self.position + np.arange(n)[keep]) % self.capacity
+        self.states[idx] = states[keep]
+        self.actions[idx] = actions[keep]
+        self.rewards[idx] = np.asarray(rewards)[keep]
+        self.next_states[idx] = np.asarray(next_states)[keep]
+        self.dones[idx] = np.asarray(dones)[keep]
+        self.position = (self.position + n) % self.capacity
+        self.size = min(self.size + n, self.capacity)
+        self._on_write(idx)
+
+    def _advance(self, idx: np.ndarray):
+        self.position = (self.position + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        self._on_write(idx)
+
+    def _on_write(self, idx: np.ndarray):
+        """Hook for subclasses tracking per-slot state"""
+
+    def _gather(self, idx: np.ndarray) -> Tuple:
         return (
-            np.array(states),
-            np.array(actions),
-            np.array(rewards),
-            np.array(next_states),
-            np.array(dones)
+            self.states[idx],
+            self.actions[idx],
+            self.rewards[idx],
+            self.next_states[idx],
+            self.dones[idx]
         )
-    
+
+    def sample(self, batch_size: int) -> Tuple:
+        """Sample random batch (uniformly, with replacement) from buffer"""
+        return self._gather(np.random.randint(0, self.size, size=batch_size))
+
     def __len__(self) -> int:
-        return len(self.buffer)
+        return self.size
+
+
+class SumTree:
+    """
+    Binary tree of priorities stored in a flat array
+
+    Leaves hold per-slot priorities and every internal node the sum of its
+    children, so prefix-sum lookups and updates take O(log n) and both are
+    vectorized across a batch of indices.
+    """
+
+    def __init__(self, capacity: int):
+        self.leaf_count = 1
+        while self.leaf_count < capacity:
+            self.leaf_count *= 2
+        self.tree = np.zeros(2 * self.leaf_count)
+
+    @property
+    def total(self) -> float:
+        return self.tree[1]
+
+    def update(self, idx: np.ndarray, priorities: np.ndarray):
+        """Set leaf priorities and refresh their ancestors"""
+        if len(idx) == 0:
+            return
+        nodes = np.asarray(idx) + self.leaf_count
+        self.tree[nodes] = priorities
+        nodes = np.unique(nodes // 2)
+        while nodes[0] >= 1:
+            self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+            nodes = np.unique(nodes // 2)
+
+    def find(self, values: np.ndarray) -> np.ndarray:
+        """Leaf index whose prefix-sum range contains each value"""
+        nodes = np.ones(len(values), dtype=np.int64)
+        values = np.asarray(values, dtype=float).copy()
+        while nodes[0] < self.leaf_count:
+            left = 2 * nodes
+            go_right = values >= self.tree[left]
+            values = np.where(go_right, values - self.tree[left], values)
+            nodes = np.where(go_right, left + 1, left)
+        return nodes - self.leaf_count
+
+
+class PrioritizedReplayBuffer(ReplayBuffer):
+    """
+    Prioritized experience replay (Schaul et al., 2015)
+
+    Transitions are sampled in proportion to priority ** alpha via a
+    SumTree; new transitions get the current maximum priority so each is
+    seen at least once. ``sample`` also returns importance-sampling weights
+    and the sampled slots, to be passed back to ``update_priorities``.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        alpha: float = 0.6,
+        beta: float = 0.4,
+        state_dtype: Any = np.float32,
+        storage_dir: Optional[str] = None,
+        epsilon: float = 1e-6
+    ):
+        """
+        Initialize prioritized replay buffer
+
+        Args:
+            capacity: Maximum number of experiences to store
+            alpha: How strongly priorities skew sampling (0 = uniform)
+            beta: Importance-sampling correction exponent (1 = full correction)
+            state_dtype: dtype for stored states and next states
+            storage_dir: Directory for memory-mapped storage
+            epsilon: Added to TD errors so no transition gets zero priority
+        """
+        super().__init__(capacity, state_dtype=state_dtype, storage_dir=storage_dir)
+        self.alpha = alpha
+        self.beta = beta
+        self.epsilon = epsilon
+        self.tree = SumTree(capacity)
+        self.max_priority = 1.0
+
+    def _on_write(self, idx: np.ndarray):
+        self.tree.update(idx, np.full(len(idx), self.max_priority ** self.alpha))
+
+    def sample(self, batch_size: int) -> Tuple:
+        """
+        Sample batch proportionally to priority
+
+        Returns:
+            (states, actions, rewards, next_states, dones, weights, indices)
+        """
+        # One draw per equal-mass segment keeps the batch spread over the tree
+        segment = self.tree.total / batch_size
+        values = (np.arange(batch_size) + np.random.random(batch_size)) * segment
+        idx = np.minimum(self.tree.find(values), self.size - 1)
+
+        probs = self.tree.tree[idx + self.tree.leaf_count] / self.tree.total
+        weights = (self.size * probs) ** -self.beta
+        weights = (weights / weights.max()).astype(np.float32)
+
+        return self._gather(idx) + (weights, idx)
+
+    def update_priorities(self, indices: np.ndarray, td_errors: np.ndarray):
+        """Set priorities of sampled transitions from their TD errors"""
+        priorities = np.abs(np.asarray(td_errors, dtype=float)) + self.epsilon
+        self.max_priority = max(self.max_priority, priorities.max())
+        self.tree.update(indices, priorities ** self.alpha)
 
 
 class QNetwork(nn.Module):
@@ -204,7 +393,20 @@ class DQNAgent:
         self.optimizer = optim.Adam(self.q_network.parameters(), lr=self.config.learning_rate)
         
         # Replay buffer
-        self.replay_buffer = ReplayBuffer(self.config.buffer_size)
+        if self.config.prioritized_replay:
+            self.replay_buffer = PrioritizedReplayBuffer(
+                self.config.buffer_size,
+                alpha=self.config.priority_alpha,
+                beta=self.config.priority_beta,
+                state_dtype=self.config.replay_state_dtype,
+                storage_dir=self.config.replay_storage_dir
+            )
+        else:
+            self.replay_buffer = ReplayBuffer(
+                self.config.buffer_size,
+                state_dtype=self.config.replay_state_dtype,
+                storage_dir=self.config.replay_storage_dir
+            )
         
         # Exploration
         self.epsilon = self.config.epsilon_start
@@ -251,14 +453,15 @@ class DQNAgent:
             return None
         
         # Sample batch
-        states, actions, rewards, next_states, dones = self.replay_buffer.sample(self.config.batch_size)
+        batch = self.replay_buffer.sample(self.config.batch_size)
+        states, actions, rewards, next_states, dones = batch[:5]
         
-        # Convert to tensors
-        states = torch.FloatTensor(states).to(self.device)
-        actions = torch.LongTensor(actions).to(self.device)
-        rewards = torch.FloatTensor(rewards).to(self.device)
-        next_states = torch.FloatTensor(next_states).to(self.device)
-        dones = torch.FloatTensor(dones).to(self.device)
+        # Convert to tensors (buffer arrays are already contiguous and typed)
+        states = torch.as_tensor(states, device=self.device).float()
+        actions = torch.as_tensor(actions, dtype=torch.long, device=self.device)
+        rewards = torch.as_tensor(rewards, device=self.device)
+        next_states = torch.as_tensor(next_states, device=self.device).float()
+        dones = torch.as_tensor(dones, device=self.device)
         
         # Current Q values
         current_q_values = self.q_network(states).gather(1, actions.unsqueeze(1)).squeeze(1)
@@ -276,7 +479,14 @@ class DQNAgent:
             target_q_values = rewards + (1 - dones) * self.config.gamma * next_q_values
         
         # Calculate loss
-        loss = F.smooth_l1_loss(current_q_values, target_q_values)
+        if self.config.prioritized_replay:
+            weights, indices = batch[5:]
+            element_loss = F.smooth_l1_loss(current_q_values, target_q_values, reduction='none')
+            loss = (torch.as_tensor(weights, device=self.device) * element_loss).mean()
+            td_errors = (target_q_values - current_q_values).detach().abs().cpu().numpy()
+            self.replay_buffer.update_priorities(indices, td_errors)
+        else:
+            loss = F.smooth_l1_loss(current_q_values, target_q_values)
         
         # Optimize
         self.optimizer.zero_grad()
@@ -8,12 +8,13 @@ import logging
 import re
 import time
 from datetime import datetime
-from typing import Dict, Optional, Tuple, List, Any
+from typing import Dict, Optional, Tuple, List, Any, Union
 
 from infrastructure.security import hash_sensitive_data
 from trading_exceptions import ValidationError
-from trading_utils import validate_financial_amount, poll_with_backoff
+from trading_utils import validate_financial_amount
 from fno.indices import IndexConfig
+from core.order_tracker import OrderHandle, OrderTracker
 
 logger = logging.getLogger('trading_system.executor')
 
@@ -31,14 +32,81 @@ class TradeExecutor:
         self.pricing_engine = portfolio.pricing_engine
         self.dashboard = portfolio.dashboard
         self.silent = portfolio.silent
-        
+
+        # Live fills are resolved from one shared update stream / batched poll
+        self.order_tracker = OrderTracker(self.kite) if self.kite else None
+
         # Transaction costs constants
         self.gst_rate = 0.18
         self.stt_rate = 0.001
 
     def execute_trade(self, symbol: str, shares: int, price: float, side: str, timestamp: datetime = None, confidence: float = 0.5, sector: str = None, atr: float = None, allow_immediate_sell: bool = False, strategy: str = None) -> Optional[Dict]:
         """Execute trade based on trading mode"""
-        
+        request = self._normalize_trade(symbol, shares, price, side, timestamp, allow_immediate_sell)
+        if request is None:
+            return None
+        symbol, shares, price, side, timestamp = request
+
+        if side == "buy":
+            return self._execute_buy(symbol, shares, price, timestamp, confidence, sector, atr, strategy)
+        elif side == "sell":
+            return self._execute_sell(symbol, shares, price, timestamp, confidence, sector, atr, strategy, allow_immediate_sell)
+
+        return None
+
+    def execute_trades(self, legs: List[Dict]) -> List[Optional[Dict]]:
+        """
+        Execute a multi-leg entry (straddle, iron condor, ...)
+
+        Each leg holds ``execute_trade`` keyword arguments. In live mode every
+        leg's order is submitted before waiting on any fill, so the legs fill
+        concurrently instead of one 15s wait after another. Results are in
+        leg order, None for legs that were rejected or not filled.
+        """
+        if self.trading_mode != 'live' or not self.order_tracker:
+            return [self.execute_trade(**leg) for leg in legs]
+
+        # Submit all legs first. Nothing is deducted from cash until a leg
+        # fills, so margin taken by earlier legs is carried in ``reserved``
+        submitted = []
+        reserved = 0.0
+        for leg in legs:
+            request = self._normalize_trade(
+                leg.get('symbol'), leg.get('shares'), leg.get('price'), leg.get('side'),
+                leg.get('timestamp'), leg.get('allow_immediate_sell', False)
+            )
+            order = None
+            if request is not None:
+                symbol, shares, price, side, _ = request
+                if side == "buy":
+                    quantity = self._size_buy(symbol, shares, price, leg.get('atr'))
+                else:
+                    quantity = self._size_sell(symbol, shares, leg.get('allow_immediate_sell', False))
+                if quantity:
+                    required = self._required_margin(symbol, quantity, price, side.upper())
+                    if self._has_margin(symbol, required, reserved):
+                        order = self.place_live_order(symbol, quantity, price, side.upper())
+                    if order is not None:
+                        reserved += required
+            submitted.append((request, order))
+
+        # Then settle each leg as its fill arrives
+        results = []
+        for leg, (request, order) in zip(legs, submitted):
+            if order is None:
+                results.append(None)
+                continue
+            symbol, _, price, side, timestamp = request
+            args = (symbol, order.expected_quantity, price, timestamp, leg.get('confidence', 0.5),
+                    leg.get('sector'), leg.get('atr'), leg.get('strategy'))
+            if side == "buy":
+                results.append(self._execute_buy(*args, order=order))
+            else:
+                results.append(self._execute_sell(*args, leg.get('allow_immediate_sell', False), order=order))
+        return results
+
+    def _normalize_trade(self, symbol: str, shares: int, price: float, side: str, timestamp: Optional[datetime], allow_immediate_sell: bool) -> Optional[Tuple[str, int, float, str, datetime]]:
+        """Sanitized (symbol, shares, price, side, timestamp), or None if the trade is not allowed"""
         # Sanitize symbol
         if not symbol or not isinstance(symbol, str):
             logger.error(f"❌ Invalid symbol: {symbol}")
@@ -85,14 +153,10 @@ class TradeExecutor:
                     print(f"🚫 Trade blocked: {reason}")
                 return None
 
-        if side == "buy":
-            return self._execute_buy(symbol, shares, price, timestamp, confidence, sector, atr, strategy)
-        elif side == "sell":
-            return self._execute_sell(symbol, shares, price, timestamp, confidence, sector, atr, strategy, allow_immediate_sell)
-            
-        return None
+        return symbol, shares, price, side, timestamp
 
-    def _execute_buy(self, symbol: str, shares: int, price: float, timestamp: datetime, confidence: float, sector: str, atr: float, strategy: str) -> Optional[Dict]:
+    def _size_buy(self, symbol: str, shares: int, price: float, atr: Optional[float]) -> Optional[int]:
+        """Shares to buy after pre-trade validation, or None if rejected"""
         # RESTORED: Pre-trade validation (Compliance & Risk)
         atr_value = atr if atr and atr > 0 else None
         is_option = "CE" in symbol or "PE" in symbol
@@ -127,14 +191,21 @@ class TradeExecutor:
         elif is_option:
             logger.debug(f"📊 Skipping professional validation for option trade: {symbol}")
 
+        return shares
+
+    def _execute_buy(self, symbol: str, shares: int, price: float, timestamp: datetime, confidence: float, sector: str, atr: float, strategy: str, order: Optional[OrderHandle] = None) -> Optional[Dict]:
+        # An already-submitted order was sized when it was placed
+        if order is None:
+            shares = self._size_buy(symbol, shares, price, atr)
+            if shares is None: return None
+
         # Calculate execution price
         execution_price = price
         if self.trading_mode == 'live':
-            if not self._check_margin_requirement(symbol, shares, price, 'BUY'):
-                return None
-            order_id = self.place_live_order(symbol, shares, price, "BUY")
-            if not order_id: return None
-            filled_qty, exec_price = self._wait_for_order_completion(order_id, shares)
+            if order is None:
+                order = self._submit_live_order(symbol, shares, price, "BUY")
+                if not order: return None
+            filled_qty, exec_price = self._wait_for_order_completion(order, shares)
             if filled_qty <= 0 or not exec_price: return None
             shares = filled_qty
             execution_price = exec_price
@@ -248,26 +319,36 @@ class TradeExecutor:
 
         return self.portfolio.record_trade(symbol, "buy", shares, execution_price, fees, None, timestamp, confidence, sector, atr)
 
-    def _execute_sell(self, symbol: str, shares: int, price: float, timestamp: datetime, confidence: float, sector: str, atr: float, strategy: str, allow_immediate_sell: bool) -> Optional[Dict]:
+    def _size_sell(self, symbol: str, shares: int, allow_immediate_sell: bool) -> Optional[int]:
+        """Shares to sell (capped at the long position), or None if the exit is not allowed"""
         position = self.portfolio.positions.get(symbol)
         shares_available = int(position.get("shares", 0)) if position else 0
         is_short_sell = position is None or shares_available <= 0
-        
+
         if not is_short_sell:
             if not allow_immediate_sell and not self.portfolio.can_exit_position(symbol):
                 return None
             shares_to_sell = min(shares, shares_available)
         else:
             shares_to_sell = shares
-            
-        if shares_to_sell <= 0: return None
+
+        return shares_to_sell if shares_to_sell > 0 else None
+
+    def _execute_sell(self, symbol: str, shares: int, price: float, timestamp: datetime, confidence: float, sector: str, atr: float, strategy: str, allow_immediate_sell: bool, order: Optional[OrderHandle] = None) -> Optional[Dict]:
+        position = self.portfolio.positions.get(symbol)
+        shares_available = int(position.get("shares", 0)) if position else 0
+        is_short_sell = position is None or shares_available <= 0
+
+        # An already-submitted order was sized when it was placed
+        shares_to_sell = shares if order is not None else self._size_sell(symbol, shares, allow_immediate_sell)
+        if not shares_to_sell: return None
 
         execution_price = price
         if self.trading_mode == 'live':
-             if not self._check_margin_requirement(symbol, shares_to_sell, price, 'SELL'): return None
-             order_id = self.place_live_order(symbol, shares_to_sell, price, "SELL")
-             if not order_id: return None
-             filled_qty, exec_price = self._wait_for_order_completion(order_id, shares_to_sell)
+             if order is None:
+                 order = self._submit_live_order(symbol, shares_to_sell, price, "SELL")
+                 if not order: return None
+             filled_qty, exec_price = self._wait_for_order_completion(order, shares_to_sell)
              if filled_qty <= 0 or not exec_price: return None
              shares_to_sell = filled_qty
              execution_price = exec_price
@@ -336,7 +417,8 @@ class TradeExecutor:
         
         return brokerage + stt
 
-    def place_live_order(self, symbol: str, quantity: int, price: float, side: str) -> Optional[str]:
+    def place_live_order(self, symbol: str, quantity: int, price: float, side: str) -> Optional[OrderHandle]:
+        """Place a market order and return its tracking handle without waiting for the fill"""
         if not self.kite or self.trading_mode != 'live': return None
         try:
              exchange, product, _ = self._determine_order_context(symbol)
@@ -349,66 +431,39 @@ class TradeExecutor:
                  product=product,
                  validity='DAY'
              )
-             return order_id
         except Exception as e:
              logger.error(f"Error placing live order: {e}")
              return None
+        if not order_id: return None
+        return self.order_tracker.track(order_id, quantity, symbol=symbol, side=side.upper())
+
+    def _submit_live_order(self, symbol: str, quantity: int, price: float, side: str) -> Optional[OrderHandle]:
+        """Margin check, then place the order"""
+        if not self._check_margin_requirement(symbol, quantity, price, side):
+            return None
+        return self.place_live_order(symbol, quantity, price, side)
 
-    def _wait_for_order_completion(self, order_id: str, expected_quantity: int, timeout: int = 15, poll_interval: float = 1.0, cancel_on_timeout: bool = True) -> Tuple[int, Optional[float]]:
+    def _wait_for_order_completion(self, order: Union[OrderHandle, str], expected_quantity: int, timeout: int = 15, cancel_on_timeout: bool = True) -> Tuple[int, Optional[float]]:
         """Wait for order fill; return (filled_quantity, average_price)."""
-        if not self.kite:
+        if not self.kite or not self.order_tracker:
             return 0, None
 
-        def _extract_fill_data(events: List[Dict]) -> Tuple[int, Optional[float], str]:
-            fill_qty = 0
-            avg_price = None
-            status = ''
-            for event in events:
-                try:
-                    fill_qty = max(fill_qty, int(float(event.get('filled_quantity') or event.get('filled_qty') or 0)))
-                except (TypeError, ValueError):
-                    pass
-                price_candidate = event.get('average_price') or event.get('averageprice') or event.get('averagePrice')
-                if price_candidate is not None:
-                    try:
-                        avg_price = float(price_candidate)
-                    except (TypeError, ValueError):
-                        pass
-                status = str(event.get('status', '')).upper()
-            return fill_qty, avg_price, status
-
-        def check_order_status():
-            try:
-                history = self.kite.order_history(order_id) or []
-                filled_qty, avg_price, last_status = _extract_fill_data(history)
-
-                if last_status in {'COMPLETE', 'FILLED'} or filled_qty >= expected_quantity:
-                    return (filled_qty, avg_price, 'COMPLETE')
+        if not isinstance(order, OrderHandle):
+            order = self.order_tracker.track(order, expected_quantity)
+        order_id = order.order_id
 
-                if last_status in {'REJECTED', 'CANCELLED'}:
-                    message = history[-1].get('status_message') if history else 'No message'
-                    logger.error(f"Order {order_id} {last_status}: {message}")
-                    return (filled_qty, None, 'FAILED')
-
-                return None  # Still pending
-            except Exception as exc:
-                logger.warning(f"Order status check failed for {order_id}: {exc}")
-                return None
+        fill = order.wait(timeout)
+        if fill is None and self.order_tracker.refresh():
+            # Last look before cancelling, in case the stream missed the update
+            fill = order.wait(0)
 
-        result = poll_with_backoff(
-            check_order_status,
-            timeout=timeout,
-            initial_interval=poll_interval,
-            max_interval=min(5.0, timeout/6)
-        )
-
-        if result:
-            filled_qty, avg_price, status = result
-            if status == 'COMPLETE':
-                return filled_qty, avg_price
-            elif status == 'FAILED':
-                return filled_qty, None
+        if fill:
+            if fill.status == 'COMPLETE':
+                return fill.filled_quantity, fill.average_price
+            elif fill.status == 'FAILED':
+                return fill.filled_quantity, None
 
+        self.order_tracker.forget(order_id)
         if cancel_on_timeout:
             try:
                 variety = getattr(self.kite, 'VARIETY_REGULAR', 'regular')
@@ -423,6 +478,12 @@ class TradeExecutor:
         """Validate sufficient margin/cash before placing live order."""
         if not self.kite:
             return True
+        return self._has_margin(symbol, self._required_margin(symbol, quantity, price, side))
+
+    def _required_margin(self, symbol: str, quantity: int, price: float, side: str) -> float:
+        """Broker margin for an order, or its notional value if the margin API fails"""
+        if not self.kite:
+            return 0.0
 
         exchange, product, instrument_type = self._determine_order_context(symbol)
 
@@ -441,6 +502,12 @@ class TradeExecutor:
         except Exception as exc:
             logger.warning(f"⚠️ Could not fetch margin requirement for {symbol}: {exc}")
             required_margin = price * quantity
+        return required_margin
+
+    def _has_margin(self, symbol: str, required_margin: float, reserved: float = 0.0) -> bool:
+        """True if available cash, less ``reserved`` for orders not yet filled, covers the margin"""
+        if not self.kite:
+            return True
 
         available_cash = self.portfolio.cash
         try:
@@ -450,6 +517,7 @@ class TradeExecutor:
         except Exception as exc:
             logger.warning(f"⚠️ Failed to fetch broker margins, using local cash: {exc}")
 
+        available_cash -= reserved
         if required_margin > available_cash:
             logger.error(f"❌ Insufficient margin for {symbol}: required ₹{required_margin:,.2f}, available ₹{available_cash:,.2f}")
             return False
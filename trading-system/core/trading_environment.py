@@ -11,13 +11,14 @@ Features:
 - Multiple market regimes
 - Portfolio management
 - Customizable reward functions
+- Batched VectorTradingEnv stepping many environments in lockstep
 
 Author: Trading System
 Date: October 22, 2025
 """
 
 import logging
-from typing import Tuple, Dict, Optional, List
+from typing import Tuple, Dict, Optional, List, Union
 from enum import Enum
 import numpy as np
 import pandas as pd
@@ -25,6 +26,7 @@ import pandas as pd
 try:
     import gymnasium as gym
     from gymnasium import spaces
+    gymnasium = gym
 except ImportError:
     # Fallback to older gym if gymnasium not available
     try:
@@ -34,6 +36,7 @@ except ImportError:
     except ImportError:
         gym = None
         spaces = None
+        gymnasium = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -54,6 +57,65 @@ class RewardFunction(Enum):
     CALMAR = "calmar"  # Calmar ratio
 
 
+PRICE_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+N_PORTFOLIO_FEATURES = 3  # position, unrealized_pnl, cash_ratio
+
+# Returns the Sharpe/Sortino rewards look back over
+REWARD_WINDOW = 20
+
+
+def build_feature_matrix(data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-bar market features, computed once per episode instead of per step
+
+    Args:
+        data: DataFrame with OHLCV and technical columns
+
+    Returns:
+        (features, close): float32 array of shape (bars, 5 + n_technical)
+        holding OHLCV divided by close followed by the technical columns
+        (NaN as 0), and the float64 closes
+    """
+    close = data['close'].to_numpy(dtype=float)
+    prices = data[PRICE_COLUMNS].to_numpy(dtype=float) / close[:, None]
+    technical = data[[c for c in data.columns if c not in PRICE_COLUMNS]].to_numpy(dtype=float)
+    technical = np.where(np.isnan(technical), 0.0, technical)
+    return np.hstack([prices, technical]).astype(np.float32), close
+
+
+def stack_observations(
+    feature_windows: np.ndarray,
+    close_windows: np.ndarray,
+    position: np.ndarray,
+    entry_price: np.ndarray,
+    cash_ratio: np.ndarray
+) -> np.ndarray:
+    """
+    Flattened observations from market feature windows plus portfolio state
+
+    Args:
+        feature_windows: (envs, lookback, n_market_features) slices of
+            ``build_feature_matrix`` output
+        close_windows: (envs, lookback) closes for the same bars
+        position, entry_price, cash_ratio: (envs,) portfolio state
+
+    Returns:
+        float32 array of shape (envs, lookback * (n_market_features + 3));
+        each bar contributes its market features then position, unrealized
+        P&L at that bar's close and cash ratio
+    """
+    n_envs, lookback, n_market = feature_windows.shape
+    obs = np.empty((n_envs, lookback, n_market + N_PORTFOLIO_FEATURES), dtype=np.float32)
+    obs[:, :, :n_market] = feature_windows
+
+    held = (position != 0) & (entry_price > 0)
+    entry = np.where(held, entry_price, 1.0)[:, None]
+    obs[:, :, n_market] = position[:, None]
+    obs[:, :, n_market + 1] = np.where(held[:, None], position[:, None] * (close_windows - entry) / entry, 0.0)
+    obs[:, :, n_market + 2] = cash_ratio[:, None]
+    return obs.reshape(n_envs, -1)
+
+
 class TradingEnvironment(gym.Env if gym else object):
     """
     OpenAI Gym-compatible trading environment for RL
@@ -130,6 +192,12 @@ class TradingEnvironment(gym.Env if gym else object):
         self.returns_history = []
         self.actions_history = []
         self.rewards_history = []
+        self._peak_equity = initial_capital
+        self._max_drawdown = 0.0
+
+        # Market features, built at reset
+        self._features: Optional[np.ndarray] = None
+        self._close: Optional[np.ndarray] = None
 
         # Define action and observation spaces
         self._define_spaces()
@@ -197,6 +265,11 @@ class TradingEnvironment(gym.Env if gym else object):
         self.returns_history = []
         self.actions_history = []
         self.rewards_history = []
+        self._peak_equity = self.initial_capital
+        self._max_drawdown = 0.0
+
+        # Normalize market features once; observations slice this matrix
+        self._features, self._close = build_feature_matrix(self.data)
 
         obs = self._get_observation()
 
@@ -223,8 +296,11 @@ class TradingEnvironment(gym.Env if gym else object):
         # Convert action to position size
         target_position = self._action_to_position(action)
 
+        if self._features is None:
+            self._features, self._close = build_feature_matrix(self.data)
+
         # Execute trade
-        current_price = self.data.iloc[self.current_step]['close']
+        current_price = self._close[self.current_step]
         reward = self._execute_trade(target_position, current_price)
 
         # Update step
@@ -349,6 +425,8 @@ class TradingEnvironment(gym.Env if gym else object):
 
         self.equity_history.append(self.portfolio_value)
         self.returns_history.append(current_return)
+        self._peak_equity = max(self._peak_equity, self.portfolio_value)
+        self._max_drawdown = max(self._max_drawdown, (self._peak_equity - self.portfolio_value) / self._peak_equity)
 
         # Calculate reward based on chosen reward function
         reward = self._calculate_reward(current_return, unrealized_pnl)
@@ -364,7 +442,7 @@ class TradingEnvironment(gym.Env if gym else object):
         elif self.reward_function == RewardFunction.SHARPE:
             # Sharpe ratio-based reward
             if len(self.returns_history) > 2:
-                returns = np.array(self.returns_history[-20:])  # Last 20 returns
+                returns = np.array(self.returns_history[-REWARD_WINDOW:])  # Last 20 returns
                 if returns.std() > 0:
                     sharpe = returns.mean() / returns.std() * np.sqrt(252)
                     reward = sharpe
@@ -376,7 +454,7 @@ class TradingEnvironment(gym.Env if gym else object):
         elif self.reward_function == RewardFunction.SORTINO:
             # Sortino ratio-based reward (only penalize downside volatility)
             if len(self.returns_history) > 2:
-                returns = np.array(self.returns_history[-20:])
+                returns = np.array(self.returns_history[-REWARD_WINDOW:])
                 negative_returns = returns[returns < 0]
                 if len(negative_returns) > 0:
                     downside_std = negative_returns.std()
@@ -393,13 +471,11 @@ class TradingEnvironment(gym.Env if gym else object):
         elif self.reward_function == RewardFunction.CALMAR:
             # Calmar ratio-based reward (return / max drawdown)
             if len(self.equity_history) > 2:
-                equity = np.array(self.equity_history)
-                peak = np.maximum.accumulate(equity)
-                drawdown = (equity - peak) / peak
-                max_drawdown = abs(drawdown.min())
+                # Running peak/drawdown instead of rescanning the equity curve
+                max_drawdown = self._max_drawdown
 
                 if max_drawdown > 0.01:  # Avoid division by very small numbers
-                    total_return = (equity[-1] - equity[0]) / equity[0]
+                    total_return = (self.equity_history[-1] - self.equity_history[0]) / self.equity_history[0]
                     calmar = total_return / max_drawdown
                     reward = calmar
                 else:
@@ -422,58 +498,25 @@ class TradingEnvironment(gym.Env if gym else object):
         Returns:
             Flattened numpy array of features
         """
-        if self.current_step < self.lookback_window:
-            # Pad with zeros if at start
-            lookback_data = self.data.iloc[:self.current_step + 1]
-            padding_needed = self.lookback_window - len(lookback_data)
-        else:
-            lookback_data = self.data.iloc[self.current_step - self.lookback_window + 1:self.current_step + 1]
-            padding_needed = 0
-
-        features_list = []
-
-        for idx, row in lookback_data.iterrows():
-            # Price features
-            price_features = [
-                row['open'],
-                row['high'],
-                row['low'],
-                row['close'],
-                row['volume']
-            ]
-
-            # Normalize prices
-            close = row['close']
-            normalized_prices = [p / close for p in price_features]
-
-            # Technical features (already in data)
-            technical_features = []
-            for col in self.data.columns:
-                if col not in ['open', 'high', 'low', 'close', 'volume']:
-                    technical_features.append(row[col] if not pd.isna(row[col]) else 0.0)
-
-            # Portfolio features
-            unrealized_pnl = 0.0
-            if self.position != 0 and self.entry_price > 0:
-                unrealized_pnl = self.position * (close - self.entry_price) / self.entry_price
-
-            portfolio_features = [
-                self.position,
-                unrealized_pnl,
-                self.capital / self.initial_capital
-            ]
-
-            # Combine all features
-            step_features = normalized_prices + technical_features + portfolio_features
-            features_list.extend(step_features)
-
-        # Pad if necessary
+        start = max(self.current_step - self.lookback_window + 1, 0)
+        end = self.current_step + 1
+
+        # Views into the precomputed feature matrix; only the portfolio
+        # columns are computed per step
+        obs = stack_observations(
+            self._features[None, start:end],
+            self._close[None, start:end],
+            np.array([self.position]),
+            np.array([self.entry_price]),
+            np.array([self.capital / self.initial_capital])
+        )[0]
+
+        # Pad with zeros if at start
+        padding_needed = self.lookback_window - (end - start)
         if padding_needed > 0:
-            n_features_per_step = len(features_list) // len(lookback_data) if len(lookback_data) > 0 else 8
-            padding = [0.0] * (n_features_per_step * padding_needed)
-            features_list = padding + features_list
+            obs = np.concatenate([np.zeros(padding_needed * (len(obs) // (end - start)), dtype=np.float32), obs])
 
-        return np.array(features_list, dtype=np.float32)
+        return obs
 
     def render(self, mode='human'):
         """Render environment state"""
@@ -527,6 +570,290 @@ class TradingEnvironment(gym.Env if gym else object):
         }
 
 
+class VectorTradingEnv:
+    """
+    N trading environments stepped in lockstep with array operations
+
+    Each sub-environment replays its own DataFrame (a different symbol or
+    the same symbol from a different start offset) with the same trading
+    rules as ``TradingEnvironment``; portfolio state is held in (n_envs,)
+    arrays so one ``step`` call advances every environment at once.
+    Finished environments are reset automatically and report their final
+    portfolio value in ``info['final_portfolio_value']``.
+
+    Returns gymnasium-style tuples: ``reset`` gives (obs, info) and ``step``
+    gives (obs, rewards, dones, truncated, info) with a leading env axis.
+    """
+
+    def __init__(
+        self,
+        data: Union[pd.DataFrame, List[pd.DataFrame]],
+        start_offsets: Optional[List[int]] = None,
+        initial_capital: float = 100000.0,
+        transaction_cost_pct: float = 0.001,
+        slippage_pct: float = 0.0005,
+        action_space_type: ActionSpace = ActionSpace.CONTINUOUS,
+        reward_function: RewardFunction = RewardFunction.SHARPE,
+        lookback_window: int = 20,
+        max_position_size: float = 1.0,
+        enable_short_selling: bool = True,
+        reward_scaling: float = 1.0,
+    ):
+        """
+        Initialize vectorized trading environment
+
+        Args:
+            data: One DataFrame per environment, or a single DataFrame shared
+                by all environments (then ``start_offsets`` sets their count)
+            start_offsets: Bars to skip before each environment's first
+                observation (default 0 for every environment)
+            Remaining arguments as in ``TradingEnvironment``
+        """
+        datasets = [data] if isinstance(data, pd.DataFrame) else list(data)
+        if start_offsets is None:
+            start_offsets = [0] * len(datasets)
+        if len(datasets) == 1 and len(start_offsets) > 1:
+            datasets = datasets * len(start_offsets)
+        if len(datasets) != len(start_offsets):
+            raise ValueError("Need one start offset per DataFrame")
+
+        for df in datasets:
+            for col in PRICE_COLUMNS:
+                if col not in df.columns:
+                    raise ValueError(f"Data must contain '{col}' column")
+            if list(df.columns) != list(datasets[0].columns):
+                raise ValueError("All DataFrames must share the same columns")
+
+        self.n_envs = len(datasets)
+        self.initial_capital = initial_capital
+        self.transaction_cost_pct = transaction_cost_pct
+        self.slippage_pct = slippage_pct
+        self.action_space_type = action_space_type
+        self.reward_function = reward_function
+        self.lookback_window = lookback_window
+        self.max_position_size = max_position_size
+        self.enable_short_selling = enable_short_selling
+        self.reward_scaling = reward_scaling
+
+        # Market features for every environment, zero-padded to the longest series
+        matrices = [build_feature_matrix(df) for df in datasets]
+        self._lengths = np.array([len(close) for _, close in matrices])
+        n_bars = self._lengths.max()
+        n_market = matrices[0][0].shape[1]
+        self._features = np.zeros((self.n_envs, n_bars, n_market), dtype=np.float32)
+        self._close = np.ones((self.n_envs, n_bars))
+        for i, (features, close) in enumerate(matrices):
+            self._features[i, :len(close)] = features
+            self._close[i, :len(close)] = close
+
+        self._start_steps = lookback_window + np.asarray(start_offsets, dtype=int)
+        if np.any(self._start_steps >= self._lengths - 1):
+            raise ValueError("Start offset leaves no bars to step through")
+
+        self._env_idx = np.arange(self.n_envs)
+        self._window = np.arange(-lookback_window + 1, 1)
+        self.observation_dim = lookback_window * (n_market + N_PORTFOLIO_FEATURES)
+
+        if spaces is not None:
+            if action_space_type == ActionSpace.DISCRETE:
+                self.action_space = spaces.Discrete(3)
+            else:
+                self.action_space = spaces.Box(
+                    low=-1.0 if enable_short_selling else 0.0,
+                    high=1.0,
+                    shape=(1,),
+                    dtype=np.float32
+                )
+            self.observation_space = spaces.Box(
+                low=-np.inf,
+                high=np.inf,
+                shape=(self.observation_dim,),
+                dtype=np.float32
+            )
+
+        self._reset_state(np.ones(self.n_envs, dtype=bool))
+
+        logger.info(f"Vector trading environment initialized: {self.n_envs} envs, "
+                   f"action_space={action_space_type.value}, "
+                   f"reward={reward_function.value}")
+
+    def _reset_state(self, mask: np.ndarray):
+        """Reset portfolio state for the environments selected by mask"""
+        if not hasattr(self, 'current_step'):
+            self.current_step = np.zeros(self.n_envs, dtype=int)
+            self.capital = np.zeros(self.n_envs)
+            self.position = np.zeros(self.n_envs)
+            self.entry_price = np.zeros(self.n_envs)
+            self.portfolio_value = np.zeros(self.n_envs)
+            self._peak_equity = np.zeros(self.n_envs)
+            self._max_drawdown = np.zeros(self.n_envs)
+            self._returns = np.zeros((self.n_envs, REWARD_WINDOW))
+            self._n_returns = np.zeros(self.n_envs, dtype=int)
+
+        self.current_step[mask] = self._start_steps[mask]
+        self.capital[mask] = self.initial_capital
+        self.position[mask] = 0.0
+        self.entry_price[mask] = 0.0
+        self.portfolio_value[mask] = self.initial_capital
+        self._peak_equity[mask] = self.initial_capital
+        self._max_drawdown[mask] = 0.0
+        self._returns[mask] = 0.0
+        self._n_returns[mask] = 0
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[np.ndarray, Dict]:
+        """
+        Reset every environment
+
+        Returns:
+            (observations, info) with observations of shape (n_envs, observation_dim)
+        """
+        if seed is not None:
+            np.random.seed(seed)
+
+        self._reset_state(np.ones(self.n_envs, dtype=bool))
+        return self._get_observations(), {}
+
+    def step(self, actions) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Dict]:
+        """
+        Execute one step in every environment
+
+        Args:
+            actions: (n_envs,) discrete actions or (n_envs,) / (n_envs, 1)
+                continuous position targets
+
+        Returns:
+            (observations, rewards, dones, truncated, info); info maps
+            'portfolio_value', 'position', 'step', 'capital' and
+            'final_portfolio_value' (NaN unless done) to (n_envs,) arrays
+        """
+        target = self._actions_to_positions(np.asarray(actions))
+        price = self._close[self._env_idx, self.current_step]
+        rewards = self._execute_trades(target, price)
+
+        self.current_step += 1
+        dones = (
+            (self.current_step >= self._lengths - 1) |
+            (self.portfolio_value <= 0.1 * self.initial_capital)  # Stop if lost 90%
+        )
+
+        info = {
+            'portfolio_value': self.portfolio_value.copy(),
+            'position': self.position.copy(),
+            'step': self.current_step.copy(),
+            'capital': self.capital.copy(),
+            'final_portfolio_value': np.where(dones, self.portfolio_value, np.nan)
+        }
+
+        if dones.any():
+            self._reset_state(dones)
+
+        return self._get_observations(), rewards, dones, np.zeros(self.n_envs, dtype=bool), info
+
+    def _actions_to_positions(self, actions: np.ndarray) -> np.ndarray:
+        """Convert a batch of actions to target position sizes"""
+        min_pos = -self.max_position_size if self.enable_short_selling else 0.0
+
+        if self.action_space_type == ActionSpace.DISCRETE:
+            actions = actions.reshape(self.n_envs)
+            return np.where(
+                actions == 0, min_pos,
+                np.where(actions == 1, self.position, self.max_position_size)
+            )
+
+        actions = actions.reshape(self.n_envs, -1)[:, 0].astype(float)
+        return np.clip(actions, min_pos, self.max_position_size)
+
+    def _execute_trades(self, target: np.ndarray, price: np.ndarray) -> np.ndarray:
+        """Vectorized ``TradingEnvironment._execute_trade``; returns rewards"""
+        position = self.position
+        entry = self.entry_price
+        change = target - position
+
+        trade_value = np.abs(change) * price * self.initial_capital
+        self.capital -= trade_value * (self.transaction_cost_pct + self.slippage_pct)
+
+        held = (position != 0) & (entry > 0)
+        pnl = np.where(held, position * (price - entry) * self.initial_capital, 0.0)
+
+        trading = np.abs(change) > 1e-6
+        flipping = trading & (np.sign(position) != np.sign(target)) & (np.abs(position) > 1e-6)
+        opening = trading & ~flipping & (np.abs(position) < 1e-6)
+        adding = trading & ~flipping & ~opening & (np.abs(target) > 0)
+
+        self.capital += np.where(flipping, pnl, 0.0)
+        averaged = (np.abs(position) * entry + np.abs(change) * price) / np.where(adding, np.abs(target), 1.0)
+        self.entry_price = np.where(flipping | opening, price, np.where(adding, averaged, entry))
+        self.position = np.where(trading, target, position)
+
+        unrealized_pnl = np.where(
+            self.position != 0, self.position * (price - self.entry_price) * self.initial_capital, 0.0
+        )
+        prev_value = self.portfolio_value
+        self.portfolio_value = self.capital + unrealized_pnl
+        current_return = (self.portfolio_value - prev_value) / prev_value
+
+        self._returns[:, :-1] = self._returns[:, 1:]
+        self._returns[:, -1] = current_return
+        self._n_returns += 1
+        self._peak_equity = np.maximum(self._peak_equity, self.portfolio_value)
+        self._max_drawdown = np.maximum(
+            self._max_drawdown, (self._peak_equity - self.portfolio_value) / self._peak_equity
+        )
+
+        return self._calculate_rewards(current_return, unrealized_pnl)
+
+    def _calculate_rewards(self, current_return: np.ndarray, unrealized_pnl: np.ndarray) -> np.ndarray:
+        """Vectorized ``TradingEnvironment._calculate_reward``"""
+        fallback = current_return * 100
+        warm = self._n_returns > 2
+
+        if self.reward_function == RewardFunction.PNL:
+            reward = unrealized_pnl / self.initial_capital * 100
+
+        elif self.reward_function in (RewardFunction.SHARPE, RewardFunction.SORTINO):
+            # Returns still inside each env's window; older slots are stale
+            valid = np.arange(REWARD_WINDOW) >= REWARD_WINDOW - np.minimum(self._n_returns, REWARD_WINDOW)[:, None]
+            count = valid.sum(axis=1)
+            mean = np.where(valid, self._returns, 0.0).sum(axis=1) / np.maximum(count, 1)
+
+            if self.reward_function == RewardFunction.SHARPE:
+                std = np.sqrt(np.where(valid, (self._returns - mean[:, None]) ** 2, 0.0).sum(axis=1) / np.maximum(count, 1))
+                ratio = mean / np.where(std > 0, std, 1.0) * np.sqrt(252)
+                reward = np.where(warm, np.where(std > 0, ratio, 0.0), fallback)
+            else:
+                negative = valid & (self._returns < 0)
+                n_negative = negative.sum(axis=1)
+                negative_mean = np.where(negative, self._returns, 0.0).sum(axis=1) / np.maximum(n_negative, 1)
+                downside_std = np.sqrt(
+                    np.where(negative, (self._returns - negative_mean[:, None]) ** 2, 0.0).sum(axis=1) /
+                    np.maximum(n_negative, 1)
+                )
+                ratio = mean / np.where(downside_std > 0, downside_std, 1.0) * np.sqrt(252)
+                reward = np.where(warm, np.where(downside_std > 0, ratio, mean * 100), fallback)
+
+        elif self.reward_function == RewardFunction.CALMAR:
+            total_return = (self.portfolio_value - self.initial_capital) / self.initial_capital
+            calmar = total_return / np.where(self._max_drawdown > 0.01, self._max_drawdown, 1.0)
+            reward = np.where(self._n_returns >= 2, np.where(self._max_drawdown > 0.01, calmar, fallback), fallback)
+
+        else:
+            reward = fallback
+
+        return reward * self.reward_scaling
+
+    def _get_observations(self) -> np.ndarray:
+        """Observation windows for every environment, shape (n_envs, observation_dim)"""
+        bars = self.current_step[:, None] + self._window
+        rows = self._env_idx[:, None]
+        return stack_observations(
+            self._features[rows, bars],
+            self._close[rows, bars],
+            self.position,
+            self.entry_price,
+            self.capital / self.initial_capital
+        )
+
+
 if __name__ == "__main__":
     print("Trading Environment Module")
     print("=" * 50)
@@ -17,10 +17,14 @@ Key improvements:
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple, Optional
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 import logging
+import pickle
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -299,6 +303,72 @@ class AbstractTradingLoop(ABC):
         pass
 
 
+class ReplayPanel:
+    """
+    Historical data pre-aligned onto one integer time axis
+
+    Built once per backtest so the replay never searches or filters a
+    DataFrame per bar: ``ends[t, j]`` is how many of symbol j's bars lie
+    strictly before ``times[t]`` and ``close[t, j]`` is its close at
+    ``times[t]`` (NaN when it has no bar there). Strategy inputs are
+    positional slices of each symbol's frame, i.e. views, not copies.
+    """
+
+    def __init__(self, df_map: Dict[str, pd.DataFrame], all_times: List[pd.Timestamp]):
+        self.symbols = list(df_map)
+        self.times = pd.DatetimeIndex(all_times)
+        self.frames: Dict[str, pd.DataFrame] = {}
+
+        self.ends = np.zeros((len(self.times), len(self.symbols)), dtype=np.int64)
+        self.close = np.full((len(self.times), len(self.symbols)), np.nan)
+
+        for j, symbol in enumerate(self.symbols):
+            df = df_map[symbol]
+            if not df.index.is_monotonic_increasing:
+                df = df.sort_index()
+            if df.index.has_duplicates:
+                df = df[~df.index.duplicated(keep='last')]
+            self.frames[symbol] = df
+
+            ends = df.index.searchsorted(self.times, side='left')
+            self.ends[:, j] = ends
+            if 'close' in df.columns and len(df):
+                at = np.minimum(ends, len(df) - 1)
+                on_bar = (ends < len(df)) & (df.index[at] == self.times)
+                self.close[on_bar, j] = df['close'].to_numpy(dtype=float)[at[on_bar]]
+
+        self.column = {symbol: j for j, symbol in enumerate(self.symbols)}
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def prices_at(self, t: int) -> Dict[str, float]:
+        """Closes of the symbols that have a bar at time index ``t``"""
+        row = self.close[t]
+        return {self.symbols[j]: float(row[j]) for j in np.flatnonzero(~np.isnan(row))}
+
+    def history_length(self, symbol: str, t: int) -> int:
+        """Number of bars strictly before time index ``t``"""
+        return int(self.ends[t, self.column[symbol]])
+
+    def window(self, symbol: str, t: int, lookback: Optional[int] = None) -> pd.DataFrame:
+        """Bars strictly before time index ``t`` (at most ``lookback`` of them), as a view"""
+        end = self.history_length(symbol, t)
+        start = max(0, end - lookback) if lookback else 0
+        return self.frames[symbol].iloc[start:end]
+
+    def last_prices(self) -> Dict[str, float]:
+        """Latest close of every symbol up to the final timestamp"""
+        prices = {}
+        if not len(self.times):
+            return prices
+        for symbol, df in self.frames.items():
+            end = df.index.searchsorted(self.times[-1], side='right')
+            if end and 'close' in df.columns:
+                prices[symbol] = float(df['close'].iloc[end - 1])
+        return prices
+
+
 class BacktestTradingLoop(AbstractTradingLoop):
     """
     Backtesting implementation using unified logic
@@ -307,9 +377,14 @@ class BacktestTradingLoop(AbstractTradingLoop):
     ensuring backtest results accurately predict live performance
     """
 
+    # Bars of history a symbol needs before it is traded
+    MIN_HISTORY_BARS = 50
+
     def __init__(self, portfolio, strategies, aggregator, config, data_provider):
         super().__init__(portfolio, strategies, aggregator, config)
         self.data_provider = data_provider
+        # Trailing bars handed to strategies (None = full history)
+        self.lookback = config.get('replay_lookback_bars')
 
     def fetch_data(
         self,
@@ -332,7 +407,10 @@ class BacktestTradingLoop(AbstractTradingLoop):
             df = df_map[symbol]
             if timestamp is not None:
                 # CRITICAL: Only use data BEFORE current timestamp
-                df = df[df.index < timestamp]
+                if df.index.is_monotonic_increasing:
+                    df = df.iloc[:df.index.searchsorted(timestamp, side='left')]
+                else:
+                    df = df[df.index < timestamp]
             return df
         else:
             # Fallback to data provider
@@ -347,6 +425,11 @@ class BacktestTradingLoop(AbstractTradingLoop):
         """
         Run backtest with unified logic
 
+        All symbols are aligned onto one integer time axis up front
+        (``ReplayPanel``), so each bar costs a row lookup and strategies
+        receive positional views of the bars before ``ts`` rather than a
+        freshly filtered copy of the whole history.
+
         Args:
             symbols: List of symbols to trade
             df_map: Pre-loaded historical data
@@ -356,16 +439,12 @@ class BacktestTradingLoop(AbstractTradingLoop):
             Dict with backtest results
         """
         logger.info("⚡ Running UNIFIED backtest (matches live trading logic)...")
+        started = time.perf_counter()
+        replay = ReplayPanel(df_map, all_times)
 
-        for ts_idx, ts in enumerate(all_times[:-1]):
+        for ts_idx, ts in enumerate(replay.times[:-1]):
             # Get prices at this timestamp
-            prices = {}
-            for symbol, df in df_map.items():
-                if ts in df.index:
-                    try:
-                        prices[symbol] = float(df.loc[ts, 'close'])
-                    except Exception:
-                        continue
+            prices = replay.prices_at(ts_idx)
 
             # Update stop losses (UNIFIED LOGIC)
             for symbol, position in list(self.portfolio.positions.items()):
@@ -392,11 +471,10 @@ class BacktestTradingLoop(AbstractTradingLoop):
                 if symbol not in prices:
                     continue
 
-                # Fetch data up to current timestamp (no look-ahead)
-                data = self.fetch_data(symbol, timestamp=ts, df_map=df_map)
-
-                if len(data) < 50:
+                # Data up to current timestamp (no look-ahead)
+                if replay.history_length(symbol, ts_idx) < self.MIN_HISTORY_BARS:
                     continue
+                data = replay.window(symbol, ts_idx, self.lookback)
 
                 # Generate signal using SAME logic as live
                 signal = self.generate_signals(symbol, data)
@@ -432,13 +510,101 @@ class BacktestTradingLoop(AbstractTradingLoop):
                             atr=signal.get('atr')
                         )
 
-        logger.info("✅ Unified backtest complete")
+        elapsed = time.perf_counter() - started
+        logger.info(f"✅ Unified backtest complete: {max(len(replay) - 1, 0)} bars in {elapsed:.1f}s")
+
+        return {
+            'bars': max(len(replay) - 1, 0),
+            'symbols': list(symbols),
+            'start': replay.times[0] if len(replay) else None,
+            'end': replay.times[-1] if len(replay) else None,
+            'final_value': self.portfolio.calculate_total_value(replay.last_prices()),
+            'cash': self.portfolio.cash,
+            'open_positions': len(self.portfolio.positions),
+            'trades': getattr(self.portfolio, 'trades_count', None),
+            'elapsed_seconds': elapsed,
+        }
 
     def get_sector(self, symbol: str) -> str:
         """Get sector for symbol (placeholder)"""
         return "Other"
 
 
+def _run_shard(loop_factory: Callable[[], BacktestTradingLoop], symbols: List[str],
+               df_map: Dict[str, pd.DataFrame], times: List[pd.Timestamp]) -> Dict[str, Any]:
+    """Replay one shard on a fresh loop (process pool entry point)"""
+    return loop_factory().run(symbols, df_map, times)
+
+
+def run_sharded(
+    loop_factory: Callable[[], BacktestTradingLoop],
+    symbols: List[str],
+    df_map: Dict[str, pd.DataFrame],
+    all_times: List[pd.Timestamp],
+    shards: int,
+    by: str = 'symbol',
+    max_workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Split a backtest into independent shards and replay them in parallel
+
+    Each shard runs on its own loop from ``loop_factory`` (and so its own
+    portfolio): capital and position limits apply per shard, which suits
+    nightly signal-quality runs. Use ``BacktestTradingLoop.run`` directly
+    when all symbols must share one portfolio.
+
+    Args:
+        loop_factory: Picklable zero-argument callable returning a new loop
+        symbols: Symbols to trade
+        df_map: Pre-loaded historical data
+        all_times: All timestamps to iterate through
+        shards: Number of shards
+        by: 'symbol' to split the symbol list, 'date' to split the time
+            axis into consecutive ranges (earlier bars stay visible as history)
+        max_workers: Process count (None = one per shard, 1 = in-process)
+
+    Returns:
+        One result dict per shard, in shard order
+    """
+    if by not in ('symbol', 'date'):
+        raise ValueError(f"Unknown shard axis: {by}")
+
+    jobs = []
+    if by == 'symbol':
+        for group in np.array_split(np.asarray(symbols, dtype=object), shards):
+            if len(group):
+                group = list(group)
+                jobs.append((group, {s: df_map[s] for s in group if s in df_map}, list(all_times)))
+    else:
+        for chunk in np.array_split(np.arange(len(all_times)), shards):
+            if len(chunk):
+                times = [all_times[i] for i in chunk]
+                # One bar past the range so its last timestamp is traded too
+                if chunk[-1] + 1 < len(all_times):
+                    times.append(all_times[chunk[-1] + 1])
+                last = times[-1]
+                jobs.append((list(symbols), {s: df[df.index <= last] for s, df in df_map.items()}, times))
+
+    workers = min(max_workers or len(jobs), len(jobs))
+    if workers > 1:
+        try:
+            pickle.dumps(loop_factory)
+        except Exception as e:
+            logger.warning(f"Loop factory is not picklable ({e}); replaying shards in-process")
+            workers = 1
+
+    if workers <= 1:
+        results = [_run_shard(loop_factory, *job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_run_shard, loop_factory, *job) for job in jobs]
+            results = [future.result() for future in futures]
+
+    for shard, result in enumerate(results):
+        result['shard'] = shard
+    return results
+
+
 # ============================================================================
 # CODE UNIFICATION SUMMARY
 # ============================================================================
@@ -11,7 +11,7 @@ import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
-from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
 import logging
 
 import pandas as pd
@@ -25,6 +25,7 @@ from trading_utils import (
     format_ist_timestamp,
     safe_divide,
     safe_float_conversion,
+    is_zero,
     validate_symbol,
     CircuitBreaker,
 )
@@ -42,6 +43,7 @@ from api_rate_limiter import wrap_kite_with_rate_limiter
 from utilities.market_hours import MarketHoursManager
 from utilities.state_managers import TradingStateManager
 from utilities.dashboard import DashboardConnector
+from utilities.logger import SECTOR_GROUPS
 from advanced_market_manager import AdvancedMarketManager
 from core.security_context import SecurityContext
 from core.backtest_engine import BacktestEngine
@@ -238,11 +240,16 @@ class UnifiedTradingSystem:
             if s and s not in self.symbols:
                 self.symbols.append(s)
 
-    def run_fast_backtest(self, interval: str = "5minute", days: int = 30) -> None:
+    def run_fast_backtest(self, interval: str = "5minute", days: int = 30, portfolio: bool = False) -> None:
         """
         Run high-performance vectorized backtest
+
+        With ``portfolio=True`` the watchlist is backtested as one panel sharing
+        capital under the system's ``max_positions`` limit.
         """
-        self.backtest_engine.run_fast_backtest(self.symbols, interval, days)
+        self.backtest_engine.run_fast_backtest(
+            self.symbols, interval, days, portfolio=portfolio, max_positions=self.max_positions
+        )
 
 
 
@@ -1123,115 +1130,198 @@ class UnifiedTradingSystem:
         today = datetime.now().date()
         return expiry_date.date() == today
 
+    def _scan_pool_sizes(self, batch_size: int) -> Tuple[int, int]:
+        """Worker counts for the fetch (I/O) and signal (CPU) pools of a scan"""
+        rate_limiter = getattr(self.dp, 'rate_limiter', None)
+        fetch_budget = getattr(rate_limiter, 'max_per_second', 3) or 1
+        fetch_workers = int(self.config.get('scan_fetch_workers', fetch_budget))
+        compute_workers = int(self.config.get('scan_workers', os.cpu_count() or 2))
+        return (
+            max(1, min(batch_size, fetch_workers)),
+            max(1, min(batch_size, compute_workers)),
+        )
+
     def scan_batch(self, batch: List[str], interval: str, batch_num: int, total_batches: int) -> Tuple[Dict, Dict]:
-        """Scan a batch of symbols for signals"""
+        """
+        Scan a batch of symbols for signals
+
+        Historical data for the whole batch is fetched concurrently, bounded by
+        the data provider's historical_data rate budget. Each symbol's signal
+        generation is handed to a worker pool as soon as its candles arrive, so
+        network waits overlap with strategy evaluation. Actionable signals are
+        then confirmed by the ML model in a single batched prediction. Results
+        are returned in batch order.
+        """
         signals = {}
         prices = {}
+        if not batch:
+            return signals, prices
         logger.info(f"  Batch {batch_num}/{total_batches}: {', '.join(batch[:3])}...")
 
-        for symbol in batch:
-            try:
-                df = self.dp.fetch_with_retry(symbol, interval=interval, days=5)
-                if df.empty or len(df) < 50:
+        scan_timeout = self.config.get('scan_timeout') if self.config else None
+        deadline = time.monotonic() + scan_timeout if scan_timeout else None
+
+        def remaining() -> Optional[float]:
+            return None if deadline is None else max(0.0, deadline - time.monotonic())
+
+        fetch_workers, compute_workers = self._scan_pool_sizes(len(batch))
+        fetch_pool = ThreadPoolExecutor(max_workers=fetch_workers, thread_name_prefix='scan-fetch')
+        compute_pool = ThreadPoolExecutor(max_workers=compute_workers, thread_name_prefix='scan-signal')
+        results: Dict[str, Tuple[float, Optional[Dict]]] = {}
+        frames: Dict[str, pd.DataFrame] = {}
+
+        try:
+            fetch_futures = {
+                fetch_pool.submit(self.dp.fetch_with_retry, symbol, interval=interval, days=5): symbol
+                for symbol in batch
+            }
+            compute_futures = {}
+            for future in as_completed(fetch_futures, timeout=remaining()):
+                symbol = fetch_futures[future]
+                try:
+                    df = future.result()
+                except Exception as e:
+                    logger.error(f"Error scanning {symbol}: {e}", exc_info=True)
                     continue
+                if df is None or df.empty or len(df) < 50:
+                    continue
+                frames[symbol] = df
+                compute_futures[compute_pool.submit(self._evaluate_symbol, symbol, df)] = symbol
 
-                current_price = safe_float_conversion(df["close"].iloc[-1])
-                prices[symbol] = current_price
+            for future in as_completed(compute_futures, timeout=remaining()):
+                symbol = compute_futures[future]
+                try:
+                    results[symbol] = future.result()
+                except Exception as e:
+                    logger.error(f"Error scanning {symbol}: {e}", exc_info=True)
+        except FutureTimeoutError:
+            logger.warning(
+                f"⏱️ Scan timeout after {scan_timeout}s: "
+                f"{len(batch) - len(results)} of {len(batch)} symbols skipped this iteration"
+            )
+        finally:
+            fetch_pool.shutdown(wait=False, cancel_futures=True)
+            compute_pool.shutdown(wait=False, cancel_futures=True)
+
+        # ML confirmation for every actionable signal in one batched model call
+        if self.ml_predictor.model:
+            actionable = {symbol: frames[symbol] for symbol, (_, aggregated) in results.items() if aggregated is not None}
+            if actionable:
+                for symbol, ml_pred in self.ml_predictor.predict_many(actionable).items():
+                    self._apply_ml_confirmation(results[symbol][1], ml_pred)
 
-                # Generate signals from all strategies
-                strategy_signals = []
-                for strategy in self.strategies:
-                    sig = strategy.generate_signals(df, symbol)
-                    strategy_signals.append(sig)
+        for symbol in batch:
+            if symbol not in results:
+                continue
+            current_price, aggregated = results[symbol]
+            prices[symbol] = current_price
+            if aggregated is None:
+                continue
 
-                # Check if this is an exit signal for existing position
-                is_exit_signal = symbol in self.portfolio.positions
+            signals[symbol] = aggregated
 
-                # Aggregate signals (pass is_exit to allow exits regardless of regime)
-                aggregated = self.aggregator.aggregate_signals(strategy_signals, symbol, is_exit=is_exit_signal)
+            # Send signal to dashboard
+            if self.dashboard:
+                self.dashboard.send_signal(
+                    symbol=symbol,
+                    action=aggregated['action'],
+                    confidence=aggregated['confidence'],
+                    price=current_price,
+                    sector=self.get_sector(symbol),
+                    reasons=aggregated.get('reasons', [])
+                )
 
-                if aggregated['action'] != 'hold':
-                    # Debug logging to show all signals
-                    sector = self.get_sector(symbol)
-                    logger.info(f"    {symbol} ({sector}): {aggregated['action'].upper()} @ ₹{current_price:.2f} ({aggregated['confidence']:.1%}) - {aggregated.get('reasons', ['N/A'])}")
+        return signals, prices
 
-                    # Disable trend filter for aggressive profile to allow more trades
-                    if not hasattr(self, 'config') or self.config is None:
-                        trend_filter_enabled = self.trading_mode != 'backtest'
-                        trading_profile = None
-                    else:
-                        trend_filter_enabled = self.config.get('trend_filter_enabled', self.trading_mode != 'backtest')
-                        trading_profile = self.config.get('trading_profile')
-
-                    # CRITICAL FIX: Skip trend filter for exits (position liquidations)
-                    # Only apply trend filter to NEW entry signals, not existing position exits
-                    if trend_filter_enabled and not (self.trading_mode == 'paper' and trading_profile == 'Aggressive') and not is_exit_signal:
-                        ema_fast = safe_float_conversion(df['close'].ewm(span=20, adjust=False).mean().iloc[-1])
-                        ema_slow = safe_float_conversion(df['close'].ewm(span=50, adjust=False).mean().iloc[-1])
-                        if is_zero(ema_fast) or is_zero(ema_slow):
-                            logger.info(f"    {symbol}: Skipping due to NaN trend data")
-                            continue
-                        downtrend = current_price < ema_slow and ema_fast < ema_slow
-                        uptrend = current_price > ema_slow and ema_fast > ema_slow
+    def _evaluate_symbol(self, symbol: str, df: pd.DataFrame) -> Tuple[float, Optional[Dict]]:
+        """
+        Run strategies, filters and ML confirmation for one symbol
 
-                        if aggregated['action'] == 'sell' and not downtrend:
-                            logger.info(f"    {symbol}: Sell entry blocked - not in downtrend (new position only)")
-                            continue
-                        if aggregated['action'] == 'buy' and not uptrend:  # STRICTER: Always require uptrend for buys
-                            logger.info(f"    {symbol}: Buy entry blocked - not in uptrend (new position only)")
-                            continue
+        Returns:
+            (current_price, aggregated signal or None when no actionable signal)
+        """
+        current_price = safe_float_conversion(df["close"].iloc[-1])
 
-                    # Check minimum confidence threshold - ensure config is available
-                    if not hasattr(self, 'config') or self.config is None:
-                        logger.warning("Config not available, using default min_confidence")
-                        min_confidence = 0.65  # INCREASED: Higher default (was 0.35)
-                    else:
-                        min_confidence = self.config.get('min_confidence', 0.65)  # INCREASED default (was 0.35)
+        # Generate signals from all strategies
+        strategy_signals = []
+        for strategy in self.strategies:
+            sig = strategy.generate_signals(df, symbol)
+            strategy_signals.append(sig)
 
-                    # Ensure min_confidence is always defined
-                    if 'min_confidence' not in locals():
-                        min_confidence = 0.65  # INCREASED: Higher default (was 0.35)
+        # Check if this is an exit signal for existing position
+        is_exit_signal = symbol in self.portfolio.positions
 
-                    # CRITICAL FIX: Don't filter exits by confidence - always allow position liquidations
-                    # Only apply confidence threshold to NEW entry signals
-                    if not is_exit_signal and aggregated['confidence'] < min_confidence:
-                        logger.info(f"    {symbol}: Entry signal confidence {aggregated['confidence']:.1%} below threshold {min_confidence:.1%} (new position only)")
-                        continue
+        # Aggregate signals (pass is_exit to allow exits regardless of regime)
+        aggregated = self.aggregator.aggregate_signals(strategy_signals, symbol, is_exit=is_exit_signal)
 
-                    aggregated['atr'] = self.technical_analyzer.calculate_atr(df)
-                    aggregated['last_close'] = current_price
-                    
-                    # ML Enhancement
-                    if self.ml_predictor.model:
-                        ml_pred = self.ml_predictor.predict(df)
-                        aggregated['ml_probability'] = ml_pred['probability']
-                        aggregated['ml_direction'] = 'UP' if ml_pred['direction'] == 1 else 'DOWN'
-                        
-                        # Boost confidence if ML agrees with signal
-                        if (aggregated['action'] == 'buy' and ml_pred['direction'] == 1) or \
-                           (aggregated['action'] == 'sell' and ml_pred['direction'] == 0):
-                            if ml_pred['confidence'] > 0.6: # Only boost if ML is confident
-                                boost = 0.1
-                                aggregated['confidence'] = min(1.0, aggregated['confidence'] + boost)
-                                aggregated['reasons'].append(f"ML Confirmed ({ml_pred['probability']:.0%})")
-                    
-                    signals[symbol] = aggregated
-
-                    # Send signal to dashboard
-                    if self.dashboard:
-                        self.dashboard.send_signal(
-                            symbol=symbol,
-                            action=aggregated['action'],
-                            confidence=aggregated['confidence'],
-                            price=current_price,
-                            sector=sector,
-                            reasons=aggregated.get('reasons', [])
-                        )
-            except Exception as e:
-                logger.error("Error scanning %s: %s", symbol, e, exc_info=True)
-                continue
+        if aggregated['action'] != 'hold':
+            # Debug logging to show all signals
+            sector = self.get_sector(symbol)
+            logger.info(f"    {symbol} ({sector}): {aggregated['action'].upper()} @ ₹{current_price:.2f} ({aggregated['confidence']:.1%}) - {aggregated.get('reasons', ['N/A'])}")
 
-        return signals, prices
+            # Disable trend filter for aggressive profile to allow more trades
+            if not hasattr(self, 'config') or self.config is None:
+                trend_filter_enabled = self.trading_mode != 'backtest'
+                trading_profile = None
+            else:
+                trend_filter_enabled = self.config.get('trend_filter_enabled', self.trading_mode != 'backtest')
+                trading_profile = self.config.get('trading_profile')
+
+            # CRITICAL FIX: Skip trend filter for exits (position liquidations)
+            # Only apply trend filter to NEW entry signals, not existing position exits
+            if trend_filter_enabled and not (self.trading_mode == 'paper' and trading_profile == 'Aggressive') and not is_exit_signal:
+                ema_fast = safe_float_conversion(df['close'].ewm(span=20, adjust=False).mean().iloc[-1])
+                ema_slow = safe_float_conversion(df['close'].ewm(span=50, adjust=False).mean().iloc[-1])
+                if is_zero(ema_fast) or is_zero(ema_slow):
+                    logger.info(f"    {symbol}: Skipping due to NaN trend data")
+                    return current_price, None
+                downtrend = current_price < ema_slow and ema_fast < ema_slow
+                uptrend = current_price > ema_slow and ema_fast > ema_slow
+
+                if aggregated['action'] == 'sell' and not downtrend:
+                    logger.info(f"    {symbol}: Sell entry blocked - not in downtrend (new position only)")
+                    return current_price, None
+                if aggregated['action'] == 'buy' and not uptrend:  # STRICTER: Always require uptrend for buys
+                    logger.info(f"    {symbol}: Buy entry blocked - not in uptrend (new position only)")
+                    return current_price, None
+
+            # Check minimum confidence threshold - ensure config is available
+            if not hasattr(self, 'config') or self.config is None:
+                logger.warning("Config not available, using default min_confidence")
+                min_confidence = 0.65  # INCREASED: Higher default (was 0.35)
+            else:
+                min_confidence = self.config.get('min_confidence', 0.65)  # INCREASED default (was 0.35)
+
+            # Ensure min_confidence is always defined
+            if 'min_confidence' not in locals():
+                min_confidence = 0.65  # INCREASED: Higher default (was 0.35)
+
+            # CRITICAL FIX: Don't filter exits by confidence - always allow position liquidations
+            # Only apply confidence threshold to NEW entry signals
+            if not is_exit_signal and aggregated['confidence'] < min_confidence:
+                logger.info(f"    {symbol}: Entry signal confidence {aggregated['confidence']:.1%} below threshold {min_confidence:.1%} (new position only)")
+                return current_price, None
+
+            aggregated['atr'] = self.technical_analyzer.calculate_atr(df)
+            aggregated['last_close'] = current_price
+
+            return current_price, aggregated
+
+        return current_price, None
+
+    @staticmethod
+    def _apply_ml_confirmation(aggregated: Dict, ml_pred: Dict) -> None:
+        """Attach an ML prediction to a signal, boosting confidence when they agree"""
+        aggregated['ml_probability'] = ml_pred['probability']
+        aggregated['ml_direction'] = 'UP' if ml_pred['direction'] == 1 else 'DOWN'
+        
+        # Boost confidence if ML agrees with signal
+        if (aggregated['action'] == 'buy' and ml_pred['direction'] == 1) or \
+           (aggregated['action'] == 'sell' and ml_pred['direction'] == 0):
+            if ml_pred['confidence'] > 0.6: # Only boost if ML is confident
+                boost = 0.1
+                aggregated['confidence'] = min(1.0, aggregated['confidence'] + boost)
+                aggregated['reasons'].append(f"ML Confirmed ({ml_pred['probability']:.0%})")
 
     def run_nifty50_trading(self, interval: str = "5minute", check_interval: int = 30) -> None:
         """Run the trading system"""
@@ -1451,17 +1541,9 @@ class UnifiedTradingSystem:
                             time.sleep(300)
                             continue
 
-                    # Scan in batches
-                    batch_size = 10
-                    batches = [self.symbols[i:i+batch_size] for i in range(0, len(self.symbols), batch_size)]
-                    all_signals = {}
-                    all_prices = {}
-
-                    for i, batch in enumerate(batches, 1):
-                        batch_signals, batch_prices = self.scan_batch(batch, interval, i, len(batches))
-                        all_signals.update(batch_signals)
-                        all_prices.update(batch_prices)
-                        time.sleep(0.3)
+                    # Scan the whole universe in one concurrent pass; the data
+                    # provider's rate limiter paces the historical_data calls
+                    all_signals, all_prices = self.scan_batch(self.symbols, interval, 1, 1)
 
                     if all_signals:
                         buy_count = sum(1 for s in all_signals.values() if s['action'] == 'buy')
@@ -117,6 +117,48 @@ Capital:
 """
 
 
+@dataclass
+class PortfolioBacktestResults:
+    """Results of a shared-capital backtest across many symbols"""
+    # Performance metrics
+    total_return_pct: float
+    annualized_return_pct: float
+    sharpe_ratio: float
+    sortino_ratio: float
+    calmar_ratio: float
+    max_drawdown_pct: float
+
+    # Trade statistics (closed round trips)
+    total_trades: int
+    winning_trades: int
+    losing_trades: int
+    win_rate_pct: float
+    profit_factor: float
+
+    # Capital metrics
+    final_capital: float
+    peak_capital: float
+    max_positions_held: int
+
+    # Time series data
+    equity_curve: pd.Series
+    drawdown_series: pd.Series
+    returns_series: pd.Series
+    positions_held: pd.Series
+
+    # One row per round trip (exit_time is NaT for positions still open)
+    trades: pd.DataFrame
+    # Per-symbol trades, wins, P&L and exposure
+    symbol_summary: pd.DataFrame
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (excluding time series and tables)"""
+        return {
+            name: value for name, value in asdict(self).items()
+            if not isinstance(value, (pd.Series, pd.DataFrame))
+        }
+
+
 class Strategy(ABC):
     """Abstract base class for trading strategies"""
 
@@ -133,6 +175,180 @@ class Strategy(ABC):
         """
         pass
 
+    @classmethod
+    def signal_matrix(cls, data: pd.DataFrame, combinations: List[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """
+        Signals for many parameter combinations at once (optional)
+
+        Strategies that can broadcast their indicators override this to
+        enable the sweep mode of ``VectorizedBacktester.optimize_parameters``.
+
+        Args:
+            data: OHLCV data
+            combinations: Constructor keyword arguments, one dict per combination
+
+        Returns:
+            Array of shape (len(data), len(combinations)) with 1/-1/0
+            signals matching ``generate_signals``, or None when unsupported
+        """
+        return None
+
+    def panel_signals(self, panel: Dict[str, pd.DataFrame]) -> np.ndarray:
+        """
+        Signals for many symbols sharing one time axis
+
+        The default runs ``generate_signals`` symbol by symbol; strategies
+        whose indicators work column-wise override it to compute the whole
+        panel in one pass.
+
+        Args:
+            panel: Field name (open, high, low, close, volume) to a
+                (time x symbol) DataFrame, as built by ``align_panel``
+
+        Returns:
+            Array of shape (bars, symbols) with 1/-1/0 signals
+        """
+        close = panel['close']
+        columns = []
+        for symbol in close.columns:
+            data = pd.DataFrame({field: frame[symbol] for field, frame in panel.items()})
+            columns.append(self.generate_signals(data)['signal'].to_numpy())
+        return np.column_stack(columns) if columns else np.zeros(close.shape, dtype=int)
+
+
+class IndicatorCache:
+    """
+    Indicator columns computed once per distinct parameter
+
+    Sweeps look up every combination's indicators here, so a grid over 20
+    fast and 20 slow periods computes 40 moving averages rather than 400.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        self.close = data['close'].astype(float)
+        self._cache: Dict[Tuple, np.ndarray] = {}
+
+    def _get(self, key: Tuple, compute: Callable[[], pd.Series]) -> np.ndarray:
+        column = self._cache.get(key)
+        if column is None:
+            column = self._cache[key] = compute().to_numpy(dtype=float)
+        return column
+
+    def sma(self, window: int) -> np.ndarray:
+        return self._get(('sma', window), lambda: self.close.rolling(window=window).mean())
+
+    def ema(self, span: int) -> np.ndarray:
+        return self._get(('ema', span), lambda: self.close.ewm(span=span, adjust=False).mean())
+
+    def std(self, window: int) -> np.ndarray:
+        return self._get(('std', window), lambda: self.close.rolling(window=window).std())
+
+    def rsi(self, period: int) -> np.ndarray:
+        """RSI from rolling mean gains and losses (as in strategies.vectorized_strategies)"""
+        def compute():
+            delta = self.close.diff()
+            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+            return 100 - (100 / (1 + gain / loss))
+        return self._get(('rsi', period), compute)
+
+    def columns(self, name: str, values: List[Any]) -> np.ndarray:
+        """Stack one indicator column per value into shape (len(data), len(values))"""
+        method = getattr(self, name)
+        return np.column_stack([method(value) for value in values])
+
+
+def param_values(combinations: List[Dict[str, Any]], name: str, default: Any) -> List[Any]:
+    """One parameter's value across combinations, falling back to the constructor default"""
+    return [combo.get(name, default) for combo in combinations]
+
+
+def threshold_signals(buy: np.ndarray, sell: np.ndarray) -> np.ndarray:
+    """1 where ``buy`` holds, -1 where ``sell`` holds (sell wins ties), 0 otherwise"""
+    return np.where(sell, -1, np.where(buy, 1, 0)).astype(np.int8)
+
+
+# Metrics the broadcast sweep can rank combinations by
+SWEEP_METRICS = (
+    'total_return_pct',
+    'annualized_return_pct',
+    'sharpe_ratio',
+    'sortino_ratio',
+    'calmar_ratio',
+    'max_drawdown_pct',
+)
+
+# Upper bound on bars x combinations evaluated per broadcast block
+SWEEP_BLOCK_CELLS = 4_000_000
+
+
+def _positions_from_signals(signals: np.ndarray) -> np.ndarray:
+    """
+    Long/flat positions from 1/-1/0 signals along axis 0 (VECTORIZED)
+
+    A buy (1) opens a position, a sell (-1) closes it and 0 holds the
+    previous position. Works on one column or a (bars, combinations) matrix.
+    """
+    state = np.where(signals == 1, 1.0, np.where(signals == -1, 0.0, np.nan))
+    rows = np.arange(len(state)).reshape((-1,) + (1,) * (state.ndim - 1))
+    last_set = np.where(np.isnan(state), 0, rows)
+    np.maximum.accumulate(last_set, axis=0, out=last_set)
+    positions = np.take_along_axis(state, last_set, axis=0)
+    return np.nan_to_num(positions, nan=0.0)
+
+
+PANEL_FIELDS = ('open', 'high', 'low', 'close', 'volume')
+
+PORTFOLIO_TRADE_COLUMNS = [
+    'symbol', 'entry_time', 'exit_time', 'shares',
+    'entry_price', 'exit_price', 'pnl', 'return_pct',
+]
+
+
+def _index_bound(index: pd.Index, value: datetime) -> pd.Timestamp:
+    """Date bound comparable with ``index``; naive bounds are read in the index timezone"""
+    bound = pd.Timestamp(value)
+    tz = getattr(index, 'tz', None)
+    if tz is not None and bound.tzinfo is None:
+        return bound.tz_localize(tz)
+    if tz is None and bound.tzinfo is not None:
+        return bound.tz_localize(None)
+    return bound
+
+
+def align_panel(data: Dict[str, pd.DataFrame]) -> Dict[str, pd.DataFrame]:
+    """
+    Align per-symbol OHLCV frames into (time x symbol) matrices
+
+    The time axis is the sorted union of every symbol's timestamps. Bars a
+    symbol did not trade are NaN; callers decide how to fill them.
+
+    Returns:
+        Field name to DataFrame with one column per symbol, for every OHLCV
+        field present in all frames
+    """
+    if not data:
+        raise ValueError("No symbols to align")
+
+    frames = {
+        symbol: df[~df.index.duplicated(keep='last')]
+        for symbol, df in data.items()
+    }
+    index = None
+    for df in frames.values():
+        index = df.index if index is None else index.union(df.index)
+    index = index.sort_values()
+
+    fields = [field for field in PANEL_FIELDS if all(field in df.columns for df in frames.values())]
+    if 'close' not in fields:
+        raise ValueError("Every symbol needs a 'close' column")
+
+    frames = {symbol: df.reindex(index) for symbol, df in frames.items()}
+    return {
+        field: pd.DataFrame({symbol: df[field].astype(float) for symbol, df in frames.items()}, index=index)
+        for field in fields
+    }
+
 
 class VectorizedBacktester:
     """
@@ -155,6 +371,7 @@ class VectorizedBacktester:
             config: Backtesting configuration
         """
         self.config = config or BacktestConfig()
+        self.last_sweep: Optional[pd.DataFrame] = None
         logger.info(f"VectorizedBacktester initialized: initial_capital=₹{self.config.initial_capital:,.0f}")
 
     def run(
@@ -178,9 +395,9 @@ class VectorizedBacktester:
         """
         # Filter data by date range
         if start_date:
-            data = data[data.index >= start_date]
+            data = data[data.index >= _index_bound(data.index, start_date)]
         if end_date:
-            data = data[data.index <= end_date]
+            data = data[data.index <= _index_bound(data.index, end_date)]
 
         if len(data) < 2:
             raise ValueError("Insufficient data for backtesting")
@@ -207,6 +424,239 @@ class VectorizedBacktester:
 
         return results
 
+    def run_portfolio(
+        self,
+        strategy: Strategy,
+        data: Dict[str, pd.DataFrame],
+        max_positions: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> PortfolioBacktestResults:
+        """
+        Run one strategy across many symbols sharing the same capital
+
+        All symbols are aligned into (time x symbol) matrices and signals come
+        from ``strategy.panel_signals`` in a single pass. Positions are long/flat
+        per symbol as in ``run``; on top of that:
+
+        - at most ``max_positions`` are held at once (fresh buy signals take
+          free slots first, then symbol order)
+        - each entry buys whole shares worth ``position_size_pct / max_positions``
+          of current equity, limited by available cash
+        - every fill pays slippage and transaction costs
+
+        Args:
+            strategy: Trading strategy
+            data: Symbol to OHLCV DataFrame with DatetimeIndex
+            max_positions: Concurrent position limit (None = one slot per symbol)
+            start_date: Start date for backtest (None = use all data)
+            end_date: End date for backtest (None = use all data)
+
+        Returns:
+            PortfolioBacktestResults
+        """
+        panel = align_panel(data)
+        index = panel['close'].index
+        keep = np.ones(len(index), dtype=bool)
+        if start_date:
+            keep &= index >= _index_bound(index, start_date)
+        if end_date:
+            keep &= index <= _index_bound(index, end_date)
+        panel = {field: frame[keep] for field, frame in panel.items()}
+        index = panel['close'].index
+
+        if len(index) < 2:
+            raise ValueError("Insufficient data for backtesting")
+
+        symbols = list(panel['close'].columns)
+        limit = min(max_positions or len(symbols), len(symbols))
+        if limit < 1:
+            raise ValueError("max_positions must be at least 1")
+
+        logger.info(
+            f"Running portfolio backtest: {len(symbols)} symbols x {len(index)} bars "
+            f"from {index[0]} to {index[-1]}, max_positions={limit}"
+        )
+
+        # Indicators see forward-filled prices; signals on bars a symbol did
+        # not trade are dropped so it neither enters nor exits there
+        available = panel['close'].notna().to_numpy()
+        filled = {field: frame.ffill() for field, frame in panel.items()}
+        if 'volume' in filled:
+            filled['volume'] = panel['volume'].fillna(0)
+
+        signals = np.asarray(strategy.panel_signals(filled))
+        signals = np.where(available, signals, 0)
+        wanted = _positions_from_signals(signals) > 0
+        prices = np.nan_to_num(filled['close'].to_numpy(dtype=float), nan=0.0)
+
+        equity, held, trades = self._simulate_portfolio(prices, available, signals, wanted, limit)
+
+        equity_curve = pd.Series(equity, index=index)
+        returns = equity_curve.pct_change().fillna(0)
+        positions_held = pd.Series(held.sum(axis=1), index=index)
+
+        trades_df = pd.DataFrame(trades, columns=PORTFOLIO_TRADE_COLUMNS)
+        trades_df['symbol'] = [symbols[i] for i in trades_df['symbol']]
+        trades_df['entry_time'] = index[trades_df['entry_time'].to_numpy(dtype=int)]
+        exit_bars = trades_df['exit_time'].to_numpy(dtype=int)
+        trades_df['exit_time'] = index[np.maximum(exit_bars, 0)].where(exit_bars >= 0, pd.NaT)
+
+        results = self._portfolio_metrics(equity_curve, returns, positions_held, trades_df,
+                                          held, symbols)
+        logger.info(
+            f"Portfolio backtest complete: Return={results.total_return_pct:.2f}%, "
+            f"Sharpe={results.sharpe_ratio:.2f}, Trades={results.total_trades}"
+        )
+        return results
+
+    def _simulate_portfolio(
+        self,
+        prices: np.ndarray,
+        available: np.ndarray,
+        signals: np.ndarray,
+        wanted: np.ndarray,
+        limit: int
+    ) -> Tuple[np.ndarray, np.ndarray, List[Tuple]]:
+        """
+        Shared-capital fills over a (bars x symbols) panel
+
+        Holdings only change on bars where some symbol's long/flat state
+        flips, so the loop visits those bars and the equity curve between
+        them is filled in with array ops.
+
+        Returns:
+            (equity per bar, bool held matrix, trade tuples)
+        """
+        cfg = self.config
+        n_bars, n_symbols = prices.shape
+        slot_fraction = cfg.position_size_pct / limit
+        buy_factor = (1 + cfg.slippage_pct) * (1 + cfg.transaction_cost_pct)
+        sell_factor = (1 - cfg.slippage_pct) * (1 - cfg.transaction_cost_pct)
+
+        previous = np.vstack([np.zeros((1, n_symbols), dtype=bool), wanted[:-1]])
+        events = np.flatnonzero((wanted != previous).any(axis=1))
+
+        cash = cfg.initial_capital
+        shares = np.zeros(n_symbols)
+        entry_bar = np.zeros(n_symbols, dtype=int)
+        entry_price = np.zeros(n_symbols)
+        entry_outlay = np.zeros(n_symbols)
+
+        # Row 0 is the state before the first event
+        cash_at = np.full(len(events) + 1, cash)
+        shares_at = np.zeros((len(events) + 1, n_symbols))
+        trades = []
+
+        for k, bar in enumerate(events, start=1):
+            px = prices[bar]
+
+            exits = np.flatnonzero((shares > 0) & ~wanted[bar])
+            if exits.size:
+                proceeds = shares[exits] * px[exits] * sell_factor
+                cash += proceeds.sum()
+                for j, value in zip(exits, proceeds):
+                    pnl = value - entry_outlay[j]
+                    trades.append((j, entry_bar[j], bar, shares[j], entry_price[j],
+                                   px[j], pnl, pnl / entry_outlay[j] * 100))
+                shares[exits] = 0
+
+            slots = limit - np.count_nonzero(shares)
+            if slots > 0:
+                candidates = np.flatnonzero(wanted[bar] & available[bar] & (shares == 0))
+                if candidates.size:
+                    fresh = signals[bar, candidates] == 1
+                    candidates = candidates[np.argsort(~fresh, kind='stable')][:slots]
+
+                    equity = cash + shares @ px
+                    cost_per_share = px[candidates] * buy_factor
+                    qty = np.floor(equity * slot_fraction / cost_per_share)
+                    outlay = qty * cost_per_share
+                    # Greedy in priority order: skip a candidate that does not
+                    # fit the remaining cash, keep trying the cheaper ones
+                    for j, q, cost in zip(candidates, qty, outlay):
+                        if q <= 0 or cost > cash:
+                            continue
+                        cash -= cost
+                        shares[j] = q
+                        entry_bar[j] = bar
+                        entry_price[j] = px[j]
+                        entry_outlay[j] = cost
+
+            cash_at[k] = cash
+            shares_at[k] = shares
+
+        # Positions still open are marked at the last close
+        for j in np.flatnonzero(shares > 0):
+            pnl = shares[j] * prices[-1, j] - entry_outlay[j]
+            trades.append((j, entry_bar[j], -1, shares[j], entry_price[j],
+                           prices[-1, j], pnl, pnl / entry_outlay[j] * 100))
+
+        state = np.searchsorted(events, np.arange(n_bars), side='right')
+        held_shares = shares_at[state]
+        equity = cash_at[state] + (held_shares * prices).sum(axis=1)
+        return equity, held_shares > 0, trades
+
+    def _portfolio_metrics(
+        self,
+        equity_curve: pd.Series,
+        returns: pd.Series,
+        positions_held: pd.Series,
+        trades: pd.DataFrame,
+        held: np.ndarray,
+        symbols: List[str]
+    ) -> PortfolioBacktestResults:
+        """Performance, trade and per-symbol statistics for a portfolio run"""
+        initial_capital = self.config.initial_capital
+        final_capital = equity_curve.iloc[-1]
+        total_return_pct = (final_capital - initial_capital) / initial_capital * 100
+
+        days = (equity_curve.index[-1] - equity_curve.index[0]).days
+        years = max(days / 365.25, 0.01)
+        annualized_return_pct = ((1 + total_return_pct / 100) ** (1 / years) - 1) * 100
+
+        peak_equity = equity_curve.expanding().max()
+        drawdown = (equity_curve - peak_equity) / peak_equity * 100
+        max_drawdown_pct = abs(drawdown.min())
+
+        closed = trades[trades['exit_time'].notna()]
+        wins = closed['pnl'][closed['pnl'] > 0]
+        losses = closed['pnl'][closed['pnl'] < 0]
+        total_losses = abs(losses.sum())
+
+        summary = pd.DataFrame({
+            'trades': closed.groupby('symbol').size(),
+            'winning_trades': wins.groupby(closed['symbol']).size(),
+            'pnl': trades.groupby('symbol')['pnl'].sum(),
+        }).reindex(symbols).fillna(0)
+        summary[['trades', 'winning_trades']] = summary[['trades', 'winning_trades']].astype(int)
+        summary['return_pct'] = summary['pnl'] / initial_capital * 100
+        summary['exposure_pct'] = held.mean(axis=0) * 100
+        summary.index.name = 'symbol'
+
+        return PortfolioBacktestResults(
+            total_return_pct=total_return_pct,
+            annualized_return_pct=annualized_return_pct,
+            sharpe_ratio=self._calculate_sharpe_ratio(returns, years),
+            sortino_ratio=self._calculate_sortino_ratio(returns, years),
+            calmar_ratio=annualized_return_pct / max_drawdown_pct if max_drawdown_pct > 0 else 0,
+            max_drawdown_pct=max_drawdown_pct,
+            total_trades=len(closed),
+            winning_trades=len(wins),
+            losing_trades=len(losses),
+            win_rate_pct=len(wins) / len(closed) * 100 if len(closed) else 0,
+            profit_factor=wins.sum() / total_losses if total_losses > 0 else (float('inf') if len(wins) else 0),
+            final_capital=final_capital,
+            peak_capital=peak_equity.max(),
+            max_positions_held=int(positions_held.max()),
+            equity_curve=equity_curve,
+            drawdown_series=drawdown,
+            returns_series=returns,
+            positions_held=positions_held,
+            trades=trades,
+            symbol_summary=summary
+        )
+
     def _calculate_positions(self, signals_df: pd.DataFrame) -> pd.Series:
         """
         Calculate position sizes from signals (VECTORIZED)
@@ -220,25 +670,12 @@ class VectorizedBacktester:
         # Extract signals
         signals = signals_df['signal']
 
-        # Positions start at 0
-        positions = pd.Series(0, index=signals.index, dtype=int)
-
-        # VECTORIZED: Find buy signals (signal == 1)
-        buy_signals = signals == 1
-
-        # VECTORIZED: Find sell signals (signal == -1)
-        sell_signals = signals == -1
-
-        # Forward-fill positions
         # When buy signal appears, set position to 1
         # When sell signal appears, set position to 0
-        positions[buy_signals] = 1
-        positions[sell_signals] = 0
-
         # Forward-fill to maintain position until next signal
-        positions = positions.replace(0, np.nan).ffill().fillna(0).astype(int)
+        positions = _positions_from_signals(signals.to_numpy(dtype=float))
 
-        return positions
+        return pd.Series(positions.astype(int), index=signals.index)
 
     def _calculate_returns(self, data: pd.DataFrame, positions: pd.Series) -> pd.Series:
         """
@@ -463,16 +900,24 @@ class VectorizedBacktester:
         strategy_class: type,
         data: pd.DataFrame,
         param_grid: Dict[str, List[Any]],
-        metric: str = 'sharpe_ratio'
+        metric: str = 'sharpe_ratio',
+        sweep: bool = True
     ) -> Tuple[Dict[str, Any], BacktestResults]:
         """
         Optimize strategy parameters using grid search
 
+        When ``sweep`` is set, the strategy implements ``signal_matrix`` and
+        ``metric`` is one of SWEEP_METRICS, every combination is evaluated
+        in one NumPy broadcast (see ``sweep_parameters``) and only the best
+        one is re-run through ``run``. Otherwise each combination is run
+        individually.
+
         Args:
             strategy_class: Strategy class to optimize
             data: Historical data
             param_grid: Dictionary of parameter names to lists of values
             metric: Metric to optimize ('sharpe_ratio', 'total_return_pct', etc.)
+            sweep: Use the broadcast sweep when the strategy supports it
 
         Returns:
             Tuple of (best_params, best_results)
@@ -486,6 +931,20 @@ class VectorizedBacktester:
 
         logger.info(f"Testing {len(combinations)} parameter combinations")
 
+        if sweep and metric in SWEEP_METRICS:
+            table = self.sweep_parameters(strategy_class, data, param_grid)
+            if table is not None:
+                scores = table[metric].to_numpy(dtype=float)
+                if np.isnan(scores).all():
+                    logger.warning(f"Sweep produced no valid {metric} values")
+                    return None, None
+                best = int(np.nanargmax(scores))
+                best_params = dict(zip(param_names, combinations[best]))
+                best_results = self.run(strategy_class(**best_params), data)
+                logger.info(f"Optimization complete (sweep): Best {metric}={scores[best]:.2f}")
+                logger.info(f"Best parameters: {best_params}")
+                return best_params, best_results
+
         best_metric_value = float('-inf')
         best_params = None
         best_results = None
@@ -522,13 +981,118 @@ class VectorizedBacktester:
 
         return best_params, best_results
 
+    def sweep_parameters(
+        self,
+        strategy_class: type,
+        data: pd.DataFrame,
+        param_grid: Dict[str, List[Any]]
+    ) -> Optional[pd.DataFrame]:
+        """
+        Evaluate every parameter combination in one broadcast (VECTORIZED)
+
+        The strategy's ``signal_matrix`` computes each distinct indicator
+        once and returns a (bars, combinations) signal matrix; positions,
+        returns, equity curves and metrics are then computed column-wise
+        with the same rules as ``run``. Combinations are processed in
+        blocks of at most SWEEP_BLOCK_CELLS cells to bound memory.
+
+        Args:
+            strategy_class: Strategy class implementing ``signal_matrix``
+            data: Historical OHLCV data
+            param_grid: Dictionary of parameter names to lists of values
+
+        Returns:
+            DataFrame with one row per combination (parameter columns plus
+            SWEEP_METRICS), or None when the strategy cannot sweep
+        """
+        if len(data) < 2:
+            raise ValueError("Insufficient data for backtesting")
+
+        param_names = list(param_grid.keys())
+        combinations = [dict(zip(param_names, combo))
+                        for combo in itertools.product(*param_grid.values())]
+
+        block = max(1, SWEEP_BLOCK_CELLS // len(data))
+        parts = []
+        for lo in range(0, len(combinations), block):
+            signals = strategy_class.signal_matrix(data, combinations[lo:lo + block])
+            if signals is None:
+                return None
+            parts.append(self._sweep_metrics(data, np.asarray(signals, dtype=float)))
+
+        table = pd.DataFrame(combinations, columns=param_names)
+        for metric in SWEEP_METRICS:
+            table[metric] = np.concatenate([part[metric] for part in parts])
+        self.last_sweep = table
+        return table
+
+    def _sweep_metrics(self, data: pd.DataFrame, signals: np.ndarray) -> Dict[str, np.ndarray]:
+        """Column-wise equivalent of run(): positions, costs, equity and metrics"""
+        close = data['close'].to_numpy(dtype=float)
+        market_returns = np.full(len(close), np.nan)
+        market_returns[1:] = (close[1:] - close[:-1]) / close[:-1]
+
+        positions = _positions_from_signals(signals)
+        position_changes = np.full(positions.shape, np.nan)
+        position_changes[1:] = np.diff(positions, axis=0)
+        held = np.full(positions.shape, np.nan)
+        held[1:] = positions[:-1]
+
+        costs = np.abs(position_changes) * (self.config.transaction_cost_pct + self.config.slippage_pct)
+        returns = held * market_returns[:, None] - costs
+        returns[np.isnan(returns)] = 0.0
+
+        initial_capital = self.config.initial_capital
+        if self.config.compound_returns:
+            equity = np.cumprod(1 + returns, axis=0) * initial_capital
+        else:
+            equity = np.cumsum(returns, axis=0) * initial_capital + initial_capital
+
+        total_return_pct = (equity[-1] - initial_capital) / initial_capital * 100
+        days = (data.index[-1] - data.index[0]).days
+        years = max(days / 365.25, 0.01)
+        with np.errstate(invalid='ignore'):
+            annualized_return_pct = (np.power(1 + total_return_pct / 100, 1 / years) - 1) * 100
+
+        peak = np.maximum.accumulate(equity, axis=0)
+        max_drawdown_pct = np.abs(((equity - peak) / peak * 100).min(axis=0))
+
+        # Sharpe / Sortino as in _calculate_sharpe_ratio / _calculate_sortino_ratio
+        risk_free = self.config.risk_free_rate
+        mean_return = returns.mean(axis=0) * 252
+        std_return = returns.std(axis=0, ddof=1) * np.sqrt(252)
+        sharpe = np.zeros(returns.shape[1])
+        np.divide(mean_return - risk_free, std_return, out=sharpe, where=std_return > 0)
+
+        negative = returns < 0
+        n_negative = negative.sum(axis=0)
+        downside_mean = np.where(negative, returns, 0).sum(axis=0) / np.maximum(n_negative, 1)
+        downside_var = (np.where(negative, returns - downside_mean, 0) ** 2).sum(axis=0) / np.maximum(n_negative - 1, 1)
+        downside_std = np.sqrt(downside_var) * np.sqrt(252)
+        valid = (n_negative > 1) & (downside_std > 0)
+        sortino = np.full(returns.shape[1], np.inf)
+        np.divide(mean_return - risk_free, downside_std, out=sortino, where=valid)
+
+        calmar = np.zeros(returns.shape[1])
+        np.divide(annualized_return_pct, max_drawdown_pct, out=calmar, where=max_drawdown_pct > 0)
+
+        return {
+            'total_return_pct': total_return_pct,
+            'annualized_return_pct': annualized_return_pct,
+            'sharpe_ratio': sharpe,
+            'sortino_ratio': sortino,
+            'calmar_ratio': calmar,
+            'max_drawdown_pct': max_drawdown_pct,
+        }
+
     def walk_forward_optimization(
         self,
         strategy_class: type,
         data: pd.DataFrame,
         param_grid: Dict[str, List[Any]],
         in_sample_pct: float = 0.6,
-        n_splits: int = 5
+        n_splits: int = 5,
+        sweep: bool = True
     ) -> List[BacktestResults]:
         """
         Walk-forward optimization to prevent overfitting
@@ -546,6 +1110,7 @@ class VectorizedBacktester:
             param_grid: Parameter grid for optimization
             in_sample_pct: Percentage of data for in-sample optimization
             n_splits: Number of walk-forward splits
+            sweep: Optimize each split with the broadcast sweep when supported
 
         Returns:
             List of BacktestResults for out-of-sample periods
@@ -577,7 +1142,8 @@ class VectorizedBacktester:
             best_params, _ = self.optimize_parameters(
                 strategy_class,
                 in_sample_data,
-                param_grid
+                param_grid,
+                sweep=sweep
             )
 
             # Test on out-of-sample data
@@ -5,7 +5,11 @@ Data fetching, caching, and market data providers.
 """
 
 from data.provider import DataProvider
+from data.candle_store import CandleStore
+from data.bar_aggregator import LiveBarAggregator
 
 __all__ = [
     'DataProvider',
+    'CandleStore',
+    'LiveBarAggregator',
 ]
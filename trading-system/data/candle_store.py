@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Candle Store
+Persistent, memory-mappable OHLCV store used to fetch history incrementally
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timedelta, timezone, tzinfo
+from pathlib import Path
+from typing import Dict, Optional, Union
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger('trading_system.candle_store')
+
+CANDLE_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+# Fixed-width record layout: appending is a plain write and reading is a
+# zero-copy np.memmap over the whole file.
+CANDLE_DTYPE = np.dtype([
+    ('ts', '<i8'),
+    ('open', '<f8'),
+    ('high', '<f8'),
+    ('low', '<f8'),
+    ('close', '<f8'),
+    ('volume', '<f8'),
+])
+
+TimeLike = Union[datetime, pd.Timestamp]
+
+
+def tz_to_meta(tz: Optional[tzinfo]) -> Union[str, int, None]:
+    """
+    JSON-safe form of a timezone: the zone name when it has one, otherwise
+    its fixed UTC offset in seconds (Kite history uses ``tzoffset(None, 19800)``,
+    whose ``str()`` is not a zone name)
+    """
+    if tz is None:
+        return None
+    name = getattr(tz, 'key', None) or getattr(tz, 'zone', None)
+    if name:
+        return name
+    if tz is timezone.utc or str(tz) == 'UTC':
+        return 'UTC'
+    offset = tz.utcoffset(None)
+    if offset is None:
+        offset = pd.Timestamp.now(tz=tz).utcoffset()
+    return int(offset.total_seconds())
+
+
+def tz_from_meta(value: Union[str, int, None]) -> Union[str, tzinfo, None]:
+    """Inverse of ``tz_to_meta``; accepted by ``tz_localize``/``tz_convert``"""
+    if value is None or isinstance(value, str):
+        return value
+    return timezone(timedelta(seconds=value))
+
+
+class CandleStore:
+    """
+    Per-(symbol, interval) candle store on local disk
+
+    Layout:
+    - ``<root>/<interval>/<symbol>.bin``: packed CANDLE_DTYPE records sorted by time
+    - ``<root>/<interval>/<symbol>.json``: timezone (name or UTC offset) and covered window start
+
+    Timestamps are stored as int64 nanoseconds (UTC for tz-aware data). The
+    last stored bar is always re-fetched on the next update because it may
+    have been a partial candle; ``write`` truncates any overlap before
+    appending so the file never holds duplicate bars.
+    """
+
+    def __init__(self, root: Union[str, Path] = 'data/cache/candles'):
+        self.root = Path(root)
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+        # Statistics
+        self.reads = 0
+        self.writes = 0
+        self.bars_written = 0
+
+    # ------------------------------------------------------------------
+    # Paths and metadata
+    # ------------------------------------------------------------------
+
+    def _paths(self, symbol: str, interval: str):
+        base = self.root / quote(interval, safe='') / quote(symbol, safe='')
+        return base.with_suffix('.bin'), base.with_suffix('.json')
+
+    def _lock_for(self, symbol: str, interval: str) -> threading.Lock:
+        key = f"{interval}:{symbol}"
+        with self._locks_guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.Lock()
+            return lock
+
+    @staticmethod
+    def _load_meta(meta_path: Path) -> Dict:
+        try:
+            with open(meta_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _save_meta(meta_path: Path, meta: Dict) -> None:
+        tmp_path = meta_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(meta, f)
+        os.replace(tmp_path, meta_path)
+
+    @staticmethod
+    def _to_ns(value: TimeLike, tz: Union[str, tzinfo, None]) -> int:
+        """Convert a datetime to the store's int64 representation."""
+        ts = pd.Timestamp(value)
+        if tz is not None:
+            ts = ts.tz_localize(tz) if ts.tzinfo is None else ts.tz_convert(tz)
+        elif ts.tzinfo is not None:
+            ts = ts.tz_localize(None)
+        return int(ts.value)
+
+    @staticmethod
+    def _from_ns(value: int, tz: Union[str, tzinfo, None]) -> datetime:
+        """Convert a stored timestamp back to a naive wall-clock datetime."""
+        if tz is not None:
+            return pd.Timestamp(value, tz='UTC').tz_convert(tz).tz_localize(None).to_pydatetime()
+        return pd.Timestamp(value).to_pydatetime()
+
+    @staticmethod
+    def _open_records(data_path: Path) -> np.ndarray:
+        if not data_path.exists():
+            return np.empty(0, dtype=CANDLE_DTYPE)
+        count = data_path.stat().st_size // CANDLE_DTYPE.itemsize
+        if count == 0:
+            return np.empty(0, dtype=CANDLE_DTYPE)
+        return np.memmap(data_path, dtype=CANDLE_DTYPE, mode='r', shape=(count,))
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def last_timestamp(self, symbol: str, interval: str) -> Optional[datetime]:
+        """Return the timestamp of the newest stored bar as a naive wall-clock datetime."""
+        data_path, meta_path = self._paths(symbol, interval)
+        with self._lock_for(symbol, interval):
+            records = self._open_records(data_path)
+            if len(records) == 0:
+                return None
+            meta = self._load_meta(meta_path)
+            return self._from_ns(int(records['ts'][-1]), tz_from_meta(meta.get('tz')))
+
+    def resume_point(self, symbol: str, interval: str, window_start: datetime) -> Optional[datetime]:
+        """
+        Return where an incremental fetch for ``window_start`` should begin
+
+        Returns the last stored bar time when the store already covers the
+        requested window, otherwise None (a full fetch is required).
+        """
+        data_path, meta_path = self._paths(symbol, interval)
+        with self._lock_for(symbol, interval):
+            records = self._open_records(data_path)
+            if len(records) == 0:
+                return None
+            meta = self._load_meta(meta_path)
+            coverage_start = meta.get('coverage_start')
+            if coverage_start is None or self._to_ns(window_start, None) < coverage_start:
+                return None
+
+            last_bar = self._from_ns(int(records['ts'][-1]), tz_from_meta(meta.get('tz')))
+            if last_bar < window_start:
+                return None
+            return last_bar
+
+    def write(self, symbol: str, interval: str, df: pd.DataFrame,
+              coverage_start: Optional[datetime] = None, replace: bool = False) -> int:
+        """
+        Merge candles into the store
+
+        Args:
+            symbol: Trading symbol
+            interval: Candle interval
+            df: OHLCV DataFrame indexed by bar time
+            coverage_start: Start of the requested window when ``df`` is a full fetch
+            replace: Discard existing bars before writing
+
+        Returns:
+            Number of bars written
+        """
+        if df is None or df.empty:
+            return 0
+
+        df = df.sort_index()
+        df = df[~df.index.duplicated(keep='last')]
+        index = pd.DatetimeIndex(df.index).as_unit('ns')
+        tz = tz_to_meta(index.tz)
+
+        records = np.empty(len(df), dtype=CANDLE_DTYPE)
+        records['ts'] = index.asi8
+        for col in CANDLE_COLUMNS:
+            records[col] = df[col].to_numpy(dtype='f8', na_value=np.nan) if col in df.columns else np.nan
+
+        data_path, meta_path = self._paths(symbol, interval)
+        with self._lock_for(symbol, interval):
+            data_path.parent.mkdir(parents=True, exist_ok=True)
+            meta = {} if replace else self._load_meta(meta_path)
+
+            if replace or meta.get('tz', tz) != tz:
+                keep = 0
+                meta = {}
+            else:
+                existing = self._open_records(data_path)
+                keep = int(np.searchsorted(existing['ts'], records['ts'][0], side='left'))
+                del existing
+
+            with open(data_path, 'ab') as f:
+                f.truncate(keep * CANDLE_DTYPE.itemsize)
+                f.write(records.tobytes())
+
+            meta['tz'] = tz
+            if coverage_start is not None:
+                start_ns = self._to_ns(coverage_start, None)
+                previous = meta.get('coverage_start')
+                meta['coverage_start'] = start_ns if previous is None else min(previous, start_ns)
+            self._save_meta(meta_path, meta)
+
+            self.writes += 1
+            self.bars_written += len(records)
+
+        return len(records)
+
+    def read(self, symbol: str, interval: str, start: Optional[TimeLike] = None,
+             end: Optional[TimeLike] = None) -> pd.DataFrame:
+        """
+        Read stored candles in ``[start, end]`` as an OHLCV DataFrame
+
+        Naive ``start``/``end`` values are interpreted in the stored timezone.
+        """
+        data_path, meta_path = self._paths(symbol, interval)
+        with self._lock_for(symbol, interval):
+            records = self._open_records(data_path)
+            if len(records) == 0:
+                return pd.DataFrame(columns=CANDLE_COLUMNS)
+
+            tz = tz_from_meta(self._load_meta(meta_path).get('tz'))
+            ts = records['ts']
+            lo = 0 if start is None else int(np.searchsorted(ts, self._to_ns(start, tz), side='left'))
+            hi = len(ts) if end is None else int(np.searchsorted(ts, self._to_ns(end, tz), side='right'))
+            window = np.array(records[lo:hi])
+            del records
+            self.reads += 1
+
+        index = pd.to_datetime(window['ts'], utc=tz is not None)
+        if tz is not None:
+            index = index.tz_convert(tz)
+        df = pd.DataFrame({col: window[col] for col in CANDLE_COLUMNS},
+                          index=pd.DatetimeIndex(index, name='date'))
+        return df
+
+    def clear(self, symbol: str, interval: str) -> None:
+        """Remove stored candles for a symbol/interval pair"""
+        data_path, meta_path = self._paths(symbol, interval)
+        with self._lock_for(symbol, interval):
+            for path in (data_path, meta_path):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+
+    def get_stats(self) -> Dict:
+        """Get store statistics"""
+        return {
+            'root': str(self.root),
+            'reads': self.reads,
+            'writes': self.writes,
+            'bars_written': self.bars_written,
+        }
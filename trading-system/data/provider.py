@@ -15,6 +15,8 @@ import logging
 from unified_config import get_config
 from infrastructure.rate_limiting import EnhancedRateLimiter
 from infrastructure.caching import LRUCacheWithTTL
+from data.candle_store import CandleStore
+from data.bar_aggregator import LiveBarAggregator
 from enhanced_technical_analysis import EnhancedTechnicalAnalysis
 
 logger = logging.getLogger('trading_system.data_provider')
@@ -30,13 +32,21 @@ class DataProvider:
     - Rate limiting protection
     - Comprehensive technical analysis signals
     - Automatic retry on failures
+    - Persistent candle store with incremental fetches
+    - Live bars from a tick-fed LiveBarAggregator when one is attached
 
     Cache Strategy:
     - Main cache: 60-second TTL for raw OHLCV data
+    - Candle store: on-disk bars per (symbol, interval); only bars after the
+      last stored candle are requested from Kite
     - Missing token cache: Avoid repeated lookups for invalid symbols
+    - Live bars: once an attached aggregator is backfilled for the requested
+      window and its feed is live, candles come from it and Kite is not called
     """
 
-    def __init__(self, kite: KiteConnect = None, instruments_map: Dict = None, use_yf_fallback: bool = True):
+    def __init__(self, kite: KiteConnect = None, instruments_map: Dict = None, use_yf_fallback: bool = True,
+                 candle_store: Optional[CandleStore] = None,
+                 bar_aggregator: Optional[LiveBarAggregator] = None):
         self.kite = kite
         self.instruments = instruments_map or {}
         self.use_yf = use_yf_fallback
@@ -48,6 +58,15 @@ class DataProvider:
         # LRU cache for price data (60-second TTL)
         self.price_cache = LRUCacheWithTTL(max_size=1000, ttl_seconds=60)
 
+        # Persistent candle store (incremental historical fetches)
+        if candle_store is None and self.system_config.get('data.candle_store.enabled', True):
+            candle_store = CandleStore(self.system_config.get('data.candle_store.directory', 'data/cache/candles'))
+        self.candle_store = candle_store
+
+        # Tick-fed live bars (serves steady-state fetches without historical_data)
+        self.bar_aggregator = bar_aggregator
+        self.live_bar_hits = 0
+
         # Cache for symbols without tokens (to avoid repeated lookups)
         self._missing_token_cache: set = set()
         self._missing_token_logged: set = set()  # Track which symbols we've already logged
@@ -78,6 +97,12 @@ class DataProvider:
         if cached_data is not None:
             return cached_data
 
+        if self.bar_aggregator is not None and interval in self.bar_aggregator.intervals:
+            window_start = datetime.now() - timedelta(days=days)
+            if self.bar_aggregator.covers(symbol, interval, window_start):
+                self.live_bar_hits += 1
+                return self.bar_aggregator.frame(symbol, interval, start=window_start)
+
         if not self.kite:
             return pd.DataFrame()
 
@@ -94,40 +119,46 @@ class DataProvider:
                     logger.warning(f"No instrument token found for {symbol}")
             return pd.DataFrame()
 
+        end = datetime.now()
+        start = end - timedelta(days=days)
+
+        # Only request bars from the last stored candle onwards when the
+        # store already covers the requested window
+        resume_from = None
+        if self.candle_store is not None:
+            try:
+                resume_from = self.candle_store.resume_point(symbol, interval, start)
+            except Exception as e:
+                logger.warning(f"Candle store unavailable for {symbol}: {e}")
+
         for attempt in range(max_retries):
             try:
                 end = datetime.now()
-                start = end - timedelta(days=days)
-                
+
                 if not self.rate_limiter.acquire('historical_data'):
                     logger.warning(f"Rate limit hit for {symbol}, retrying...")
                     time.sleep(0.5) # Short sleep to allow token refill
                     continue
 
-                candles = self.kite.historical_data(token, start, end, interval)
-
-                if candles:
-                    df = pd.DataFrame(candles)
-                    if "date" in df.columns:
-                        df["date"] = pd.to_datetime(df["date"])
-                        df.set_index("date", inplace=True)
-
-                    # Ensure standard column names
-                    df = df.rename(columns={
-                        "open": "open",
-                        "high": "high",
-                        "low": "low",
-                        "close": "close",
-                        "volume": "volume"
-                    })
-
-                    # Ensure all expected columns exist
-                    expected_cols = ["open", "high", "low", "close", "volume"]
-                    for c in expected_cols:
-                        if c not in df.columns:
-                            df[c] = np.nan
-
-                    df = df[expected_cols]
+                candles = self.kite.historical_data(token, resume_from or start, end, interval)
+
+                df = self._candles_to_frame(candles) if candles else None
+
+                if self.candle_store is not None and (df is not None or resume_from is not None):
+                    try:
+                        if df is not None:
+                            if resume_from is None:
+                                self.candle_store.write(symbol, interval, df,
+                                                        coverage_start=start, replace=True)
+                            else:
+                                self.candle_store.write(symbol, interval, df)
+                        stored = self.candle_store.read(symbol, interval, start=start)
+                        if not stored.empty:
+                            df = stored
+                    except Exception as e:
+                        logger.warning(f"Candle store update failed for {symbol}: {e}")
+
+                if df is not None and not df.empty:
                     self.price_cache.set(cache_key, df)
                     return df
 
@@ -140,6 +171,22 @@ class DataProvider:
         logger.error(f"Failed to fetch data for {symbol} after {max_retries} attempts")
         return pd.DataFrame()
 
+    @staticmethod
+    def _candles_to_frame(candles) -> pd.DataFrame:
+        """Convert Kite historical candles into a standard OHLCV DataFrame"""
+        df = pd.DataFrame(candles)
+        if "date" in df.columns:
+            df["date"] = pd.to_datetime(df["date"])
+            df.set_index("date", inplace=True)
+
+        # Ensure all expected columns exist
+        expected_cols = ["open", "high", "low", "close", "volume"]
+        for c in expected_cols:
+            if c not in df.columns:
+                df[c] = np.nan
+
+        return df[expected_cols]
+
     def get_enhanced_technical_signals(
         self,
         symbol: str,
@@ -2,25 +2,33 @@
 """
 Enhanced Trading Dashboard Server with HTTPS and Security
 Secure HTTP server with SSL/TLS encryption and security headers
+
+Requests are served one thread per connection. GET /api/data returns a cached,
+versioned snapshot (ETag, gzip) and GET /api/stream pushes the snapshot and
+then per-section deltas as Server-Sent Events, so browsers need not poll.
 """
 
+import copy
+import gzip
 import http.server
 import socketserver
 import json
 import threading
+import time
 from datetime import datetime
 from pathlib import Path
 import os
 import sys
 import ssl
 import logging
+import random
 from urllib.parse import urlparse, parse_qs
 import re
 import secrets
 import hmac
 import hashlib
 from http import cookies
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, List
 from utilities.structured_logger import get_logger, log_function_call
 from infrastructure.security import (
     initialize_security, get_path_protector, get_data_protector,
@@ -65,9 +73,340 @@ dashboard_data = {
     }
 }
 
+# Guards dashboard_data: POST handlers mutate it while the snapshot refresher reads it
+_dashboard_lock = threading.RLock()
+
+
+def copy_dashboard_data() -> dict:
+    """Deep copy of dashboard_data that is safe to read without the lock"""
+    with _dashboard_lock:
+        return copy.deepcopy(dashboard_data)
+
+
+def load_encrypted_state() -> Optional[dict]:
+    """Attempt to load encrypted trading state if available."""
+    password = os.getenv('TRADING_SECURITY_PASSWORD')
+    if not password:
+        return None
+    try:
+        manager = SecureStateManager(master_password=password)
+        state = manager.load_encrypted_state('current_state.enc')
+        if state:
+            return state
+    except Exception as exc:
+        logger.debug(f"Encrypted state unavailable: {exc}")
+    return None
+
+
+def _published_mock_prices() -> Dict[tuple, float]:
+    """(symbol, avg_price) -> current_price of positions in the published snapshot"""
+    snapshot = snapshot_publisher.cached
+    if snapshot is None or 'positions' not in snapshot.sections:
+        return {}
+    try:
+        return {(pos['symbol'], pos['avg_price']): pos['current_price']
+                for pos in json.loads(snapshot.sections['positions'])}
+    except (ValueError, TypeError, KeyError):
+        return {}
+
+
+def build_live_trading_data(source: Optional[dict] = None) -> dict:
+    """
+    Read live trading data from state files
+
+    Args:
+        source: Dashboard data to merge in; defaults to a copy of dashboard_data
+    """
+    if source is None:
+        source = copy_dashboard_data()
+    try:
+        current_state = load_encrypted_state() or {}
+
+        # Read current state
+        if not current_state and os.path.exists('state/current_state.json'):
+            with open('state/current_state.json', 'r') as f:
+                current_state = json.load(f)
+
+        # Read shared portfolio state
+        portfolio_state = {}
+        if os.path.exists('state/shared_portfolio_state.json'):
+            try:
+                with open('state/shared_portfolio_state.json', 'r') as f:
+                    portfolio_state = json.load(f)
+            except json.JSONDecodeError:
+                logger.warning("shared_portfolio_state.json is corrupted; using empty portfolio data")
+                portfolio_state = {"cash": 1000000, "positions": {}}
+
+        # Use empty portfolio if no positions found (removed mock data)
+        if not portfolio_state:
+            portfolio_state = {
+                "cash": 1000000,
+                "positions": {}
+            }
+
+        # Format signals data (from recent trading activity)
+        signals = []
+        if 'signals' in source and source['signals']:
+            signals = source['signals'][-20:]  # Last 20 signals
+
+        # Format trades data
+        trades = []
+        # First check dashboard data
+        if 'trades' in source and source['trades']:
+            trades = source['trades'][-20:]  # Last 20 trades
+        # Also check current_state for trades_history
+        elif 'portfolio' in current_state and 'trades_history' in current_state['portfolio']:
+            trades = current_state['portfolio']['trades_history'][-20:]  # Last 20 trades
+
+        # Format positions data from portfolio state
+        positions = []
+        if 'positions' in portfolio_state and portfolio_state['positions']:
+            mock_prices = _published_mock_prices()
+            for symbol, pos_data in portfolio_state['positions'].items():
+                # Calculate unrealized P&L (mock calculation for now)
+                current_price = pos_data.get('current_price', pos_data.get('entry_price', 0))
+                entry_price = pos_data.get('entry_price', 0)
+                quantity = pos_data.get('shares', 0)
+
+                # Mock current price (in real implementation, this would come from live market data).
+                # Reuse the published one so rebuilds of unchanged state keep the same snapshot version
+                current_price = mock_prices.get((symbol, entry_price))
+                if current_price is None:
+                    price_fluctuation = random.uniform(-0.05, 0.05)  # ±5% fluctuation
+                    current_price = entry_price * (1 + price_fluctuation)
+
+                unrealized_pnl = (current_price - entry_price) * quantity
+                day_change = ((current_price - entry_price) / entry_price) * 100
+
+                positions.append({
+                    'symbol': symbol,
+                    'quantity': quantity,
+                    'avg_price': entry_price,
+                    'current_price': current_price,
+                    'unrealized_pnl': unrealized_pnl,
+                    'day_change': day_change
+                })
+
+        # Format portfolio data
+        portfolio_data_nested = current_state.get('portfolio', {})
+        portfolio = {
+            'total_value': current_state.get('total_value', portfolio_state.get('cash', 0)),
+            'cash': portfolio_state.get('cash', portfolio_data_nested.get('cash', 0)),
+            'positions_count': len(positions),
+            'total_pnl': portfolio_data_nested.get('total_pnl', 0),
+            'unrealized_pnl': sum(pos.get('unrealized_pnl', 0) for pos in positions),
+            'day_pnl': sum(pos.get('unrealized_pnl', 0) for pos in positions)  # Mock day P&L
+        }
+
+        # Format performance data
+        portfolio_data = current_state.get('portfolio', {})
+        trades_count = portfolio_data.get('trades_count', current_state.get('trades_count', 0))
+        winning_trades = portfolio_data.get('winning_trades', current_state.get('winning_trades', 0))
+
+        performance = {
+            'trades_count': trades_count,
+            'win_rate': (winning_trades / max(trades_count, 1)) * 100,
+            'best_trade': portfolio_data.get('best_trade', current_state.get('best_trade', 0)),
+            'worst_trade': portfolio_data.get('worst_trade', current_state.get('worst_trade', 0))
+        }
+
+        # Format system status - prioritize dashboard data, then current_state
+        system_status = source.get('system_status', {})
+        if not system_status or not system_status.get('is_running'):
+            # Fallback to checking if we have active trading session
+            system_status = {
+                'is_running': bool(current_state.get('mode')) or len(portfolio_state.get('positions', {})) > 0,
+                'iteration': current_state.get('iteration', 0),
+                'scan_status': source.get('system_status', {}).get('scan_status',
+                               'active' if len(portfolio_state.get('positions', {})) > 0 else 'idle')
+            }
+
+        # Get trade history from dashboard data
+        trade_history = source.get('trade_history', [])
+
+        return {
+            'signals': signals,
+            'trades': trades,
+            'positions': positions,
+            'portfolio': portfolio,
+            'performance': performance,
+            'system_status': system_status,
+            'trade_history': trade_history
+        }
+
+    except Exception as e:
+        logger.error(f"Error reading live trading data: {e}")
+        # Fallback to static data
+        return source
+
+
+class DashboardSnapshot:
+    """One serialized version of the live dashboard data"""
+
+    def __init__(self, version: int, sections: Dict[str, str]):
+        self.version = version
+        # Top-level key -> JSON text, so deltas reuse the serialized sections
+        self.sections = sections
+        self.body = ('{' + ', '.join(f'{json.dumps(key)}: {text}' for key, text in sections.items()) + '}').encode()
+        self.gzip_body = gzip.compress(self.body, compresslevel=5)
+        self.etag = f'"{version}-{hashlib.sha1(self.body).hexdigest()[:16]}"'
+        self.created_at = time.time()
+
+    def changed_sections(self, previous: Optional['DashboardSnapshot']) -> List[str]:
+        """Top-level keys whose JSON differs from previous"""
+        if previous is None:
+            return list(self.sections)
+        return [key for key, text in self.sections.items() if previous.sections.get(key) != text]
+
+    def delta_body(self, previous: Optional['DashboardSnapshot']) -> bytes:
+        """JSON with only the sections changed since previous"""
+        changed = ', '.join(f'{json.dumps(key)}: {self.sections[key]}' for key in self.changed_sections(previous))
+        removed = [key for key in (previous.sections if previous else ()) if key not in self.sections]
+        return (f'{{"version": {self.version}, "since": {previous.version if previous else 0}, '
+                f'"changed": {{{changed}}}, "removed": {json.dumps(removed)}}}').encode()
+
+
+class DashboardSnapshotPublisher:
+    """
+    Keeps a pre-serialized, versioned snapshot of the live dashboard data
+
+    A background thread rebuilds the snapshot when a POST marks the data dirty
+    or every ``refresh_interval`` seconds (state files are written by the
+    trading process), so GET /api/data and the event stream never read state
+    files or serialize JSON on the request path. The version only moves when
+    the content changes; ``wait_for_change`` blocks stream clients until then.
+    """
+
+    def __init__(self, builder: Callable[[], dict] = build_live_trading_data,
+                 refresh_interval: float = 2.0, min_interval: float = 0.1):
+        """
+        Args:
+            builder: Returns the dashboard payload dict
+            refresh_interval: Seconds between rebuilds when nothing is posted
+            min_interval: Minimum seconds between rebuilds, so bursts of POSTs coalesce
+        """
+        self.builder = builder
+        self.refresh_interval = refresh_interval
+        self.min_interval = min_interval
+
+        self._snapshot: Optional[DashboardSnapshot] = None
+        self._changed = threading.Condition()
+        self._build_lock = threading.Lock()
+        self._dirty = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.builds = 0
+
+    @property
+    def cached(self) -> Optional[DashboardSnapshot]:
+        """Current snapshot, or None before the first build; never builds"""
+        return self._snapshot
+
+    @property
+    def latest(self) -> DashboardSnapshot:
+        """Current snapshot, built on first use"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.refresh()
+        self.start()
+        return snapshot
+
+    def mark_dirty(self):
+        """Schedule a rebuild after dashboard_data changed"""
+        self._dirty.set()
+
+    def refresh(self) -> DashboardSnapshot:
+        """Rebuild now; the version is bumped only if the content changed"""
+        with self._build_lock:
+            self._dirty.clear()
+            try:
+                data = self.builder()
+                sections = {key: json.dumps(value, default=str) for key, value in data.items()}
+            except Exception as exc:
+                logger.error(f"Dashboard snapshot build failed: {exc}")
+                if self._snapshot is not None:
+                    return self._snapshot
+                sections = {}
+            self.builds += 1
+
+            previous = self._snapshot
+            if previous is not None and previous.sections == sections:
+                return previous
+
+            snapshot = DashboardSnapshot((previous.version if previous else 0) + 1, sections)
+            with self._changed:
+                self._snapshot = snapshot
+                self._changed.notify_all()
+            return snapshot
+
+    def wait_for_change(self, since_version: int, timeout: Optional[float] = None) -> DashboardSnapshot:
+        """Block until a snapshot newer than since_version exists, the timeout passes or the publisher stops"""
+        self.start()
+        with self._changed:
+            self._changed.wait_for(
+                lambda: self._stopped.is_set() or (self._snapshot is not None and self._snapshot.version > since_version),
+                timeout=timeout,
+            )
+            snapshot = self._snapshot
+        return snapshot if snapshot is not None else self.latest
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped.is_set()
+
+    def start(self):
+        """Start the background refresher (idempotent)"""
+        if self._thread is not None or self._stopped.is_set():
+            return
+        with self._build_lock:
+            if self._thread is None and not self._stopped.is_set():
+                thread = threading.Thread(target=self._run, name='DashboardSnapshotRefresher', daemon=True)
+                thread.start()
+                self._thread = thread
+
+    def stop(self):
+        """Stop the refresher and release waiting stream clients"""
+        self._stopped.set()
+        self._dirty.set()
+        with self._changed:
+            self._changed.notify_all()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._dirty.wait(self.refresh_interval)
+            if self._stopped.is_set():
+                break
+            self.refresh()
+            # Let a burst of POSTs land before the next rebuild
+            self._stopped.wait(self.min_interval)
+
+
+snapshot_publisher = DashboardSnapshotPublisher()
+
+
 class SecureDashboardHandler(http.server.BaseHTTPRequestHandler):
     """Enhanced dashboard handler with security features"""
 
+    # Set by run_server; None disables API key checks outside DEVELOPMENT_MODE handling
+    API_KEY: Optional[str] = None
+    # Seconds between keepalive comments on idle event streams
+    STREAM_KEEPALIVE = 15.0
+    # POST /api/<endpoint> (and /api/batch event type) -> dashboard_data key
+    POST_ENDPOINTS = {
+        'signals': 'signals',
+        'trades': 'trades',
+        'portfolio': 'portfolio',
+        'positions': 'positions',
+        'performance': 'performance',
+        'status': 'system_status',
+        'trade_history': 'trade_history',
+    }
+    MAX_BATCH_EVENTS = 500
+
     def __init__(self, *args, **kwargs):
         # Initialize security components
         initialize_security()
@@ -173,9 +512,8 @@ class SecureDashboardHandler(http.server.BaseHTTPRequestHandler):
             # In development mode, bypass ALL authentication
             if not hasattr(self, '_dev_mode_warning_shown'):
                 logger.warning(
-                    "⚠️ DEVELOPMENT MODE: Bypassing authentication for %s - "
-                    "NEVER use DEVELOPMENT_MODE=true in production!",
-                    client_ip
+                    f"⚠️ DEVELOPMENT MODE: Bypassing authentication for {client_ip} - "
+                    "NEVER use DEVELOPMENT_MODE=true in production!"
                 )
                 self._dev_mode_warning_shown = True
 
@@ -1195,139 +1533,144 @@ class SecureDashboardHandler(http.server.BaseHTTPRequestHandler):
                                 return response.json();
                             })
                             .then(data => {
-                                // Update portfolio overview
-                                document.getElementById('total-value').textContent = formatCurrency(data.portfolio.total_value);
-                                document.getElementById('cash').textContent = formatCurrency(data.portfolio.cash);
-                                document.getElementById('positions-count').textContent = data.portfolio.positions_count || 0;
-                                const totalPnlElement = document.getElementById('total-pnl');
-                                const totalPnlValue = data.portfolio.total_pnl || 0;
-                                totalPnlElement.textContent = formatCurrency(totalPnlValue);
-                                totalPnlElement.className = totalPnlValue >= 0 ? 'metric-value positive' : 'metric-value negative';
-
-                                // Update active positions
-                                document.getElementById('active-positions-count').textContent = data.portfolio.positions_count || 0;
-                                const unrealizedPnlElement = document.getElementById('unrealized-pnl');
-                                const unrealizedPnlValue = data.portfolio.unrealized_pnl || 0;
-                                unrealizedPnlElement.textContent = formatCurrency(unrealizedPnlValue);
-                                unrealizedPnlElement.className = unrealizedPnlValue >= 0 ? 'metric-value positive' : 'metric-value negative';
-
-                                document.getElementById('day-pnl').textContent = formatCurrency(data.portfolio.day_pnl || 0);
-                                document.getElementById('portfolio-value').textContent = formatCurrency(data.portfolio.total_value);
-
-                                // Update positions table
-                                const positionsBody = document.getElementById('positions-body');
-                                if (data.positions && data.positions.length > 0) {
-                                    positionsBody.innerHTML = data.positions.map(position =>
-                                        `<tr>
-                                            <td>${position.symbol}</td>
-                                            <td>${position.quantity}</td>
-                                            <td>${formatCurrency(position.avg_price)}</td>
-                                            <td>${formatCurrency(position.current_price)}</td>
-                                            <td class="${position.unrealized_pnl >= 0 ? 'positive' : 'negative'}">${formatCurrency(position.unrealized_pnl)}</td>
-                                            <td class="${position.day_change >= 0 ? 'positive' : 'negative'}">${position.day_change >= 0 ? '+' : ''}${position.day_change?.toFixed(2) || '0.00'}%</td>
-                                        </tr>`
-                                    ).join('');
-                                } else {
-                                    positionsBody.innerHTML = '<tr><td colspan="6" class="no-data">No active positions</td></tr>';
-                                }
+                                dashboardState = data;
+                                renderDashboard(data);
+                            })
+                            .catch(error => console.log('Error updating dashboard:', error));
+                    }
 
-                                // Update performance metrics
-                                document.getElementById('trades-count').textContent = data.performance.trades_count || 0;
-                                document.getElementById('win-rate').textContent = formatPercentage(data.performance.win_rate);
-                                const bestTradeElement = document.getElementById('best-trade');
-                                bestTradeElement.textContent = formatCurrency(data.performance.best_trade);
-                                bestTradeElement.className = 'metric-value positive';
-
-                                const worstTradeElement = document.getElementById('worst-trade');
-                                worstTradeElement.textContent = formatCurrency(data.performance.worst_trade);
-                                worstTradeElement.className = 'metric-value negative';
-
-                                // Update system status
-                                const status = data.system_status;
-                                const statusIndicator = document.getElementById('status');
-                                statusIndicator.className = 'status-indicator ' + (status.is_running ? 'running' : 'idle');
-                                statusIndicator.innerHTML = '● ' + (status.is_running ? 'RUNNING' : 'IDLE');
-
-                                document.getElementById('system-status-text').textContent = status.scan_status.toUpperCase();
-                                document.getElementById('iteration').textContent = status.iteration || 0;
-                                document.getElementById('scan-status').textContent = status.scan_status;
-
-                                // Update signals table
-                                const signalsBody = document.getElementById('signals-body');
-                                if (data.signals && data.signals.length > 0) {
-                                    signalsBody.innerHTML = data.signals.slice(-10).map(signal =>
-                                        `<tr>
-                                            <td>${new Date(signal.timestamp).toLocaleTimeString()}</td>
-                                            <td>${signal.symbol}</td>
-                                            <td><span class="signal-${signal.action}">${signal.action.toUpperCase()}</span></td>
-                                            <td>${(signal.confidence * 100).toFixed(1)}%</td>
-                                            <td>${formatCurrency(signal.price)}</td>
-                                        </tr>`
-                                    ).join('');
-                                } else {
-                                    signalsBody.innerHTML = '<tr><td colspan="5" class="no-data">No signals yet</td></tr>';
-                                }
+                    function renderDashboard(data) {
+                        // Update portfolio overview
+                        document.getElementById('total-value').textContent = formatCurrency(data.portfolio.total_value);
+                        document.getElementById('cash').textContent = formatCurrency(data.portfolio.cash);
+                        document.getElementById('positions-count').textContent = data.portfolio.positions_count || 0;
+                        const totalPnlElement = document.getElementById('total-pnl');
+                        const totalPnlValue = data.portfolio.total_pnl || 0;
+                        totalPnlElement.textContent = formatCurrency(totalPnlValue);
+                        totalPnlElement.className = totalPnlValue >= 0 ? 'metric-value positive' : 'metric-value negative';
+
+                        // Update active positions
+                        document.getElementById('active-positions-count').textContent = data.portfolio.positions_count || 0;
+                        const unrealizedPnlElement = document.getElementById('unrealized-pnl');
+                        const unrealizedPnlValue = data.portfolio.unrealized_pnl || 0;
+                        unrealizedPnlElement.textContent = formatCurrency(unrealizedPnlValue);
+                        unrealizedPnlElement.className = unrealizedPnlValue >= 0 ? 'metric-value positive' : 'metric-value negative';
+
+                        document.getElementById('day-pnl').textContent = formatCurrency(data.portfolio.day_pnl || 0);
+                        document.getElementById('portfolio-value').textContent = formatCurrency(data.portfolio.total_value);
+
+                        // Update positions table
+                        const positionsBody = document.getElementById('positions-body');
+                        if (data.positions && data.positions.length > 0) {
+                            positionsBody.innerHTML = data.positions.map(position =>
+                                `<tr>
+                                    <td>${position.symbol}</td>
+                                    <td>${position.quantity}</td>
+                                    <td>${formatCurrency(position.avg_price)}</td>
+                                    <td>${formatCurrency(position.current_price)}</td>
+                                    <td class="${position.unrealized_pnl >= 0 ? 'positive' : 'negative'}">${formatCurrency(position.unrealized_pnl)}</td>
+                                    <td class="${position.day_change >= 0 ? 'positive' : 'negative'}">${position.day_change >= 0 ? '+' : ''}${position.day_change?.toFixed(2) || '0.00'}%</td>
+                                </tr>`
+                            ).join('');
+                        } else {
+                            positionsBody.innerHTML = '<tr><td colspan="6" class="no-data">No active positions</td></tr>';
+                        }
 
-                                // Update trades table
-                                const tradesBody = document.getElementById('trades-body');
-                                if (data.trades && data.trades.length > 0) {
-                                    tradesBody.innerHTML = data.trades.slice(-10).map(trade =>
-                                        `<tr>
-                                            <td>${new Date(trade.timestamp).toLocaleTimeString()}</td>
-                                            <td>${trade.symbol}</td>
-                                            <td><span class="trade-${trade.side}">${trade.side.toUpperCase()}</span></td>
-                                            <td>${trade.shares}</td>
-                                            <td>${formatCurrency(trade.price)}</td>
-                                            <td class="${trade.pnl >= 0 ? 'positive' : 'negative'}">${formatCurrency(trade.pnl)}</td>
-                                        </tr>`
-                                    ).join('');
-                                } else {
-                                    tradesBody.innerHTML = '<tr><td colspan="6" class="no-data">No trades yet</td></tr>';
-                                }
+                        // Update performance metrics
+                        document.getElementById('trades-count').textContent = data.performance.trades_count || 0;
+                        document.getElementById('win-rate').textContent = formatPercentage(data.performance.win_rate);
+                        const bestTradeElement = document.getElementById('best-trade');
+                        bestTradeElement.textContent = formatCurrency(data.performance.best_trade);
+                        bestTradeElement.className = 'metric-value positive';
+
+                        const worstTradeElement = document.getElementById('worst-trade');
+                        worstTradeElement.textContent = formatCurrency(data.performance.worst_trade);
+                        worstTradeElement.className = 'metric-value negative';
+
+                        // Update system status
+                        const status = data.system_status;
+                        const statusIndicator = document.getElementById('status');
+                        statusIndicator.className = 'status-indicator ' + (status.is_running ? 'running' : 'idle');
+                        statusIndicator.innerHTML = '● ' + (status.is_running ? 'RUNNING' : 'IDLE');
+
+                        document.getElementById('system-status-text').textContent = status.scan_status.toUpperCase();
+                        document.getElementById('iteration').textContent = status.iteration || 0;
+                        document.getElementById('scan-status').textContent = status.scan_status;
+
+                        // Update signals table
+                        const signalsBody = document.getElementById('signals-body');
+                        if (data.signals && data.signals.length > 0) {
+                            signalsBody.innerHTML = data.signals.slice(-10).map(signal =>
+                                `<tr>
+                                    <td>${new Date(signal.timestamp).toLocaleTimeString()}</td>
+                                    <td>${signal.symbol}</td>
+                                    <td><span class="signal-${signal.action}">${signal.action.toUpperCase()}</span></td>
+                                    <td>${(signal.confidence * 100).toFixed(1)}%</td>
+                                    <td>${formatCurrency(signal.price)}</td>
+                                </tr>`
+                            ).join('');
+                        } else {
+                            signalsBody.innerHTML = '<tr><td colspan="5" class="no-data">No signals yet</td></tr>';
+                        }
 
-                                // Update Trade History table
-                                const historyBody = document.getElementById('history-body');
-                                if (data.trade_history && data.trade_history.length > 0) {
-                                    // Calculate summary stats
-                                    const totalTrades = data.trade_history.length;
-                                    const winningTrades = data.trade_history.filter(t => t.pnl > 0).length;
-                                    const losingTrades = data.trade_history.filter(t => t.pnl < 0).length;
-                                    const totalPnl = data.trade_history.reduce((sum, t) => sum + (t.pnl || 0), 0);
-
-                                    // Update summary metrics
-                                    document.getElementById('history-total-trades').textContent = totalTrades;
-                                    document.getElementById('history-winning').textContent = winningTrades;
-                                    document.getElementById('history-losing').textContent = losingTrades;
-                                    const historyPnlElement = document.getElementById('history-total-pnl');
-                                    historyPnlElement.textContent = formatCurrency(totalPnl);
-                                    historyPnlElement.className = totalPnl >= 0 ? 'metric-value positive' : 'metric-value negative';
-
-                                    // Update table (show latest 50 trades)
-                                    historyBody.innerHTML = data.trade_history.slice(-50).reverse().map(trade => {
-                                        const entryTime = new Date(trade.entry_time);
-                                        const exitTime = new Date(trade.exit_time);
-                                        const holdingTime = calculateHoldingTime(entryTime, exitTime);
-                                        const pnlPercent = trade.pnl_percent || ((trade.pnl / (trade.entry_price * trade.shares)) * 100);
-                                        const pnlClass = trade.pnl >= 0 ? 'positive' : 'negative';
-
-                                        return `<tr>
-                                            <td><strong>${trade.symbol}</strong></td>
-                                            <td>${entryTime.toLocaleString()}</td>
-                                            <td>${formatCurrency(trade.entry_price)}</td>
-                                            <td>${trade.shares}</td>
-                                            <td>${exitTime.toLocaleString()}</td>
-                                            <td>${formatCurrency(trade.exit_price)}</td>
-                                            <td>${holdingTime}</td>
-                                            <td class="${pnlClass}"><strong>${formatCurrency(trade.pnl)}</strong></td>
-                                            <td class="${pnlClass}">${trade.pnl >= 0 ? '+' : ''}${pnlPercent.toFixed(2)}%</td>
-                                            <td><span style="font-size: 0.85em; padding: 2px 6px; background: rgba(255,255,255,0.1); border-radius: 3px;">${trade.exit_reason || 'Manual'}</span></td>
-                                        </tr>`;
-                                    }).join('');
-                                } else {
-                                    historyBody.innerHTML = '<tr><td colspan="10" class="no-data">No completed trades yet</td></tr>';
-                                }
-                            })
-                            .catch(error => console.log('Error updating dashboard:', error));
+                        // Update trades table
+                        const tradesBody = document.getElementById('trades-body');
+                        if (data.trades && data.trades.length > 0) {
+                            tradesBody.innerHTML = data.trades.slice(-10).map(trade =>
+                                `<tr>
+                                    <td>${new Date(trade.timestamp).toLocaleTimeString()}</td>
+                                    <td>${trade.symbol}</td>
+                                    <td><span class="trade-${trade.side}">${trade.side.toUpperCase()}</span></td>
+                                    <td>${trade.shares}</td>
+                                    <td>${formatCurrency(trade.price)}</td>
+                                    <td class="${trade.pnl >= 0 ? 'positive' : 'negative'}">${formatCurrency(trade.pnl)}</td>
+                                </tr>`
+                            ).join('');
+                        } else {
+                            tradesBody.innerHTML = '<tr><td colspan="6" class="no-data">No trades yet</td></tr>';
+                        }
+
+                        // Update Trade History table
+                        const historyBody = document.getElementById('history-body');
+                        if (data.trade_history && data.trade_history.length > 0) {
+                            // Calculate summary stats
+                            const totalTrades = data.trade_history.length;
+                            const winningTrades = data.trade_history.filter(t => t.pnl > 0).length;
+                            const losingTrades = data.trade_history.filter(t => t.pnl < 0).length;
+                            const totalPnl = data.trade_history.reduce((sum, t) => sum + (t.pnl || 0), 0);
+
+                            // Update summary metrics
+                            document.getElementById('history-total-trades').textContent = totalTrades;
+                            document.getElementById('history-winning').textContent = winningTrades;
+                            document.getElementById('history-losing').textContent = losingTrades;
+                            const historyPnlElement = document.getElementById('history-total-pnl');
+                            historyPnlElement.textContent = formatCurrency(totalPnl);
+                            historyPnlElement.className = totalPnl >= 0 ? 'metric-value positive' : 'metric-value negative';
+
+                            // Update table (show latest 50 trades)
+                            historyBody.innerHTML = data.trade_history.slice(-50).reverse().map(trade => {
+                                const entryTime = new Date(trade.entry_time);
+                                const exitTime = new Date(trade.exit_time);
+                                const holdingTime = calculateHoldingTime(entryTime, exitTime);
+                                const pnlPercent = trade.pnl_percent || ((trade.pnl / (trade.entry_price * trade.shares)) * 100);
+                                const pnlClass = trade.pnl >= 0 ? 'positive' : 'negative';
+
+                                return `<tr>
+                                    <td><strong>${trade.symbol}</strong></td>
+                                    <td>${entryTime.toLocaleString()}</td>
+                                    <td>${formatCurrency(trade.entry_price)}</td>
+                                    <td>${trade.shares}</td>
+                                    <td>${exitTime.toLocaleString()}</td>
+                                    <td>${formatCurrency(trade.exit_price)}</td>
+                                    <td>${holdingTime}</td>
+                                    <td class="${pnlClass}"><strong>${formatCurrency(trade.pnl)}</strong></td>
+                                    <td class="${pnlClass}">${trade.pnl >= 0 ? '+' : ''}${pnlPercent.toFixed(2)}%</td>
+                                    <td><span style="font-size: 0.85em; padding: 2px 6px; background: rgba(255,255,255,0.1); border-radius: 3px;">${trade.exit_reason || 'Manual'}</span></td>
+                                </tr>`;
+                            }).join('');
+                        } else {
+                            historyBody.innerHTML = '<tr><td colspan="10" class="no-data">No completed trades yet</td></tr>';
+                        }
                     }
 
                     // Helper function to calculate holding time
@@ -1347,9 +1690,44 @@ class SecureDashboardHandler(http.server.BaseHTTPRequestHandler):
                         }
                     }
 
-                    // Auto-refresh every 2 seconds
-                    setInterval(updateDashboard, 2000);
-                    updateDashboard(); // Initial update
+                    // Live updates: the server pushes a snapshot, then only changed sections
+                    let dashboardState = null;
+                    let pollTimer = null;
+
+                    function startPolling() {
+                        if (pollTimer === null) {
+                            pollTimer = setInterval(updateDashboard, 2000);
+                            updateDashboard();
+                        }
+                    }
+
+                    function startEventStream() {
+                        if (!window.EventSource) {
+                            startPolling();
+                            return;
+                        }
+                        // EventSource cannot send headers, so the key goes in the query string
+                        const source = new EventSource(`/api/stream?${API_KEY_PARAM}=${encodeURIComponent(requireApiKey())}`);
+
+                        source.addEventListener('snapshot', event => {
+                            dashboardState = JSON.parse(event.data);
+                            renderDashboard(dashboardState);
+                        });
+                        source.addEventListener('delta', event => {
+                            const delta = JSON.parse(event.data);
+                            dashboardState = Object.assign(dashboardState || {}, delta.changed);
+                            delta.removed.forEach(key => delete dashboardState[key]);
+                            renderDashboard(dashboardState);
+                        });
+                        source.onerror = () => {
+                            // EventSource reconnects on its own; poll (and re-prompt on 401) if it gives up
+                            if (source.readyState === EventSource.CLOSED) {
+                                startPolling();
+                            }
+                        };
+                    }
+
+                    startEventStream();
 
                     // Add smooth scrolling for better UX
                     document.querySelectorAll('a[href^="#"]').forEach(anchor => {
@@ -1378,20 +1756,76 @@ class SecureDashboardHandler(http.server.BaseHTTPRequestHandler):
             self.wfile.write(json.dumps({'status': 'healthy'}).encode())
 
         elif self.path == '/api/data':
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_security_headers()
-            self.end_headers()
+            self.send_snapshot(snapshot_publisher.latest)
 
-            # Read live data from state files
-            live_data = self.get_live_trading_data()
-            self.wfile.write(json.dumps(live_data).encode())
+        elif self.path == '/api/stream':
+            self.stream_snapshots()
 
         else:
             self.send_response(404)
             self.end_headers()
             self.wfile.write(b'Not Found')
 
+    def send_snapshot(self, snapshot: DashboardSnapshot):
+        """Send a cached snapshot, honouring If-None-Match and gzip"""
+        if self.headers.get('If-None-Match') == snapshot.etag:
+            self.send_response(304)
+            self.send_header('ETag', snapshot.etag)
+            self.send_security_headers()
+            self.end_headers()
+            return
+
+        accepts_gzip = 'gzip' in self.headers.get('Accept-Encoding', '').lower()
+        body = snapshot.gzip_body if accepts_gzip else snapshot.body
+        self.send_response(200)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', snapshot.etag)
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Vary', 'Accept-Encoding')
+        if accepts_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_security_headers()
+        self.end_headers()
+        self.wfile.write(body)
+
+    def stream_snapshots(self):
+        """
+        Server-Sent Events: a full ``snapshot`` event, then ``delta`` events
+        with only the changed top-level sections as new versions are built
+        """
+        if not isinstance(self.server, socketserver.ThreadingMixIn):
+            # A stream would hold the only request thread of a single-threaded server
+            self.send_error(503, "Event stream requires the threaded server")
+            return
+
+        self.close_connection = True
+        self.send_response(200)
+        self.send_header('Content-type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('X-Accel-Buffering', 'no')
+        self.send_security_headers()
+        self.end_headers()
+
+        publisher = snapshot_publisher
+        try:
+            sent = publisher.latest
+            self._write_event('snapshot', sent.version, sent.body)
+            while not publisher.stopped:
+                snapshot = publisher.wait_for_change(sent.version, timeout=self.STREAM_KEEPALIVE)
+                if snapshot.version > sent.version:
+                    self._write_event('delta', snapshot.version, snapshot.delta_body(sent))
+                    sent = snapshot
+                else:
+                    self.wfile.write(b': keepalive\n\n')
+                    self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, ssl.SSLError, OSError):
+            logger.debug(f"Event stream closed by {getattr(self, 'client_ip', 'unknown')}")
+
+    def _write_event(self, event: str, version: int, data: bytes):
+        self.wfile.write(f'event: {event}\nid: {version}\ndata: '.encode() + data + b'\n\n')
+        self.wfile.flush()
+
     def do_POST(self):
         """Handle POST requests for API endpoints"""
         if not self._require_api_key():
@@ -1430,6 +1864,9 @@ class SecureDashboardHandler(http.server.BaseHTTPRequestHandler):
         elif self.path == '/api/trade_history':
             self.handle_api_data('trade_history')
 
+        elif self.path == '/api/batch':
+            self.handle_batch_data()
+
         elif self.path == '/api/metrics':
             # MONITORING FIX: Performance metrics endpoint
             self.handle_performance_metrics()
@@ -1501,16 +1938,9 @@ class SecureDashboardHandler(http.server.BaseHTTPRequestHandler):
             data = json.loads(post_data.decode())
             sanitized_payload = self._validate_payload(data_type, data)
 
-            if data_type in dashboard_data:
-                target = dashboard_data[data_type]
-                if isinstance(target, list):
-                    target.append(sanitized_payload)
-                    if len(target) > 100:
-                        dashboard_data[data_type] = target[-100:]
-                elif isinstance(target, dict):
-                    target.update(sanitized_payload)
-                else:
-                    dashboard_data[data_type] = sanitized_payload
+            with _dashboard_lock:
+                self._apply_update(data_type, sanitized_payload)
+            snapshot_publisher.mark_dirty()
 
             self.send_response(200)
             self.send_header('Content-type', 'application/json')
@@ -1531,6 +1961,74 @@ class SecureDashboardHandler(http.server.BaseHTTPRequestHandler):
             self.end_headers()
             self.wfile.write(json.dumps({'status': 'error', 'message': 'Internal server error'}).encode())
 
+    @staticmethod
+    def _apply_update(data_type: str, payload: Dict[str, Any]):
+        """Merge one validated update into dashboard_data (caller holds _dashboard_lock)"""
+        if data_type not in dashboard_data:
+            return
+        target = dashboard_data[data_type]
+        if isinstance(target, list):
+            target.append(payload)
+            if len(target) > 100:
+                dashboard_data[data_type] = target[-100:]
+        elif isinstance(target, dict):
+            target.update(payload)
+        else:
+            dashboard_data[data_type] = payload
+
+    def handle_batch_data(self):
+        """
+        Apply ``{"events": [{"type": "<endpoint>", "data": {...}}, ...]}`` in order
+
+        Invalid events are skipped and counted; the rest are applied under a
+        single lock acquisition with one snapshot rebuild.
+        """
+        try:
+            content_length = int(self.headers.get('Content-Length', 0))
+            if content_length > 1048576:  # 1 MB
+                raise ValueError("Payload too large")
+            body = json.loads(self.rfile.read(content_length).decode())
+            events = body.get('events') if isinstance(body, dict) else None
+            if not isinstance(events, list) or len(events) > self.MAX_BATCH_EVENTS:
+                raise ValueError("Expected an events list")
+
+            updates = []
+            rejected = 0
+            for event in events:
+                data_type = self.POST_ENDPOINTS.get(event.get('type')) if isinstance(event, dict) else None
+                try:
+                    if data_type is None:
+                        raise ValueError("Unknown event type")
+                    updates.append((data_type, self._validate_payload(data_type, event.get('data'))))
+                except ValueError:
+                    rejected += 1
+
+            with _dashboard_lock:
+                for data_type, payload in updates:
+                    self._apply_update(data_type, payload)
+            if updates:
+                snapshot_publisher.mark_dirty()
+
+            self.send_response(200)
+            self.send_header('Content-type', 'application/json')
+            self.send_security_headers()
+            self.end_headers()
+            self.wfile.write(json.dumps({'status': 'success', 'applied': len(updates),
+                                         'rejected': rejected}).encode())
+
+        except ValueError as exc:
+            logger.warning(f"Invalid batch payload: {exc}")
+            self.send_response(400)
+            self.send_security_headers()
+            self.end_headers()
+            self.wfile.write(json.dumps({'status': 'error', 'message': 'Invalid payload'}).encode())
+        except Exception as exc:
+            logger.error(f"Error handling batch API call: {exc}")
+            self.send_response(500)
+            self.send_security_headers()
+            self.end_headers()
+            self.wfile.write(json.dumps({'status': 'error', 'message': 'Internal server error'}).encode())
+
     def handle_performance_metrics(self):
         """
         MONITORING FIX: Handle performance metrics endpoint
@@ -1575,136 +2073,11 @@ class SecureDashboardHandler(http.server.BaseHTTPRequestHandler):
 
     def _load_encrypted_state(self) -> Optional[dict]:
         """Attempt to load encrypted trading state if available."""
-        password = os.getenv('TRADING_SECURITY_PASSWORD')
-        if not password:
-            return None
-        try:
-            manager = SecureStateManager(master_password=password)
-            state = manager.load_encrypted_state('current_state.enc')
-            if state:
-                return state
-        except Exception as exc:
-            logger.debug(f"Encrypted state unavailable: {exc}")
-        return None
+        return load_encrypted_state()
 
     def get_live_trading_data(self):
         """Read live trading data from state files"""
-        try:
-            current_state = self._load_encrypted_state() or {}
-
-            # Read current state
-            if not current_state and os.path.exists('state/current_state.json'):
-                with open('state/current_state.json', 'r') as f:
-                    current_state = json.load(f)
-
-            # Read shared portfolio state
-            portfolio_state = {}
-            if os.path.exists('state/shared_portfolio_state.json'):
-                try:
-                    with open('state/shared_portfolio_state.json', 'r') as f:
-                        portfolio_state = json.load(f)
-                except json.JSONDecodeError:
-                    logger.warning("shared_portfolio_state.json is corrupted; using empty portfolio data")
-                    portfolio_state = {"cash": 1000000, "positions": {}}
-
-            # Use empty portfolio if no positions found (removed mock data)
-            if not portfolio_state:
-                portfolio_state = {
-                    "cash": 1000000,
-                    "positions": {}
-                }
-
-            # Format signals data (from recent trading activity)
-            signals = []
-            if 'signals' in dashboard_data and dashboard_data['signals']:
-                signals = dashboard_data['signals'][-20:]  # Last 20 signals
-
-            # Format trades data
-            trades = []
-            # First check dashboard_data
-            if 'trades' in dashboard_data and dashboard_data['trades']:
-                trades = dashboard_data['trades'][-20:]  # Last 20 trades
-            # Also check current_state for trades_history
-            elif 'portfolio' in current_state and 'trades_history' in current_state['portfolio']:
-                trades = current_state['portfolio']['trades_history'][-20:]  # Last 20 trades
-
-            # Format positions data from portfolio state
-            positions = []
-            if 'positions' in portfolio_state and portfolio_state['positions']:
-                for symbol, pos_data in portfolio_state['positions'].items():
-                    # Calculate unrealized P&L (mock calculation for now)
-                    current_price = pos_data.get('current_price', pos_data.get('entry_price', 0))
-                    entry_price = pos_data.get('entry_price', 0)
-                    quantity = pos_data.get('shares', 0)
-
-                    # Mock current price (in real implementation, this would come from live market data)
-                    import random
-                    price_fluctuation = random.uniform(-0.05, 0.05)  # ±5% fluctuation
-                    current_price = entry_price * (1 + price_fluctuation)
-
-                    unrealized_pnl = (current_price - entry_price) * quantity
-                    day_change = ((current_price - entry_price) / entry_price) * 100
-
-                    positions.append({
-                        'symbol': symbol,
-                        'quantity': quantity,
-                        'avg_price': entry_price,
-                        'current_price': current_price,
-                        'unrealized_pnl': unrealized_pnl,
-                        'day_change': day_change
-                    })
-
-            # Format portfolio data
-            portfolio_data_nested = current_state.get('portfolio', {})
-            portfolio = {
-                'total_value': current_state.get('total_value', portfolio_state.get('cash', 0)),
-                'cash': portfolio_state.get('cash', portfolio_data_nested.get('cash', 0)),
-                'positions_count': len(positions),
-                'total_pnl': portfolio_data_nested.get('total_pnl', 0),
-                'unrealized_pnl': sum(pos.get('unrealized_pnl', 0) for pos in positions),
-                'day_pnl': sum(pos.get('unrealized_pnl', 0) for pos in positions)  # Mock day P&L
-            }
-
-            # Format performance data
-            portfolio_data = current_state.get('portfolio', {})
-            trades_count = portfolio_data.get('trades_count', current_state.get('trades_count', 0))
-            winning_trades = portfolio_data.get('winning_trades', current_state.get('winning_trades', 0))
-
-            performance = {
-                'trades_count': trades_count,
-                'win_rate': (winning_trades / max(trades_count, 1)) * 100,
-                'best_trade': portfolio_data.get('best_trade', current_state.get('best_trade', 0)),
-                'worst_trade': portfolio_data.get('worst_trade', current_state.get('worst_trade', 0))
-            }
-
-            # Format system status - prioritize dashboard_data, then current_state
-            system_status = dashboard_data.get('system_status', {})
-            if not system_status or not system_status.get('is_running'):
-                # Fallback to checking if we have active trading session
-                system_status = {
-                    'is_running': bool(current_state.get('mode')) or len(portfolio_state.get('positions', {})) > 0,
-                    'iteration': current_state.get('iteration', 0),
-                    'scan_status': dashboard_data.get('system_status', {}).get('scan_status',
-                                   'active' if len(portfolio_state.get('positions', {})) > 0 else 'idle')
-                }
-
-            # Get trade history from dashboard_data
-            trade_history = dashboard_data.get('trade_history', [])
-
-            return {
-                'signals': signals,
-                'trades': trades,
-                'positions': positions,
-                'portfolio': portfolio,
-                'performance': performance,
-                'system_status': system_status,
-                'trade_history': trade_history
-            }
-
-        except Exception as e:
-            logger.error(f"Error reading live trading data: {e}")
-            # Fallback to static data
-            return dashboard_data
+        return build_live_trading_data()
 
 def validate_server_configuration(api_key: str | None, enable_https: bool, cert_file: str | None, key_file: str | None) -> dict:
     """Validate server configuration and return configuration status"""
@@ -1741,7 +2114,21 @@ def validate_server_configuration(api_key: str | None, enable_https: bool, cert_
 
     return config_status
 
-def run_server(port=8080, enable_https=False, cert_file=None, key_file=None, api_key: str | None = None):
+class ThreadingDashboardServer(http.server.ThreadingHTTPServer):
+    """One thread per connection, so slow clients and event streams don't block POSTs"""
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def create_server(port=8080, handler_cls=SecureDashboardHandler, threaded: bool = True,
+                  host: str = "") -> socketserver.TCPServer:
+    """Bind the dashboard server; threaded=False keeps the single-threaded TCPServer"""
+    server_cls = ThreadingDashboardServer if threaded else socketserver.TCPServer
+    return server_cls((host, port), handler_cls)
+
+
+def run_server(port=8080, enable_https=False, cert_file=None, key_file=None, api_key: str | None = None,
+               threaded: bool = True):
     """Run the dashboard server with optional HTTPS support"""
     # Validate configuration before starting
     config_status = validate_server_configuration(api_key, enable_https, cert_file, key_file)
@@ -1776,20 +2163,24 @@ def run_server(port=8080, enable_https=False, cert_file=None, key_file=None, api
     if enable_https:
         print(f"📊 Enhanced Trading Dashboard Server (HTTPS)")
         print(f"🔒 Secure server running at: https://localhost:{port}")
-        httpd = socketserver.TCPServer(("", port), handler_cls)
+        httpd = create_server(port, handler_cls, threaded=threaded)
         context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
         context.load_cert_chain(cert_file, key_file)
         httpd.socket = context.wrap_socket(httpd.socket, server_side=True)
     else:
         print(f"📊 Enhanced Trading Dashboard Server (HTTP)")
         print(f"🌐 Server running at: http://localhost:{port}")
-        httpd = socketserver.TCPServer(("", port), handler_cls)
+        httpd = create_server(port, handler_cls, threaded=threaded)
 
+    snapshot_publisher.start()
     try:
         httpd.serve_forever()
     except KeyboardInterrupt:
         print('\n🛑 Dashboard server stopped')
-        httpd.shutdown()
+    finally:
+        snapshot_publisher.stop()
+        httpd.server_close()
+
 def generate_self_signed_certificate(cert_file='certs/dashboard.crt', key_file='certs/dashboard.key'):
     """Generate self-signed SSL certificate for development"""
     try:
@@ -1836,6 +2227,7 @@ if __name__ == "__main__":
     parser.add_argument('--api-key', type=str, help='API key required for dashboard API access')
     parser.add_argument('--allow-http', action='store_true', help='Explicitly allow HTTP mode (not recommended)')
     parser.add_argument('--store-api-key', action='store_true', help='Persist provided API key using secure storage')
+    parser.add_argument('--single-threaded', action='store_true', help='Serve one request at a time (disables /api/stream)')
 
     args = parser.parse_args()
 
@@ -1910,10 +2302,11 @@ if __name__ == "__main__":
     try:
         if https_enabled:
             print('🔒 Starting server in SECURE HTTPS mode')
-            run_server(port=args.port, enable_https=True, cert_file=cert_file, key_file=key_file, api_key=api_key)
+            run_server(port=args.port, enable_https=True, cert_file=cert_file, key_file=key_file, api_key=api_key,
+                       threaded=not args.single_threaded)
         else:
             print('🌐 Starting server in HTTP mode')
-            run_server(port=args.port, enable_https=False, api_key=api_key)
+            run_server(port=args.port, enable_https=False, api_key=api_key, threaded=not args.single_threaded)
     except ValueError as exc:
         print(f"❌ Error: {exc}")
         sys.exit(1)
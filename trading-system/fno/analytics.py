@@ -8,7 +8,7 @@ from typing import Dict, List, Optional
 import logging
 import math
 import numpy as np
-from fno.options import OptionContract, OptionChain
+from fno.options import OptionContract, OptionChain, norm_cdf, norm_pdf
 
 logger = logging.getLogger('trading_system.fno.analytics')
 
@@ -22,7 +22,12 @@ class FNOAnalytics:
 
     def calculate_implied_volatility(self, option: OptionContract, spot_price: float,
                                   time_to_expiry: float, risk_free_rate: float = 0.06) -> float:
-        """Calculate implied volatility using Newton-Raphson method without SciPy"""
+        """
+        Calculate implied volatility using Newton-Raphson method without SciPy
+
+        For whole chains use calculate_chain_implied_volatility, which solves
+        every strike in one vectorized pass.
+        """
         try:
             S = float(spot_price)
             K = float(option.strike_price)
@@ -33,12 +38,6 @@ class FNOAnalytics:
             if T <= 0 or market_price <= 0 or S <= 0 or K <= 0:
                 return 0.0
 
-            def _norm_pdf(x: float) -> float:
-                return (1.0 / math.sqrt(2.0 * math.pi)) * math.exp(-0.5 * x * x)
-
-            def _norm_cdf(x: float) -> float:
-                return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
-
             # Newton-Raphson method to find implied volatility
             sigma = 0.3  # Initial guess (30%)
             tolerance = 1e-4
@@ -49,11 +48,11 @@ class FNOAnalytics:
                 d2 = d1 - sigma * math.sqrt(T)
 
                 if option.option_type == 'CE':
-                    price = S * _norm_cdf(d1) - K * math.exp(-r * T) * _norm_cdf(d2)
+                    price = S * norm_cdf(d1) - K * math.exp(-r * T) * norm_cdf(d2)
                 else:
-                    price = K * math.exp(-r * T) * _norm_cdf(-d2) - S * _norm_cdf(-d1)
+                    price = K * math.exp(-r * T) * norm_cdf(-d2) - S * norm_cdf(-d1)
 
-                vega = S * math.sqrt(T) * _norm_pdf(d1)
+                vega = S * math.sqrt(T) * norm_pdf(d1)
 
                 if abs(price - market_price) < tolerance:
                     return sigma * 100.0  # percentage
@@ -69,6 +68,22 @@ class FNOAnalytics:
             logger.error(f"Error calculating IV for {option.symbol}: {e}")
             return 0.0
 
+    def calculate_chain_implied_volatility(self, chain: OptionChain,
+                                           risk_free_rate: float = 0.06) -> Dict[float, Dict[str, float]]:
+        """
+        Solve IV and Greeks for every strike of a chain in one array pass
+
+        Returns:
+            Mapping of strike -> {'CE': iv, 'PE': iv} (percent) for solved contracts
+        """
+        chain.calculate_greeks(risk_free_rate=risk_free_rate)
+        surface: Dict[float, Dict[str, float]] = {}
+        for contracts in (chain.calls, chain.puts):
+            for strike, option in contracts.items():
+                if option.implied_volatility > 0:
+                    surface.setdefault(strike, {})[option.option_type] = option.implied_volatility
+        return surface
+
     def analyze_iv_regime(self, symbol: str, current_iv: float) -> Dict:
         """Analyze if current IV is high, low, or normal"""
         if symbol not in self.historical_iv or len(self.historical_iv[symbol]) < 30:
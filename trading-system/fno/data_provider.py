@@ -4,6 +4,7 @@ FNO Data Provider
 Fetches option chains, greeks, and market data for F&O trading
 """
 
+import re
 import time
 import random
 from datetime import datetime
@@ -12,6 +13,7 @@ from kiteconnect import KiteConnect
 import logging
 
 from fno.options import OptionContract, OptionChain
+from fno.instrument_index import InstrumentIndex
 from fno.indices import FNOIndex, DynamicFNOIndices
 from utilities.market_hours import MarketHoursManager
 from infrastructure.rate_limiting import EnhancedRateLimiter
@@ -44,6 +46,7 @@ class FNODataProvider:
         self._instruments_cache = None
         self._instruments_cache_time = 0
         self._instruments_cache_ttl = 3600  # 1 hour TTL
+        self._instrument_index: Optional[InstrumentIndex] = None
 
         # Initialize dynamic index discovery
         global DYNAMIC_FNO_INDICES
@@ -110,40 +113,52 @@ class FNODataProvider:
         """Get all available F&O indices"""
         return self.indices_provider.get_available_indices()
 
-    def _build_instrument_lookup(self) -> None:
-        """Build O(1) lookup map from tradingsymbol to instrument details.
+    def _get_instrument_index(self) -> InstrumentIndex:
+        """Return the NFO+BFO instrument index, refreshing the master once per TTL.
 
-        CRITICAL FIX: This prevents O(N×M) scan over ~200k instruments for every price refresh.
-        Called lazily on first use and cached for 30 minutes.
+        The index is rebuilt only when the instrument master is re-downloaded, so
+        every chain and price lookup in between is a dict/bisect operation.
         """
         current_time = time.time()
+        if (self._instrument_index is not None and
+                current_time - self._instruments_cache_time <= self._instruments_cache_ttl):
+            return self._instrument_index
+
+        if not self.kite:
+            return self._instrument_index or InstrumentIndex([])
 
-        # Check if lookup is already built and still valid
-        if (self.lookup_cache_timestamp and
-            current_time - self.lookup_cache_timestamp < self.cache_expiry and
-            self.instrument_lookup):
-            return
-
-        logger.info("Building instrument lookup map for O(1) access...")
-
-        # Fetch instruments from both NFO and BFO
-        nfo_instruments = self._get_instruments_cached("NFO")
-        bfo_instruments = self._get_instruments_cached("BFO")
-        all_instruments = nfo_instruments + bfo_instruments
-
-        # Build the lookup dictionary
-        self.instrument_lookup.clear()
-        for inst in all_instruments:
-            tradingsymbol = inst.get('tradingsymbol')
-            if tradingsymbol:
-                self.instrument_lookup[tradingsymbol] = {
-                    'exchange': inst.get('exchange'),
-                    'instrument_token': inst.get('instrument_token'),
-                    'tradingsymbol': tradingsymbol
-                }
-
-        self.lookup_cache_timestamp = current_time
-        logger.info(f"Built lookup map for {len(self.instrument_lookup)} instruments (NFO+BFO)")
+        logger.info("🔄 Fetching live instruments from all exchanges (cache expired)...")
+        try:
+            nfo_instruments = self.kite.instruments("NFO")  # NSE F&O
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to fetch NFO instruments: {e}")
+            # Keep serving the previous master rather than failing every lookup
+            return self._instrument_index or InstrumentIndex([])
+
+        bfo_instruments = []
+        try:
+            bfo_instruments = self.kite.instruments("BFO")  # BSE F&O
+            logger.info(f"✅ Retrieved {len(bfo_instruments)} BSE F&O instruments")
+        except Exception as e:
+            logger.debug(f"BSE F&O not available: {e}")
+
+        self._instruments_cache = nfo_instruments + bfo_instruments
+        self._instruments_cache_time = current_time
+        self._instrument_index = InstrumentIndex(self._instruments_cache)
+        logger.info(f"✅ Indexed {len(self._instruments_cache)} instruments (NSE: {len(nfo_instruments)}, BSE: {len(bfo_instruments)})")
+        return self._instrument_index
+
+    def _build_instrument_lookup(self) -> None:
+        """Point the O(1) tradingsymbol lookup at the current instrument index.
+
+        CRITICAL FIX: This prevents O(N×M) scan over ~200k instruments for every price refresh.
+        The map is the index's own symbol table, so it is rebuilt only on master refresh.
+        """
+        index = self._get_instrument_index()
+        if self.instrument_lookup is not index.by_symbol:
+            self.instrument_lookup = index.by_symbol
+            self.lookup_cache_timestamp = self._instruments_cache_time
+            logger.info(f"Built lookup map for {len(self.instrument_lookup)} instruments (NFO+BFO)")
 
     def _get_instruments_cached(self, exchange: str = "NFO") -> List[Dict]:
         """Get instruments with caching for improved performance"""
@@ -347,218 +362,16 @@ class FNODataProvider:
                 logger.error("❌ Kite connection not available - cannot fetch real option chain")
                 return None
 
-            # Get LIVE instruments from Kite API - use cache to reduce API calls
-            current_time = time.time()
-            if self._instruments_cache is None or (current_time - self._instruments_cache_time) > self._instruments_cache_ttl:
-                logger.info("🔄 Fetching live instruments from all exchanges (cache expired)...")
-                nfo_instruments = self.kite.instruments("NFO")  # NSE F&O
-                bfo_instruments = []
-
-                # Try to get BSE F&O instruments if available
-                try:
-                    bfo_instruments = self.kite.instruments("BFO")  # BSE F&O
-                    logger.info(f"✅ Retrieved {len(bfo_instruments)} BSE F&O instruments")
-                except Exception as e:
-                    logger.debug(f"BSE F&O not available: {e}")
-
-                # Combine and cache instruments
-                self._instruments_cache = nfo_instruments + bfo_instruments
-                self._instruments_cache_time = current_time
-                logger.info(f"✅ Cached {len(self._instruments_cache)} instruments (NSE: {len(nfo_instruments)}, BSE: {len(bfo_instruments)})")
-            else:
-                logger.info(f"✅ Using cached instruments ({len(self._instruments_cache)} total, age: {int(current_time - self._instruments_cache_time)}s)")
-
-            instruments = self._instruments_cache
-
-            # Enhanced index instrument search with better matching
-            index_instrument = None
-
-            # First, try to find the exact index instrument
-            logger.info(f"🔍 Searching for {index_symbol} in NFO instruments...")
-
-            # Look for futures instruments (FUT)
-            for inst in instruments:
-                if inst['instrument_type'] == 'FUT':
-                    if index_symbol == inst['tradingsymbol']:
-                        index_instrument = inst
-                        logger.info(f"✅ Found exact match: {inst['tradingsymbol']} ({inst['instrument_type']})")
-                        break
-
-            # If not found, try partial matching and collect all candidates
-            if not index_instrument:
-                logger.info(f"🔄 Exact match not found, trying partial matching for {index_symbol}...")
-                candidates = []
-                prefix = index_symbol.upper()
-                for inst in instruments:
-                    tradingsymbol = str(inst.get('tradingsymbol', '')).upper()
-                    if (inst['instrument_type'] == 'FUT' and
-                        (tradingsymbol.startswith(prefix) or
-                         tradingsymbol == prefix)):
-                        candidates.append(inst)
-
-                # If we have candidates, pick the best available expiry
-                if candidates:
-                    from datetime import datetime, date
-                    current_date = datetime.now()
-                    current_date_str = current_date.strftime('%Y-%m-%d')
-                    current_date_obj = current_date.date()
-
-                    # Helper function to get date object from expiry field
-                    def get_expiry_date(instrument):
-                        expiry = instrument['expiry']
-                        if isinstance(expiry, str):
-                            return datetime.strptime(expiry, '%Y-%m-%d').date()
-                        elif isinstance(expiry, date) and not isinstance(expiry, datetime):
-                            return expiry
-                        elif isinstance(expiry, datetime):
-                            return expiry.date()
-                        elif hasattr(expiry, 'date'):
-                            return expiry.date()
-                        else:
-                            # Fallback - try to parse as string
-                            return datetime.strptime(str(expiry), '%Y-%m-%d').date()
-
-                    # Log all available expiries for transparency
-                    logger.info(f"📅 Found {len(candidates)} expiry candidates:")
-                    for i, c in enumerate(sorted(candidates, key=lambda x: x['expiry'])[:5]):  # Show first 5
-                        logger.info(f"   {i+1}. {c['tradingsymbol']} - {c['expiry']}")
-
-                    # Strategy 1: Prefer nearest future expiry (avoid same-day expiry)
-                    future_candidates = [c for c in candidates if get_expiry_date(c) > current_date_obj]
-
-                    if future_candidates:
-                        # Sort by expiry date and pick the nearest
-                        future_candidates.sort(key=lambda x: get_expiry_date(x))
-                        index_instrument = future_candidates[0]
-                        logger.info(f"✅ Found nearest future expiry: {index_instrument['tradingsymbol']} (expiry: {index_instrument['expiry']})")
-                    else:
-                        # Strategy 2: Only use current expiry (same day) if no future expiry available
-                        current_expiry_candidates = [c for c in candidates if get_expiry_date(c) == current_date_obj]
-                        if current_expiry_candidates:
-                            index_instrument = current_expiry_candidates[0]
-                            logger.info(f"⚠️ Using current expiry (same day): {index_instrument['tradingsymbol']} (expiry: {index_instrument['expiry']})")
-                        else:
-                            # Strategy 3: Use most recent past expiry (for after-hours or holidays)
-                            past_candidates = [c for c in candidates if get_expiry_date(c) < current_date_obj]
-                            if past_candidates:
-                                # Sort by expiry date descending and pick the most recent
-                                past_candidates.sort(key=lambda x: get_expiry_date(x), reverse=True)
-                                index_instrument = past_candidates[0]
-                                logger.info(f"✅ Found most recent past expiry: {index_instrument['tradingsymbol']} (expiry: {index_instrument['expiry']})")
-                            else:
-                                # Strategy 4: Fallback to any available candidate
-                                index_instrument = candidates[0]
-                                logger.info(f"✅ Found fallback match: {index_instrument['tradingsymbol']} ({index_instrument['instrument_type']})")
-
-            # Try alternative names for common indices
-            if not index_instrument:
-                logger.info(f"🔄 Trying alternative names for {index_symbol}...")
-                alternative_names = {
-                    'BANKNIFTY': ['NIFTY BANK', 'BANK NIFTY', 'NIFTYBANK', 'NIFTY BANK', 'BANK-NIFTY'],
-                    'FINNIFTY': ['FIN NIFTY', 'NIFTY FIN', 'FINANCIAL NIFTY', 'NIFTY FIN SERVICE', 'FIN-NIFTY'],
-                    'MIDCPNIFTY': ['MIDCAP NIFTY', 'NIFTY MIDCAP', 'MID CAP NIFTY', 'NIFTY MIDCAP 100', 'MIDCP-NIFTY']
-                }
-
-                if index_symbol in alternative_names:
-                    alt_candidates = []
-                    for alt_name in alternative_names[index_symbol]:
-                        for inst in instruments:
-                            if (alt_name.lower() in inst['tradingsymbol'].lower() and
-                                inst['instrument_type'] == 'FUT'):
-                                alt_candidates.append(inst)
-
-                    # If we have alternative candidates, use enhanced expiry selection
-                    if alt_candidates:
-                        # Log alternative candidates
-                        logger.info(f"📅 Found {len(alt_candidates)} alternative name candidates:")
-                        for i, c in enumerate(sorted(alt_candidates, key=lambda x: get_expiry_date(c))[:3]):
-                            logger.info(f"   {i+1}. {c['tradingsymbol']} - {c['expiry']}")
-
-                        # Apply same intelligent expiry selection strategy (prefer future expiry)
-                        future_alt_candidates = [c for c in alt_candidates if get_expiry_date(c) > current_date_obj]
-                        if future_alt_candidates:
-                            future_alt_candidates.sort(key=lambda x: get_expiry_date(x))
-                            index_instrument = future_alt_candidates[0]
-                            logger.info(f"✅ Found nearest future expiry with alternative name: {index_instrument['tradingsymbol']} (expiry: {index_instrument['expiry']})")
-                        else:
-                            current_alt_candidates = [c for c in alt_candidates if get_expiry_date(c) == current_date_obj]
-                            if current_alt_candidates:
-                                index_instrument = current_alt_candidates[0]
-                                logger.info(f"⚠️ Using current expiry with alternative name: {index_instrument['tradingsymbol']} (expiry: {index_instrument['expiry']})")
-                            else:
-                                past_alt_candidates = [c for c in alt_candidates if get_expiry_date(c) < current_date_obj]
-                                if past_alt_candidates:
-                                    past_alt_candidates.sort(key=lambda x: get_expiry_date(x), reverse=True)
-                                    index_instrument = past_alt_candidates[0]
-                                    logger.info(f"✅ Found recent past expiry with alternative name: {index_instrument['tradingsymbol']} (expiry: {index_instrument['expiry']})")
-                                else:
-                                    index_instrument = alt_candidates[0]
-                                    logger.info(f"✅ Found with alternative name: {index_instrument['tradingsymbol']} ({index_instrument['instrument_type']})")
-
-            # If still not found, try to find futures contracts with nearest expiry
-            if not index_instrument:
-                logger.info(f"🔄 Looking for futures contracts for {index_symbol}...")
-                final_candidates = []
-                for inst in instruments:
-                    if (index_symbol in inst['tradingsymbol'] and
-                        inst['instrument_type'] == 'FUT'):
-                        final_candidates.append(inst)
-
-                # If we have final candidates, use enhanced expiry selection
-                if final_candidates:
-                    current_date_str = datetime.now().strftime('%Y-%m-%d')
-
-                    # Log final candidates
-                    logger.info(f"📅 Found {len(final_candidates)} final candidates:")
-                    for i, c in enumerate(sorted(final_candidates, key=lambda x: x['expiry'])[:3]):
-                        logger.info(f"   {i+1}. {c['tradingsymbol']} - {c['expiry']}")
-
-                    # Apply comprehensive expiry selection strategy (prefer future expiry)
-                    current_date_obj = datetime.strptime(current_date_str, '%Y-%m-%d').date()
-                    future_final_candidates = [c for c in final_candidates if get_expiry_date(c) > current_date_obj]
-                    if future_final_candidates:
-                        future_final_candidates.sort(key=lambda x: get_expiry_date(x))
-                        index_instrument = future_final_candidates[0]
-                        logger.info(f"✅ Found nearest future expiry futures: {index_instrument['tradingsymbol']} (expiry: {index_instrument['expiry']})")
-                    else:
-                        current_final_candidates = [c for c in final_candidates if get_expiry_date(c) == current_date_obj]
-                        if current_final_candidates:
-                            index_instrument = current_final_candidates[0]
-                            logger.info(f"⚠️ Using current expiry futures: {index_instrument['tradingsymbol']} (expiry: {index_instrument['expiry']})")
-                        else:
-                            past_final_candidates = [c for c in final_candidates if get_expiry_date(c) < current_date_obj]
-                            if past_final_candidates:
-                                past_final_candidates.sort(key=lambda x: get_expiry_date(x), reverse=True)
-                                index_instrument = past_final_candidates[0]
-                                logger.info(f"✅ Found recent past expiry futures: {index_instrument['tradingsymbol']} (expiry: {index_instrument['expiry']})")
-                            else:
-                                index_instrument = final_candidates[0]
-                                logger.info(f"✅ Found futures contract: {index_instrument['tradingsymbol']} ({index_instrument['instrument_type']})")
+            index = self._get_instrument_index()
+            logger.info(f"✅ Using instrument index ({len(index)} total, age: {int(time.time() - self._instruments_cache_time)}s)")
+            today = datetime.now().date()
 
-            # Debug: Show available instruments if not found
+            index_instrument = self._find_index_future(index, index_symbol, today)
             if not index_instrument:
-                logger.warning(f"❌ Index {index_symbol} not found in NFO instruments")
-                logger.info("Available index instruments in NFO:")
-                index_instruments = []
-                for inst in instruments:
-                    if inst['instrument_type'] == 'FUT':
-                        logger.info(f"  - {inst['tradingsymbol']} ({inst['instrument_type']})")
-                        index_instruments.append(inst['tradingsymbol'])
-
-                # Try to find similar instruments
-                logger.info(f"🔍 Searching for similar instruments to {index_symbol}...")
-                for inst in instruments:
-                    if (index_symbol.lower() in inst['tradingsymbol'].lower() and
-                        inst['instrument_type'] == 'FUT'):
-                        logger.info(f"  - Found similar: {inst['tradingsymbol']} ({inst['instrument_type']})")
-                        index_instrument = inst
-                        break
-
-                if not index_instrument:
-                    logger.error(f"❌ Index {index_symbol} not found in NFO instruments")
-                    available_indices = list(self.get_available_indices().keys())
-                    logger.error(f"❌ Only available NFO indices are supported: {available_indices}")
-                    return None
+                logger.error(f"❌ Index {index_symbol} not found in NFO instruments")
+                available_indices = list(self.get_available_indices().keys())
+                logger.error(f"❌ Only available NFO indices are supported: {available_indices}")
+                return None
 
             # Get current market data for the index
             spot_price = self._get_index_spot_price(index_instrument)
@@ -573,72 +386,42 @@ class FNODataProvider:
                 logger.error(f"Index {index_symbol} not found in available indices: {list(available_indices.keys())}")
                 return None
 
-            # First check what option instruments we have for this index
-            all_index_options = [inst for inst in instruments
-                               if inst['name'] == index_symbol and
-                               inst['instrument_type'] in ['CE', 'PE']]
-
-            logger.info(f"📊 Total {index_symbol} options available in NFO: {len(all_index_options)}")
-
-            if not all_index_options:
+            # Expiries come pre-sorted from the index; no pass over the option rows
+            available_expiries = index.option_expiries(index_symbol)
+            if not available_expiries:
                 logger.error(f"❌ No option instruments found for {index_symbol}")
                 return None
-
-            # Get available expiries and use the nearest one if not specified
-            available_expiries = sorted(list(set(inst['expiry'] for inst in all_index_options)))
             logger.info(f"📅 Available expiry dates: {[exp.strftime('%Y-%m-%d') for exp in available_expiries[:5]]}...")
 
             # Select expiry date
+            selected_expiry = None
             if expiry_date:
                 target_expiry = datetime.strptime(expiry_date, '%Y-%m-%d').date()
-                if target_expiry not in [exp.date() if hasattr(exp, 'date') else exp for exp in available_expiries]:
-                    logger.warning(f"⚠️ Requested expiry {expiry_date} not available, using next future expiry")
-                    # Filter out same-day expiries and select next future expiry
-                    current_date = datetime.now().date()
-                    future_expiries = [exp for exp in available_expiries
-                                     if (exp.date() if hasattr(exp, 'date') else exp) > current_date]
-                    if future_expiries:
-                        selected_expiry = min(future_expiries)
-                        logger.info(f"✅ Selected next future expiry: {selected_expiry}")
-                    else:
-                        logger.warning("⚠️ No future expiries available, using nearest expiry")
-                        selected_expiry = min(available_expiries)
-                else:
+                if target_expiry in available_expiries:
                     selected_expiry = target_expiry
-            else:
-                # Avoid same-day expiry, use next future expiry
-                current_date = datetime.now().date()
-                future_expiries = [exp for exp in available_expiries
-                                 if (exp.date() if hasattr(exp, 'date') else exp) > current_date]
+                else:
+                    logger.warning(f"⚠️ Requested expiry {expiry_date} not available, using next future expiry")
 
-                if future_expiries:
-                    selected_expiry = min(future_expiries)
+            if selected_expiry is None:
+                # Avoid same-day expiry, use next future expiry
+                selected_expiry = index.next_option_expiry(index_symbol, today)
+                if selected_expiry is not None:
                     logger.info(f"✅ Avoiding same-day expiry, selected: {selected_expiry}")
                 else:
                     # If no future expiries (unlikely), use the nearest available
-                    selected_expiry = min(available_expiries)
+                    selected_expiry = available_expiries[0]
                     logger.warning(f"⚠️ No future expiries available, using: {selected_expiry}")
 
-            selected_expiry_str = selected_expiry.strftime('%Y-%m-%d') if hasattr(selected_expiry, 'strftime') else str(selected_expiry)
+            selected_expiry_str = selected_expiry.strftime('%Y-%m-%d')
             logger.info(f"🎯 Selected expiry: {selected_expiry_str}")
 
             # Create option chain with selected expiry
             chain = OptionChain(index_symbol, selected_expiry_str, index_info.lot_size)
             chain.spot_price = spot_price
 
-            # Filter options by selected expiry (ensure consistent date comparison)
-            selected_expiry_date = selected_expiry.date() if hasattr(selected_expiry, 'date') else selected_expiry
-            option_instruments = [inst for inst in all_index_options
-                                if get_expiry_date(inst) == selected_expiry_date]
+            option_instruments = index.options(index_symbol, selected_expiry)
             logger.info(f"🔍 Found {len(option_instruments)} options for expiry {selected_expiry_str}")
 
-            if not option_instruments:
-                logger.warning(
-                    f"⚠️ No options matched selected expiry {selected_expiry_str}; "
-                    "falling back to all available contracts"
-                )
-                option_instruments = all_index_options
-
             # Create option contracts from real instruments (limit to prevent timeout)
             max_options = 150  # Reasonable limit for performance
             limited_instruments = option_instruments[:max_options]
@@ -680,6 +463,10 @@ class FNODataProvider:
 
             logger.info(f"📊 Final results: {parsed_count} parsed, {live_data_count} with live data")
 
+            # Solve IV and Greeks for every contract from live prices
+            greeks_count = chain.calculate_greeks(default_volatility=25.0)
+            logger.debug(f"Greeks computed for {greeks_count} options")
+
             if not chain.calls and not chain.puts:
                 logger.error(f"❌ No valid options found for {index_symbol}")
                 return None
@@ -707,6 +494,61 @@ class FNODataProvider:
                 logger.error("❌ Cannot proceed without real market data - check API permissions")
             return None
 
+    @staticmethod
+    def _select_nearest_expiry(index: InstrumentIndex, candidates: List[Dict], today) -> Optional[Dict]:
+        """Pick a futures contract: nearest future expiry, else same-day, else most recent past"""
+        if not candidates:
+            return None
+        dated = [(index.expiry_of(c), c) for c in candidates]
+        dated = [(exp, c) for exp, c in dated if exp is not None]
+        if not dated:
+            return candidates[0]
+
+        future = [(exp, c) for exp, c in dated if exp > today]
+        if future:
+            return min(future, key=lambda item: item[0])[1]
+        same_day = [c for exp, c in dated if exp == today]
+        if same_day:
+            logger.info(f"⚠️ Using current expiry (same day): {same_day[0]['tradingsymbol']}")
+            return same_day[0]
+        return max(dated, key=lambda item: item[0])[1]
+
+    def _find_index_future(self, index: InstrumentIndex, index_symbol: str, today) -> Optional[Dict]:
+        """Resolve the futures contract used as the spot reference for an index"""
+        # Exact tradingsymbol match
+        inst = index.by_symbol.get(index_symbol)
+        if inst and inst.get('instrument_type') == 'FUT':
+            logger.info(f"✅ Found exact match: {inst['tradingsymbol']} ({inst['instrument_type']})")
+            return inst
+
+        # Futures listed under the underlying name, then tradingsymbol prefix
+        candidates = index.futures(index_symbol)
+        if not candidates:
+            prefix = index_symbol.upper()
+            candidates = [f for f in index.futures_list
+                          if str(f.get('tradingsymbol', '')).upper().startswith(prefix)]
+        if not candidates:
+            alternative_names = {
+                'BANKNIFTY': ['NIFTY BANK', 'BANK NIFTY', 'NIFTYBANK', 'NIFTY BANK', 'BANK-NIFTY'],
+                'FINNIFTY': ['FIN NIFTY', 'NIFTY FIN', 'FINANCIAL NIFTY', 'NIFTY FIN SERVICE', 'FIN-NIFTY'],
+                'MIDCPNIFTY': ['MIDCAP NIFTY', 'NIFTY MIDCAP', 'MID CAP NIFTY', 'NIFTY MIDCAP 100', 'MIDCP-NIFTY']
+            }
+            alt_names = [alt.lower() for alt in alternative_names.get(index_symbol, [])]
+            candidates = [f for f in index.futures_list
+                          if any(alt in f['tradingsymbol'].lower() for alt in alt_names)]
+        if not candidates:
+            candidates = [f for f in index.futures_list if index_symbol in f['tradingsymbol']]
+        if not candidates:
+            lowered = index_symbol.lower()
+            candidates = [f for f in index.futures_list if lowered in f['tradingsymbol'].lower()]
+
+        inst = self._select_nearest_expiry(index, candidates, today)
+        if inst:
+            logger.info(f"✅ Found futures contract: {inst['tradingsymbol']} (expiry: {inst.get('expiry')}, {len(candidates)} candidates)")
+        else:
+            logger.warning(f"❌ Index {index_symbol} not found among {len(index.futures_list)} futures instruments")
+        return inst
+
     def _get_kite_spot_price(self, index_symbol: str) -> float:
         """Get spot price from Kite API only, no external fallbacks"""
         try:
@@ -746,11 +588,8 @@ class FNODataProvider:
                         return spot_price
 
             # Try futures price as spot proxy
-            futures_instruments = self._get_instruments_cached("NFO")
-            for inst in futures_instruments:
-                if (inst['name'] == index_symbol and
-                    inst['instrument_type'] == 'FUT' and
-                    inst['tradingsymbol'].startswith(index_symbol)):
+            for inst in self._get_instrument_index().futures(index_symbol):
+                if inst['tradingsymbol'].startswith(index_symbol):
 
                     quote_symbol = f"{inst['exchange']}:{inst['tradingsymbol']}"
                     logger.debug(f"🔍 Fetching futures quote for {quote_symbol}")
@@ -852,13 +691,8 @@ class FNODataProvider:
             if isinstance(last_price, (int, float)) and last_price > 0:
                 option.last_price = float(last_price)
 
-            # Seed greeks with placeholder metrics until live data refreshes
-            time_to_expiry = 7 / 365  # Assume 7 days to expiry
-            volatility = 25.0  # Mock volatility
-            option.calculate_greeks(option.last_price, time_to_expiry, volatility)
-            option.calculate_moneyness(option.last_price)
-            option.update_intrinsic_value(option.last_price)
-
+            # Greeks, moneyness and intrinsic value are computed for the whole
+            # chain in one vectorized pass once live quotes are applied
             return option
 
         except Exception as e:
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Instrument Index
+Pre-built lookups over the Kite instrument master for F&O chain construction
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+def expiry_to_date(value) -> Optional[date]:
+    """Normalise an instrument ``expiry`` field (date, datetime or 'YYYY-MM-DD') to a date"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if hasattr(value, 'date'):
+        return value.date()
+    return datetime.strptime(str(value)[:10], '%Y-%m-%d').date()
+
+
+class InstrumentIndex:
+    """
+    Read-only index over a list of Kite instrument dicts
+
+    Built once per instrument-master refresh so chain lookups never rescan
+    the full NFO+BFO list:
+
+    - ``by_symbol``: tradingsymbol -> instrument
+    - contracts keyed by (underlying, instrument_type, expiry, strike), where
+      ``instrument_type`` is FUT, CE or PE as in the Kite master
+    - per-underlying futures and option expiry lists sorted ascending
+
+    Expiries are parsed to ``date`` once at build time. Option lists keep the
+    order of the source instrument list.
+    """
+
+    OPTION_TYPES = ('CE', 'PE')
+
+    def __init__(self, instruments: Iterable[Dict]):
+        self.instruments: List[Dict] = list(instruments)
+        self.by_symbol: Dict[str, Dict] = {}
+        self.futures_list: List[Dict] = []
+
+        self._by_name: Dict[str, List[Dict]] = {}
+        self._contracts: Dict[Tuple[str, str, date, float], Dict] = {}
+        self._futures: Dict[str, List[Dict]] = {}
+        self._options: Dict[Tuple[str, date], List[Dict]] = {}
+        self._option_expiries: Dict[str, List[date]] = {}
+        self._expiry_of: Dict[int, date] = {}
+        option_expiries: Dict[str, set] = {}
+
+        for inst in self.instruments:
+            tradingsymbol = inst.get('tradingsymbol')
+            if tradingsymbol:
+                self.by_symbol[tradingsymbol] = inst
+
+            name = inst.get('name')
+            if name:
+                self._by_name.setdefault(name, []).append(inst)
+
+            instrument_type = inst.get('instrument_type')
+            if instrument_type == 'FUT':
+                self.futures_list.append(inst)
+            elif instrument_type not in self.OPTION_TYPES:
+                continue
+
+            try:
+                expiry = expiry_to_date(inst.get('expiry'))
+            except (TypeError, ValueError):
+                expiry = None
+            if expiry is None or not name:
+                continue
+            self._expiry_of[id(inst)] = expiry
+
+            strike = float(inst.get('strike') or 0.0)
+            self._contracts[(name, instrument_type, expiry, strike)] = inst
+
+            if instrument_type == 'FUT':
+                self._futures.setdefault(name, []).append(inst)
+            else:
+                self._options.setdefault((name, expiry), []).append(inst)
+                option_expiries.setdefault(name, set()).add(expiry)
+
+        for futures in self._futures.values():
+            futures.sort(key=self.expiry_of)
+        for name, expiries in option_expiries.items():
+            self._option_expiries[name] = sorted(expiries)
+
+    def __len__(self) -> int:
+        return len(self.instruments)
+
+    def expiry_of(self, inst: Dict) -> Optional[date]:
+        """Parsed expiry of an indexed instrument (parses on the fly for foreign dicts)"""
+        expiry = self._expiry_of.get(id(inst))
+        if expiry is None:
+            expiry = expiry_to_date(inst.get('expiry'))
+        return expiry
+
+    def by_name(self, name: str) -> List[Dict]:
+        """All instruments whose ``name`` field equals ``name``"""
+        return self._by_name.get(name, [])
+
+    def contract(self, name: str, instrument_type: str, expiry: date,
+                 strike: float = 0.0) -> Optional[Dict]:
+        """Exact contract lookup; futures use strike 0"""
+        return self._contracts.get((name, instrument_type, expiry, float(strike)))
+
+    def futures(self, name: str) -> List[Dict]:
+        """Futures on an underlying, nearest expiry first"""
+        return self._futures.get(name, [])
+
+    def option_expiries(self, name: str) -> List[date]:
+        """Sorted option expiries listed for an underlying"""
+        return self._option_expiries.get(name, [])
+
+    def options(self, name: str, expiry: Optional[date] = None) -> List[Dict]:
+        """Option instruments for an underlying, optionally restricted to one expiry"""
+        if expiry is not None:
+            return self._options.get((name, expiry), [])
+        result: List[Dict] = []
+        for exp in self.option_expiries(name):
+            result.extend(self._options[(name, exp)])
+        return result
+
+    def next_option_expiry(self, name: str, after: date, inclusive: bool = False) -> Optional[date]:
+        """First option expiry strictly after ``after`` (or on it when ``inclusive``)"""
+        expiries = self.option_expiries(name)
+        pos = bisect_left(expiries, after) if inclusive else bisect_right(expiries, after)
+        return expiries[pos] if pos < len(expiries) else None
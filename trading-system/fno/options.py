@@ -4,13 +4,277 @@ Option Contracts and Option Chains
 Option contract modeling and option chain analysis
 """
 
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
 import logging
 import math
 
+import numpy as np
+
+try:
+    from scipy.special import ndtr as _ndtr
+except ImportError:  # SciPy is optional; fall back to math.erf
+    _ndtr = None
+
 logger = logging.getLogger('trading_system.fno.options')
 
+_SQRT_2 = math.sqrt(2.0)
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+_vec_erf = np.vectorize(math.erf, otypes=[float])
+
+# Implied volatility search bracket (decimal volatility)
+IV_LOWER_BOUND = 1e-4
+IV_UPPER_BOUND = 5.0
+WING_EXPONENT = 25.0
+
+
+def norm_pdf(x: float) -> float:
+    return _INV_SQRT_2PI * math.exp(-0.5 * x * x)
+
+
+def norm_cdf(x: float) -> float:
+    return 0.5 * (1.0 + math.erf(x / _SQRT_2))
+
+
+def norm_pdf_array(x: np.ndarray) -> np.ndarray:
+    """Standard normal PDF over an array"""
+    return _INV_SQRT_2PI * np.exp(-0.5 * x * x)
+
+
+def norm_cdf_array(x: np.ndarray) -> np.ndarray:
+    """Standard normal CDF over an array"""
+    if _ndtr is not None:
+        return _ndtr(x)
+    return 0.5 * (1.0 + _vec_erf(np.asarray(x, dtype=float) / _SQRT_2))
+
+
+def black_scholes_price_array(spot, strike, time_to_expiry, volatility, is_call,
+                              risk_free_rate=0.06) -> np.ndarray:
+    """
+    Black-Scholes prices for arrays of contracts
+
+    Args:
+        spot, strike, time_to_expiry: Broadcastable arrays (T in years)
+        volatility: Decimal volatility (0.25 = 25%)
+        is_call: Boolean array, True for CE and False for PE
+        risk_free_rate: Annual risk-free rate
+    """
+    S = np.asarray(spot, dtype=float)
+    K = np.asarray(strike, dtype=float)
+    T = np.asarray(time_to_expiry, dtype=float)
+    sigma = np.asarray(volatility, dtype=float)
+    r = float(risk_free_rate)
+
+    sqrt_t = np.sqrt(T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * T) / (sigma * sqrt_t)
+    d2 = d1 - sigma * sqrt_t
+    discounted_k = K * np.exp(-r * T)
+
+    call = S * norm_cdf_array(d1) - discounted_k * norm_cdf_array(d2)
+    put = discounted_k * norm_cdf_array(-d2) - S * norm_cdf_array(-d1)
+    return np.where(is_call, call, put)
+
+
+def implied_volatility_array(market_price, spot, strike, time_to_expiry, is_call,
+                             risk_free_rate=0.06, tolerance: float = 1e-4,
+                             max_iterations: int = 100) -> np.ndarray:
+    """
+    Solve implied volatility for arrays of contracts in one vectorized pass
+
+    Each contract is solved on its out-of-the-money side. Newton-Raphson
+    steps on log price (then on price) are taken while they stay inside a
+    per-contract bracket that tightens every iteration; otherwise the
+    contract falls back to bisection. A full weekly chain converges in about
+    eight iterations, including deep ITM/OTM strikes with tiny vega.
+
+    Returns:
+        Decimal volatility per contract; NaN where the price violates
+        no-arbitrage bounds or inputs are invalid.
+    """
+    price, S, K, T, is_call = np.broadcast_arrays(
+        np.asarray(market_price, dtype=float),
+        np.asarray(spot, dtype=float),
+        np.asarray(strike, dtype=float),
+        np.asarray(time_to_expiry, dtype=float),
+        np.asarray(is_call, dtype=bool),
+    )
+    r = float(risk_free_rate)
+
+    result = np.full(price.shape, np.nan)
+    discounted_k = K * np.exp(-r * np.where(T > 0, T, 0.0))
+    lower = np.where(is_call, np.maximum(S - discounted_k, 0.0), np.maximum(discounted_k - S, 0.0))
+    upper = np.where(is_call, S, discounted_k)
+    valid = (T > 0) & (S > 0) & (K > 0) & (price > lower) & (price < upper)
+    if not valid.any():
+        return result
+
+    S, T, disc_k = S[valid], T[valid], discounted_k[valid]
+    # Solve each contract as its out-of-the-money side (put-call parity), whose
+    # price keeps full precision in the wings
+    otm_call = S <= disc_k
+    sign = np.where(otm_call, 1.0, -1.0)
+    target = price[valid] + np.where(is_call[valid] == otm_call, 0.0, sign * (S - disc_k))
+    sqrt_t = np.sqrt(T)
+    drift = np.log(S / K[valid]) + r * T
+
+    lo = np.full(S.shape, IV_LOWER_BOUND)
+    hi = np.full(S.shape, IV_UPPER_BOUND)
+    # Brenner-Subrahmanyam near the money; in the wings a volatility whose
+    # price is far below any quotable premium, so Newton approaches from below
+    sigma = np.clip(np.maximum(np.sqrt(2.0 * np.pi / T) * target / S,
+                               np.abs(drift) / np.sqrt(2.0 * WING_EXPONENT * T)), 0.01, 2.0)
+    log_target = np.log(target)
+    idx = np.arange(S.shape[0])
+
+    for _ in range(max_iterations):
+        sig, s, rt, w = sigma[idx], S[idx], sqrt_t[idx], sign[idx]
+        sig_rt = sig * rt
+        d1 = drift[idx] / sig_rt + 0.5 * sig_rt
+        cdf = norm_cdf_array(np.concatenate((w * d1, w * (d1 - sig_rt))))
+        model = w * (s * cdf[:idx.size] - disc_k[idx] * cdf[idx.size:])
+        diff = model - target[idx]
+        vega = s * rt * norm_pdf_array(d1)
+
+        a_lo = np.where(diff < 0, sig, lo[idx])
+        a_hi = np.where(diff > 0, sig, hi[idx])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Newton on log price converges in a few steps even where the
+            # price is exponentially flat in volatility (deep wings, short expiry)
+            log_newton = sig - (np.log(model) - log_target[idx]) * model / vega
+            newton = sig - diff / vega
+        use_log = (log_newton > a_lo) & (log_newton < a_hi)
+        use_newton = (newton > a_lo) & (newton < a_hi)
+        next_sigma = np.where(use_log, log_newton, np.where(use_newton, newton, 0.5 * (a_lo + a_hi)))
+
+        converged = np.abs(diff) < tolerance
+        done = converged | (np.abs(next_sigma - sig) < 1e-8) | ((a_hi - a_lo) < 1e-8)
+        sigma[idx] = np.where(converged, sig, next_sigma)
+        lo[idx] = a_lo
+        hi[idx] = a_hi
+        idx = idx[~done]
+        if idx.size == 0:
+            break
+
+    result[valid] = sigma
+    return result
+
+
+def black_scholes_greeks_array(spot, strike, time_to_expiry, volatility, is_call,
+                               risk_free_rate=0.06) -> Dict[str, np.ndarray]:
+    """
+    Vectorized Black-Scholes Greeks using the same conventions as
+    OptionContract.calculate_greeks (theta per day, vega/rho per 1%).
+    """
+    S = np.maximum(np.asarray(spot, dtype=float), 1e-9)
+    K = np.maximum(np.asarray(strike, dtype=float), 1e-9)
+    T = np.asarray(time_to_expiry, dtype=float)
+    sigma = np.asarray(volatility, dtype=float)
+    is_call = np.asarray(is_call, dtype=bool)
+    r = float(risk_free_rate)
+
+    sqrt_t = np.sqrt(T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma * sigma) * T) / (sigma * sqrt_t)
+    d2 = d1 - sigma * sqrt_t
+    pdf_d1 = norm_pdf_array(d1)
+    cdf_d1 = norm_cdf_array(d1)
+    cdf_d2 = norm_cdf_array(d2)
+    discounted_k = K * np.exp(-r * T)
+
+    decay = -S * pdf_d1 * sigma / (2 * sqrt_t)
+    return {
+        'delta': np.where(is_call, cdf_d1, cdf_d1 - 1.0),
+        'gamma': pdf_d1 / (S * sigma * sqrt_t),
+        'theta': np.where(is_call,
+                          decay - r * discounted_k * cdf_d2,
+                          decay + r * discounted_k * (1.0 - cdf_d2)) / 365.0,
+        'vega': S * sqrt_t * pdf_d1 / 100.0,
+        'rho': np.where(is_call,
+                        K * T * np.exp(-r * T) * cdf_d2,
+                        -K * T * np.exp(-r * T) * (1.0 - cdf_d2)) / 100.0,
+    }
+
+
+def calculate_chain_greeks(chains: Iterable['OptionChain'], risk_free_rate: float = 0.06,
+                           default_volatility: Optional[float] = None,
+                           now: Optional[datetime] = None) -> int:
+    """
+    Solve IV and Greeks for every contract of several chains in one array pass
+
+    Each chain contributes its own spot price and time to expiry, so chains
+    for multiple expiries (or underlyings) can be processed together.
+
+    Args:
+        chains: Option chains to update in place
+        risk_free_rate: Annual risk-free rate
+        default_volatility: Volatility (percent) used when IV cannot be solved;
+            contracts keep their existing IV when this is None
+        now: Valuation time (defaults to the current time)
+
+    Returns:
+        Number of contracts whose Greeks were updated
+    """
+    contracts: List[OptionContract] = []
+    spots: List[float] = []
+    expiries: List[float] = []
+    for chain in chains:
+        if not chain.spot_price or chain.spot_price <= 0:
+            continue
+        t = chain.time_to_expiry(now)
+        for option in list(chain.calls.values()) + list(chain.puts.values()):
+            contracts.append(option)
+            spots.append(chain.spot_price)
+            expiries.append(t)
+
+    if not contracts:
+        return 0
+
+    S = np.array(spots, dtype=float)
+    T = np.array(expiries, dtype=float)
+    K = np.fromiter((o.strike_price for o in contracts), dtype=float, count=len(contracts))
+    price = np.fromiter((o.last_price or 0.0 for o in contracts), dtype=float, count=len(contracts))
+    is_call = np.fromiter((o.option_type == 'CE' for o in contracts), dtype=bool, count=len(contracts))
+    existing_iv = np.fromiter((o.implied_volatility or 0.0 for o in contracts), dtype=float,
+                              count=len(contracts))
+
+    iv = implied_volatility_array(price, S, K, T, is_call, risk_free_rate)
+    fallback = existing_iv / 100.0 if default_volatility is None else \
+        np.where(existing_iv > 0, existing_iv, default_volatility) / 100.0
+    solved = np.isfinite(iv)
+    sigma = np.where(solved, iv, fallback)
+    usable = (sigma > 0) & (T > 0)
+
+    greeks = {name: np.full(len(contracts), np.nan) for name in ('delta', 'gamma', 'theta', 'vega', 'rho')}
+    if usable.any():
+        solved_greeks = black_scholes_greeks_array(S[usable], K[usable], T[usable], sigma[usable],
+                                                   is_call[usable], risk_free_rate)
+        for name, values in solved_greeks.items():
+            greeks[name][usable] = values
+
+    moneyness = np.where(is_call, S - K, K - S) / K
+    intrinsic = np.maximum(np.where(is_call, S - K, K - S), 0.0)
+    time_value = np.maximum(price - intrinsic, 0.0)
+
+    # Write back through plain Python lists; per-element numpy scalar access
+    # would dominate the cost of the array pass itself.
+    rows = zip(contracts, usable.tolist(), solved.tolist(), (iv * 100.0).tolist(),
+               moneyness.tolist(), intrinsic.tolist(), time_value.tolist(),
+               greeks['delta'].tolist(), greeks['gamma'].tolist(), greeks['theta'].tolist(),
+               greeks['vega'].tolist(), greeks['rho'].tolist())
+    for option, ok, has_iv, iv_pct, mny, intr, tv, delta, gamma, theta, vega, rho in rows:
+        option.moneyness = mny
+        option.intrinsic_value = intr
+        option.time_value = tv
+        if has_iv:
+            option.implied_volatility = iv_pct
+        if ok:
+            option.delta = delta
+            option.gamma = gamma
+            option.theta = theta
+            option.vega = vega
+            option.rho = rho
+
+    return int(usable.sum())
+
 
 class OptionContract:
     """Represents an individual option contract"""
@@ -54,34 +318,27 @@ class OptionContract:
             if T <= 0 or sigma <= 0:
                 return
 
-            # Standard normal PDF and CDF using math.erf
-            def _norm_pdf(x: float) -> float:
-                return (1.0 / math.sqrt(2.0 * math.pi)) * math.exp(-0.5 * x * x)
-
-            def _norm_cdf(x: float) -> float:
-                return 0.5 * (1.0 + math.erf(x / math.sqrt(2.0)))
-
             d1 = (math.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * math.sqrt(T))
             d2 = d1 - sigma * math.sqrt(T)
 
             if self.option_type == 'CE':  # Call option
-                self.delta = _norm_cdf(d1)
-                self.gamma = _norm_pdf(d1) / (S * sigma * math.sqrt(T))
+                self.delta = norm_cdf(d1)
+                self.gamma = norm_pdf(d1) / (S * sigma * math.sqrt(T))
                 self.theta = (
-                    -S * _norm_pdf(d1) * sigma / (2 * math.sqrt(T))
-                    - r * K * math.exp(-r * T) * _norm_cdf(d2)
+                    -S * norm_pdf(d1) * sigma / (2 * math.sqrt(T))
+                    - r * K * math.exp(-r * T) * norm_cdf(d2)
                 ) / 365.0
-                self.vega = S * math.sqrt(T) * _norm_pdf(d1) / 100.0
-                self.rho = K * T * math.exp(-r * T) * _norm_cdf(d2) / 100.0
+                self.vega = S * math.sqrt(T) * norm_pdf(d1) / 100.0
+                self.rho = K * T * math.exp(-r * T) * norm_cdf(d2) / 100.0
             else:  # Put option
-                self.delta = -_norm_cdf(-d1)
-                self.gamma = _norm_pdf(d1) / (S * sigma * math.sqrt(T))
+                self.delta = -norm_cdf(-d1)
+                self.gamma = norm_pdf(d1) / (S * sigma * math.sqrt(T))
                 self.theta = (
-                    -S * _norm_pdf(d1) * sigma / (2 * math.sqrt(T))
-                    + r * K * math.exp(-r * T) * _norm_cdf(-d2)
+                    -S * norm_pdf(d1) * sigma / (2 * math.sqrt(T))
+                    + r * K * math.exp(-r * T) * norm_cdf(-d2)
                 ) / 365.0
-                self.vega = S * math.sqrt(T) * _norm_pdf(d1) / 100.0
-                self.rho = -K * T * math.exp(-r * T) * _norm_cdf(-d2) / 100.0
+                self.vega = S * math.sqrt(T) * norm_pdf(d1) / 100.0
+                self.rho = -K * T * math.exp(-r * T) * norm_cdf(-d2) / 100.0
 
         except Exception as e:
             logger.error(f"Error calculating Greeks for {self.symbol}: {e}")
@@ -137,6 +394,30 @@ class OptionChain:
         else:
             self.puts[option.strike_price] = option
 
+    def time_to_expiry(self, now: Optional[datetime] = None) -> float:
+        """Years until expiry, measured to the 15:30 close on the expiry date"""
+        now = now or datetime.now()
+        try:
+            expiry = datetime.strptime(str(self.expiry_date)[:10], '%Y-%m-%d').replace(hour=15, minute=30)
+        except ValueError:
+            return 7 / 365  # Unknown format: assume a weekly expiry
+        seconds = (expiry - now).total_seconds()
+        return max(seconds, 0.0) / (365.0 * 24 * 3600)
+
+    def calculate_greeks(self, risk_free_rate: float = 0.06,
+                         default_volatility: Optional[float] = None,
+                         now: Optional[datetime] = None) -> int:
+        """
+        Solve IV from last prices and compute Greeks for the whole chain
+
+        Vectorized replacement for calling OptionContract.calculate_greeks and
+        FNOAnalytics.calculate_implied_volatility per contract.
+
+        Returns:
+            Number of contracts whose Greeks were updated
+        """
+        return calculate_chain_greeks([self], risk_free_rate, default_volatility, now)
+
     def get_atm_strike(self, spot_price: float = None) -> float:
         """Get ATM strike price"""
         spot = spot_price or self.spot_price
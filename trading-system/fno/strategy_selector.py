@@ -4,7 +4,7 @@ Intelligent FNO Strategy Selector
 Analyzes market conditions and selects optimal F&O strategy
 """
 
-from typing import Dict, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, TYPE_CHECKING
 import logging
 import random
 import re
@@ -1096,6 +1096,14 @@ class IntelligentFNOStrategySelector:
             logger.error(f"Error executing strategy {strategy_name}: {e}")
             return {'success': False, 'error': str(e)}
 
+    @staticmethod
+    def _execute_legs(portfolio: "UnifiedPortfolio", legs: List[Dict]) -> List[Optional[Dict]]:
+        """Execute strategy legs together when the portfolio supports multi-leg submission"""
+        # An explicit flag rather than hasattr, which is always true on mocks
+        if getattr(portfolio, 'supports_multi_leg_orders', False) is True:
+            return portfolio.execute_trades(legs)
+        return [portfolio.execute_trade(**leg) for leg in legs]
+
     def _execute_straddle(self, details: Dict, capital: float, portfolio: Optional["UnifiedPortfolio"] = None) -> Dict:
         """Execute straddle strategy using portfolio system"""
         try:
@@ -1151,29 +1159,20 @@ class IntelligentFNOStrategySelector:
             logger.info(f"   • Risk Amount Used: ₹{max_loss_per_lot * lots:.2f} ({(max_loss_per_lot * lots / capital * 100):.1f}% of capital)")
 
 
-            # Execute call option purchase
-            call_trade = portfolio.execute_trade(
-                symbol=call_option.symbol,
-                shares=lots * call_option.lot_size,
-                price=call_option.last_price,
-                side="buy",
-                confidence=0.8,
-                sector=sector,
-                strategy="straddle",
-                atr=max_loss_per_lot / (lots * call_option.lot_size) * 0.1  # Mock ATR
-            )
-
-            # Execute put option purchase
-            put_trade = portfolio.execute_trade(
-                symbol=put_option.symbol,
-                shares=lots * put_option.lot_size,
-                price=put_option.last_price,
-                side="buy",
-                confidence=0.8,
-                sector=sector,
-                strategy="straddle",
-                atr=max_loss_per_lot / (lots * put_option.lot_size) * 0.1  # Mock ATR
-            )
+            # Execute call and put purchases together
+            call_trade, put_trade = self._execute_legs(portfolio, [
+                dict(
+                    symbol=option.symbol,
+                    shares=lots * option.lot_size,
+                    price=option.last_price,
+                    side="buy",
+                    confidence=0.8,
+                    sector=sector,
+                    strategy="straddle",
+                    atr=max_loss_per_lot / (lots * option.lot_size) * 0.1  # Mock ATR
+                )
+                for option in (call_option, put_option)
+            ])
 
             if call_trade and put_trade:
                 logger.info("✅ Straddle positions opened successfully!")
@@ -1284,64 +1283,27 @@ class IntelligentFNOStrategySelector:
             logger.info(f"   • Max Profit: ₹{details['max_profit']:.2f}")
             logger.info(f"   • Max Loss: ₹{max_loss:.2f}")
 
-            # Execute trades using portfolio system
-            trades = []
-
-            # Sell call option (short position)
-            sell_call_trade = portfolio.execute_trade(
-                symbol=sell_call.symbol,
-                shares=lots * sell_call.lot_size,
-                price=sell_call.last_price,
-                side="sell",
-                confidence=0.7,
-                sector=sector,
-                strategy="iron_condor",
-                atr=max_loss / (lots * sell_call.lot_size) * 0.1
-            )
-            if sell_call_trade:
-                trades.append(sell_call_trade)
-
-            # Buy call option (long position)
-            buy_call_trade = portfolio.execute_trade(
-                symbol=buy_call.symbol,
-                shares=lots * buy_call.lot_size,
-                price=buy_call.last_price,
-                side="buy",
-                confidence=0.7,
-                sector=sector,
-                strategy="iron_condor",
-                atr=max_loss / (lots * buy_call.lot_size) * 0.1
-            )
-            if buy_call_trade:
-                trades.append(buy_call_trade)
-
-            # Sell put option (short position)
-            sell_put_trade = portfolio.execute_trade(
-                symbol=sell_put.symbol,
-                shares=lots * sell_put.lot_size,
-                price=sell_put.last_price,
-                side="sell",
-                confidence=0.7,
-                sector=sector,
-                strategy="iron_condor",
-                atr=max_loss / (lots * sell_put.lot_size) * 0.1
-            )
-            if sell_put_trade:
-                trades.append(sell_put_trade)
-
-            # Buy put option (long position)
-            buy_put_trade = portfolio.execute_trade(
-                symbol=buy_put.symbol,
-                shares=lots * buy_put.lot_size,
-                price=buy_put.last_price,
-                side="buy",
-                confidence=0.7,
-                sector=sector,
-                strategy="iron_condor",
-                atr=max_loss / (lots * buy_put.lot_size) * 0.1
-            )
-            if buy_put_trade:
-                trades.append(buy_put_trade)
+            # Submit all four legs together; fills are awaited concurrently in live mode
+            legs = [
+                (sell_call, "sell"),
+                (buy_call, "buy"),
+                (sell_put, "sell"),
+                (buy_put, "buy"),
+            ]
+            results = self._execute_legs(portfolio, [
+                dict(
+                    symbol=option.symbol,
+                    shares=lots * option.lot_size,
+                    price=option.last_price,
+                    side=side,
+                    confidence=0.7,
+                    sector=sector,
+                    strategy="iron_condor",
+                    atr=max_loss / (lots * option.lot_size) * 0.1
+                )
+                for option, side in legs
+            ])
+            trades = [trade for trade in results if trade]
 
             if len(trades) == 4:
                 logger.info("✅ Iron Condor positions opened successfully!")
@@ -1418,29 +1380,20 @@ class IntelligentFNOStrategySelector:
 
             # Execute trades using portfolio system with error handling
             try:
-                # Execute call option purchase
-                call_trade = portfolio.execute_trade(
-                    symbol=call_option.symbol,
-                    shares=lots * call_option.lot_size,
-                    price=call_option.last_price,
-                    side="buy",
-                    confidence=0.75,
-                    sector=sector,
-                    strategy="strangle",
-                    atr=max_loss_per_lot / (lots * call_option.lot_size) * 0.1  # Mock ATR
-                )
-
-                # Execute put option purchase
-                put_trade = portfolio.execute_trade(
-                    symbol=put_option.symbol,
-                    shares=lots * put_option.lot_size,
-                    price=put_option.last_price,
-                    side="buy",
-                    confidence=0.75,
-                    sector=sector,
-                    strategy="strangle",
-                    atr=max_loss_per_lot / (lots * put_option.lot_size) * 0.1  # Mock ATR
-                )
+                # Execute call and put purchases together
+                call_trade, put_trade = self._execute_legs(portfolio, [
+                    dict(
+                        symbol=option.symbol,
+                        shares=lots * option.lot_size,
+                        price=option.last_price,
+                        side="buy",
+                        confidence=0.75,
+                        sector=sector,
+                        strategy="strangle",
+                        atr=max_loss_per_lot / (lots * option.lot_size) * 0.1  # Mock ATR
+                    )
+                    for option in (call_option, put_option)
+                ])
 
                 if call_trade and put_trade:
                     logger.info("✅ Strangle positions opened successfully!")
@@ -5,10 +5,12 @@ Utilities for caching, rate limiting, and circuit breaking
 """
 
 from infrastructure.caching import LRUCacheWithTTL
-from infrastructure.rate_limiting import EnhancedRateLimiter, CircuitBreaker
+from infrastructure.rate_limiting import EnhancedRateLimiter, CircuitBreaker, RateLimitEngine, TokenBucket
 
 __all__ = [
     'LRUCacheWithTTL',
     'EnhancedRateLimiter',
     'CircuitBreaker',
+    'RateLimitEngine',
+    'TokenBucket',
 ]
@@ -9,6 +9,10 @@ ADDRESSES CRITICAL RECOMMENDATION #3:
 - Usage analytics and reporting
 - Automatic throttling to prevent quota exhaustion
 - Multi-timeframe quota management (per-second, per-minute, per-day)
+
+Window usage comes from bucketed ring counters (SlidingWindowCounter), so
+recording a call and reading usage cost the same at any call volume. The
+detailed APICall history is a sampled side log used for latency statistics.
 """
 
 import logging
@@ -66,6 +70,77 @@ class QuotaUsage:
         }
 
 
+class SlidingWindowCounter:
+    """
+    Event count over a trailing time window, kept in a ring of fixed-width buckets
+
+    ``add`` and ``count`` are O(1) amortized: each bucket is cleared once as
+    time moves past it. The ring holds one bucket more than the window, so an
+    event is counted for up to one bucket width longer than the window but
+    never less (errs towards throttling). Not thread-safe; callers hold their
+    own lock.
+    """
+
+    def __init__(self, window_seconds: float, buckets: int = 60):
+        self.window_seconds = window_seconds
+        self.buckets = buckets
+        self.bucket_width = window_seconds / buckets
+        self._slots = buckets + 1
+        self._counts = [0] * self._slots
+        self._last_bucket: Optional[int] = None
+        self.total = 0
+
+    def _advance(self, now: float) -> int:
+        """Expire buckets that fell out of the window; returns the current bucket number"""
+        current = int(now // self.bucket_width)
+        last = self._last_bucket
+        if last is None or current - last >= self._slots:
+            if self.total:
+                self._counts = [0] * self._slots
+                self.total = 0
+        elif current > last:
+            for bucket in range(last + 1, current + 1):
+                slot = bucket % self._slots
+                self.total -= self._counts[slot]
+                self._counts[slot] = 0
+        else:
+            # Clock did not move forward; keep counting into the last bucket
+            current = last
+        self._last_bucket = current
+        return current
+
+    def add(self, now: float, amount: int = 1):
+        current = self._advance(now)
+        self._counts[current % self._slots] += amount
+        self.total += amount
+
+    def count(self, now: float) -> int:
+        self._advance(now)
+        return self.total
+
+    def time_until_reset(self, now: float) -> float:
+        """Seconds until the oldest counted event leaves the window (0 if empty)"""
+        current = self._advance(now)
+        if not self.total:
+            return 0.0
+        for bucket in range(current - self.buckets, current + 1):
+            if self._counts[bucket % self._slots]:
+                return max((bucket + self._slots) * self.bucket_width - now, 0.0)
+        return 0.0
+
+    def time_until_below(self, now: float, threshold: float) -> float:
+        """Seconds until the count drops below threshold (0 if it already is)"""
+        current = self._advance(now)
+        remaining = self.total
+        if remaining < threshold:
+            return 0.0
+        for bucket in range(current - self.buckets, current + 1):
+            remaining -= self._counts[bucket % self._slots]
+            if remaining < threshold:
+                return max((bucket + self._slots) * self.bucket_width - now, 0.0)
+        return self.window_seconds
+
+
 @dataclass
 class APICall:
     """Individual API call record"""
@@ -119,7 +194,8 @@ class APIQuotaMonitor:
         self,
         enable_auto_throttling: bool = True,
         alert_threshold_warning: float = 0.75,
-        alert_threshold_critical: float = 0.90
+        alert_threshold_critical: float = 0.90,
+        history_sample_every: int = 10
     ):
         """
         Initialize API quota monitor
@@ -128,10 +204,14 @@ class APIQuotaMonitor:
             enable_auto_throttling: Auto-throttle when quota near limit
             alert_threshold_warning: Warning threshold (0-1)
             alert_threshold_critical: Critical threshold (0-1)
+            history_sample_every: Keep one in N calls per endpoint in the detailed
+                history, failed or not, so latency statistics are unbiased;
+                quota, call and error counts are exact
         """
         self.enable_auto_throttling = enable_auto_throttling
         self.alert_threshold_warning = alert_threshold_warning
         self.alert_threshold_critical = alert_threshold_critical
+        self.history_sample_every = max(1, history_sample_every)
 
         # Quota limits (Zerodha API)
         self.quota_limits = [
@@ -141,9 +221,16 @@ class APIQuotaMonitor:
             QuotaLimit("per_day", max_requests=50000, window_seconds=86400),  # Conservative
         ]
 
-        # API call tracking
-        self._api_calls: deque = deque(maxlen=100000)  # Last 100k calls
-        self._calls_by_endpoint: Dict[str, List[APICall]] = defaultdict(list)
+        # Window counters per quota limit (created on first use)
+        self._counters: Dict[str, SlidingWindowCounter] = {}
+
+        # Sampled call history (latency statistics)
+        self._api_calls: deque = deque(maxlen=100000)  # Last 100k sampled calls
+        self._calls_by_endpoint: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
+
+        # Exact per-endpoint totals
+        self._endpoint_calls: Dict[str, int] = defaultdict(int)
+        self._endpoint_errors: Dict[str, int] = defaultdict(int)
 
         # Current usage by timeframe
         self._current_usage: Dict[str, QuotaUsage] = {}
@@ -223,31 +310,40 @@ class APIQuotaMonitor:
             response_time_ms: Response time in milliseconds
             error: Error message if call failed
         """
-        call = APICall(
-            timestamp=datetime.now(),
-            endpoint=endpoint,
-            method=method,
-            status_code=status_code,
-            response_time_ms=response_time_ms,
-            error=error
-        )
+        now = time.monotonic()
+        failed = bool(error) or status_code >= 400
 
         with self._lock:
-            self._api_calls.append(call)
-            self._calls_by_endpoint[endpoint].append(call)
-
-            # Keep only last 1000 calls per endpoint
-            if len(self._calls_by_endpoint[endpoint]) > 1000:
-                self._calls_by_endpoint[endpoint] = (
-                    self._calls_by_endpoint[endpoint][-1000:]
-                )
+            for limit in self.quota_limits:
+                self._counter(limit).add(now)
 
             self.total_calls += 1
-            if error or status_code >= 400:
+            self._endpoint_calls[endpoint] += 1
+            if failed:
                 self.total_errors += 1
+                self._endpoint_errors[endpoint] += 1
+
+            # Sample failures at the same rate as successes: keeping every
+            # failure would skew latencies and the sampled error share
+            if (self._endpoint_calls[endpoint] - 1) % self.history_sample_every == 0:
+                call = APICall(
+                    timestamp=datetime.now(),
+                    endpoint=endpoint,
+                    method=method,
+                    status_code=status_code,
+                    response_time_ms=response_time_ms,
+                    error=error
+                )
+                self._api_calls.append(call)
+                self._calls_by_endpoint[endpoint].append(call)
 
-        # Update usage immediately
-        self._update_usage_statistics()
+    def _counter(self, limit: QuotaLimit) -> SlidingWindowCounter:
+        """Window counter for a quota limit (caller holds the lock)"""
+        counter = self._counters.get(limit.name)
+        if counter is None or counter.window_seconds != limit.window_seconds:
+            counter = SlidingWindowCounter(limit.window_seconds)
+            self._counters[limit.name] = counter
+        return counter
 
     def can_make_request(self, safety_margin: float = 0.95) -> bool:
         """
@@ -259,19 +355,20 @@ class APIQuotaMonitor:
         Returns:
             True if safe to make request
         """
-        # Ensure we evaluate against the most recent window boundaries.
-        self._update_usage_statistics()
+        now = time.monotonic()
 
         with self._lock:
-            for limit_name, usage in self._current_usage.items():
+            for limit in self.quota_limits:
+                current_usage = self._counter(limit).count(now)
+
                 # Calculate effective limit with safety margin
-                effective_limit = usage.max_requests * safety_margin
+                effective_limit = limit.max_requests * safety_margin
 
-                if usage.current_usage >= effective_limit:
+                if current_usage >= effective_limit:
                     logger.warning(
-                        f"⚠️ Quota near limit for {limit_name}: "
-                        f"{usage.current_usage}/{usage.max_requests} "
-                        f"({usage.usage_percent:.1f}%)"
+                        f"⚠️ Quota near limit for {limit.name}: "
+                        f"{current_usage}/{limit.max_requests} "
+                        f"({current_usage / limit.max_requests * 100:.1f}%)"
                     )
                     return False
 
@@ -292,25 +389,36 @@ class APIQuotaMonitor:
         Returns:
             True if can proceed, False if timeout
         """
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
 
-        while (time.time() - start_time) < timeout:
-            if self.can_make_request(safety_margin):
+        while True:
+            wait_time = self._time_until_allowed(safety_margin)
+            if wait_time <= 0:
                 return True
 
-            # Wait for shortest quota window to reset
-            min_wait = self._get_min_wait_time()
-            if min_wait > 0:
-                wait_time = min(min_wait, 0.1)  # Wait max 100ms at a time
-                time.sleep(wait_time)
-                self.total_throttled += 1
+            # Sleep exactly until the binding window has room again
+            if time.monotonic() + wait_time > deadline:
+                break
+            self.total_throttled += 1
+            time.sleep(wait_time)
 
         logger.error(f"❌ Quota wait timeout after {timeout}s")
         return False
 
+    def _time_until_allowed(self, safety_margin: float) -> float:
+        """Seconds until every quota window is under its effective limit"""
+        now = time.monotonic()
+        with self._lock:
+            return max(
+                (self._counter(limit).time_until_below(now, limit.max_requests * safety_margin)
+                 for limit in self.quota_limits),
+                default=0.0,
+            )
+
     def _get_min_wait_time(self) -> float:
         """Get minimum time to wait for quota reset"""
         min_wait = float('inf')
+        self._update_usage_statistics()
 
         with self._lock:
             for usage in self._current_usage.values():
@@ -322,15 +430,13 @@ class APIQuotaMonitor:
     def _update_usage_statistics(self):
         """Update current usage statistics for all quota limits"""
         now = datetime.now()
+        now_monotonic = time.monotonic()
 
         with self._lock:
             for limit in self.quota_limits:
                 # Count calls within window
-                cutoff = now - timedelta(seconds=limit.window_seconds)
-                calls_in_window = sum(
-                    1 for call in self._api_calls
-                    if call.timestamp >= cutoff
-                )
+                counter = self._counter(limit)
+                calls_in_window = counter.count(now_monotonic)
 
                 # Calculate usage percentage
                 usage_percent = (calls_in_window / limit.max_requests) * 100
@@ -346,16 +452,7 @@ class APIQuotaMonitor:
                     level = QuotaLevel.SAFE
 
                 # Calculate time until reset (oldest call expires)
-                time_until_reset = 0
-                if calls_in_window > 0:
-                    oldest_call = min(
-                        (call for call in self._api_calls if call.timestamp >= cutoff),
-                        key=lambda c: c.timestamp
-                    )
-                    time_until_reset = (
-                        limit.window_seconds -
-                        (now - oldest_call.timestamp).total_seconds()
-                    )
+                time_until_reset = counter.time_until_reset(now_monotonic)
 
                 # Create usage object
                 usage = QuotaUsage(
@@ -433,15 +530,14 @@ class APIQuotaMonitor:
         cutoff = datetime.now() - timedelta(days=1)
 
         with self._lock:
-            # Cleanup by endpoint
+            # Cleanup by endpoint (calls are in time order)
             for endpoint in list(self._calls_by_endpoint.keys()):
-                self._calls_by_endpoint[endpoint] = [
-                    call for call in self._calls_by_endpoint[endpoint]
-                    if call.timestamp >= cutoff
-                ]
+                calls = self._calls_by_endpoint[endpoint]
+                while calls and calls[0].timestamp < cutoff:
+                    calls.popleft()
 
                 # Remove endpoint if empty
-                if not self._calls_by_endpoint[endpoint]:
+                if not calls:
                     del self._calls_by_endpoint[endpoint]
 
     def get_current_usage(self, limit_name: Optional[str] = None) -> Dict[str, QuotaUsage]:
@@ -454,6 +550,7 @@ class APIQuotaMonitor:
         Returns:
             Dictionary of limit_name -> QuotaUsage
         """
+        self._update_usage_statistics()
         with self._lock:
             if limit_name:
                 return {limit_name: self._current_usage.get(limit_name)}
@@ -471,45 +568,47 @@ class APIQuotaMonitor:
         """
         with self._lock:
             if endpoint:
-                calls = self._calls_by_endpoint.get(endpoint, [])
+                calls = self._calls_by_endpoint.get(endpoint, ())
                 return self._calculate_endpoint_stats(endpoint, calls)
 
             # All endpoints
             stats = {}
-            for endpoint, calls in self._calls_by_endpoint.items():
-                stats[endpoint] = self._calculate_endpoint_stats(endpoint, calls)
+            for endpoint in self._endpoint_calls:
+                stats[endpoint] = self._calculate_endpoint_stats(endpoint, self._calls_by_endpoint.get(endpoint, ()))
 
             return stats
 
-    def _calculate_endpoint_stats(self, endpoint: str, calls: List[APICall]) -> Dict[str, Any]:
-        """Calculate statistics for endpoint"""
+    def _calculate_endpoint_stats(self, endpoint: str, calls) -> Dict[str, Any]:
+        """Calculate statistics for endpoint (counts are exact, latencies from the sampled calls)"""
+        total_calls = self._endpoint_calls.get(endpoint, 0)
         if not calls:
             return {
                 'endpoint': endpoint,
-                'total_calls': 0,
-                'error_count': 0,
+                'total_calls': total_calls,
+                'error_count': self._endpoint_errors.get(endpoint, 0),
                 'avg_response_time_ms': 0,
                 'p95_response_time_ms': 0,
                 'p99_response_time_ms': 0
             }
 
-        response_times = [call.response_time_ms for call in calls]
-        errors = sum(1 for call in calls if call.error or call.status_code >= 400)
+        response_times = sorted(call.response_time_ms for call in calls)
+        errors = self._endpoint_errors.get(endpoint, 0)
 
         return {
             'endpoint': endpoint,
-            'total_calls': len(calls),
+            'total_calls': total_calls,
             'error_count': errors,
-            'error_rate': errors / len(calls) if calls else 0,
+            'error_rate': errors / total_calls if total_calls else 0,
             'avg_response_time_ms': sum(response_times) / len(response_times),
             'min_response_time_ms': min(response_times),
             'max_response_time_ms': max(response_times),
-            'p95_response_time_ms': sorted(response_times)[int(len(response_times) * 0.95)],
-            'p99_response_time_ms': sorted(response_times)[int(len(response_times) * 0.99)],
+            'p95_response_time_ms': response_times[int(len(response_times) * 0.95)],
+            'p99_response_time_ms': response_times[int(len(response_times) * 0.99)],
         }
 
     def get_quota_report(self) -> Dict[str, Any]:
         """Generate comprehensive quota report"""
+        self._update_usage_statistics()
         with self._lock:
             report = {
                 'timestamp': datetime.now().isoformat(),
@@ -530,8 +629,8 @@ class APIQuotaMonitor:
     def _get_top_endpoints(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get top endpoints by call count"""
         endpoint_counts = [
-            {'endpoint': endpoint, 'calls': len(calls)}
-            for endpoint, calls in self._calls_by_endpoint.items()
+            {'endpoint': endpoint, 'calls': calls}
+            for endpoint, calls in self._endpoint_calls.items()
         ]
 
         # Sort by call count
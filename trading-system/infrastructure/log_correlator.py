@@ -9,10 +9,11 @@ ADDRESSES WEEK 6 ISSUE:
 """
 
 import logging
+import os
 import re
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from collections import defaultdict
@@ -71,8 +72,9 @@ class LogCorrelator:
     Usage:
         correlator = LogCorrelator()
 
-        # Ingest logs
-        correlator.ingest_log_file("trading_system.log")
+        # Ingest logs (bulk), or only what was appended since the last call
+        correlator.ingest_log_file(Path("trading_system.log"))
+        correlator.tail_log_file(Path("trading_system.log"))
 
         # Query logs
         logs = correlator.query_logs(
@@ -84,15 +86,38 @@ class LogCorrelator:
         correlated = correlator.get_correlated_logs("TRADE_123")
     """
 
-    def __init__(self, db_path: str = "logs_database.db"):
+    # Secondary indexes on logs; dropped during large loads and rebuilt afterwards
+    _LOG_INDEXES = {
+        'idx_logs_timestamp': 'timestamp',
+        'idx_logs_level': 'level',
+        'idx_logs_component': 'component',
+        'idx_logs_correlation': 'correlation_id',
+    }
+
+    _INSERT_SQL = """
+        INSERT INTO logs (timestamp, level, component, message, context, correlation_id, thread_id, process_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    def __init__(
+        self,
+        db_path: str = "logs_database.db",
+        batch_size: int = 50000,
+        bulk_load_bytes: int = 16 * 1024 * 1024
+    ):
         """
         Initialize log correlator
 
         Args:
             db_path: Path to log database
+            batch_size: Rows inserted per transaction during file ingestion
+            bulk_load_bytes: File reads at least this large drop the log
+                indexes for the load and rebuild them afterwards
         """
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.bulk_load_bytes = bulk_load_bytes
 
         # Initialize database
         self._init_database()
@@ -104,14 +129,23 @@ class LogCorrelator:
             'component': r'([a-zA-Z_\.]+)',
             'correlation_id': r'(?:trade_id|order_id|correlation_id)[:\s=]+([A-Z0-9_-]+)',
         }
+        self._compiled_patterns = {name: re.compile(pattern) for name, pattern in self._log_patterns.items()}
 
         logger.info(f"📋 LogCorrelator initialized: {self.db_path}")
 
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path))
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
     def _init_database(self):
         """Initialize log database schema"""
         conn = sqlite3.connect(str(self.db_path))
         cursor = conn.cursor()
 
+        # WAL lets queries run while a bulk load is writing; persists in the file
+        cursor.execute("PRAGMA journal_mode=WAL")
+
         # Logs table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS logs (
@@ -129,10 +163,17 @@ class LogCorrelator:
         """)
 
         # Indices for performance
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_logs_timestamp ON logs(timestamp)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_logs_level ON logs(level)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_logs_component ON logs(component)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_logs_correlation ON logs(correlation_id)")
+        self._create_indexes(cursor)
+
+        # Read position per log file, for incremental tailing
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS ingest_offsets (
+                path TEXT PRIMARY KEY,
+                inode INTEGER,
+                offset INTEGER NOT NULL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
 
         # Log patterns table (for pattern detection)
         cursor.execute("""
@@ -149,6 +190,14 @@ class LogCorrelator:
         conn.commit()
         conn.close()
 
+    def _create_indexes(self, cursor: sqlite3.Cursor):
+        for name, column in self._LOG_INDEXES.items():
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON logs({column})")
+
+    def _drop_indexes(self, cursor: sqlite3.Cursor):
+        for name in self._LOG_INDEXES:
+            cursor.execute(f"DROP INDEX IF EXISTS {name}")
+
     def parse_log_line(self, line: str, component: str = "unknown") -> Optional[LogEntry]:
         """
         Parse a log line into structured LogEntry
@@ -162,24 +211,24 @@ class LogCorrelator:
         """
         try:
             # Extract timestamp
-            timestamp_match = re.search(self._log_patterns['timestamp'], line)
+            timestamp_match = self._compiled_patterns['timestamp'].search(line)
             if not timestamp_match:
                 return None
 
-            timestamp_str = timestamp_match.group(1)
-            timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d %H:%M:%S,%f")
+            # "YYYY-MM-DD HH:MM:SS,mmm"; fromisoformat is far cheaper than strptime
+            timestamp = datetime.fromisoformat(timestamp_match.group(1).replace(',', '.'))
 
             # Extract level
-            level_match = re.search(self._log_patterns['level'], line)
+            level_match = self._compiled_patterns['level'].search(line)
             level = LogLevel(level_match.group(1)) if level_match else LogLevel.INFO
 
             # Extract component
-            component_match = re.search(self._log_patterns['component'], line)
+            component_match = self._compiled_patterns['component'].search(line)
             if component_match:
                 component = component_match.group(1)
 
             # Extract correlation ID
-            corr_match = re.search(self._log_patterns['correlation_id'], line)
+            corr_match = self._compiled_patterns['correlation_id'].search(line)
             correlation_id = corr_match.group(1) if corr_match else None
 
             # Message is everything after level
@@ -199,6 +248,19 @@ class LogCorrelator:
             logger.debug(f"Failed to parse log line: {e}")
             return None
 
+    @staticmethod
+    def _entry_row(entry: LogEntry) -> tuple:
+        return (
+            entry.timestamp.isoformat(),
+            entry.level.value,
+            entry.component,
+            entry.message,
+            json.dumps(entry.context) if entry.context else None,
+            entry.correlation_id,
+            entry.thread_id,
+            entry.process_id
+        )
+
     def ingest_log(self, entry: LogEntry) -> bool:
         """
         Ingest a single log entry
@@ -209,63 +271,183 @@ class LogCorrelator:
         Returns:
             True if successful
         """
-        try:
-            conn = sqlite3.connect(str(self.db_path))
-            cursor = conn.cursor()
-
-            cursor.execute("""
-                INSERT INTO logs (timestamp, level, component, message, context, correlation_id, thread_id, process_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                entry.timestamp.isoformat(),
-                entry.level.value,
-                entry.component,
-                entry.message,
-                json.dumps(entry.context) if entry.context else None,
-                entry.correlation_id,
-                entry.thread_id,
-                entry.process_id
-            ))
-
-            conn.commit()
-            conn.close()
+        return self.ingest_logs([entry]) == 1
+
+    def ingest_logs(self, entries: Iterable[LogEntry]) -> int:
+        """
+        Ingest log entries in batches (one executemany and commit per batch)
 
-            return True
+        Args:
+            entries: LogEntry objects to store
+
+        Returns:
+            Number of logs ingested
+        """
+        ingested = 0
+        try:
+            conn = self._connect()
+            try:
+                batch = []
+                for entry in entries:
+                    batch.append(self._entry_row(entry))
+                    if len(batch) >= self.batch_size:
+                        with conn:
+                            conn.executemany(self._INSERT_SQL, batch)
+                        ingested += len(batch)
+                        batch = []
+                if batch:
+                    with conn:
+                        conn.executemany(self._INSERT_SQL, batch)
+                    ingested += len(batch)
+            finally:
+                conn.close()
 
         except Exception as e:
             logger.error(f"Failed to ingest log: {e}")
-            return False
 
-    def ingest_log_file(self, log_file: Path, component: str = "system") -> int:
+        return ingested
+
+    def ingest_log_file(self, log_file: Path, component: str = "system", final: bool = True) -> int:
         """
         Ingest logs from a file
 
+        The file is read in chunks and inserted in large transactions. Each
+        chunk records the file position with its rows, so calling this again
+        after an interrupted load (or ``tail_log_file`` later) continues from
+        there without duplicating rows.
+
         Args:
             log_file: Path to log file
             component: Component name
+            final: The file is complete (rotated or archived), so a last line
+                without a trailing newline is ingested too; pass False for a
+                file still being written to leave that line for the next call
 
         Returns:
             Number of logs ingested
         """
+        log_file = Path(log_file)
         if not log_file.exists():
             logger.warning(f"Log file not found: {log_file}")
             return 0
 
+        ingested = self._ingest_from(log_file, component, self._resume_offset(log_file, log_file.stat()), final)
+        logger.info(f"✅ Ingested {ingested} logs from {log_file.name}")
+        return ingested
+
+    def tail_log_file(self, log_file: Path, component: str = "system") -> int:
+        """
+        Ingest only what was appended to a file since the last ingestion
+
+        Starts over if the file was rotated (new inode) or truncated. A line
+        still being written (no trailing newline) is left for the next call.
+
+        Args:
+            log_file: Path to log file
+            component: Component name
+
+        Returns:
+            Number of logs ingested
+        """
+        log_file = Path(log_file)
+        if not log_file.exists():
+            logger.warning(f"Log file not found: {log_file}")
+            return 0
+
+        stat = log_file.stat()
+        offset = self._resume_offset(log_file, stat)
+        if offset == stat.st_size:
+            return 0
+
+        return self._ingest_from(log_file, component, offset)
+
+    def _resume_offset(self, log_file: Path, stat: os.stat_result) -> int:
+        """Recorded offset for the file, or 0 if it was rotated (new inode) or truncated"""
+        saved = self.get_ingest_offset(log_file)
+        if saved is not None:
+            saved_inode, saved_offset = saved
+            if saved_inode == stat.st_ino and saved_offset <= stat.st_size:
+                return saved_offset
+        return 0
+
+    def get_ingest_offset(self, log_file: Path) -> Optional[Tuple[int, int]]:
+        """(inode, byte offset) recorded for a log file, or None"""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT inode, offset FROM ingest_offsets WHERE path = ?",
+                (str(Path(log_file).resolve()),)
+            ).fetchone()
+        finally:
+            conn.close()
+        return tuple(row) if row else None
+
+    def _read_line_chunks(self, f, final: bool = False) -> Iterator[Tuple[List[bytes], int]]:
+        """
+        Yield (complete lines, end offset) per chunk of about batch_size lines
+
+        Bytes after the last newline are only yielded with ``final`` (the
+        file is complete), so a live file's offset never points into the
+        middle of a line.
+        """
+        chunk_bytes = max(self.batch_size * 128, 1 << 16)
+        pending = b''
+        position = f.tell()
+        while True:
+            data = f.read(chunk_bytes)
+            if not data:
+                break
+            data = pending + data
+            cut = data.rfind(b'\n') + 1
+            pending = data[cut:]
+            if cut:
+                position += cut
+                yield data[:cut].splitlines(), position
+        if pending and final:
+            yield [pending], position + len(pending)
+
+    def _ingest_from(self, log_file: Path, component: str, offset: int, final: bool = False) -> int:
+        """
+        Parse and insert a file from offset; each chunk's rows and new offset
+        commit together, so an interrupted load resumes without duplicates
+        """
         ingested = 0
+        path_key = str(log_file.resolve())
 
         try:
-            with open(log_file, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    entry = self.parse_log_line(line, component)
-                    if entry:
-                        if self.ingest_log(entry):
-                            ingested += 1
-
-            logger.info(f"✅ Ingested {ingested} logs from {log_file.name}")
+            stat = log_file.stat()
+            bulk = stat.st_size - offset >= self.bulk_load_bytes
+            conn = self._connect()
+            try:
+                if bulk:
+                    with conn:
+                        self._drop_indexes(conn.cursor())
+
+                with open(log_file, 'rb') as f:
+                    f.seek(offset)
+                    for lines, end_offset in self._read_line_chunks(f, final):
+                        rows = []
+                        for raw in lines:
+                            line = raw.decode('utf-8', errors='replace').strip()
+                            if not line:
+                                continue
+                            entry = self.parse_log_line(line, component)
+                            if entry:
+                                rows.append(self._entry_row(entry))
+
+                        with conn:
+                            conn.executemany(self._INSERT_SQL, rows)
+                            conn.execute(
+                                "INSERT OR REPLACE INTO ingest_offsets (path, inode, offset, updated_at) "
+                                "VALUES (?, ?, ?, CURRENT_TIMESTAMP)",
+                                (path_key, stat.st_ino, end_offset)
+                            )
+                        ingested += len(rows)
+            finally:
+                if bulk:
+                    with conn:
+                        self._create_indexes(conn.cursor())
+                conn.close()
 
         except Exception as e:
             logger.error(f"Failed to ingest log file {log_file}: {e}")
@@ -5,7 +5,7 @@ Prevents unbounded memory growth from caching market data
 
 ADDRESSES CRITICAL ISSUE:
 - Original cache: Unbounded Dict could reach 10GB+ with 8,321 instruments
-- This implementation: Hard limit of 2GB with LRU eviction
+- This implementation: Hard limit of 2GB with size-aware LRU eviction
 """
 
 import sys
@@ -16,8 +16,72 @@ from collections import OrderedDict
 from dataclasses import dataclass
 import logging
 
+import numpy as np
+
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    pd = None
+    PANDAS_AVAILABLE = False
+
 logger = logging.getLogger('trading_system.cache')
 
+DEFAULT_NAMESPACE = 'default'
+
+
+def estimate_size(obj: Any, _seen: Optional[set] = None) -> int:
+    """
+    Estimate the deep memory footprint of an object in bytes
+
+    - pandas objects: ``memory_usage(deep=True)`` (includes object/string columns)
+    - numpy arrays: ``nbytes`` of the buffer plus the array header
+    - dict/list/tuple/set: container overhead plus every element
+    - other objects: ``sys.getsizeof`` plus their ``__dict__``/``__slots__``
+
+    Objects reachable more than once are counted once.
+    """
+    if _seen is None:
+        _seen = set()
+    obj_id = id(obj)
+    if obj_id in _seen:
+        return 0
+    _seen.add(obj_id)
+
+    if PANDAS_AVAILABLE:
+        if isinstance(obj, pd.DataFrame):
+            return int(obj.memory_usage(index=True, deep=True).sum())
+        if isinstance(obj, (pd.Series, pd.Index)):
+            return int(obj.memory_usage(deep=True))
+
+    if isinstance(obj, np.ndarray):
+        size = sys.getsizeof(obj)
+        # Views report only the header from getsizeof; count the viewed buffer
+        if obj.base is not None:
+            size += obj.nbytes
+        if obj.dtype.hasobject:
+            size += sum(estimate_size(item, _seen) for item in obj.ravel())
+        return size
+
+    if isinstance(obj, (str, bytes, bytearray, int, float, bool, complex)) or obj is None:
+        return sys.getsizeof(obj)
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            size += estimate_size(k, _seen) + estimate_size(v, _seen)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += estimate_size(item, _seen)
+    else:
+        attrs = getattr(obj, '__dict__', None)
+        if attrs is not None:
+            size += estimate_size(attrs, _seen)
+        for slot in getattr(type(obj), '__slots__', ()):
+            if hasattr(obj, slot):
+                size += estimate_size(getattr(obj, slot), _seen)
+    return size
+
 
 @dataclass
 class CacheEntry:
@@ -26,6 +90,8 @@ class CacheEntry:
     timestamp: float
     size_bytes: int
     access_count: int
+    ttl: float = 60.0
+    namespace: str = DEFAULT_NAMESPACE
 
 
 class MemoryBoundedCache:
@@ -33,17 +99,19 @@ class MemoryBoundedCache:
     Memory-bounded LRU cache with TTL
 
     Features:
-    - Hard memory limit (default 2GB)
-    - LRU eviction policy
-    - TTL (time-to-live) for entries
+    - Hard memory limit (default 2GB) based on deep object sizes
+    - Size-aware LRU eviction: expired entries first, then the costliest
+      of the least recently used entries
+    - Optional per-namespace budgets (namespace = key prefix before ':')
+    - Per-entry TTL (time-to-live)
     - Thread-safe operations
     - Memory usage tracking
-    - Automatic eviction when limit reached
 
     Usage:
-        cache = MemoryBoundedCache(max_size_mb=2048, default_ttl=60)
-        cache.set('key', data)
-        value = cache.get('key')
+        cache = MemoryBoundedCache(max_size_mb=2048, default_ttl=60,
+                                   namespace_budgets_mb={'quote': 64})
+        cache.set('quote:NIFTY', data)
+        value = cache.get('quote:NIFTY')
     """
 
     def __init__(
@@ -51,7 +119,9 @@ class MemoryBoundedCache:
         max_size_mb: int = 2048,  # 2GB default
         default_ttl: int = 60,  # 60 seconds default
         max_entries: int = 1000,  # Maximum number of entries
-        eviction_threshold: float = 0.9  # Start evicting at 90% full
+        eviction_threshold: float = 0.9,  # Start evicting at 90% full
+        namespace_budgets_mb: Optional[Dict[str, float]] = None,
+        eviction_sample: int = 8  # LRU candidates considered per eviction
     ):
         """
         Initialize memory-bounded cache
@@ -61,22 +131,37 @@ class MemoryBoundedCache:
             default_ttl: Default TTL in seconds
             max_entries: Maximum number of cache entries
             eviction_threshold: Start evicting at this % of max_size
+            namespace_budgets_mb: Optional size limit per key namespace
+            eviction_sample: Number of least recently used entries weighed when
+                freeing memory (1 = plain LRU)
         """
         self.max_size_bytes = max_size_mb * 1024 * 1024
         self.default_ttl = default_ttl
         self.max_entries = max_entries
         self.eviction_threshold = eviction_threshold
+        self.eviction_sample = max(1, eviction_sample)
 
         # Thread-safe cache storage (LRU)
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self._lock = threading.RLock()
 
+        # Namespace accounting: LRU order and byte totals per namespace
+        self._namespace_budgets: Dict[str, int] = {}
+        self._namespace_keys: Dict[str, OrderedDict] = {}
+        self._namespace_bytes: Dict[str, int] = {}
+        self._namespace_evictions: Dict[str, int] = {}
+        for namespace, budget_mb in (namespace_budgets_mb or {}).items():
+            self.set_namespace_budget(namespace, budget_mb)
+
         # Statistics
         self._current_size_bytes = 0
+        self._peak_size_bytes = 0
         self._hits = 0
         self._misses = 0
         self._evictions = 0
+        self._evicted_bytes = 0
         self._expirations = 0
+        self._rejections = 0
 
         logger.info(
             f"📦 MemoryBoundedCache initialized: "
@@ -105,7 +190,7 @@ class MemoryBoundedCache:
 
             # Check if expired
             age = time.time() - entry.timestamp
-            if age > self.default_ttl:
+            if age > entry.ttl:
                 self._remove_entry(key)
                 self._expirations += 1
                 self._misses += 1
@@ -113,6 +198,7 @@ class MemoryBoundedCache:
 
             # Update access (move to end for LRU)
             self._cache.move_to_end(key)
+            self._namespace_keys[entry.namespace].move_to_end(key)
             entry.access_count += 1
             self._hits += 1
 
@@ -130,38 +216,44 @@ class MemoryBoundedCache:
         Returns:
             True if successfully cached, False if evicted immediately
         """
-        with self._lock:
-            # Calculate size of new entry
-            size_bytes = self._estimate_size(value)
+        # Deep sizing walks the whole object, so do it outside the lock
+        size_bytes = self._estimate_size(value)
+        namespace = self._namespace_of(key)
 
+        with self._lock:
             # Check if single entry exceeds max size
-            if size_bytes > self.max_size_bytes:
+            budget = self._namespace_budgets.get(namespace)
+            limit = self.max_size_bytes if budget is None else min(budget, self.max_size_bytes)
+            if size_bytes > limit:
+                self._rejections += 1
                 logger.warning(
                     f"⚠️  Entry too large to cache: {key} "
-                    f"({size_bytes / 1024 / 1024:.1f}MB > {self.max_size_bytes / 1024 / 1024:.1f}MB)"
+                    f"({size_bytes / 1024 / 1024:.1f}MB > {limit / 1024 / 1024:.1f}MB)"
                 )
                 return False
 
-            # Evict if necessary
-            self._evict_if_needed(size_bytes)
-
-            # Remove old entry if exists
+            # Remove old entry if exists (its bytes no longer count)
             if key in self._cache:
                 self._remove_entry(key)
 
+            # Evict if necessary
+            self._evict_if_needed(size_bytes, namespace)
+
             # Add new entry
             entry = CacheEntry(
                 value=value,
                 timestamp=time.time(),
                 size_bytes=size_bytes,
-                access_count=0
+                access_count=0,
+                ttl=self.default_ttl if ttl is None else ttl,
+                namespace=namespace
             )
 
             self._cache[key] = entry
+            self._namespace_keys.setdefault(namespace, OrderedDict())[key] = None
+            self._namespace_bytes[namespace] = self._namespace_bytes.get(namespace, 0) + size_bytes
             self._current_size_bytes += size_bytes
-
-            # Move to end (most recently used)
-            self._cache.move_to_end(key)
+            self._peak_size_bytes = max(self._peak_size_bytes, self._current_size_bytes)
 
             return True
 
@@ -185,9 +277,24 @@ class MemoryBoundedCache:
         """Clear all cache entries"""
         with self._lock:
             self._cache.clear()
+            self._namespace_keys.clear()
+            self._namespace_bytes.clear()
+            self._namespace_evictions.clear()
             self._current_size_bytes = 0
             logger.info("🗑️  Cache cleared")
 
+    def set_namespace_budget(self, namespace: str, max_size_mb: Optional[float]):
+        """
+        Limit the bytes held by one key namespace (None removes the limit)
+
+        Entries over the new budget are evicted on the next insert into the namespace.
+        """
+        with self._lock:
+            if max_size_mb is None:
+                self._namespace_budgets.pop(namespace, None)
+            else:
+                self._namespace_budgets[namespace] = int(max_size_mb * 1024 * 1024)
+
     def get_or_compute(
         self,
         key: str,
@@ -218,42 +325,90 @@ class MemoryBoundedCache:
 
         return computed
 
-    def _evict_if_needed(self, incoming_size: int):
+    @staticmethod
+    def _namespace_of(key: str) -> str:
+        """Namespace of a key: the prefix before the first ':'"""
+        namespace, sep, _ = key.partition(':')
+        return namespace if sep else DEFAULT_NAMESPACE
+
+    def _evict_if_needed(self, incoming_size: int, namespace: str = DEFAULT_NAMESPACE):
         """
         Evict entries if necessary to make room
 
-        Uses LRU policy - evicts least recently used entries first
+        Entry-count overflow evicts strictly in LRU order. Byte overflow (global
+        or namespace) first drops expired entries, then evicts the costliest of
+        the ``eviction_sample`` least recently used candidates, so one large
+        stale DataFrame goes before many small hot quotes.
 
         Args:
             incoming_size: Size of incoming entry
+            namespace: Namespace the incoming entry will be stored in
         """
+        # Evict by count first: plain LRU
+        while self._cache and len(self._cache) >= self.max_entries:
+            self._evict(next(iter(self._cache)))
+
+        budget = self._namespace_budgets.get(namespace)
+        if budget is not None:
+            ns_keys = self._namespace_keys.get(namespace)
+            while ns_keys and self._namespace_bytes.get(namespace, 0) + incoming_size > budget:
+                self._evict(self._pick_victim(ns_keys))
+
         # Calculate threshold
         threshold_bytes = int(self.max_size_bytes * self.eviction_threshold)
-
-        # Evict while over threshold or too many entries
-        while (
-            (self._current_size_bytes + incoming_size > threshold_bytes) or
-            (len(self._cache) >= self.max_entries)
-        ):
-            if not self._cache:
-                break  # Nothing to evict
-
-            # Evict oldest (first) entry (LRU)
-            key_to_evict = next(iter(self._cache))
-            self._remove_entry(key_to_evict)
-            self._evictions += 1
-
-            if self._evictions % 100 == 0:
-                logger.info(
-                    f"📤 Cache evictions: {self._evictions}, "
-                    f"current_size: {self._current_size_bytes / 1024 / 1024:.1f}MB"
-                )
+        if self._current_size_bytes + incoming_size > threshold_bytes:
+            self._purge_expired()
+        while self._cache and self._current_size_bytes + incoming_size > threshold_bytes:
+            self._evict(self._pick_victim(self._cache))
+
+    def _pick_victim(self, lru_keys) -> str:
+        """Choose the entry to evict among the least recently used ``lru_keys``"""
+        now = time.time()
+        best_key = None
+        best_score = -1.0
+        for i, key in enumerate(lru_keys):
+            if i >= self.eviction_sample:
+                break
+            entry = self._cache[key]
+            # Bytes freed per unit of recent usefulness
+            score = entry.size_bytes * (1.0 + now - entry.timestamp) / (1.0 + entry.access_count)
+            if score > best_score:
+                best_key, best_score = key, score
+        return best_key
+
+    def _purge_expired(self):
+        """Drop every expired entry (cheapest memory to reclaim)"""
+        now = time.time()
+        expired = [k for k, e in self._cache.items() if now - e.timestamp > e.ttl]
+        for key in expired:
+            self._remove_entry(key)
+        self._expirations += len(expired)
+
+    def _evict(self, key: str):
+        """Evict one entry and record it in the statistics"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return
+        self._remove_entry(key)
+        self._evictions += 1
+        self._evicted_bytes += entry.size_bytes
+        self._namespace_evictions[entry.namespace] = self._namespace_evictions.get(entry.namespace, 0) + 1
+
+        if self._evictions % 100 == 0:
+            logger.info(
+                f"📤 Cache evictions: {self._evictions}, "
+                f"current_size: {self._current_size_bytes / 1024 / 1024:.1f}MB"
+            )
 
     def _remove_entry(self, key: str):
         """Remove entry and update size tracking"""
         if key in self._cache:
             entry = self._cache.pop(key)
             self._current_size_bytes -= entry.size_bytes
+            self._namespace_bytes[entry.namespace] -= entry.size_bytes
+            ns_keys = self._namespace_keys.get(entry.namespace)
+            if ns_keys is not None:
+                ns_keys.pop(key, None)
 
     def _estimate_size(self, obj: Any) -> int:
         """
@@ -263,11 +418,9 @@ class MemoryBoundedCache:
             obj: Object to estimate
 
         Returns:
-            Estimated size in bytes
+            Estimated deep size in bytes (see ``estimate_size``)
         """
-        # Use sys.getsizeof for basic estimation
-        # This includes object overhead but not deep size of complex objects
-        return sys.getsizeof(obj)
+        return estimate_size(obj)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
@@ -284,8 +437,27 @@ class MemoryBoundedCache:
                 'misses': self._misses,
                 'hit_rate_pct': hit_rate * 100,
                 'evictions': self._evictions,
+                'evicted_mb': self._evicted_bytes / 1024 / 1024,
                 'expirations': self._expirations,
+                'rejections': self._rejections,
+                'peak_size_mb': self._peak_size_bytes / 1024 / 1024,
+                'namespaces': self._namespace_stats(),
+            }
+
+    def _namespace_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-namespace size, budget and eviction counts (caller holds the lock)"""
+        stats = {}
+        for namespace in set(self._namespace_keys) | set(self._namespace_budgets):
+            budget = self._namespace_budgets.get(namespace)
+            size_bytes = self._namespace_bytes.get(namespace, 0)
+            stats[namespace] = {
+                'entries': len(self._namespace_keys.get(namespace, ())),
+                'size_mb': size_bytes / 1024 / 1024,
+                'budget_mb': budget / 1024 / 1024 if budget is not None else None,
+                'utilization_pct': (size_bytes / budget) * 100 if budget else None,
+                'evictions': self._namespace_evictions.get(namespace, 0),
             }
+        return stats
 
     def print_stats(self):
         """Print cache statistics"""
@@ -300,8 +472,11 @@ class MemoryBoundedCache:
         print(f"Hit Rate:       {stats['hit_rate_pct']:.1f}%")
         print(f"Hits:           {stats['hits']:,}")
         print(f"Misses:         {stats['misses']:,}")
-        print(f"Evictions:      {stats['evictions']:,}")
+        print(f"Evictions:      {stats['evictions']:,} ({stats['evicted_mb']:.1f} MB)")
         print(f"Expirations:    {stats['expirations']:,}")
+        for namespace, ns in sorted(stats['namespaces'].items()):
+            budget = f"{ns['budget_mb']:.1f} MB" if ns['budget_mb'] is not None else "-"
+            print(f"  {namespace:<14}{ns['entries']:,} entries, {ns['size_mb']:.1f} MB / {budget}")
         print("="*60 + "\n")
 
 
@@ -320,12 +495,14 @@ class InstrumentCache(MemoryBoundedCache):
         max_size_mb: int = 2048,
         instrument_ttl: int = 3600,  # 1 hour for instruments
         quote_ttl: int = 60,  # 1 minute for quotes
-        max_instruments: int = 1000
+        max_instruments: int = 1000,
+        namespace_budgets_mb: Optional[Dict[str, float]] = None
     ):
         super().__init__(
             max_size_mb=max_size_mb,
             default_ttl=quote_ttl,
-            max_entries=max_instruments
+            max_entries=max_instruments,
+            namespace_budgets_mb=namespace_budgets_mb
         )
         self.instrument_ttl = instrument_ttl
         self.quote_ttl = quote_ttl
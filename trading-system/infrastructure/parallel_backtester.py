@@ -11,13 +11,16 @@ ADDRESSES HIGH PRIORITY RECOMMENDATION #4:
 - Performance comparison across strategies
 """
 
+import hashlib
 import logging
+import pickle
 import threading
 import time
-from typing import Dict, List, Optional, Any, Callable, Tuple
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any, Callable, Tuple, Union
+from datetime import datetime, timedelta, tzinfo
 from dataclasses import dataclass, field, asdict
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
 from pathlib import Path
 import json
 import numpy as np
@@ -26,6 +29,24 @@ from enum import Enum
 
 logger = logging.getLogger('trading_system.parallel_backtest')
 
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+# Bars per trading day (NSE 09:15-15:30) used to annualise bar returns
+BARS_PER_DAY = {
+    'minute': 375,
+    '3minute': 125,
+    '5minute': 75,
+    '10minute': 38,
+    '15minute': 25,
+    '30minute': 13,
+    '60minute': 7,
+    'day': 1,
+}
+TRADING_DAYS_PER_YEAR = 252
+
+# A single OHLCV frame (one symbol) or symbol -> frame
+MarketData = Union[pd.DataFrame, Dict[str, pd.DataFrame]]
+
 
 class BacktestMode(Enum):
     """Backtesting modes"""
@@ -116,12 +137,329 @@ class ParameterGrid:
     values: List[Any]
 
 
+# ============================================================================
+# Strategy simulation
+# ============================================================================
+
+def _symbol_frames(market_data: Optional[MarketData], symbols: List[str]) -> Dict[str, pd.DataFrame]:
+    """Normalise market data to symbol -> OHLCV frame"""
+    if market_data is None:
+        return {}
+    if isinstance(market_data, pd.DataFrame):
+        if market_data.empty:
+            return {}
+        return {symbols[0] if symbols else 'DATA': market_data}
+    return {symbol: df for symbol, df in market_data.items() if df is not None and not df.empty}
+
+
+def _data_fingerprint(frames: Dict[str, pd.DataFrame]) -> Optional[str]:
+    """Content hash of per-symbol market data, used in result cache keys"""
+    if not frames:
+        return None
+    digest = hashlib.sha256()
+    for symbol in sorted(frames):
+        df = frames[symbol]
+        digest.update(f"{symbol}|{list(df.columns)}|".encode())
+        digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _strategy_identity(strategy_fn) -> str:
+    """
+    Cache identity of a strategy
+
+    The qualified name keeps keys readable; the object id separates lambdas,
+    closures and strategy instances that share a name.
+    """
+    owner = strategy_fn if hasattr(strategy_fn, '__qualname__') else type(strategy_fn)
+    return f"{owner.__module__}.{owner.__qualname__}@{id(strategy_fn):x}"
+
+
+def _date_window(df: pd.DataFrame, start: Optional[datetime], end: Optional[datetime]) -> pd.DataFrame:
+    """Restrict a frame to ``[start, end]``; naive bounds are read in the index timezone"""
+    if not isinstance(df.index, pd.DatetimeIndex):
+        return df
+    tz = df.index.tz
+    bounds = []
+    for value in (start, end):
+        if value is None:
+            bounds.append(None)
+            continue
+        ts = pd.Timestamp(value)
+        if tz is not None and ts.tzinfo is None:
+            ts = ts.tz_localize(tz)
+        elif tz is None and ts.tzinfo is not None:
+            ts = ts.tz_localize(None)
+        bounds.append(ts)
+    lo = 0 if bounds[0] is None else df.index.searchsorted(bounds[0], side='left')
+    hi = len(df) if bounds[1] is None else df.index.searchsorted(bounds[1], side='right')
+    return df.iloc[lo:hi]
+
+
+def _strategy_signals(strategy_fn, config: BacktestConfig, data: pd.DataFrame) -> np.ndarray:
+    """
+    Run a strategy over one symbol and return per-bar signals (1=buy, -1=sell, 0=hold)
+
+    ``strategy_fn`` may be a ``core.vectorized_backtester.Strategy`` instance,
+    a Strategy subclass (built with ``config.parameters``) or a callable
+    ``strategy_fn(config, data)``. Callables may return a signal Series/array,
+    a DataFrame with a ``signal`` column, or None for no trades.
+    """
+    # Duck-typed so workers do not import the core package
+    if isinstance(strategy_fn, type) and hasattr(strategy_fn, 'generate_signals'):
+        strategy_fn = strategy_fn(**config.parameters)
+    if hasattr(strategy_fn, 'generate_signals'):
+        output = strategy_fn.generate_signals(data)
+    else:
+        output = strategy_fn(config, data)
+
+    if output is None:
+        return np.zeros(len(data))
+    if isinstance(output, pd.DataFrame):
+        output = output['signal']
+    signals = np.nan_to_num(np.asarray(output, dtype=float))
+    if signals.shape != (len(data),):
+        raise ValueError(f"Strategy returned {signals.shape} signals for {len(data)} bars")
+    return signals
+
+
+def _positions_from_signals(signals: np.ndarray) -> np.ndarray:
+    """Long/flat position per bar: a buy holds until the next sell (as VectorizedBacktester)"""
+    state = np.where(signals > 0, 1.0, np.where(signals < 0, 0.0, np.nan))
+    idx = np.where(np.isnan(state), 0, np.arange(len(state)))
+    np.maximum.accumulate(idx, out=idx)
+    positions = state[idx]
+    positions[np.isnan(positions)] = 0.0
+    return positions
+
+
+def _apply_exits(positions: np.ndarray, close: np.ndarray, stop_loss_pct: float,
+                 take_profit_pct: float) -> List[Tuple[int, int]]:
+    """
+    Cut trades at the first close beyond the stop loss / take profit
+
+    Modifies ``positions`` in place and returns (entry_bar, exit_bar) pairs;
+    a trade still open on the last bar exits there. A stopped-out trade is
+    not re-entered until the signal state goes flat again.
+    """
+    changes = np.diff(np.concatenate(([0.0], positions, [0.0])))
+    entries = np.flatnonzero(changes > 0)
+    exits = np.flatnonzero(changes < 0)
+    last = len(positions) - 1
+
+    trades = []
+    for entry, exit_ in zip(entries, exits):
+        exit_ = min(exit_, last)
+        if exit_ > entry and (stop_loss_pct > 0 or take_profit_pct > 0):
+            path = close[entry + 1:exit_ + 1] / close[entry] - 1.0
+            hit = np.zeros(len(path), dtype=bool)
+            if stop_loss_pct > 0:
+                hit |= path <= -stop_loss_pct
+            if take_profit_pct > 0:
+                hit |= path >= take_profit_pct
+            if hit.any():
+                stop = entry + 1 + int(hit.argmax())
+                positions[stop:exit_] = 0.0
+                exit_ = stop
+        trades.append((int(entry), int(exit_)))
+    return trades
+
+
+def simulate_strategy(config: BacktestConfig, strategy_fn: Callable,
+                      frames: Dict[str, pd.DataFrame]) -> BacktestResult:
+    """
+    Backtest a strategy over per-symbol OHLCV frames
+
+    Each symbol is traded long/flat on its own signals at bar closes with
+    an allocation of ``min(max_position_size, 1/len(symbols))`` of capital.
+    Commission and slippage are charged on every position change; stop loss
+    and take profit are checked on closes. Portfolio bar returns are the
+    weighted sum of symbol returns on the union of bar timestamps.
+
+    Raises:
+        ValueError: no market data for any configured symbol
+    """
+    symbols = [s for s in (config.symbols or list(frames)) if s in frames] or list(frames)
+    frames = {s: _date_window(frames[s], config.start_date, config.end_date) for s in symbols}
+    frames = {s: df for s, df in frames.items() if len(df) > 1}
+    if not frames:
+        raise ValueError(f"No market data for {config.strategy_name} ({', '.join(config.symbols)})")
+
+    weight = min(config.max_position_size, 1.0 / len(frames))
+    cost = config.commission + config.slippage
+    capital = config.initial_capital
+
+    symbol_returns = []
+    trade_returns = []
+    for symbol, df in frames.items():
+        close = df['close'].to_numpy(dtype=float)
+        positions = _positions_from_signals(_strategy_signals(strategy_fn, config, df))
+        trades = _apply_exits(positions, close, config.stop_loss_pct, config.take_profit_pct)
+
+        bar_returns = np.zeros(len(close))
+        bar_returns[1:] = close[1:] / close[:-1] - 1.0
+        held = np.concatenate(([0.0], positions[:-1]))
+        turnover = np.abs(np.diff(np.concatenate(([0.0], positions))))
+        strategy_returns = held * bar_returns - turnover * cost
+        symbol_returns.append(pd.Series(strategy_returns * weight, index=df.index))
+
+        for entry, exit_ in trades:
+            trade_returns.append(close[exit_] / close[entry] - 1.0 - 2 * cost)
+
+    portfolio = pd.concat(symbol_returns, axis=1).fillna(0.0).sum(axis=1).sort_index()
+    returns = portfolio.to_numpy()
+    equity = capital * np.cumprod(1.0 + returns)
+
+    total_return = equity[-1] / capital - 1.0
+    periods_per_year = TRADING_DAYS_PER_YEAR * BARS_PER_DAY.get(config.timeframe, 1)
+    if isinstance(portfolio.index, pd.DatetimeIndex):
+        days = max((portfolio.index[-1] - portfolio.index[0]).total_seconds() / 86400, 1.0)
+    else:
+        days = max(len(returns) / BARS_PER_DAY.get(config.timeframe, 1) * 365.25 / TRADING_DAYS_PER_YEAR, 1.0)
+    annualized_return = (1 + total_return) ** (365.25 / days) - 1 if total_return > -1 else -1.0
+
+    std = returns.std()
+    sharpe_ratio = returns.mean() / std * np.sqrt(periods_per_year) if std > 0 else 0.0
+    downside = returns[returns < 0]
+    downside_std = np.sqrt(np.mean(downside ** 2)) if len(downside) else 0.0
+    sortino_ratio = returns.mean() / downside_std * np.sqrt(periods_per_year) if downside_std > 0 else 0.0
+
+    running_max = np.maximum.accumulate(equity)
+    max_drawdown = float(np.min((equity - running_max) / running_max))
+
+    trade_pnl = np.asarray(trade_returns) * capital * weight
+    wins = trade_pnl[trade_pnl > 0]
+    losses = trade_pnl[trade_pnl <= 0]
+    num_trades = len(trade_pnl)
+    gross_loss = abs(losses.sum())
+
+    return BacktestResult(
+        strategy_name=config.strategy_name,
+        parameters=config.parameters,
+        total_return=float(total_return),
+        annualized_return=float(annualized_return),
+        sharpe_ratio=float(sharpe_ratio),
+        sortino_ratio=float(sortino_ratio),
+        max_drawdown=max_drawdown,
+        win_rate=len(wins) / num_trades if num_trades else 0.0,
+        profit_factor=float(wins.sum() / gross_loss) if gross_loss > 0 else 0.0,
+        total_trades=num_trades,
+        winning_trades=len(wins),
+        losing_trades=len(losses),
+        avg_trade=float(trade_pnl.mean()) if num_trades else 0.0,
+        avg_win=float(wins.mean()) if len(wins) else 0.0,
+        avg_loss=float(losses.mean()) if len(losses) else 0.0,
+        final_capital=float(equity[-1]),
+        total_pnl=float(equity[-1] - capital),
+        execution_time_seconds=0
+    )
+
+
+# ============================================================================
+# Shared-memory market data for process pools
+# ============================================================================
+
+class SharedMarketData:
+    """
+    Market data packed into one shared memory block for worker processes
+
+    All symbols are stored as a single (rows, 5) float64 OHLCV array plus an
+    int64 nanosecond timestamp array. Workers attach by name through
+    ``descriptor`` and wrap read-only slices as DataFrames, so the data is
+    never pickled per task. The creating process must call ``close()``,
+    which also unlinks the block.
+    """
+
+    def __init__(self, frames: Dict[str, pd.DataFrame]):
+        rows = sum(len(df) for df in frames.values())
+        self._values_shm = shared_memory.SharedMemory(create=True, size=max(rows * 5 * 8, 1))
+        self._ts_shm = shared_memory.SharedMemory(create=True, size=max(rows * 8, 1))
+        values = np.ndarray((rows, 5), dtype=np.float64, buffer=self._values_shm.buf)
+        ts = np.ndarray((rows,), dtype=np.int64, buffer=self._ts_shm.buf)
+
+        self.layout: Dict[str, Tuple[int, int, Optional[tzinfo]]] = {}
+        offset = 0
+        for symbol, df in frames.items():
+            n = len(df)
+            index = pd.DatetimeIndex(df.index).as_unit('ns')
+            ts[offset:offset + n] = index.asi8
+            for i, col in enumerate(OHLCV_COLUMNS):
+                values[offset:offset + n, i] = (
+                    df[col].to_numpy(dtype=float) if col in df.columns else np.nan
+                )
+            # The tzinfo itself (it pickles); str() of Kite's tzoffset is not a zone name
+            self.layout[symbol] = (offset, offset + n, index.tz)
+            offset += n
+        self.rows = rows
+        del values, ts
+
+    @property
+    def descriptor(self) -> Dict[str, Any]:
+        """Picklable handle passed to worker initializers"""
+        return {
+            'values': self._values_shm.name,
+            'ts': self._ts_shm.name,
+            'rows': self.rows,
+            'layout': self.layout,
+        }
+
+    @staticmethod
+    def attach(descriptor: Dict[str, Any]) -> Tuple[List[shared_memory.SharedMemory], Dict[str, pd.DataFrame]]:
+        """Open a descriptor and build zero-copy, read-only frames per symbol"""
+        values_shm = shared_memory.SharedMemory(name=descriptor['values'])
+        ts_shm = shared_memory.SharedMemory(name=descriptor['ts'])
+        rows = descriptor['rows']
+        values = np.ndarray((rows, 5), dtype=np.float64, buffer=values_shm.buf)
+        ts = np.ndarray((rows,), dtype=np.int64, buffer=ts_shm.buf)
+        values.flags.writeable = False
+
+        frames = {}
+        for symbol, (lo, hi, tz) in descriptor['layout'].items():
+            index = pd.DatetimeIndex(ts[lo:hi].copy(), name='date')
+            if tz is not None:
+                index = index.tz_localize('UTC').tz_convert(tz)
+            frames[symbol] = pd.DataFrame(values[lo:hi], index=index, columns=OHLCV_COLUMNS, copy=False)
+        return [values_shm, ts_shm], frames
+
+    def close(self):
+        """Release and unlink the shared blocks"""
+        for shm in (self._values_shm, self._ts_shm):
+            shm.close()
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+# Per-worker state set by _init_worker
+_worker_frames: Dict[str, pd.DataFrame] = {}
+_worker_segments: List[shared_memory.SharedMemory] = []
+
+
+def _init_worker(descriptor: Dict[str, Any]):
+    """Process pool initializer: attach the shared market data once per worker"""
+    global _worker_frames, _worker_segments
+    _worker_segments, _worker_frames = SharedMarketData.attach(descriptor)
+
+
+def _run_in_worker(config: BacktestConfig, strategy_fn: Callable) -> Tuple[Optional[BacktestResult], Optional[str]]:
+    """Process pool task; errors are returned rather than raised so one bad combination does not abort a batch"""
+    start_time = time.time()
+    try:
+        result = simulate_strategy(config, strategy_fn, _worker_frames)
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+    result.execution_time_seconds = time.time() - start_time
+    return result, None
+
+
 class ParallelBacktestEngine:
     """
     Parallel Backtesting Engine
 
     Features:
-    - Multi-threaded strategy execution
+    - Multi-threaded or multi-process strategy execution
+    - Real strategy simulation over OHLCV from the local candle store
     - Parameter grid optimization
     - Monte Carlo simulation
     - Walk-forward analysis
@@ -143,13 +481,21 @@ class ParallelBacktestEngine:
             strategy_fn,
             parameter_grids
         )
+
+    ``strategy_fn`` is a ``core.vectorized_backtester.Strategy`` (instance or
+    subclass built from ``config.parameters``) or ``fn(config, data)``
+    returning per-bar signals. With ``use_processes=True`` market data is
+    placed in shared memory once per batch and workers read it in place;
+    strategies must then be picklable (module-level) and must not modify
+    the input frame in place. Unpicklable strategies fall back to threads.
     """
 
     def __init__(
         self,
         max_workers: Optional[int] = None,
         use_processes: bool = False,
-        cache_results: bool = True
+        cache_results: bool = True,
+        candle_store=None
     ):
         """
         Initialize parallel backtesting engine
@@ -158,11 +504,14 @@ class ParallelBacktestEngine:
             max_workers: Maximum parallel workers (default: CPU count)
             use_processes: Use processes instead of threads (for CPU-intensive)
             cache_results: Cache backtest results
+            candle_store: data.candle_store.CandleStore used to load market
+                data (default: the store under data/cache/candles)
         """
         import multiprocessing
         self.max_workers = max_workers or multiprocessing.cpu_count()
         self.use_processes = use_processes
         self.cache_results = cache_results
+        self.candle_store = candle_store
 
         # Result cache
         self._results_cache: Dict[str, BacktestResult] = {}
@@ -180,7 +529,7 @@ class ParallelBacktestEngine:
         self,
         config: BacktestConfig,
         strategy_fn: Callable,
-        market_data: Optional[pd.DataFrame] = None
+        market_data: Optional[MarketData] = None
     ) -> BacktestResult:
         """
         Run single backtest
@@ -188,13 +537,23 @@ class ParallelBacktestEngine:
         Args:
             config: Backtest configuration
             strategy_fn: Strategy function to test
-            market_data: Historical market data (optional)
+            market_data: OHLCV frame, or symbol -> frame (default: load from store)
 
         Returns:
             BacktestResult
         """
-        cache_key = self._get_cache_key(config)
+        data_key = None if market_data is None else _data_fingerprint(_symbol_frames(market_data, config.symbols))
+        return self._run_backtest(config, strategy_fn, market_data,
+                                  self._get_cache_key(config, strategy_fn, data_key))
 
+    def _run_backtest(
+        self,
+        config: BacktestConfig,
+        strategy_fn: Callable,
+        market_data: Optional[MarketData],
+        cache_key: str
+    ) -> BacktestResult:
+        """run_backtest with a precomputed cache key"""
         # Check cache
         if self.cache_results and cache_key in self._results_cache:
             logger.info(f"📋 Using cached result for {config.strategy_name}")
@@ -237,7 +596,7 @@ class ParallelBacktestEngine:
         self,
         configs: List[BacktestConfig],
         strategy_fns: List[Callable],
-        market_data: Optional[pd.DataFrame] = None
+        market_data: Optional[MarketData] = None
     ) -> List[BacktestResult]:
         """
         Compare multiple strategies in parallel
@@ -260,30 +619,10 @@ class ParallelBacktestEngine:
             market_data = self._load_market_data(configs[0])
 
         # Execute in parallel
-        results = []
-
-        executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
-
-        with executor_class(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            futures = {
-                executor.submit(
-                    self.run_backtest,
-                    config,
-                    strategy_fn,
-                    market_data
-                ): config.strategy_name
-                for config, strategy_fn in zip(configs, strategy_fns)
-            }
-
-            # Collect results as they complete
-            for future in as_completed(futures):
-                strategy_name = futures[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    logger.error(f"❌ Strategy {strategy_name} failed: {e}")
+        results = [
+            result for _, result in self._run_many(configs, strategy_fns, market_data)
+            if result is not None
+        ]
 
         # Sort by performance score
         results.sort(key=lambda r: r.score(), reverse=True)
@@ -297,7 +636,7 @@ class ParallelBacktestEngine:
         base_config: BacktestConfig,
         strategy_fn: Callable,
         parameter_grids: List[ParameterGrid],
-        market_data: Optional[pd.DataFrame] = None,
+        market_data: Optional[MarketData] = None,
         top_n: int = 5
     ) -> List[Tuple[Dict[str, Any], BacktestResult]]:
         """
@@ -334,34 +673,24 @@ class ParallelBacktestEngine:
                 initial_capital=base_config.initial_capital,
                 symbols=base_config.symbols,
                 timeframe=base_config.timeframe,
-                parameters=params
+                commission=base_config.commission,
+                slippage=base_config.slippage,
+                parameters=params,
+                max_position_size=base_config.max_position_size,
+                stop_loss_pct=base_config.stop_loss_pct,
+                take_profit_pct=base_config.take_profit_pct
             )
             configs.append(config)
 
         # Run parallel backtests
-        results = []
-
-        executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
-
-        with executor_class(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(
-                    self.run_backtest,
-                    config,
-                    strategy_fn,
-                    market_data
-                ): (config, config.parameters)
-                for config in configs
-            }
-
-            # Collect results
-            for future in as_completed(futures):
-                config, params = futures[future]
-                try:
-                    result = future.result()
-                    results.append((params, result))
-                except Exception as e:
-                    logger.error(f"❌ Parameter combination failed: {e}")
+        results = [
+            (config.parameters, result)
+            for config, result in self._run_many(configs, [strategy_fn] * len(configs), market_data)
+            if result is not None
+        ]
+        if not results:
+            logger.error("❌ Parameter optimization produced no results")
+            return []
 
         # Sort by score
         results.sort(key=lambda x: x[1].score(), reverse=True)
@@ -467,91 +796,127 @@ class ParallelBacktestEngine:
 
         return combinations
 
+    def _run_many(
+        self,
+        configs: List[BacktestConfig],
+        strategy_fns: List[Callable],
+        market_data: Optional[MarketData]
+    ) -> List[Tuple[BacktestConfig, Optional[BacktestResult]]]:
+        """
+        Run many backtests over the same market data
+
+        Threads share the frames directly. Processes attach to one
+        SharedMarketData block via the pool initializer, so only configs and
+        results cross the process boundary. Failed runs are logged and
+        returned with a None result.
+        """
+        frames = _symbol_frames(market_data, configs[0].symbols if configs else [])
+        data_key = _data_fingerprint(frames)
+        keys = [self._get_cache_key(config, strategy_fn, data_key)
+                for config, strategy_fn in zip(configs, strategy_fns)]
+        outcomes: Dict[int, Optional[BacktestResult]] = {}
+        pending = []
+        for i in range(len(keys)):
+            cached = self._results_cache.get(keys[i]) if self.cache_results else None
+            if cached is not None:
+                outcomes[i] = cached
+            else:
+                pending.append(i)
+
+        use_processes = self.use_processes and len(pending) > 1 and bool(frames)
+        if use_processes:
+            try:
+                for fn in {id(strategy_fns[i]): strategy_fns[i] for i in pending}.values():
+                    pickle.dumps(fn)
+            except Exception as e:
+                logger.warning(f"Strategy is not picklable ({e}); running in threads")
+                use_processes = False
+
+        if use_processes:
+            shared = SharedMarketData(frames)
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers, initializer=_init_worker,
+                                         initargs=(shared.descriptor,)) as executor:
+                    futures = {
+                        executor.submit(_run_in_worker, configs[i], strategy_fns[i]): i
+                        for i in pending
+                    }
+                    for future in as_completed(futures):
+                        i = futures[future]
+                        try:
+                            result, error = future.result()
+                        except Exception as e:
+                            result, error = None, str(e)
+                        if error:
+                            logger.error(f"❌ Backtest {configs[i].strategy_name} failed: {error}")
+                        else:
+                            self._record(keys[i], result)
+                        outcomes[i] = result
+            finally:
+                shared.close()
+        elif pending:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = {
+                    executor.submit(self._run_backtest, configs[i], strategy_fns[i], frames or None, keys[i]): i
+                    for i in pending
+                }
+                for future in as_completed(futures):
+                    i = futures[future]
+                    try:
+                        outcomes[i] = future.result()
+                    except Exception as e:
+                        logger.error(f"❌ Backtest {configs[i].strategy_name} failed: {e}")
+                        outcomes[i] = None
+
+        return [(configs[i], outcomes.get(i)) for i in range(len(configs))]
+
+    def _record(self, cache_key: str, result: BacktestResult):
+        """Cache a result produced outside run_backtest and update statistics"""
+        if self.cache_results:
+            self._results_cache[cache_key] = result
+        self.total_backtests += 1
+        self.total_execution_time += result.execution_time_seconds
+
     def _execute_strategy(
         self,
         config: BacktestConfig,
         strategy_fn: Callable,
-        market_data: pd.DataFrame
+        market_data: MarketData
     ) -> BacktestResult:
+        """Execute strategy over the market data and calculate metrics"""
+        return simulate_strategy(config, strategy_fn, _symbol_frames(market_data, config.symbols))
+
+    def _load_market_data(self, config: BacktestConfig) -> Dict[str, pd.DataFrame]:
+        """Load OHLCV for the configured symbols and window from the local candle store"""
+        if self.candle_store is None:
+            from data.candle_store import CandleStore
+            self.candle_store = CandleStore()
+
+        frames = {}
+        for symbol in config.symbols:
+            try:
+                df = self.candle_store.read(symbol, config.timeframe,
+                                            start=config.start_date, end=config.end_date)
+            except Exception as e:
+                logger.warning(f"Could not load {symbol} {config.timeframe}: {e}")
+                continue
+            if df.empty:
+                logger.warning(f"No stored {config.timeframe} candles for {symbol}")
+                continue
+            frames[symbol] = df
+        return frames
+
+    def _get_cache_key(self, config: BacktestConfig, strategy_fn: Callable,
+                       data_key: Optional[str] = None) -> str:
         """
-        Execute strategy and calculate metrics
+        Generate cache key for a config, strategy and market data
 
-        This is a simplified implementation - in production,
-        this would use the full trading system simulation
+        ``data_key`` is the _data_fingerprint of caller-supplied data; None
+        means the data is loaded from the candle store for the config.
         """
-        # Simulate strategy execution
-        # In real implementation, this would call the actual strategy
-
-        # For demonstration, generate synthetic results
-        np.random.seed(hash(str(config.parameters)) % 2**32)
-
-        num_trades = np.random.randint(50, 200)
-        win_rate = 0.45 + np.random.random() * 0.15  # 45-60%
-        avg_win = 0.02 + np.random.random() * 0.02   # 2-4%
-        avg_loss = -0.01 - np.random.random() * 0.01  # -1% to -2%
-
-        winning_trades = int(num_trades * win_rate)
-        losing_trades = num_trades - winning_trades
-
-        total_pnl = (winning_trades * avg_win + losing_trades * avg_loss) * config.initial_capital
-        total_return = total_pnl / config.initial_capital
-
-        # Calculate Sharpe ratio (simplified)
-        daily_returns = np.random.normal(total_return / 252, 0.02, 252)
-        sharpe_ratio = np.mean(daily_returns) / np.std(daily_returns) * np.sqrt(252)
-
-        # Calculate max drawdown
-        cumulative = np.cumprod(1 + daily_returns)
-        running_max = np.maximum.accumulate(cumulative)
-        drawdown = (cumulative - running_max) / running_max
-        max_drawdown = np.min(drawdown)
-
-        # Annualized return
-        days = (config.end_date - config.start_date).days
-        annualized_return = (1 + total_return) ** (365.25 / days) - 1
-
-        # Profit factor
-        gross_profit = winning_trades * avg_win * config.initial_capital
-        gross_loss = abs(losing_trades * avg_loss * config.initial_capital)
-        profit_factor = gross_profit / gross_loss if gross_loss > 0 else 0
-
-        # Sortino ratio (simplified, same as Sharpe for this demo)
-        sortino_ratio = sharpe_ratio
-
-        result = BacktestResult(
-            strategy_name=config.strategy_name,
-            parameters=config.parameters,
-            total_return=total_return,
-            annualized_return=annualized_return,
-            sharpe_ratio=sharpe_ratio,
-            sortino_ratio=sortino_ratio,
-            max_drawdown=max_drawdown,
-            win_rate=win_rate,
-            profit_factor=profit_factor,
-            total_trades=num_trades,
-            winning_trades=winning_trades,
-            losing_trades=losing_trades,
-            avg_trade=total_pnl / num_trades,
-            avg_win=avg_win * config.initial_capital,
-            avg_loss=avg_loss * config.initial_capital,
-            final_capital=config.initial_capital + total_pnl,
-            total_pnl=total_pnl,
-            execution_time_seconds=0
-        )
-
-        return result
-
-    def _load_market_data(self, config: BacktestConfig) -> pd.DataFrame:
-        """Load historical market data"""
-        # In production, this would load actual market data
-        # For now, return empty dataframe
-        return pd.DataFrame()
-
-    def _get_cache_key(self, config: BacktestConfig) -> str:
-        """Generate cache key for config"""
-        import hashlib
         config_str = json.dumps(asdict(config), sort_keys=True, default=str)
-        return hashlib.sha256(config_str.encode()).hexdigest()
+        key = f"{config_str}|{_strategy_identity(strategy_fn)}|{data_key or 'store'}"
+        return hashlib.sha256(key.encode()).hexdigest()
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get engine statistics"""
@@ -601,19 +966,28 @@ if __name__ == "__main__":
 
     engine = ParallelBacktestEngine(max_workers=4)
 
+    # Synthetic daily random walk in place of stored candles
+    index = pd.date_range(datetime.now() - timedelta(days=365), periods=365, freq='D', name='date')
+    close = 100 * np.exp(np.cumsum(np.random.normal(0.0005, 0.015, len(index))))
+    market_data = pd.DataFrame({'open': close, 'high': close * 1.01, 'low': close * 0.99,
+                                'close': close, 'volume': 1e6}, index=index)
+
     # Test 1: Single backtest
     print("1. Single Backtest")
     config = BacktestConfig(
         strategy_name="MA_Crossover",
         start_date=datetime.now() - timedelta(days=365),
         end_date=datetime.now(),
+        timeframe='day',
         parameters={'fast_ma': 10, 'slow_ma': 30}
     )
 
     def dummy_strategy(config, data):
-        return None
+        fast = data['close'].rolling(config.parameters.get('fast_ma', 10)).mean()
+        slow = data['close'].rolling(config.parameters.get('slow_ma', 30)).mean()
+        return np.sign(fast - slow).diff().fillna(0).clip(-1, 1)
 
-    result = engine.run_backtest(config, dummy_strategy)
+    result = engine.run_backtest(config, dummy_strategy, market_data)
     print(f"Result: Return={result.total_return:.2%}, Sharpe={result.sharpe_ratio:.2f}\n")
 
     # Test 2: Strategy comparison
@@ -623,12 +997,13 @@ if __name__ == "__main__":
             strategy_name=f"Strategy_{i}",
             start_date=datetime.now() - timedelta(days=365),
             end_date=datetime.now(),
-            parameters={'param': i}
+            timeframe='day',
+            parameters={'fast_ma': 5 + i, 'slow_ma': 30}
         )
         for i in range(5)
     ]
 
-    results = engine.compare_strategies(configs, [dummy_strategy] * 5)
+    results = engine.compare_strategies(configs, [dummy_strategy] * 5, market_data)
     engine.print_results_table(results)
 
     # Test 3: Parameter optimization
@@ -642,6 +1017,7 @@ if __name__ == "__main__":
         config,
         dummy_strategy,
         parameter_grids,
+        market_data=market_data,
         top_n=3
     )
 
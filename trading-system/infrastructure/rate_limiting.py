@@ -2,17 +2,267 @@
 """
 Rate Limiting and Circuit Breaker for API protection
 Prevents API throttling and cascading failures
+
+RateLimitEngine is the token-bucket core shared by EnhancedRateLimiter,
+APIRateLimiter and core.async_rate_limiter.AsyncRateLimiter.
 """
 
+import asyncio
+import bisect
 import threading
 import time
-from collections import defaultdict, deque
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger('trading_system.rate_limiting')
 
 
+# Published Kite Connect limits per endpoint: (requests, period seconds) rules
+KITE_ENDPOINT_LIMITS: Dict[str, List[Tuple[int, float]]] = {
+    'quote': [(1, 1.0)],
+    'ltp': [(1, 1.0)],
+    'ohlc': [(1, 1.0)],
+    'historical_data': [(3, 1.0)],
+    'place_order': [(10, 1.0), (200, 60.0)],
+    'modify_order': [(10, 1.0)],
+    'cancel_order': [(10, 1.0)],
+    'default': [(10, 1.0)],
+}
+
+
+class TokenBucket:
+    """
+    Token bucket that can be reserved into debt
+
+    ``reserve`` takes tokens even when they are not there yet and returns how
+    long the caller must wait for them; the deficit pushes later reservations
+    further out, which makes the bucket a virtual FIFO schedule (equivalent to
+    GCRA). Not thread-safe on its own; RateLimitEngine serializes access.
+    """
+
+    def __init__(self, capacity: float, tokens: Optional[float] = None, fill_rate: float = 1.0,
+                 last_update: Optional[float] = None):
+        """
+        Args:
+            capacity: Maximum tokens (burst size)
+            tokens: Initial tokens (defaults to a full bucket)
+            fill_rate: Tokens added per second
+            last_update: Monotonic time of the last refill
+        """
+        self.capacity = capacity
+        self.tokens = capacity if tokens is None else tokens
+        self.fill_rate = fill_rate
+        self.last_update = time.monotonic() if last_update is None else last_update
+
+    @classmethod
+    def spacing(cls, requests: int, period: float) -> 'TokenBucket':
+        """At most ``requests`` per ``period`` in any window: evenly spaced calls, no burst"""
+        return cls(capacity=1.0, fill_rate=requests / period)
+
+    def _refill(self, now: Optional[float] = None):
+        """Refill tokens based on elapsed time"""
+        now = time.monotonic() if now is None else now
+        elapsed = now - self.last_update
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.fill_rate)
+            self.last_update = now
+
+    def wait_time(self, tokens: float = 1.0, now: Optional[float] = None) -> float:
+        """Seconds until ``tokens`` are available (0 if available now)"""
+        self._refill(now)
+        if self.tokens >= tokens:
+            return 0.0
+        return (tokens - self.tokens) / self.fill_rate
+
+    def consume(self, tokens: float = 1.0) -> bool:
+        """Take tokens only if available now"""
+        self._refill()
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+
+    def reserve(self, tokens: float = 1.0, now: Optional[float] = None) -> float:
+        """Take tokens now, possibly into debt; returns the wait before they are usable"""
+        delay = self.wait_time(tokens, now)
+        self.tokens -= tokens
+        return delay
+
+    def __repr__(self) -> str:
+        return f"TokenBucket(capacity={self.capacity}, tokens={self.tokens:.3f}, fill_rate={self.fill_rate})"
+
+
+class RateLimitEngine:
+    """
+    Shared token-bucket core for the rate limiters
+
+    Each key has one or more TokenBuckets that must all admit a call.
+    ``reserve`` commits the call against every bucket in one short critical
+    section and returns the exact delay until its slot, so callers sleep once
+    (``time.sleep`` or ``asyncio.sleep``) and wake when capacity exists
+    instead of polling. Reservations are granted in arrival order, so sync and
+    asyncio waiters share one fair FIFO schedule. Nothing sleeps while the
+    lock is held.
+    """
+
+    # Upper bounds (ms) of the wait-time histogram buckets
+    WAIT_HISTOGRAM_MS = (0, 1, 5, 10, 50, 100, 250, 500, 1000, 2500, 5000, float('inf'))
+
+    def __init__(self, default_limits: Optional[Callable[[str], List[TokenBucket]]] = None):
+        """
+        Args:
+            default_limits: Builds the buckets for a key seen for the first time;
+                None leaves unknown keys unlimited
+        """
+        self.default_limits = default_limits
+        self._limits: Dict[str, List[TokenBucket]] = {}
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_kite(cls, endpoint_limits: Optional[Dict[str, List[Tuple[int, float]]]] = None) -> 'RateLimitEngine':
+        """Engine with per-endpoint Kite limits; unknown endpoints get the 'default' rules"""
+        endpoint_limits = endpoint_limits or KITE_ENDPOINT_LIMITS
+
+        def limits(key: str) -> List[TokenBucket]:
+            rules = endpoint_limits.get(key, endpoint_limits['default'])
+            return [TokenBucket.spacing(requests, period) for requests, period in rules]
+
+        return cls(limits)
+
+    def set_limits(self, key: str, buckets: List[TokenBucket]):
+        with self._lock:
+            self._limits[key] = list(buckets)
+
+    def has_limits(self, key: str) -> bool:
+        with self._lock:
+            return key in self._limits
+
+    def _buckets_locked(self, key: str) -> List[TokenBucket]:
+        buckets = self._limits.get(key)
+        if buckets is None:
+            buckets = self.default_limits(key) if self.default_limits else []
+            self._limits[key] = buckets
+        return buckets
+
+    def _stats_locked(self, key: str) -> Dict[str, Any]:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = {
+                'granted': 0,
+                'rejected': 0,
+                'throttled': 0,
+                'total_wait_time': 0.0,
+                'first_grant': None,
+                'last_grant': None,
+                'wait_histogram': [0] * len(self.WAIT_HISTOGRAM_MS),
+            }
+            self._stats[key] = stats
+        return stats
+
+    def delay(self, key: str, cost: float = 1.0) -> float:
+        """Seconds until a call would be admitted, without reserving it"""
+        now = time.monotonic()
+        with self._lock:
+            return max((b.wait_time(cost, now) for b in self._buckets_locked(key)), default=0.0)
+
+    def reserve(self, key: str, cost: float = 1.0, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Reserve the next slot for key
+
+        Returns:
+            Seconds to wait before making the call, or None (nothing reserved)
+            if that would exceed max_wait
+        """
+        now = time.monotonic()
+        with self._lock:
+            buckets = self._buckets_locked(key)
+            wait = max((b.wait_time(cost, now) for b in buckets), default=0.0)
+            stats = self._stats_locked(key)
+            if max_wait is not None and wait > max_wait:
+                stats['rejected'] += 1
+                return None
+            for bucket in buckets:
+                bucket.reserve(cost, now)
+
+            stats['granted'] += 1
+            start = now + wait
+            if stats['first_grant'] is None:
+                stats['first_grant'] = start
+            stats['last_grant'] = max(start, stats['last_grant'] or start)
+            if wait > 0:
+                stats['throttled'] += 1
+                stats['total_wait_time'] += wait
+            stats['wait_histogram'][bisect.bisect_left(self.WAIT_HISTOGRAM_MS, wait * 1000)] += 1
+            return wait
+
+    def record(self, key: str, cost: float = 1.0):
+        """Count a call made without reserving (takes its tokens, into debt if needed)"""
+        now = time.monotonic()
+        with self._lock:
+            for bucket in self._buckets_locked(key):
+                bucket.reserve(cost, now)
+
+    def acquire(self, key: str, cost: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """Block until the call may be made; False if that would take longer than timeout"""
+        wait = self.reserve(key, cost, max_wait=timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    async def acquire_async(self, key: str, cost: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """asyncio version of ``acquire``"""
+        wait = self.reserve(key, cost, max_wait=timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._limits)
+
+    def available_tokens(self, key: str) -> Optional[float]:
+        """Tokens left in the tightest bucket of key (0 while reservations are in debt); None if unlimited"""
+        now = time.monotonic()
+        with self._lock:
+            buckets = self._limits.get(key)
+            if not buckets:
+                return None
+            for bucket in buckets:
+                bucket._refill(now)
+            return max(0.0, min(bucket.tokens for bucket in buckets))
+
+    def get_stats(self, key: str) -> Dict[str, Any]:
+        """Throughput, throttling and wait-time histogram for a key"""
+        with self._lock:
+            stats = dict(self._stats_locked(key))
+            stats['wait_histogram'] = {
+                (f"<={bound:g}ms" if bound != float('inf') else f">{self.WAIT_HISTOGRAM_MS[-2]:g}ms"): count
+                for bound, count in zip(self.WAIT_HISTOGRAM_MS, stats['wait_histogram'])
+            }
+        first, last = stats.pop('first_grant'), stats.pop('last_grant')
+        span = (last - first) if first is not None else 0.0
+        stats['throughput_per_sec'] = (stats['granted'] - 1) / span if span > 0 else 0.0
+        stats['avg_wait_ms'] = stats['total_wait_time'] / stats['granted'] * 1000 if stats['granted'] else 0.0
+        return stats
+
+    def reset(self, key: Optional[str] = None, limits: bool = True):
+        """Drop state (and stats) for a key or all keys; limits=False keeps configured buckets"""
+        with self._lock:
+            if key is None:
+                self._stats.clear()
+                if limits:
+                    self._limits.clear()
+            else:
+                self._stats.pop(key, None)
+                if limits:
+                    self._limits.pop(key, None)
+
+
 class EnhancedRateLimiter:
     """
     Enhanced rate limiter with burst protection for Zerodha API
@@ -22,7 +272,11 @@ class EnhancedRateLimiter:
     - 1000 requests per minute
     - Burst protection: Max 5 requests in 100ms window
 
-    Thread-safe implementation for concurrent API calls.
+    Thread-safe implementation for concurrent API calls. Every "N requests
+    per T seconds" rule (including per-key ``endpoint_limits``) gets its own
+    GCRA spacing bucket (TokenBucket.spacing, one call per T/N) and a call
+    reserves against all of them, so no window of length T ever holds more
+    than N calls for any rule; callers wait exactly until their slot.
     """
 
     def __init__(
@@ -32,87 +286,82 @@ class EnhancedRateLimiter:
         burst_size: int = 5,
         burst_window: float = 0.1,
         min_interval: Optional[float] = None,
+        endpoint_limits: Optional[Dict[str, List[Tuple[int, float]]]] = None,
     ):
+        """
+        Args:
+            endpoint_limits: Extra per-key rules, e.g. KITE_ENDPOINT_LIMITS; a
+                'default' entry applies to keys without their own rules
+        """
         self.max_per_second = max_requests_per_second or 3
         self.max_per_minute = max_requests_per_minute or 1000
         self.max_burst = burst_size
         self.burst_window = burst_window
         self.min_interval = min_interval if min_interval is not None else (1.0 / self.max_per_second)
+        self.endpoint_limits = endpoint_limits or {}
 
-        self._burst_buckets = defaultdict(deque)
-        self._second_buckets = defaultdict(deque)
-        self._minute_buckets = defaultdict(deque)
-        self._last_call: Dict[str, float] = {}
+        self._engine = RateLimitEngine(self._key_limits)
 
         self.total_calls = 0
         self.total_waits = 0
         self._lock = threading.RLock()
 
-    def _cleanup_bucket(self, bucket: deque, window: float, now: float) -> None:
-        while bucket and (now - bucket[0]) > window:
-            bucket.popleft()
-
-    def _required_wait_time(self, key: str, now: float) -> float:
-        wait_time = 0.0
-
-        burst_bucket = self._burst_buckets[key]
-        self._cleanup_bucket(burst_bucket, self.burst_window, now)
-        if len(burst_bucket) >= self.max_burst:
-            wait_time = max(wait_time, (burst_bucket[0] + self.burst_window) - now)
-
-        second_bucket = self._second_buckets[key]
-        self._cleanup_bucket(second_bucket, 1.0, now)
-        if len(second_bucket) >= self.max_per_second:
-            wait_time = max(wait_time, (second_bucket[0] + 1.0) - now)
-
-        minute_bucket = self._minute_buckets[key]
-        self._cleanup_bucket(minute_bucket, 60.0, now)
-        if len(minute_bucket) >= self.max_per_minute:
-            wait_time = max(wait_time, (minute_bucket[0] + 60.0) - now)
-
+    def _key_limits(self, key: str) -> List[TokenBucket]:
+        rules = [(self.max_per_second, 1.0), (self.max_per_minute, 60.0), (self.max_burst, self.burst_window)]
         if self.min_interval:
-            last_call = self._last_call.get(key)
-            if last_call is not None:
-                wait_time = max(wait_time, (last_call + self.min_interval) - now)
-
-        return max(wait_time, 0.0)
+            rules.append((1, self.min_interval))
+        rules.extend(self.endpoint_limits.get(key, self.endpoint_limits.get('default', [])))
+        # Spacing, not burst-N buckets: a burst of N followed by refills would
+        # let up to 2N - 1 calls into one window of length T
+        return [TokenBucket.spacing(requests, period) for requests, period in rules]
 
     def can_make_request(self, key: str = 'default') -> bool:
-        with self._lock:
-            now = time.time()
-            return self._required_wait_time(key, now) <= 0.0
+        return self._engine.delay(key) <= 0.0
 
-    def wait_if_needed(self, key: str = 'default', timeout: float = 10.0) -> bool:
-        start_time = time.time()
+    def wait_if_needed(self, key: str = 'default', timeout: float = 10.0, record: bool = False) -> bool:
+        if record:
+            return self.acquire(key, timeout)
+
+        # Nothing is reserved here (the caller records the call), so other
+        # callers may take the slot while we sleep: re-check until it is free
+        deadline = time.monotonic() + timeout
+        waited = False
         while True:
-            with self._lock:
-                now = time.time()
-                wait_time = self._required_wait_time(key, now)
+            wait_time = self._engine.delay(key)
             if wait_time <= 0:
                 return True
-            if (time.time() - start_time) + wait_time > timeout:
-                logger.error(
-                    "❌ Rate limit timeout after %.2fs for key '%s' - API overloaded",
-                    timeout,
-                    key,
-                )
+            if time.monotonic() + wait_time > deadline:
+                self._log_timeout(key, timeout)
                 return False
-            self.total_waits += 1
-            time.sleep(min(wait_time, 0.1))
+            if not waited:
+                waited = True
+                with self._lock:
+                    self.total_waits += 1
+            time.sleep(wait_time)
+
+    def _log_timeout(self, key: str, timeout: float):
+        logger.error(
+            "❌ Rate limit timeout after %.2fs for key '%s' - API overloaded",
+            timeout,
+            key,
+        )
 
     def record_request(self, key: str = 'default') -> None:
+        self._engine.record(key)
         with self._lock:
-            now = time.time()
-            self._burst_buckets[key].append(now)
-            self._second_buckets[key].append(now)
-            self._minute_buckets[key].append(now)
-            self._last_call[key] = now
             self.total_calls += 1
 
     def acquire(self, key: str = 'default', timeout: float = 10.0) -> bool:
-        if not self.wait_if_needed(key, timeout):
+        wait_time = self._engine.reserve(key, max_wait=timeout)
+        if wait_time is None:
+            self._log_timeout(key, timeout)
             return False
-        self.record_request(key)
+        with self._lock:
+            self.total_calls += 1
+            if wait_time > 0:
+                self.total_waits += 1
+        if wait_time > 0:
+            time.sleep(wait_time)
         return True
 
     def wait(self, key: str = 'default', timeout: float = 10.0) -> bool:
@@ -132,26 +381,20 @@ class EnhancedRateLimiter:
             return wrapper
         return decorator
 
-    def get_stats(self) -> Dict[str, float]:
+    def get_stats(self) -> Dict[str, Any]:
+        keys = self._engine.keys()
         with self._lock:
             return {
                 'total_calls': self.total_calls,
                 'total_waits': self.total_waits,
-                'active_keys': len(self._last_call),
+                'active_keys': len(keys),
+                'keys': {key: self._engine.get_stats(key) for key in keys},
             }
 
     def reset(self, key: Optional[str] = None) -> None:
-        with self._lock:
-            if key:
-                self._burst_buckets.pop(key, None)
-                self._second_buckets.pop(key, None)
-                self._minute_buckets.pop(key, None)
-                self._last_call.pop(key, None)
-            else:
-                self._burst_buckets.clear()
-                self._second_buckets.clear()
-                self._minute_buckets.clear()
-                self._last_call.clear()
+        self._engine.reset(key)
+        if not key:
+            with self._lock:
                 self.total_calls = 0
                 self.total_waits = 0
 
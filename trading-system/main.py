@@ -500,7 +500,8 @@ def main():
                 'https://localhost:8080' if args.mode == 'live' else 'http://localhost:8080'
             )
             time.sleep(2)
-            dashboard = DashboardConnector(base_url=dashboard_url, api_key=os.getenv("DASHBOARD_API_KEY"))
+            dashboard = DashboardConnector(base_url=dashboard_url, api_key=os.getenv("DASHBOARD_API_KEY"),
+                                           publish_async=True)
             if dashboard.is_connected:
                 print("✅ Dashboard connected")
                 print(f"📊 Monitor at: {dashboard_url}")
@@ -563,7 +564,8 @@ def main():
                         'https://localhost:8080' if fno_mode == "3" else 'http://localhost:8080'
                     )
                     time.sleep(2)
-                    dashboard = DashboardConnector(base_url=dashboard_url, api_key=os.getenv("DASHBOARD_API_KEY"))
+                    dashboard = DashboardConnector(base_url=dashboard_url, api_key=os.getenv("DASHBOARD_API_KEY"),
+                                                   publish_async=True)
                     if dashboard.is_connected:
                         print("✅ Dashboard connected")
                         print(f"📊 Monitor at: {dashboard_url}")
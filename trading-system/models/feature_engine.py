@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Rolling Feature Engine
+Keeps per-symbol indicator state so ML features for the latest candle are
+updated from new bars only, instead of recomputing the whole history.
+
+Features match MLDataBuilder._add_technical_features for the latest row.
+"""
+
+import copy
+import math
+import threading
+from collections import deque
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Model inputs produced by MLDataBuilder._add_technical_features, in column order
+FEATURE_COLUMNS = [
+    'volatility_20', 'rsi', 'macd_line', 'macd_signal', 'macd_hist',
+    'bb_upper', 'bb_lower', 'bb_position', 'atr', 'atr_pct', 'roc_10'
+]
+
+
+def _ema_step(previous: Optional[float], value: float, span: int) -> float:
+    """One step of pandas ewm(span=..., adjust=False).mean()"""
+    if previous is None:
+        return value
+    alpha = 2.0 / (span + 1)
+    return alpha * value + (1 - alpha) * previous
+
+
+def _mean(values) -> float:
+    return math.fsum(values) / len(values)
+
+
+def _sample_std(values) -> float:
+    mean = _mean(values)
+    return math.sqrt(math.fsum((v - mean) ** 2 for v in values) / (len(values) - 1))
+
+
+def _divide(numerator: float, denominator: float) -> float:
+    """Float division with pandas semantics (x/0 -> +-inf, 0/0 -> NaN)"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return float(np.float64(numerator) / np.float64(denominator))
+
+
+class _SymbolState:
+    """Indicator state for one symbol after its last committed bar"""
+
+    def __init__(self):
+        self.last_index = None
+        self.last_close: Optional[float] = None
+        self.returns = deque(maxlen=20)
+        self.gains = deque(maxlen=14)
+        self.losses = deque(maxlen=14)
+        self.closes = deque(maxlen=20)
+        self.true_ranges = deque(maxlen=14)
+        self.roc_closes = deque(maxlen=11)
+        self.ema12: Optional[float] = None
+        self.ema26: Optional[float] = None
+        self.macd_signal: Optional[float] = None
+
+    def update(self, index, high: float, low: float, close: float) -> Dict[str, float]:
+        """Advance by one bar and return that bar's features"""
+        prev_close = self.last_close
+        if prev_close is not None:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                self.returns.append(float(np.log(_divide(close, prev_close))))
+            delta = close - prev_close
+            true_range = max(high - low, abs(high - prev_close), abs(low - prev_close))
+        else:
+            delta = float('nan')
+            true_range = high - low
+        # Matches delta.where(delta > 0, 0): the first bar contributes 0
+        self.gains.append(delta if delta > 0 else 0.0)
+        self.losses.append(-delta if delta < 0 else 0.0)
+        self.true_ranges.append(true_range)
+        self.closes.append(close)
+        self.roc_closes.append(close)
+
+        self.ema12 = _ema_step(self.ema12, close, 12)
+        self.ema26 = _ema_step(self.ema26, close, 26)
+        macd_line = self.ema12 - self.ema26
+        self.macd_signal = _ema_step(self.macd_signal, macd_line, 9)
+
+        self.last_index = index
+        self.last_close = close
+
+        nan = float('nan')
+        volatility = _sample_std(self.returns) if len(self.returns) == 20 else nan
+
+        rsi = nan
+        if len(self.gains) == 14:
+            rs = _divide(_mean(self.gains), _mean(self.losses))
+            rsi = 100 - _divide(100, 1 + rs)
+
+        bb_upper = bb_lower = bb_position = nan
+        if len(self.closes) == 20:
+            sma, std = _mean(self.closes), _sample_std(self.closes)
+            bb_upper, bb_lower = sma + std * 2, sma - std * 2
+            bb_position = _divide(close - bb_lower, bb_upper - bb_lower)
+
+        atr = _mean(self.true_ranges) if len(self.true_ranges) == 14 else nan
+        roc = _divide(close, self.roc_closes[0]) - 1 if len(self.roc_closes) == 11 else nan
+
+        return {
+            'volatility_20': volatility,
+            'rsi': rsi,
+            'macd_line': macd_line,
+            'macd_signal': self.macd_signal,
+            'macd_hist': macd_line - self.macd_signal,
+            'bb_upper': bb_upper,
+            'bb_lower': bb_lower,
+            'bb_position': bb_position,
+            'atr': atr,
+            'atr_pct': _divide(atr, close),
+            'roc_10': roc,
+        }
+
+
+class RollingFeatureEngine:
+    """
+    Incremental ML features per symbol
+
+    Each call to ``update`` commits the bars that arrived since the previous
+    call and evaluates the final bar on a copy of the state, so a candle that
+    is still forming can be re-scored with new prices without being counted
+    twice. If the supplied history no longer lines up with the stored state
+    (a gap, an edited bar, an older frame), the symbol is rebuilt from the
+    frame.
+    """
+
+    def __init__(self, feature_columns: Optional[List[str]] = None):
+        self.feature_columns = list(feature_columns or FEATURE_COLUMNS)
+        unknown = [c for c in self.feature_columns if c not in FEATURE_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unsupported feature columns: {unknown}")
+        self._states: Dict[str, _SymbolState] = {}
+        self._lock = threading.Lock()
+
+    def update(self, symbol: str, df: pd.DataFrame) -> np.ndarray:
+        """
+        Features of the latest candle in df
+
+        Returns:
+            float64 array ordered like ``feature_columns`` (NaN where an
+            indicator lacks history)
+        """
+        high = df['high'].to_numpy(dtype=float)
+        low = df['low'].to_numpy(dtype=float)
+        close = df['close'].to_numpy(dtype=float)
+        index = df.index
+
+        with self._lock:
+            state = self._states.get(symbol)
+
+        start = self._resume_position(state, index, close)
+        if start is None:
+            state, start = _SymbolState(), 0
+
+        for i in range(start, len(df) - 1):
+            state.update(index[i], high[i], low[i], close[i])
+        with self._lock:
+            self._states[symbol] = state
+
+        latest = copy.deepcopy(state).update(index[-1], high[-1], low[-1], close[-1])
+        return np.array([latest[c] for c in self.feature_columns], dtype=float)
+
+    @staticmethod
+    def _resume_position(state: Optional[_SymbolState], index: pd.Index, close: np.ndarray) -> Optional[int]:
+        """First row of df not yet committed to state, or None to rebuild"""
+        if state is None or state.last_index is None or not index.is_monotonic_increasing:
+            return None
+        position = index.searchsorted(state.last_index, side='right')
+        if position == 0 or position >= len(index) or index[position - 1] != state.last_index:
+            return None
+        if close[position - 1] != state.last_close:
+            return None
+        return position
+
+    def reset(self, symbol: Optional[str] = None):
+        """Drop stored state for one symbol, or for all of them"""
+        with self._lock:
+            if symbol is None:
+                self._states.clear()
+            else:
+                self._states.pop(symbol, None)
@@ -12,10 +12,13 @@ import logging
 from typing import Dict, Optional, Tuple
 
 from models.data_builder import MLDataBuilder
+from models.feature_engine import FEATURE_COLUMNS, RollingFeatureEngine
 from utilities.structured_logger import get_logger
 
 logger = get_logger(__name__)
 
+NEUTRAL_PREDICTION = {'probability': 0.5, 'direction': 0, 'confidence': 0.0}
+
 class MLPredictor:
     def __init__(self, model_dir: str = None):
         if model_dir is None:
@@ -29,6 +32,10 @@ class MLPredictor:
         self.builder = MLDataBuilder(None) # Data provider not needed for feature calc on existing df
         
         self._load_model()
+
+        # Per-symbol rolling indicator state for predict_many / predict(symbol=...)
+        self.feature_engine = RollingFeatureEngine()
+        self._check_feature_columns()
         
     def _load_model(self):
         """Load model and scaler from disk"""
@@ -41,20 +48,57 @@ class MLPredictor:
                 logger.warning(f"⚠️ ML Model not found at {self.model_path}")
         except Exception as e:
             logger.error(f"❌ Failed to load ML model: {e}")
+
+    def _check_feature_columns(self):
+        """
+        Match the loaded scaler's inputs to the features the engine produces
+
+        A model trained on other columns cannot be scored; it is disabled
+        with an error naming the columns instead of failing on every call.
+        """
+        if self.model is None:
+            return
+        names = getattr(self.scaler, 'feature_names_in_', None)
+        if names is None:
+            n_features = getattr(self.scaler, 'n_features_in_', len(FEATURE_COLUMNS))
+            if n_features != len(FEATURE_COLUMNS):
+                logger.error(
+                    f"❌ ML scaler expects {n_features} unnamed features, feature engine "
+                    f"produces {len(FEATURE_COLUMNS)} {FEATURE_COLUMNS}; ML predictions disabled"
+                )
+                self.model = None
+            return
+        try:
+            self.feature_engine = RollingFeatureEngine(self.feature_columns)
+        except ValueError as e:
+            logger.error(f"❌ ML model features do not match the feature engine ({e}); ML predictions disabled")
+            self.model = None
+
+    @property
+    def feature_columns(self):
+        """Model input columns, as recorded by the scaler at training time"""
+        names = getattr(self.scaler, 'feature_names_in_', None)
+        return list(names) if names is not None else list(FEATURE_COLUMNS)
             
-    def predict(self, df: pd.DataFrame) -> Dict[str, float]:
+    def predict(self, df: pd.DataFrame, symbol: Optional[str] = None) -> Dict[str, float]:
         """
         Generate prediction for the latest candle
+
+        With a symbol, features come from that symbol's rolling state and
+        only bars added since the previous call are processed.
         Returns: {'probability': float, 'direction': int}
         """
+        if symbol is not None:
+            return self.predict_many({symbol: df})[symbol]
+
         if self.model is None or df is None or df.empty:
-            return {'probability': 0.5, 'direction': 0}
+            return dict(NEUTRAL_PREDICTION)
             
         try:
             # 1. Calculate Features
             # We need enough history to calculate features (e.g. 26 periods for MACD)
             if len(df) < 50:
-                return {'probability': 0.5, 'direction': 0}
+                return dict(NEUTRAL_PREDICTION)
                 
             df_features = self.builder._add_technical_features(df)
             
@@ -74,14 +118,56 @@ class MLPredictor:
             
             # 4. Predict
             prob = self.model.predict_proba(X_scaled)[0][1] # Probability of class 1 (Up)
-            direction = 1 if prob > 0.5 else 0
-            
-            return {
-                'probability': float(prob),
-                'direction': direction,
-                'confidence': float(abs(prob - 0.5) * 2) # 0 to 1 scale
-            }
+            return self._format_prediction(prob)
             
         except Exception as e:
             logger.error(f"❌ Prediction failed: {e}")
-            return {'probability': 0.5, 'direction': 0}
+            return dict(NEUTRAL_PREDICTION)
+
+    def predict_many(self, frames: Dict[str, pd.DataFrame]) -> Dict[str, Dict[str, float]]:
+        """
+        Score the latest candle of every symbol with one model call
+
+        Features are updated incrementally per symbol, stacked into one
+        matrix and passed through a single scaler.transform/predict_proba.
+        Symbols without a model, data or 50 bars of history get the neutral
+        prediction.
+
+        Returns: {symbol: {'probability', 'direction', 'confidence'}}
+        """
+        results = {symbol: dict(NEUTRAL_PREDICTION) for symbol in frames}
+        if self.model is None:
+            return results
+
+        rows = []
+        scored = []
+        for symbol, df in frames.items():
+            if df is None or len(df) < 50:
+                continue
+            try:
+                rows.append(self.feature_engine.update(symbol, df))
+                scored.append(symbol)
+            except Exception as e:
+                logger.error(f"❌ Feature update failed for {symbol}: {e}")
+
+        if not rows:
+            return results
+
+        try:
+            X = pd.DataFrame(np.vstack(rows), columns=self.feature_engine.feature_columns).fillna(0)
+            probs = self.model.predict_proba(self.scaler.transform(X))[:, 1] # Probability of class 1 (Up)
+        except Exception as e:
+            logger.error(f"❌ Batch prediction failed: {e}")
+            return results
+
+        for symbol, prob in zip(scored, probs):
+            results[symbol] = self._format_prediction(prob)
+        return results
+
+    @staticmethod
+    def _format_prediction(prob: float) -> Dict[str, float]:
+        return {
+            'probability': float(prob),
+            'direction': 1 if prob > 0.5 else 0,
+            'confidence': float(abs(prob - 0.5) * 2) # 0 to 1 scale
+        }
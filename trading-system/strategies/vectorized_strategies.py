@@ -1,34 +1,61 @@
 import pandas as pd
 import numpy as np
-from core.vectorized_backtester import Strategy
+from abc import abstractmethod
+from typing import Any, Dict, List
+from core.vectorized_backtester import Strategy, IndicatorCache, param_values, threshold_signals
 
-class VectorizedMACrossover(Strategy):
+
+class ColumnwiseStrategy(Strategy):
+    """
+    Strategy whose indicators are pandas ops that apply column by column
+
+    ``_signals`` reads ``data['close']`` / ``data['volume']``, which are
+    Series for one symbol and (time x symbol) DataFrames for a panel, so the
+    same code drives ``VectorizedBacktester.run`` and ``run_portfolio``.
+    """
+
+    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame({'signal': self._signals(data)}, index=data.index)
+
+    def panel_signals(self, panel: Dict[str, pd.DataFrame]) -> np.ndarray:
+        return self._signals(panel)
+
+    @abstractmethod
+    def _signals(self, data) -> np.ndarray:
+        """Signals (1=buy, -1=sell, 0=hold) aligned with ``data['close']``"""
+        pass
+
+
+class VectorizedMACrossover(ColumnwiseStrategy):
     """Vectorized Moving Average Crossover"""
     def __init__(self, fast_period: int = 3, slow_period: int = 10):
         self.fast_period = fast_period
         self.slow_period = slow_period
 
-    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
-        signals = pd.DataFrame(index=data.index)
-        
+    def _signals(self, data) -> np.ndarray:
         # Calculate EMAs
         fast_ema = data['close'].ewm(span=self.fast_period, adjust=False).mean()
         slow_ema = data['close'].ewm(span=self.slow_period, adjust=False).mean()
         
         # Generate signals
-        signals['signal'] = 0
-        signals['signal'] = np.where(fast_ema > slow_ema, 1, -1)
-        
-        return pd.DataFrame({'signal': np.where(fast_ema > slow_ema, 1, -1)}, index=data.index)
+        return np.where(fast_ema > slow_ema, 1, -1)
+
+    @classmethod
+    def signal_matrix(cls, data: pd.DataFrame, combinations: List[Dict[str, Any]]) -> np.ndarray:
+        """EMA crossover signals for many (fast_period, slow_period) pairs; each span computed once"""
+        cache = IndicatorCache(data)
+        fast = cache.columns('ema', param_values(combinations, 'fast_period', 3))
+        slow = cache.columns('ema', param_values(combinations, 'slow_period', 10))
+        return np.where(fast > slow, 1, -1).astype(np.int8)
 
-class VectorizedRSI(Strategy):
+class VectorizedRSI(ColumnwiseStrategy):
     """Vectorized RSI Strategy"""
     def __init__(self, period: int = 14, buy_threshold: int = 30, sell_threshold: int = 70):
         self.period = period
         self.buy_threshold = buy_threshold
         self.sell_threshold = sell_threshold
 
-    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
+    def _signals(self, data) -> np.ndarray:
         delta = data['close'].diff()
         gain = (delta.where(delta > 0, 0)).rolling(window=self.period).mean()
         loss = (-delta.where(delta < 0, 0)).rolling(window=self.period).mean()
@@ -36,51 +63,50 @@ class VectorizedRSI(Strategy):
         rs = gain / loss
         rsi = 100 - (100 / (1 + rs))
         
-        signals = pd.DataFrame(index=data.index)
-        signals['signal'] = 0
-        
-        # Buy when RSI < 30
-        signals.loc[rsi < self.buy_threshold, 'signal'] = 1
-        
-        # Sell when RSI > 70
-        signals.loc[rsi > self.sell_threshold, 'signal'] = -1
-        
-        return signals
+        # Buy when RSI < 30, sell when RSI > 70
+        return threshold_signals(rsi < self.buy_threshold, rsi > self.sell_threshold)
 
-class VectorizedBollingerBands(Strategy):
+    @classmethod
+    def signal_matrix(cls, data: pd.DataFrame, combinations: List[Dict[str, Any]]) -> np.ndarray:
+        """RSI threshold signals for many combinations; each RSI period computed once"""
+        rsi = IndicatorCache(data).columns('rsi', param_values(combinations, 'period', 14))
+        buy = np.asarray(param_values(combinations, 'buy_threshold', 30), dtype=float)
+        sell = np.asarray(param_values(combinations, 'sell_threshold', 70), dtype=float)
+        return threshold_signals(rsi < buy, rsi > sell)
+
+class VectorizedBollingerBands(ColumnwiseStrategy):
     """Vectorized Bollinger Bands Strategy"""
     def __init__(self, period: int = 20, std_dev: float = 2):
         self.period = period
         self.std_dev = std_dev
 
-    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
-        signals = pd.DataFrame(index=data.index)
-        signals['signal'] = 0
-        
+    def _signals(self, data) -> np.ndarray:
         # Calculate Bands
         sma = data['close'].rolling(window=self.period).mean()
         std = data['close'].rolling(window=self.period).std()
         upper_band = sma + (std * self.std_dev)
         lower_band = sma - (std * self.std_dev)
         
-        # Buy when price < lower band (Oversold)
-        signals.loc[data['close'] < lower_band, 'signal'] = 1
-        
-        # Sell when price > upper band (Overbought)
-        signals.loc[data['close'] > upper_band, 'signal'] = -1
-        
-        return signals
+        # Buy when price < lower band (Oversold), sell when price > upper band (Overbought)
+        return threshold_signals(data['close'] < lower_band, data['close'] > upper_band)
+
+    @classmethod
+    def signal_matrix(cls, data: pd.DataFrame, combinations: List[Dict[str, Any]]) -> np.ndarray:
+        """Band signals for many (period, std_dev) pairs; widths broadcast over one SMA/std per period"""
+        cache = IndicatorCache(data)
+        periods = param_values(combinations, 'period', 20)
+        sma = cache.columns('sma', periods)
+        width = cache.columns('std', periods) * np.asarray(param_values(combinations, 'std_dev', 2), dtype=float)
+        close = cache.close.to_numpy()[:, None]
+        return threshold_signals(close < sma - width, close > sma + width)
 
-class VectorizedVolumeBreakout(Strategy):
+class VectorizedVolumeBreakout(ColumnwiseStrategy):
     """Vectorized Volume Breakout Strategy"""
     def __init__(self, volume_multiplier: float = 1.3, price_threshold: float = 0.001):
         self.volume_multiplier = volume_multiplier
         self.price_threshold = price_threshold
 
-    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
-        signals = pd.DataFrame(index=data.index)
-        signals['signal'] = 0
-        
+    def _signals(self, data) -> np.ndarray:
         # Volume MA
         vol_avg = data['volume'].rolling(window=20).mean()
         
@@ -92,24 +118,16 @@ class VectorizedVolumeBreakout(Strategy):
         price_up = price_change > self.price_threshold
         price_down = price_change < -self.price_threshold
         
-        # Buy: High Vol + Price Up
-        signals.loc[high_volume & price_up, 'signal'] = 1
-        
-        # Sell: High Vol + Price Down
-        signals.loc[high_volume & price_down, 'signal'] = -1
-        
-        return signals
+        # Buy: High Vol + Price Up, Sell: High Vol + Price Down
+        return threshold_signals(high_volume & price_up, high_volume & price_down)
 
-class VectorizedMomentum(Strategy):
+class VectorizedMomentum(ColumnwiseStrategy):
     """Vectorized Momentum Strategy (Simplified)"""
     def __init__(self, momentum_period: int = 10, rsi_period: int = 14):
         self.momentum_period = momentum_period
         self.rsi_period = rsi_period
 
-    def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
-        signals = pd.DataFrame(index=data.index)
-        signals['signal'] = 0
-        
+    def _signals(self, data) -> np.ndarray:
         # Momentum
         momentum = data['close'].pct_change(self.momentum_period)
         
@@ -128,13 +146,11 @@ class VectorizedMomentum(Strategy):
         
         # Buy: Positive Momentum + RSI < 70 + MACD > Signal
         buy_cond = (momentum > 0) & (rsi < 70) & (macd > signal_line)
-        signals.loc[buy_cond, 'signal'] = 1
         
         # Sell: Negative Momentum + RSI > 30 + MACD < Signal
         sell_cond = (momentum < 0) & (rsi > 30) & (macd < signal_line)
-        signals.loc[sell_cond, 'signal'] = -1
         
-        return signals
+        return threshold_signals(buy_cond, sell_cond)
 
 class CombinedVectorizedStrategy(Strategy):
     """Combines multiple vectorized strategies"""
@@ -142,19 +158,18 @@ class CombinedVectorizedStrategy(Strategy):
         self.strategies = strategies
 
     def generate_signals(self, data: pd.DataFrame) -> pd.DataFrame:
-        combined_signal = pd.Series(0, index=data.index)
+        combined_signal = np.zeros(len(data), dtype=int)
         
         for strategy in self.strategies:
-            s_sig = strategy.generate_signals(data)['signal']
-            combined_signal += s_sig
+            combined_signal = combined_signal + strategy.generate_signals(data)['signal'].to_numpy()
             
         # Majority vote
-        final_signal = pd.DataFrame(index=data.index)
-        final_signal['signal'] = 0
-        
         # If sum > 0 -> Buy/Hold Long
         # If sum < 0 -> Sell/Flat
-        final_signal.loc[combined_signal > 0, 'signal'] = 1
-        final_signal.loc[combined_signal < 0, 'signal'] = -1
-        
-        return final_signal
+        return pd.DataFrame({'signal': np.sign(combined_signal)}, index=data.index)
+
+    def panel_signals(self, panel: Dict[str, pd.DataFrame]) -> np.ndarray:
+        """Majority vote of every sub-strategy's panel signals"""
+        combined_signal = sum(np.asarray(strategy.panel_signals(panel), dtype=int)
+                              for strategy in self.strategies)
+        return np.sign(combined_signal)
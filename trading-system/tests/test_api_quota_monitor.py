@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Tests for api_quota_monitor.py window counters and usage tracking"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from infrastructure.api_quota_monitor import APIQuotaMonitor, QuotaLevel, SlidingWindowCounter
+
+
+def test_counter_expires_buckets_as_window_slides():
+    counter = SlidingWindowCounter(window_seconds=60, buckets=60)
+    counter.add(1000.2)
+    counter.add(1000.7, amount=2)
+    counter.add(1030.0)
+
+    assert counter.count(1030.5) == 4
+    # Bucket 1000 stays counted until the whole window has passed its end
+    assert counter.time_until_reset(1030.5) == 1061.0 - 1030.5
+    assert counter.count(1060.9) == 4
+    assert counter.count(1061.0) == 1
+    assert counter.time_until_reset(1061.0) == 30.0
+    assert counter.count(2000.0) == 0
+    assert counter.time_until_reset(2000.0) == 0.0
+
+
+def test_counter_matches_exact_window_at_bucket_granularity():
+    counter = SlidingWindowCounter(window_seconds=1, buckets=10)
+    times = [i * 0.037 for i in range(200)]
+    for t in times:
+        counter.add(t)
+        exact = sum(1 for u in times if u <= t and u > t - 1)
+        # Over-counts by at most one bucket of calls, never under-counts
+        assert exact <= counter.count(t) <= exact + 3
+    assert counter.count(times[-1] + 1.1) == 0
+
+
+def test_usage_and_throttling_from_counters():
+    monitor = APIQuotaMonitor(history_sample_every=1)
+    for _ in range(3):
+        monitor.record_api_call(endpoint="/quote")
+
+    usage = monitor.get_current_usage()
+    assert usage['per_second'].current_usage == 3
+    assert usage['per_second'].level == QuotaLevel.DANGER
+    assert usage['per_minute'].requests_remaining == 997
+    assert 0 < usage['per_second'].time_until_reset <= 1.0 + 1 / 60
+    assert not monitor.can_make_request(safety_margin=1.0)
+
+
+def test_sampled_history_keeps_exact_endpoint_counts():
+    monitor = APIQuotaMonitor(history_sample_every=10)
+    for i in range(95):
+        monitor.record_api_call(endpoint="/quote", response_time_ms=100 + i)
+    monitor.record_api_call(endpoint="/orders", status_code=500, error="boom")
+
+    quote = monitor.get_endpoint_statistics("/quote")
+    assert quote['total_calls'] == 95
+    assert len(monitor._calls_by_endpoint["/quote"]) == 10
+
+    orders = monitor.get_endpoint_statistics("/orders")
+    assert (orders['total_calls'], orders['error_count']) == (1, 1)
+
+    report = monitor.get_quota_report()
+    assert report['total_api_calls'] == 96
+    assert report['top_endpoints'][0] == {'endpoint': '/quote', 'calls': 95}
+    assert report['current_usage']['per_minute']['current_usage'] == 96
+
+
+def test_failures_sampled_at_the_same_rate_as_successes():
+    monitor = APIQuotaMonitor(history_sample_every=10)
+    for i in range(200):
+        failed = i % 8 == 3
+        monitor.record_api_call(endpoint="/quote", status_code=504 if failed else 200,
+                                response_time_ms=5000 if failed else 100)
+
+    sampled = monitor._calls_by_endpoint["/quote"]
+    assert len(sampled) == 20
+    stats = monitor.get_endpoint_statistics("/quote")
+    assert stats['error_count'] == 25
+    assert stats['error_rate'] == 25 / 200
+    assert stats['avg_response_time_ms'] < 1000
+
+
+def test_time_until_below_finds_first_bucket_that_frees_room():
+    counter = SlidingWindowCounter(window_seconds=60, buckets=60)
+    counter.add(1000.5, amount=2)
+    counter.add(1010.5, amount=3)
+
+    assert counter.time_until_below(1020.0, threshold=6) == 0.0
+    # Dropping the first bucket leaves 3 < 4
+    assert counter.time_until_below(1020.0, threshold=4) == 1061.0 - 1020.0
+    assert counter.time_until_below(1020.0, threshold=1) == 1071.0 - 1020.0
@@ -62,6 +62,17 @@ class TestBacktestEngine:
             mock_data_provider.fetch_with_retry.assert_called_with('NIFTY 50', interval='5minute', days=5)
             mock_instance.run.assert_called()
 
+    def test_run_fast_backtest_portfolio(self, mock_data_provider):
+        engine = BacktestEngine(mock_data_provider)
+
+        results = engine.run_fast_backtest(['AAA', 'BBB', 'CCC'], interval='5minute', days=5,
+                                           portfolio=True, max_positions=2)
+
+        assert mock_data_provider.fetch_with_retry.call_count == 3
+        assert list(results.symbol_summary.index) == ['AAA', 'BBB', 'CCC']
+        assert results.max_positions_held <= 2
+        assert len(results.equity_curve) == 100
+
     def test_normalize_interval(self):
         assert BacktestEngine._normalize_fast_interval('5m') == '5minute'
         assert BacktestEngine._normalize_fast_interval('1h') == '60minute'
@@ -15,7 +15,7 @@ from datetime import datetime, timedelta
 from unittest.mock import Mock, MagicMock
 
 # Import the unified trading loop
-from core.trading_loop_base import AbstractTradingLoop, BacktestTradingLoop
+from core.trading_loop_base import AbstractTradingLoop, BacktestTradingLoop, ReplayPanel, run_sharded
 
 
 class TestBacktestLiveParity:
@@ -273,6 +273,115 @@ class TestBacktestLiveParity:
         print("✅ Trade execution decision parity: PASS")
 
 
+class ReplayPortfolio:
+    """Minimal portfolio that records fills"""
+
+    def __init__(self):
+        self.cash = 1000000.0
+        self.positions = {}
+        self.min_position_size = 0.10
+        self.max_position_size = 0.25
+        self.trailing_activation_multiplier = 1.5
+        self.trailing_stop_multiplier = 0.8
+        self.trades_count = 0
+        self.fills = []
+
+    def execute_trade(self, symbol, shares, price, side, timestamp, confidence, sector, atr=None):
+        self.fills.append((symbol, side, timestamp, price))
+        self.trades_count += 1
+        if side == 'buy':
+            self.cash -= shares * price
+            self.positions[symbol] = {'shares': shares, 'entry_price': price, 'stop_loss': price * 0.98,
+                                      'take_profit': price * 1.03, 'confidence': confidence}
+        else:
+            self.cash += shares * price
+            del self.positions[symbol]
+
+    def calculate_total_value(self, price_map):
+        return self.cash + sum(p['shares'] * price_map[s] for s, p in self.positions.items())
+
+
+class AboveMean:
+    def generate_signals(self, data, symbol):
+        closes = data['close'].to_numpy()[-20:]
+        return {'signal': 1 if closes[-1] > closes.mean() else -1}
+
+
+class SignAggregator:
+    def aggregate_signals(self, signals, symbol, is_exit=False):
+        return {'action': 'buy' if signals[0]['signal'] > 0 else 'sell', 'confidence': 0.8}
+
+
+REPLAY_CONFIG = {'cooldown_minutes': 0, 'stop_loss_cooldown_minutes': 0}
+
+
+def make_replay_loop():
+    """Module-level so shard workers can unpickle it"""
+    return BacktestTradingLoop(ReplayPortfolio(), [AboveMean()], SignAggregator(), REPLAY_CONFIG, Mock())
+
+
+def replay_data(symbols=('AAA', 'BBB', 'CCC'), bars=200):
+    rng = np.random.default_rng(5)
+    index = pd.date_range('2025-01-01 09:15', periods=bars, freq='5min')
+    df_map = {}
+    for symbol in symbols:
+        df = pd.DataFrame({'close': 100 * np.exp(np.cumsum(rng.normal(0, 0.004, bars)))}, index=index)
+        df_map[symbol] = df.drop(index[rng.integers(0, bars, 5)])
+    return df_map, list(index)
+
+
+class TestBarReplay:
+
+    def test_windows_are_views_of_history_before_bar(self):
+        df_map, times = replay_data()
+        replay = ReplayPanel(df_map, times)
+
+        for t in (0, 60, 199):
+            expected = df_map['BBB'][df_map['BBB'].index < times[t]]
+            window = replay.window('BBB', t)
+            assert window.index.equals(expected.index)
+            assert replay.history_length('BBB', t) == len(expected)
+            if len(window):
+                assert np.shares_memory(window['close'].to_numpy(), df_map['BBB']['close'].to_numpy())
+
+        assert len(replay.window('BBB', 199, lookback=30)) == 30
+        dropped = times[next(i for i, ts in enumerate(times) if ts not in df_map['AAA'].index)]
+        assert 'AAA' not in replay.prices_at(times.index(dropped))
+
+    def test_run_trades_and_reports(self):
+        df_map, times = replay_data()
+        loop = make_replay_loop()
+
+        result = loop.run(list(df_map), df_map, times)
+
+        assert loop.portfolio.fills
+        first_fill = min(ts for _, _, ts, _ in loop.portfolio.fills)
+        assert first_fill >= times[BacktestTradingLoop.MIN_HISTORY_BARS]
+        assert result['bars'] == len(times) - 1
+        assert result['trades'] == len(loop.portfolio.fills)
+
+    def test_symbol_shards_match_separate_runs(self):
+        df_map, times = replay_data()
+
+        sharded = run_sharded(make_replay_loop, list(df_map), df_map, times, shards=3, max_workers=1)
+        solo = make_replay_loop().run(['BBB'], {'BBB': df_map['BBB']}, times)
+
+        assert [r['symbols'] for r in sharded] == [['AAA'], ['BBB'], ['CCC']]
+        assert sharded[1]['final_value'] == pytest.approx(solo['final_value'])
+
+    def test_date_shards_in_processes(self):
+        df_map, times = replay_data()
+
+        in_process = run_sharded(make_replay_loop, list(df_map), df_map, times, shards=2,
+                                 by='date', max_workers=1)
+        pooled = run_sharded(make_replay_loop, list(df_map), df_map, times, shards=2,
+                             by='date', max_workers=2)
+
+        assert [r['start'] for r in in_process] == [times[0], times[100]]
+        assert sum(r['bars'] for r in in_process) == len(times) - 1
+        assert [r['final_value'] for r in pooled] == pytest.approx([r['final_value'] for r in in_process])
+
+
 def test_full_backtest_vs_live_simulation():
     """
     Integration test: Run same scenario in backtest and simulated live mode
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Tests for the tick-fed live bar aggregator and DataProvider live-bar serving
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+from dateutil.tz import tzoffset
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data.bar_aggregator import BarRing, LiveBarAggregator
+from data.provider import DataProvider
+
+SESSION = datetime(2025, 1, 6, 9, 15)
+
+
+def tick(symbol, at, price, volume):
+    """Minimal TickData stand-in"""
+    return SimpleNamespace(symbol=symbol, timestamp=at, exchange_timestamp=None,
+                           last_price=price, volume=volume)
+
+
+def history(start, periods, freq='5min', tz=None):
+    index = pd.date_range(start, periods=periods, freq=freq, tz=tz, name='date')
+    closes = np.arange(periods, dtype=float) + 100.0
+    return pd.DataFrame({'open': closes, 'high': closes + 1, 'low': closes - 1,
+                         'close': closes, 'volume': 1000.0}, index=index)
+
+
+class TestBarRing:
+
+    def test_ring_keeps_newest_bars_contiguous(self):
+        ring = BarRing(capacity=4, interval_minutes=1)
+        minute = 60 * 1_000_000_000
+        for i in range(11):
+            ring.update(i * minute, 100.0 + i, 1)
+
+        assert len(ring) == 4
+        views = ring.arrays()
+        assert views['close'].tolist() == [107.0, 108.0, 109.0, 110.0]
+        assert np.shares_memory(views['close'], ring.data)
+        assert not ring.update(5 * minute, 1.0, 1)  # older than the current bar
+
+
+class TestLiveBarAggregator:
+
+    def test_ticks_build_bars_per_interval(self):
+        agg = LiveBarAggregator(intervals=('minute', '5minute'))
+        prices = [(0, 100.0, 1000), (20, 102.0, 1100), (50, 99.0, 1150),
+                  (70, 101.0, 1300), (310, 105.0, 1400)]
+        for seconds, price, volume in prices:
+            agg.on_tick(tick('RELIANCE', SESSION + timedelta(seconds=seconds), price, volume))
+
+        five = agg.frame('RELIANCE', '5minute')
+        assert five.index.tolist() == [pd.Timestamp('2025-01-06 09:15'), pd.Timestamp('2025-01-06 09:20')]
+        assert five.iloc[0][['open', 'high', 'low', 'close']].tolist() == [100.0, 102.0, 99.0, 101.0]
+        # First tick only establishes the cumulative volume baseline
+        assert five['volume'].tolist() == [300.0, 100.0]
+
+        one = agg.frame('RELIANCE', 'minute')
+        assert len(one) == 3
+        assert one['close'].tolist() == [99.0, 101.0, 105.0]
+
+    def test_backfill_merges_with_live_partial_bar(self):
+        agg = LiveBarAggregator(intervals=('5minute',))
+        agg.on_tick(tick('TCS', SESSION + timedelta(minutes=50, seconds=30), 120.0, 500))
+        agg.on_tick(tick('TCS', SESSION + timedelta(minutes=51), 125.0, 600))
+
+        df = history(SESSION, 11, tz='Asia/Kolkata')  # last bar 10:05 overlaps the live bar
+        assert agg.backfill('TCS', '5minute', df) == 11
+
+        bars = agg.frame('TCS', '5minute')
+        assert len(bars) == 11
+        assert str(bars.index.tz) == 'Asia/Kolkata'
+        last = bars.iloc[-1]
+        assert last['open'] == 110.0 and last['close'] == 125.0 and last['high'] == 125.0
+
+    def test_kite_tzoffset_history(self):
+        kite_tz = tzoffset(None, 19800)
+        agg = LiveBarAggregator(intervals=('5minute',))
+        assert agg.backfill('SBIN', '5minute', history(SESSION, 6, tz=kite_tz)) == 6
+
+        bars = agg.frame('SBIN', '5minute', start=pd.Timestamp(SESSION + timedelta(minutes=10), tz=kite_tz))
+        assert bars.index[0] == pd.Timestamp(SESSION + timedelta(minutes=10), tz=kite_tz)
+        assert bars.index.tz.utcoffset(None) == timedelta(hours=5, minutes=30)
+        assert len(bars) == 4
+
+    def test_naive_ticks_converted_to_history_timezone(self):
+        agg = LiveBarAggregator(intervals=('5minute',))
+        agg.backfill('SBIN', '5minute', history(SESSION, 2, tz='Asia/Kolkata'))
+
+        # Naive tick times are host-local; 09:27 IST expressed that way
+        at = pd.Timestamp(SESSION + timedelta(minutes=12), tz='Asia/Kolkata')
+        naive = at.to_pydatetime().astimezone().replace(tzinfo=None)
+        agg.on_tick(tick('SBIN', naive, 130.0, 10))
+
+        assert agg.frame('SBIN', '5minute').index[-1] == pd.Timestamp(SESSION + timedelta(minutes=10), tz='Asia/Kolkata')
+
+    def test_liveness_is_per_symbol(self):
+        agg = LiveBarAggregator(intervals=('5minute',), stale_after=60)
+        agg.backfill('INFY', '5minute', history(SESSION, 5), coverage_start=SESSION - timedelta(days=30))
+        agg.backfill('TCS', '5minute', history(SESSION, 5), coverage_start=SESSION - timedelta(days=30))
+        agg.on_tick(tick('TCS', SESSION + timedelta(minutes=30), 120.0, 10))
+
+        assert agg.is_live() and agg.is_live('TCS')
+        assert not agg.is_live('INFY')
+        assert agg.covers('TCS', '5minute', SESSION)
+        assert not agg.covers('INFY', '5minute', SESSION)
+
+    def test_coverage_limited_to_bars_kept_by_ring(self):
+        agg = LiveBarAggregator(intervals=('5minute',), capacity=100)
+        agg.backfill('INFY', '5minute', history(SESSION, 500), coverage_start=SESSION)
+        agg.on_tick(tick('INFY', SESSION + timedelta(minutes=5 * 499), 150.0, 10))
+
+        first_kept = agg.frame('INFY', '5minute').index[0]
+        assert first_kept == pd.Timestamp(SESSION + timedelta(minutes=5 * 400))
+        assert not agg.covers('INFY', '5minute', SESSION)
+        assert agg.covers('INFY', '5minute', first_kept)
+
+        # Live bars evicting older ones move coverage forward
+        agg.on_tick(tick('INFY', SESSION + timedelta(minutes=5 * 501), 151.0, 20))
+        assert not agg.covers('INFY', '5minute', first_kept)
+        assert agg.covers('INFY', '5minute', first_kept + timedelta(minutes=10))
+
+    def test_unknown_interval_rejected(self):
+        with pytest.raises(ValueError):
+            LiveBarAggregator(intervals=('2minute',))
+
+
+class TestDataProviderLiveBars:
+
+    def test_fetch_served_from_aggregator_once_backfilled(self):
+        now = datetime.now().replace(second=0, microsecond=0)
+        start = now - timedelta(hours=2)
+        kite = Mock()
+        kite.historical_data.return_value = [
+            {'date': ts.to_pydatetime(), **row} for ts, row in history(start, 24).to_dict('index').items()
+        ]
+        agg = LiveBarAggregator(intervals=('5minute',))
+        provider = DataProvider(kite=kite, instruments_map={'INFY': 1}, bar_aggregator=agg)
+        provider.candle_store = None
+
+        assert agg.backfill_from(provider, ['INFY'], days=1) == 24
+        assert kite.historical_data.call_count == 1
+
+        agg.on_tick(tick('INFY', now, 150.0, 10))
+        provider.price_cache.clear()
+        df = provider.fetch_with_retry('INFY', '5minute', days=1)
+
+        assert kite.historical_data.call_count == 1
+        assert provider.live_bar_hits == 1
+        assert df['close'].iloc[-1] == 150.0
+        assert list(df.columns) == ['open', 'high', 'low', 'close', 'volume']
+
+    def test_stale_feed_falls_back_to_history(self):
+        agg = LiveBarAggregator(intervals=('5minute',), stale_after=0)
+        agg.backfill('INFY', '5minute', history(SESSION, 5), coverage_start=SESSION - timedelta(days=30))
+        agg._last_tick_at['INFY'] = 0.0
+
+        assert not agg.covers('INFY', '5minute', SESSION)
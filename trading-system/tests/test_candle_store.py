@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent candle store and incremental DataProvider fetches
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from dateutil.tz import tzoffset
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data.candle_store import CandleStore
+from data.provider import DataProvider
+
+
+def make_candles(start, periods, freq='5min', tz='Asia/Kolkata', base=100.0):
+    index = pd.date_range(start, periods=periods, freq=freq, tz=tz, name='date')
+    closes = [base + i for i in range(periods)]
+    return pd.DataFrame({
+        'open': closes,
+        'high': [c + 1 for c in closes],
+        'low': [c - 1 for c in closes],
+        'close': closes,
+        'volume': [1000 + i for i in range(periods)],
+    }, index=index)
+
+
+class MockKite:
+    """Serves candles from a fixed DataFrame, filtered by the requested window"""
+
+    def __init__(self, df):
+        self.df = df
+        self.calls = []
+
+    def historical_data(self, token, from_date, to_date, interval):
+        self.calls.append((from_date, to_date))
+        start = pd.Timestamp(from_date).tz_localize(self.df.index.tz)
+        rows = self.df[self.df.index >= start]
+        return [
+            {'date': ts.to_pydatetime(), **row}
+            for ts, row in rows.to_dict('index').items()
+        ]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CandleStore(tmp_path / 'candles')
+
+
+class TestCandleStore:
+
+    def test_write_and_read_roundtrip(self, store):
+        df = make_candles('2025-01-06 09:15', 10)
+        assert store.write('RELIANCE', '5minute', df) == 10
+
+        result = store.read('RELIANCE', '5minute')
+        assert len(result) == 10
+        assert list(result.columns) == ['open', 'high', 'low', 'close', 'volume']
+        assert str(result.index.tz) == 'Asia/Kolkata'
+        assert result.index[0] == df.index[0]
+        assert result['close'].tolist() == df['close'].tolist()
+
+    def test_append_replaces_overlapping_bars(self, store):
+        store.write('RELIANCE', '5minute', make_candles('2025-01-06 09:15', 10))
+        # Last stored bar was partial; the update re-sends it with new values
+        update = make_candles('2025-01-06 10:00', 3, base=500.0)
+        store.write('RELIANCE', '5minute', update)
+
+        result = store.read('RELIANCE', '5minute')
+        assert len(result) == 12
+        assert result.index.is_unique
+        assert result['close'].iloc[-3:].tolist() == [500.0, 501.0, 502.0]
+
+    def test_read_window_with_naive_bounds(self, store):
+        store.write('TCS', '5minute', make_candles('2025-01-06 09:15', 12))
+
+        result = store.read('TCS', '5minute', start=datetime(2025, 1, 6, 9, 30),
+                            end=datetime(2025, 1, 6, 9, 45))
+        assert len(result) == 4
+        assert result.index[0] == pd.Timestamp('2025-01-06 09:30', tz='Asia/Kolkata')
+
+    def test_kite_tzoffset_roundtrip(self, store):
+        # Kite history timestamps carry tzoffset(None, 19800), not a named zone
+        df = make_candles('2025-01-06 09:15', 6, tz=tzoffset(None, 19800))
+        store.write('SBIN', '5minute', df)
+        store.write('SBIN', '5minute', make_candles('2025-01-06 09:40', 2, tz=tzoffset(None, 19800), base=200.0))
+
+        result = store.read('SBIN', '5minute', start=datetime(2025, 1, 6, 9, 20))
+        assert len(result) == 6
+        assert result.index[0] == pd.Timestamp('2025-01-06 09:20', tz='Asia/Kolkata')
+        assert result.index.tz.utcoffset(None) == timedelta(hours=5, minutes=30)
+        assert store.last_timestamp('SBIN', '5minute') == datetime(2025, 1, 6, 9, 45)
+
+    def test_symbols_with_special_characters(self, store):
+        store.write('M&M', 'day', make_candles('2025-01-06', 3, freq='D'))
+        store.write('NIFTY 50', 'day', make_candles('2025-01-06', 2, freq='D'))
+
+        assert len(store.read('M&M', 'day')) == 3
+        assert len(store.read('NIFTY 50', 'day')) == 2
+
+    def test_resume_point_requires_coverage(self, store):
+        df = make_candles('2025-01-06 09:15', 10)
+        window_start = datetime(2025, 1, 5, 9, 0)
+
+        store.write('INFY', '5minute', df)
+        assert store.resume_point('INFY', '5minute', window_start) is None
+
+        store.write('INFY', '5minute', df, coverage_start=window_start, replace=True)
+        assert store.resume_point('INFY', '5minute', window_start) == datetime(2025, 1, 6, 10, 0)
+
+        # Larger window than stored → full fetch needed
+        assert store.resume_point('INFY', '5minute', window_start - timedelta(days=1)) is None
+
+    def test_clear(self, store):
+        store.write('INFY', '5minute', make_candles('2025-01-06 09:15', 3))
+        store.clear('INFY', '5minute')
+        assert store.read('INFY', '5minute').empty
+        assert store.last_timestamp('INFY', '5minute') is None
+
+
+class TestDataProviderIncrementalFetch:
+
+    def test_second_fetch_only_requests_new_bars(self, store):
+        start = (datetime.now() - timedelta(days=2)).replace(second=0, microsecond=0)
+        history = make_candles(start, 100)
+        kite = MockKite(history)
+
+        provider = DataProvider(kite=kite, instruments_map={'RELIANCE': 1}, candle_store=store)
+        first = provider.fetch_with_retry('RELIANCE', '5minute', days=5)
+        assert len(first) == 100
+
+        provider.price_cache.clear()
+        second = provider.fetch_with_retry('RELIANCE', '5minute', days=5)
+
+        assert len(kite.calls) == 2
+        assert kite.calls[1][0] == history.index[-1].tz_localize(None).to_pydatetime()
+        assert len(second) == 100
+        assert second['close'].tolist() == first['close'].tolist()
+
+    def test_incremental_fetch_with_kite_tzoffset(self, store):
+        start = (datetime.now() - timedelta(days=2)).replace(second=0, microsecond=0)
+        kite = MockKite(make_candles(start, 40, tz=tzoffset(None, 19800)))
+
+        provider = DataProvider(kite=kite, instruments_map={'SBIN': 3}, candle_store=store)
+        provider.fetch_with_retry('SBIN', '5minute', days=5)
+        provider.price_cache.clear()
+        df = provider.fetch_with_retry('SBIN', '5minute', days=5)
+
+        assert len(df) == 40
+        # Second call resumed from the stored last bar instead of refetching
+        assert kite.calls[1][0] == kite.df.index[-1].tz_localize(None).to_pydatetime()
+
+    def test_cold_restart_uses_stored_history(self, store):
+        start = (datetime.now() - timedelta(days=2)).replace(second=0, microsecond=0)
+        kite = MockKite(make_candles(start, 50))
+
+        DataProvider(kite=kite, instruments_map={'TCS': 2}, candle_store=store) \
+            .fetch_with_retry('TCS', '5minute', days=5)
+
+        restarted = DataProvider(kite=kite, instruments_map={'TCS': 2}, candle_store=store)
+        df = restarted.fetch_with_retry('TCS', '5minute', days=5)
+
+        assert len(df) == 50
+        assert kite.calls[-1][0] != kite.calls[0][0]
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Tests for candlestick_patterns.py vectorized detection"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.candlestick_patterns import CandlestickPatternDetector, PatternType
+
+
+@pytest.fixture
+def ohlcv():
+    rng = np.random.default_rng(3)
+    n = 300
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    open_ = close * (1 + rng.normal(0, 0.01, n))
+    open_[::9] = close[::9]  # Sprinkle dojis
+    return pd.DataFrame({
+        'open': open_,
+        'high': np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.01, n))),
+        'low': np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.01, n))),
+        'close': close,
+        'volume': rng.integers(100000, 1000000, n).astype(float),
+    })
+
+
+def _downtrend_then(last_two: list) -> pd.DataFrame:
+    """25 falling candles followed by the given (open, high, low, close, volume) rows"""
+    close = np.linspace(130, 100, 25)
+    rows = [(c + 0.5, c + 1.0, c - 1.0, c, 1000.0) for c in close] + last_two
+    return pd.DataFrame(rows, columns=['open', 'high', 'low', 'close', 'volume'])
+
+
+def test_bullish_engulfing_in_downtrend_scores_with_context():
+    df = _downtrend_then([(100.5, 101.0, 98.5, 99.0, 1000.0), (98.0, 102.5, 97.5, 102.0, 5000.0)])
+    detector = CandlestickPatternDetector(min_confidence=0)
+
+    patterns = [p for p in detector.detect_engulfing(df) if p.index == len(df) - 1]
+
+    assert len(patterns) == 1
+    pattern = patterns[0]
+    assert pattern.name == "Bullish Engulfing"
+    assert pattern.pattern_type == PatternType.BULLISH
+    assert pattern.trend_aligned and pattern.volume_confirmed
+    assert pattern.confidence == 100.0  # 80 base + 15 volume + 10 trend, capped
+    assert pattern.price == 102.0
+
+
+def test_single_index_helpers_match_vectorized_context(ohlcv):
+    detector = CandlestickPatternDetector()
+    trends = {detector._detect_trend(ohlcv, i) for i in range(len(ohlcv))}
+
+    assert trends <= {'uptrend', 'downtrend', 'sideways'}
+    assert detector._detect_trend(ohlcv, 5) == 'sideways'
+    assert detector._check_volume_confirmation(ohlcv, 5) is False
+
+
+@pytest.mark.parametrize('lookback', [3, 10, 20])
+def test_latest_patterns_equal_tail_of_full_scan(ohlcv, lookback):
+    """Evaluating only trailing bars gives the same patterns as a full scan"""
+    detector = CandlestickPatternDetector(min_confidence=0)
+    start = len(ohlcv) - lookback
+
+    full = [p for p in detector.detect_all_patterns(ohlcv) if p.index >= start]
+    latest = detector.get_latest_patterns(ohlcv, lookback=lookback)
+
+    assert [(p.name, p.index, p.confidence, p.volume_confirmed, p.trend_aligned) for p in latest] == \
+           [(p.name, p.index, p.confidence, p.volume_confirmed, p.trend_aligned) for p in full]
+    assert all(p.index >= start for p in latest)
+
+
+def test_latest_only_mode_and_pattern_filter(ohlcv):
+    detector = CandlestickPatternDetector(min_confidence=0, latest_bars=5)
+
+    latest = detector.detect_all_patterns(ohlcv, latest_only=True)
+    dojis = detector.detect_all_patterns(ohlcv, pattern_types=['doji'])
+
+    assert all(p.index >= len(ohlcv) - 5 for p in latest)
+    assert dojis and all(p.name == "Doji" for p in dojis)
+    assert [p.confidence for p in dojis] == sorted((p.confidence for p in dojis), reverse=True)
+
+
+def test_min_confidence_filters_patterns(ohlcv):
+    loose = CandlestickPatternDetector(min_confidence=0).detect_all_patterns(ohlcv)
+    strict = CandlestickPatternDetector(min_confidence=80).detect_all_patterns(ohlcv)
+
+    assert len(strict) < len(loose)
+    assert all(p.confidence >= 80 for p in strict)
+
+
+def test_short_frames_yield_no_patterns():
+    df = pd.DataFrame({'open': [1.0, 2.0], 'high': [2.0, 3.0], 'low': [0.5, 1.5],
+                       'close': [1.5, 2.5], 'volume': [10.0, 10.0]})
+    detector = CandlestickPatternDetector()
+
+    assert detector.detect_all_patterns(df) == []
+    assert detector.get_latest_patterns(df) == []
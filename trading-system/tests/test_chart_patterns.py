@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Tests for chart_patterns.py pivot index and detectors"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.chart_patterns import ChartPatternDetector, ChartPatternType, PivotIndex
+
+
+def _ohlcv(n, seed):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n))
+    return pd.DataFrame({
+        'open': close,
+        'high': close * (1 + np.abs(rng.normal(0, 0.01, n))),
+        'low': close * (1 - np.abs(rng.normal(0, 0.01, n))),
+        'close': close,
+        'volume': rng.integers(100000, 1000000, n).astype(float),
+    }, index=pd.date_range('2024-01-01 09:15', periods=n, freq='5min'))
+
+
+def _argrelextrema(values, comparator, order):
+    """Reference pivots: scipy.signal.argrelextrema with mode='clip'"""
+    n = len(values)
+    return np.array([
+        i for i in range(n)
+        if all(comparator(values[i], values[min(max(i + s, 0), n - 1)])
+               for s in range(-order, order + 1) if s != 0)
+    ], dtype=int)
+
+
+def test_pivot_index_matches_argrelextrema():
+    df = _ohlcv(400, seed=1)
+    pivots = PivotIndex.from_frame(df, order=5)
+
+    assert np.array_equal(pivots.high_idx, _argrelextrema(df['high'].values, np.greater, 5))
+    assert np.array_equal(pivots.low_idx, _argrelextrema(df['low'].values, np.less, 5))
+    assert np.array_equal(pivots.high_price, df['high'].values[pivots.high_idx])
+
+
+def test_incremental_pivots_match_rebuild_on_sliding_window():
+    """Appending bars, dropping old ones and revising the forming bar keep the index exact"""
+    full = _ohlcv(1500, seed=2)
+    detector = ChartPatternDetector()
+    rng = np.random.default_rng(0)
+    start, end = 0, 200
+
+    for step in range(150):
+        end += int(rng.integers(1, 4))
+        start = min(start + int(rng.integers(0, 4)), end - 30)
+        df = full.iloc[start:end].copy()
+        if step % 5 == 0:
+            df.iloc[-1, df.columns.get_loc('high')] *= 1.02
+
+        incremental = detector.pivot_index(df, symbol='TEST')
+        rebuilt = PivotIndex.from_frame(df, order=detector.pivot_order)
+        assert np.array_equal(incremental.high_idx, rebuilt.high_idx)
+        assert np.array_equal(incremental.low_idx, rebuilt.low_idx)
+
+
+def test_pivot_index_rebuilds_when_history_changes():
+    df = _ohlcv(300, seed=3)
+    detector = ChartPatternDetector()
+    detector.pivot_index(df, symbol='TEST')
+
+    edited = df.copy()
+    edited.iloc[-2, edited.columns.get_loc('low')] *= 0.5
+    pivots = detector.pivot_index(edited, symbol='TEST')
+    assert len(edited) - 2 in pivots.low_idx
+
+    # Older frame than the stored one
+    older = df.iloc[:-50]
+    assert np.array_equal(detector.pivot_index(older, symbol='TEST').high_idx,
+                          PivotIndex.from_frame(older, order=5).high_idx)
+
+
+def test_pivots_between_use_strict_bounds():
+    df = _ohlcv(300, seed=4)
+    pivots = PivotIndex.from_frame(df, order=5)
+    first, last = pivots.high_idx[0], pivots.high_idx[-1]
+
+    start, end = pivots.lows_between(first, last)
+    inside = pivots.low_idx[start:end]
+    assert np.array_equal(inside, pivots.low_idx[(pivots.low_idx > first) & (pivots.low_idx < last)])
+
+
+def test_double_top_detected_after_breakdown():
+    closes = [100, 104, 108, 112, 108, 104, 100, 96, 100, 104, 108, 112, 108, 104, 100, 96, 92, 88, 86, 85]
+    closes = np.array(closes, dtype=float)
+    n = len(closes)
+    df = pd.DataFrame({
+        'open': closes, 'high': closes + 0.5, 'low': closes - 0.5, 'close': closes,
+        'volume': np.full(n, 1e5),
+    })
+    df.iloc[-1, df.columns.get_loc('volume')] = 1e6
+
+    detector = ChartPatternDetector(pivot_order=3)
+    patterns = detector.detect_double_top(df)
+
+    assert len(patterns) == 1
+    pattern = patterns[0]
+    assert pattern.pattern_type == ChartPatternType.REVERSAL_BEARISH
+    assert pattern.pivot_points == [(3, 112.5), (7, 95.5), (11, 112.5)]
+    assert pattern.breakout_level == 95.5
+    assert pattern.volume_confirmed
+    assert pattern.confidence == 95.0
+
+
+def test_detect_all_patterns_same_with_and_without_symbol():
+    df = _ohlcv(500, seed=5)
+    detector = ChartPatternDetector(min_confidence=0)
+
+    for end in range(400, 500, 7):
+        frame = df.iloc[end - 375:end]
+        assert (detector.detect_all_patterns(frame, symbol='TEST')
+                == detector.detect_all_patterns(frame))
+
+
+def test_detect_all_patterns_requires_history():
+    assert ChartPatternDetector().detect_all_patterns(_ohlcv(10, seed=6)) == []
+
+
+def test_reset_drops_stored_index():
+    detector = ChartPatternDetector()
+    detector.pivot_index(_ohlcv(100, seed=7), symbol='A')
+    detector.pivot_index(_ohlcv(100, seed=8), symbol='B')
+
+    detector.reset('A')
+    assert set(detector._pivot_indexes) == {'B'}
+    detector.reset()
+    assert detector._pivot_indexes == {}
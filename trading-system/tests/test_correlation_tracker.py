@@ -527,6 +527,7 @@ class TestPersistence:
         """Test that record is persisted to database"""
         corr_id = tracker.start_operation("test_operation", metadata={"key": "value"})
         tracker.end_operation(corr_id)
+        tracker.flush()
 
         # Query database directly
         import sqlite3
@@ -562,6 +563,85 @@ class TestPersistence:
         assert record.metadata == metadata
 
 
+# ============================================================================
+# Write-behind Tests
+# ============================================================================
+
+def _row_count(db_path):
+    import sqlite3
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM correlations").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestWriteBehind:
+    """Test batched background persistence"""
+
+    def test_end_operation_queues_without_writing(self, temp_db):
+        tracker = CorrelationTracker(db_path=temp_db, flush_interval=60)
+        for i in range(10):
+            tracker.end_operation(tracker.start_operation(f"op_{i}"))
+
+        assert _row_count(temp_db) == 0
+        assert tracker.flush() == 10
+        assert _row_count(temp_db) == 10
+        assert tracker.get_stats()['persistence']['batches'] == 1
+        tracker.close()
+
+    def test_background_writer_flushes_on_interval(self, temp_db):
+        tracker = CorrelationTracker(db_path=temp_db, flush_interval=0.05)
+        tracker.end_operation(tracker.start_operation("tick"))
+
+        deadline = time.time() + 2.0
+        while _row_count(temp_db) == 0 and time.time() < deadline:
+            time.sleep(0.02)
+
+        assert _row_count(temp_db) == 1
+        tracker.close()
+
+    def test_bounded_buffer_drops_oldest(self, temp_db):
+        tracker = CorrelationTracker(db_path=temp_db, flush_interval=60, max_pending=5, batch_size=100)
+        ids = [tracker.start_operation("tick") for _ in range(8)]
+        for corr_id in ids:
+            tracker.end_operation(corr_id)
+
+        stats = tracker.get_stats()
+        assert stats['persistence']['dropped'] == 3
+        assert stats['total'] == 5
+        assert tracker.get_correlation(ids[0]) is None
+        assert tracker.get_correlation(ids[-1]) is not None
+        tracker.close()
+
+    def test_close_flushes_pending(self, temp_db):
+        tracker = CorrelationTracker(db_path=temp_db, flush_interval=60)
+        tracker.end_operation(tracker.start_operation("shutdown_op"))
+        tracker.close()
+
+        assert _row_count(temp_db) == 1
+
+    def test_sampling_keeps_failures(self, temp_db):
+        tracker = CorrelationTracker(db_path=temp_db, sample_rates={"tick": 0.0})
+        for _ in range(20):
+            tracker.end_operation(tracker.start_operation("tick"))
+        tracker.end_operation(tracker.start_operation("tick"), status='failure', error_message='boom')
+        tracker.end_operation(tracker.start_operation("order"))
+
+        stats = tracker.get_stats()
+        assert stats['persistence']['sampled_out'] == 20
+        assert stats['by_operation'] == {'tick': 1, 'order': 1}
+        assert stats['by_status'] == {'failure': 1, 'success': 1}
+        tracker.close()
+
+    def test_synchronous_mode(self, temp_db):
+        tracker = CorrelationTracker(db_path=temp_db, write_behind=False)
+        tracker.end_operation(tracker.start_operation("sync_op"))
+
+        assert _row_count(temp_db) == 1
+        assert tracker._writer is None
+
+
 if __name__ == "__main__":
     # Run tests with: pytest test_correlation_tracker.py -v
     pytest.main([__file__, "-v", "--tb=short"])
@@ -1,3 +1,5 @@
+import threading
+import time
 from dataclasses import dataclass
 
 import pytest
@@ -94,3 +96,115 @@ def test_circuit_breaker_trips_after_failures():
     # Next attempt short-circuits because breaker is open
     FakeSession.default_post_responses = [FakeResponse(200)]
     assert not connector.send_portfolio_update(1000.0, 500.0, 1, 50.0)
+
+
+class RecordingConnector:
+    """Connector double for DashboardPublisher that records batches"""
+
+    def __init__(self, results=None, gate=None):
+        self.batches = []
+        self.results = list(results or [])
+        self.gate = gate
+
+    def send_batch(self, events):
+        if self.gate is not None:
+            self.gate.wait(5)
+        self.batches.append(events)
+        delivered = self.results.pop(0) if self.results else True
+        return [] if delivered else list(events)
+
+
+def test_async_send_does_not_block_on_slow_dashboard():
+    gate = threading.Event()
+    connector = dashboard.DashboardConnector(base_url='http://fake', api_key='secret', publish_async=True)
+    connector.publisher.connector = RecordingConnector(gate=gate)
+
+    started = time.monotonic()
+    for i in range(50):
+        assert connector.send_signal('NIFTY', 'buy', 0.8, 100.0 + i)
+    assert time.monotonic() - started < 0.5
+
+    gate.set()
+    assert connector.flush(timeout=5)
+    assert sum(len(b) for b in connector.publisher.connector.batches) == 50
+    connector.close()
+
+
+def test_publisher_coalesces_snapshots_and_keeps_event_order():
+    sender = RecordingConnector()
+    publisher = dashboard.DashboardPublisher(sender, flush_interval=10)
+    publisher.publish('signals', {'symbol': 'A'})
+    publisher.publish('portfolio', {'cash': 1, 'total_value': 10})
+    publisher.publish('signals', {'symbol': 'B'})
+    publisher.publish('portfolio', {'cash': 2})
+
+    assert publisher.flush(timeout=5)
+    assert sender.batches == [[
+        {'type': 'signals', 'data': {'symbol': 'A'}},
+        {'type': 'signals', 'data': {'symbol': 'B'}},
+        {'type': 'portfolio', 'data': {'cash': 2, 'total_value': 10}},
+    ]]
+    assert publisher.coalesced == 1
+    publisher.close()
+
+
+def test_publisher_bounded_queue_drops_oldest():
+    sender = RecordingConnector()
+    publisher = dashboard.DashboardPublisher(sender, max_queue=3, flush_interval=10)
+    for i in range(5):
+        publisher.publish('trades', {'n': i})
+
+    assert publisher.dropped == 2
+    assert publisher.flush(timeout=5)
+    assert [e['data']['n'] for e in sender.batches[0]] == [2, 3, 4]
+    publisher.close()
+
+
+def test_publisher_retries_failed_batch():
+    sender = RecordingConnector(results=[False, True])
+    publisher = dashboard.DashboardPublisher(sender, flush_interval=0.01, max_backoff=0.01)
+    publisher.publish('status', {'scan_status': 'scanning'})
+
+    assert publisher.flush(timeout=5)
+    assert len(sender.batches) == 2 and sender.batches[0] == sender.batches[1]
+    assert (publisher.failures, publisher.sent) == (1, 1)
+    publisher.close()
+
+
+def test_send_batch_posts_once_and_falls_back_without_endpoint():
+    FakeSession.default_post_responses = [FakeResponse(200), FakeResponse(404), FakeResponse(200), FakeResponse(200)]
+    connector = dashboard.DashboardConnector(base_url='http://fake', api_key='secret')
+    events = [{'type': 'signals', 'data': {'symbol': 'A'}}, {'type': 'status', 'data': {'is_running': True}}]
+    session = FakeSession.instances[-1]
+
+    assert connector.send_batch(events) == []
+    assert session.post_calls[0][:2] == ('http://fake/api/batch', {'events': events})
+
+    # Older server without /api/batch: one POST per event from then on
+    assert connector.send_batch(events) == []
+    assert [call[0] for call in session.post_calls[1:]] == [
+        'http://fake/api/batch', 'http://fake/api/signals', 'http://fake/api/status'
+    ]
+    assert not connector.batch_endpoint_available
+
+
+def test_publisher_requeues_only_undelivered_events_without_batch_endpoint():
+    # Per-event fallback: signal B fails, A and the status update arrive
+    FakeSession.default_post_responses = [FakeResponse(200), FakeResponse(500), FakeResponse(200),
+                                          FakeResponse(200)]
+    connector = dashboard.DashboardConnector(base_url='http://fake', api_key='secret')
+    connector.batch_endpoint_available = False
+    connector.circuit_breaker_timeout = 0
+    session = FakeSession.instances[-1]
+    publisher = dashboard.DashboardPublisher(connector, flush_interval=10, max_backoff=0.01)
+    publisher.publish('signals', {'symbol': 'A'})
+    publisher.publish('signals', {'symbol': 'B'})
+    publisher.publish('status', {'is_running': True})
+
+    assert publisher.flush(timeout=10)
+    posted = [(url.rsplit('/', 1)[-1], payload) for url, payload, *_ in session.post_calls]
+    assert posted.count(('signals', {'symbol': 'A'})) == 1
+    assert posted.count(('signals', {'symbol': 'B'})) == 2
+    assert posted.count(('status', {'is_running': True})) == 1
+    assert (publisher.failures, publisher.sent) == (1, 3)
+    publisher.close()
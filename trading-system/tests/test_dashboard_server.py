@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Tests for enhanced_dashboard_server.py snapshots, event stream and threaded serving"""
+
+import gzip
+import http.client
+import json
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import enhanced_dashboard_server as server_module
+from enhanced_dashboard_server import DashboardSnapshotPublisher, SecureDashboardHandler, create_server
+from infrastructure.security import (
+    PathTraversalProtector, SecureSessionManager, SecurityAuditor, SensitiveDataProtector,
+)
+
+
+def _stub_security(monkeypatch):
+    """
+    Handler security components without the key managers
+
+    Other test modules replace cryptography with mocks in sys.modules, which
+    breaks the key derivation in initialize_security.
+    """
+    components = {
+        'get_path_protector': PathTraversalProtector(Path.cwd()),
+        'get_data_protector': SensitiveDataProtector(),
+        'get_session_manager': SecureSessionManager(),
+        'get_security_auditor': SecurityAuditor(),
+    }
+    monkeypatch.setattr(server_module, 'initialize_security', lambda *args, **kwargs: None)
+    for accessor, component in components.items():
+        monkeypatch.setattr(server_module, accessor, lambda component=component: component)
+
+
+@pytest.fixture
+def dashboard(monkeypatch):
+    """Threaded server on a free port, serving dashboard_data as-is"""
+    monkeypatch.setenv('DEVELOPMENT_MODE', 'true')
+    _stub_security(monkeypatch)
+    monkeypatch.setattr(SecureDashboardHandler, 'API_KEY', None)
+    monkeypatch.setattr(SecureDashboardHandler, 'STREAM_KEEPALIVE', 0.2)
+    monkeypatch.setattr(server_module, 'dashboard_data', {'signals': [], 'portfolio': {'cash': 100}})
+    publisher = DashboardSnapshotPublisher(builder=server_module.copy_dashboard_data,
+                                           refresh_interval=0.05, min_interval=0.01)
+    monkeypatch.setattr(server_module, 'snapshot_publisher', publisher)
+
+    httpd = create_server(0, SecureDashboardHandler, host='127.0.0.1')
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd.server_address[1]
+    publisher.stop()
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_mock_position_prices_stable_across_rebuilds(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv('TRADING_SECURITY_PASSWORD', raising=False)
+    (tmp_path / 'state').mkdir()
+    (tmp_path / 'state' / 'shared_portfolio_state.json').write_text(json.dumps(
+        {'cash': 5000, 'positions': {'RELIANCE': {'entry_price': 2500.0, 'shares': 10}}}))
+    publisher = DashboardSnapshotPublisher(builder=lambda: server_module.build_live_trading_data({}))
+    monkeypatch.setattr(server_module, 'snapshot_publisher', publisher)
+
+    first = publisher.refresh()
+    assert all(publisher.refresh() is first for _ in range(5))
+    assert json.loads(first.sections['positions'])[0]['symbol'] == 'RELIANCE'
+
+
+def _get(port, path, headers=None):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+    conn.request('GET', path, headers=headers or {})
+    response = conn.getresponse()
+    return response, response.read()
+
+
+def _post(port, path, payload):
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+    conn.request('POST', path, body=json.dumps(payload), headers={'Content-Type': 'application/json'})
+    assert conn.getresponse().status == 200
+
+
+def _read_event(response):
+    """(event, id, data) of the next SSE event, skipping keepalive comments"""
+    fields = {}
+    while True:
+        line = response.readline().decode().rstrip('\n')
+        if line.startswith(':'):
+            continue
+        if not line:
+            if fields:
+                return fields.get('event'), int(fields['id']), json.loads(fields['data'])
+            continue
+        key, _, value = line.partition(': ')
+        fields[key] = value
+
+
+def test_publisher_bumps_version_only_on_change():
+    data = {'portfolio': {'cash': 1}}
+    publisher = DashboardSnapshotPublisher(builder=lambda: json.loads(json.dumps(data)))
+
+    first = publisher.refresh()
+    assert publisher.refresh() is first
+
+    data['portfolio']['cash'] = 2
+    second = publisher.refresh()
+    assert second.version == first.version + 1
+    assert second.etag != first.etag
+    assert second.changed_sections(first) == ['portfolio']
+    assert json.loads(second.body) == data
+
+
+def test_data_served_with_etag_and_gzip(dashboard):
+    response, body = _get(dashboard, '/api/data')
+    assert response.status == 200
+    assert json.loads(body) == {'signals': [], 'portfolio': {'cash': 100}}
+    etag = response.getheader('ETag')
+
+    response, body = _get(dashboard, '/api/data', {'If-None-Match': etag})
+    assert response.status == 304 and body == b''
+
+    response, body = _get(dashboard, '/api/data', {'Accept-Encoding': 'gzip'})
+    assert response.getheader('Content-Encoding') == 'gzip'
+    assert json.loads(gzip.decompress(body))['portfolio'] == {'cash': 100}
+
+
+def test_stream_sends_snapshot_then_deltas(dashboard):
+    conn = http.client.HTTPConnection('127.0.0.1', dashboard, timeout=5)
+    conn.request('GET', '/api/stream')
+    stream = conn.getresponse()
+    assert stream.getheader('Content-Type') == 'text/event-stream'
+
+    event, version, data = _read_event(stream)
+    assert event == 'snapshot'
+    assert data['signals'] == []
+
+    _post(dashboard, '/api/signals', {'symbol': 'RELIANCE', 'action': 'BUY'})
+    event, delta_version, delta = _read_event(stream)
+    assert event == 'delta'
+    assert delta_version > version and delta['since'] == version
+    assert list(delta['changed']) == ['signals']
+    assert delta['changed']['signals'][0]['symbol'] == 'RELIANCE'
+    conn.close()
+
+
+def test_slow_client_does_not_block_other_requests(dashboard):
+    # Half-sent request that never completes
+    stalled = socket.create_connection(('127.0.0.1', dashboard))
+    stalled.sendall(b'GET /api/data HTTP/1.1\r\nHost: local')
+    try:
+        started = time.monotonic()
+        response, _ = _get(dashboard, '/health')
+        assert response.status == 200
+        assert time.monotonic() - started < 2
+    finally:
+        stalled.close()
+
+
+def test_stream_rejected_on_single_threaded_server(monkeypatch):
+    monkeypatch.setenv('DEVELOPMENT_MODE', 'true')
+    _stub_security(monkeypatch)
+    monkeypatch.setattr(SecureDashboardHandler, 'API_KEY', None)
+    httpd = create_server(0, SecureDashboardHandler, threaded=False, host='127.0.0.1')
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        response, _ = _get(httpd.server_address[1], '/api/stream')
+        assert response.status == 503
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_batch_endpoint_applies_events_in_order(dashboard):
+    events = [
+        {'type': 'signals', 'data': {'symbol': 'tcs', 'action': 'BUY'}},
+        {'type': 'portfolio', 'data': {'cash': 250}},
+        {'type': 'unknown', 'data': {}},
+        {'type': 'signals', 'data': {'symbol': 'infy', 'action': 'SELL'}},
+    ]
+    conn = http.client.HTTPConnection('127.0.0.1', dashboard, timeout=5)
+    conn.request('POST', '/api/batch', body=json.dumps({'events': events}),
+                 headers={'Content-Type': 'application/json'})
+    response = conn.getresponse()
+    assert response.status == 200
+    assert json.loads(response.read()) == {'status': 'success', 'applied': 3, 'rejected': 1}
+
+    data = server_module.dashboard_data
+    assert [s['symbol'] for s in data['signals']] == ['TCS', 'INFY']
+    assert data['portfolio'] == {'cash': 250}
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Tests for incremental ML features and batched MLPredictor scoring"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from models.data_builder import MLDataBuilder
+from models.feature_engine import FEATURE_COLUMNS, RollingFeatureEngine
+from models.ml_predictor import MLPredictor
+
+
+def make_candles(rows: int, seed: int, start: str = '2025-01-06 09:15') -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 1000 * np.exp(np.cumsum(rng.normal(0, 0.002, rows)))
+    return pd.DataFrame({
+        'open': close * (1 + rng.normal(0, 0.001, rows)),
+        'high': close * (1 + np.abs(rng.normal(0, 0.002, rows))),
+        'low': close * (1 - np.abs(rng.normal(0, 0.002, rows))),
+        'close': close,
+        'volume': rng.integers(1000, 5000, rows).astype(float),
+    }, index=pd.date_range(start, periods=rows, freq='5min'))
+
+
+def full_recompute(df: pd.DataFrame) -> np.ndarray:
+    features = MLDataBuilder(None)._add_technical_features(df)
+    return features[FEATURE_COLUMNS].iloc[-1].to_numpy(dtype=float)
+
+
+def test_features_match_builder_on_first_call():
+    df = make_candles(120, seed=1)
+    engine = RollingFeatureEngine()
+
+    assert np.allclose(engine.update('AAA', df), full_recompute(df), rtol=1e-9, equal_nan=True)
+
+
+def test_incremental_updates_match_builder():
+    """Appending bars and revising the forming candle track a full recompute"""
+    df = make_candles(200, seed=2)
+    engine = RollingFeatureEngine()
+    engine.update('AAA', df.iloc[:80])
+
+    for end in range(81, 200, 7):
+        assert np.allclose(engine.update('AAA', df.iloc[:end]), full_recompute(df.iloc[:end]), rtol=1e-9)
+
+    # The latest candle is still forming: its close moves between calls
+    revised = df.copy()
+    revised.iloc[-1, revised.columns.get_loc('close')] *= 1.01
+    engine.update('AAA', df)
+    assert np.allclose(engine.update('AAA', revised), full_recompute(revised), rtol=1e-9)
+
+
+def test_edited_history_triggers_rebuild():
+    df = make_candles(100, seed=3)
+    engine = RollingFeatureEngine()
+    engine.update('AAA', df)
+
+    edited = df.copy()
+    edited.iloc[50:, edited.columns.get_loc('close')] *= 0.95
+    assert np.allclose(engine.update('AAA', edited), full_recompute(edited), rtol=1e-9)
+
+
+@pytest.mark.filterwarnings('ignore::UserWarning')
+def test_predict_many_matches_per_symbol_predict():
+    predictor = MLPredictor()
+    if predictor.model is None:
+        pytest.skip("Trained model not available")
+
+    frames = {f'SYM{i}': make_candles(150, seed=10 + i) for i in range(5)}
+    frames['SHORT'] = make_candles(20, seed=99)
+
+    batched = predictor.predict_many(frames)
+
+    assert batched['SHORT'] == {'probability': 0.5, 'direction': 0, 'confidence': 0.0}
+    for symbol, df in frames.items():
+        if symbol != 'SHORT':
+            assert batched[symbol]['probability'] == pytest.approx(predictor.predict(df)['probability'])
+            assert predictor.predict(df, symbol=symbol) == pytest.approx(batched[symbol])
+
+
+def test_unknown_feature_columns_rejected():
+    with pytest.raises(ValueError, match='momentum_5'):
+        RollingFeatureEngine(['rsi', 'momentum_5'])
+
+
+@pytest.mark.filterwarnings('ignore::UserWarning')
+def test_predictor_disables_model_with_mismatched_scaler(tmp_path):
+    joblib = pytest.importorskip('joblib')
+    sklearn_preprocessing = pytest.importorskip('sklearn.preprocessing')
+    sklearn_linear = pytest.importorskip('sklearn.linear_model')
+
+    X = pd.DataFrame(np.random.default_rng(0).normal(size=(40, 2)), columns=['rsi', 'momentum_5'])
+    y = (X['rsi'] > 0).astype(int)
+    scaler = sklearn_preprocessing.StandardScaler().fit(X)
+    joblib.dump(sklearn_linear.LogisticRegression().fit(scaler.transform(X), y), tmp_path / 'rf_model_latest.joblib')
+    joblib.dump(scaler, tmp_path / 'scaler_latest.joblib')
+
+    predictor = MLPredictor(str(tmp_path))
+
+    assert predictor.model is None
+    assert predictor.predict_many({'AAA': make_candles(80, seed=1)})['AAA']['confidence'] == 0.0
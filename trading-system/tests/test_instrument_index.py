@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tests for the F&O instrument index and indexed option-chain lookups
+"""
+
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fno.data_provider import FNODataProvider
+from fno.instrument_index import InstrumentIndex, expiry_to_date
+
+TODAY = datetime.now().date()
+
+
+def make_master(name='NIFTY', exchange='NFO', expiries=None, strikes=(24000, 24100, 24200)):
+    expiries = expiries or [TODAY + timedelta(days=d) for d in (14, 0, 7)]
+    master = []
+    token = 1000 if exchange == 'NFO' else 5000
+    for expiry in expiries:
+        tag = expiry.strftime('%y%b').upper()
+        token += 1
+        master.append({'instrument_token': token, 'tradingsymbol': f'{name}{tag}{expiry.day}FUT',
+                       'name': name, 'expiry': expiry, 'strike': 0.0,
+                       'instrument_type': 'FUT', 'exchange': exchange})
+        for strike in strikes:
+            for option_type in ('CE', 'PE'):
+                token += 1
+                master.append({'instrument_token': token,
+                               'tradingsymbol': f'{name}{tag}{expiry.day}{strike}{option_type}',
+                               'name': name, 'expiry': expiry, 'strike': float(strike),
+                               'instrument_type': option_type, 'exchange': exchange})
+    return master
+
+
+class TestInstrumentIndex:
+
+    def test_expiry_normalisation(self):
+        assert expiry_to_date('2025-01-30') == date(2025, 1, 30)
+        assert expiry_to_date(datetime(2025, 1, 30, 15, 30)) == date(2025, 1, 30)
+        assert expiry_to_date(date(2025, 1, 30)) == date(2025, 1, 30)
+        assert expiry_to_date(None) is None
+
+    def test_expiries_sorted_and_contract_lookup(self):
+        index = InstrumentIndex(make_master() + make_master('SENSEX', 'BFO', strikes=(80000,)))
+
+        expiries = index.option_expiries('NIFTY')
+        assert expiries == sorted(expiries)
+        assert len(expiries) == 3
+
+        futures = index.futures('NIFTY')
+        assert [index.expiry_of(f) for f in futures] == expiries
+
+        ce = index.contract('NIFTY', 'CE', expiries[1], 24100)
+        assert ce['strike'] == 24100.0 and ce['instrument_type'] == 'CE'
+        assert index.contract('NIFTY', 'CE', expiries[1], 99999) is None
+        assert index.contract('SENSEX', 'PE', index.option_expiries('SENSEX')[0], 80000)['exchange'] == 'BFO'
+
+    def test_options_per_expiry_and_next_expiry(self):
+        index = InstrumentIndex(make_master())
+        week = TODAY + timedelta(days=7)
+
+        assert len(index.options('NIFTY', week)) == 6
+        assert len(index.options('NIFTY')) == 18
+        assert index.next_option_expiry('NIFTY', TODAY) == week
+        assert index.next_option_expiry('NIFTY', TODAY, inclusive=True) == TODAY
+        assert index.next_option_expiry('NIFTY', TODAY + timedelta(days=30)) is None
+        assert index.options('BANKNIFTY') == []
+
+
+class TestIndexedOptionChain:
+
+    def _provider(self, master):
+        kite = Mock()
+        kite.instruments.side_effect = lambda exchange: [i for i in master if i['exchange'] == exchange]
+        kite.quote.side_effect = lambda symbols: {
+            s: {'last_price': 100.0, 'volume': 10, 'oi': 5, 'depth': {}} for s in symbols
+        }
+        provider = FNODataProvider(kite=kite)
+        provider.get_available_indices = Mock(return_value={'NIFTY': SimpleNamespace(lot_size=75)})
+        return provider, kite
+
+    def test_chain_uses_next_future_expiry(self):
+        master = make_master()
+        provider, kite = self._provider(master)
+        week = TODAY + timedelta(days=7)
+        week_future = next(i for i in master if i['instrument_type'] == 'FUT' and i['expiry'] == week)
+
+        chain = provider.fetch_option_chain('NIFTY')
+
+        assert chain is not None
+        assert chain.expiry_date == week.strftime('%Y-%m-%d')
+        assert len(chain.calls) == 3 and len(chain.puts) == 3
+        # Spot reference is the nearest non-expiring future
+        assert kite.quote.call_args_list[0].args[0] == [f"NFO:{week_future['tradingsymbol']}"]
+
+    def test_master_fetched_once_and_shared_with_price_lookup(self):
+        provider, kite = self._provider(make_master())
+
+        provider.fetch_option_chain('NIFTY')
+        provider.fetch_option_chain('NIFTY', expiry_date=(TODAY + timedelta(days=14)).strftime('%Y-%m-%d'))
+        provider._build_instrument_lookup()
+
+        assert kite.instruments.call_count == 2  # NFO + BFO, once
+        assert provider.instrument_lookup is provider._get_instrument_index().by_symbol
+        symbol = make_master()[1]['tradingsymbol']
+        assert provider.instrument_lookup[symbol]['exchange'] == 'NFO'
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for the Kite ticker binary frame decoder
+"""
+
+import struct
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.kite_ticker_decoder import (
+    PACKET_FULL,
+    TickDecodeError,
+    decode_depth,
+    decode_frame,
+    split_frame,
+)
+
+RELIANCE = 738561        # NSE segment (1)
+NIFTY_INDEX = 256265     # indices segment (9)
+USDINR_FUT = 412675      # CDS segment (3)
+
+
+def ltp_packet(token, price):
+    return struct.pack('>ii', token, price)
+
+
+def quote_packet(token, ltp, last_qty=10, avg=0, volume=1000, buy=50, sell=60,
+                 o=0, h=0, l=0, c=0):
+    return struct.pack('>11i', token, ltp, last_qty, avg, volume, buy, sell, o, h, l, c)
+
+
+def full_packet(token, ltp, exchange_ts, oi=5000, bids=None, asks=None):
+    bids = bids or [(100 + i, ltp - 5 * (i + 1), 2) for i in range(5)]
+    asks = asks or [(200 + i, ltp + 5 * (i + 1), 3) for i in range(5)]
+    body = quote_packet(token, ltp, volume=123456, o=ltp - 100, h=ltp + 200, l=ltp - 300, c=ltp - 50)
+    body += struct.pack('>5i', exchange_ts - 2, oi, oi + 10, oi - 10, exchange_ts)
+    for qty, price, orders in bids + asks:
+        body += struct.pack('>iihh', qty, price, orders, 0)
+    assert len(body) == PACKET_FULL
+    return body
+
+
+def index_full_packet(token, ltp, exchange_ts):
+    return struct.pack('>8i', token, ltp, ltp + 100, ltp - 100, ltp - 20, ltp - 40, 40, exchange_ts)
+
+
+def frame(*packets):
+    return struct.pack('>H', len(packets)) + b''.join(struct.pack('>H', len(p)) + p for p in packets)
+
+
+class TestSplitFrame:
+
+    def test_heartbeat_and_empty_frames(self):
+        assert split_frame(b'\x00') == {}
+        assert split_frame(struct.pack('>H', 0)) == {}
+        assert len(decode_frame(b'\x00')['token']) == 0
+
+    def test_uniform_frame_is_zero_copy_view(self):
+        data = frame(*(ltp_packet(RELIANCE + i * 256, 100000 + i) for i in range(50)))
+        groups = split_frame(data)
+
+        packets = groups[8]
+        assert len(packets) == 50
+        assert not packets.flags.owndata
+        assert np.shares_memory(packets, np.frombuffer(data, dtype=np.uint8))
+
+    def test_truncated_and_unknown_lengths_raise(self):
+        data = frame(ltp_packet(RELIANCE, 100))
+        with pytest.raises(TickDecodeError):
+            split_frame(data[:-3])
+        with pytest.raises(TickDecodeError):
+            split_frame(frame(b'\x00' * 12))
+
+
+class TestDecodeFrame:
+
+    def test_ltp_and_quote_prices(self):
+        cols = decode_frame(frame(quote_packet(RELIANCE, 245075, volume=98765)))
+
+        assert cols['last_price'][0] == 2450.75
+        assert cols['volume'][0] == 98765
+        assert cols['last_quantity'][0] == 10
+        assert np.isnan(cols['bid_price'][0])
+        assert cols['exchange_timestamp'][0] == 0
+
+    def test_full_mode_depth_and_timestamps(self):
+        ts = 1_736_140_500
+        cols = decode_frame(frame(full_packet(RELIANCE, 245075, ts, oi=7000)))
+
+        assert cols['exchange_timestamp'][0] == ts * 1_000_000_000
+        assert cols['oi'][0] == 7000
+        assert cols['bid_price'][0] == pytest.approx(2450.70)
+        assert cols['ask_price'][0] == pytest.approx(2450.80)
+        assert cols['bid_quantity'][0] == 100
+        assert cols['ask_quantity'][0] == 200
+        assert cols['high'][0] == pytest.approx(2452.75)
+
+    def test_mixed_modes_and_segment_divisors(self):
+        ts = 1_736_140_500
+        data = frame(
+            ltp_packet(RELIANCE, 245075),
+            index_full_packet(NIFTY_INDEX, 2415050, ts),
+            ltp_packet(USDINR_FUT, 834512500),
+            full_packet(RELIANCE, 245100, ts),
+        )
+        cols = decode_frame(data)
+
+        assert len(cols['token']) == 4
+        prices = dict(zip(cols['token'].tolist(), cols['last_price'].tolist()))
+        assert prices[NIFTY_INDEX] == 24150.50
+        assert prices[USDINR_FUT] == pytest.approx(83.45125)
+        assert sorted(cols['packet_length'].tolist()) == [8, 8, 32, 184]
+
+    def test_unsigned_fields_above_int32(self):
+        token = 3_000_000_001    # NSE token with the high bit set
+        volume = 2**31 + 12345
+        packet = struct.pack('>IiIiIIIiiii', token, 245075, 10, 0, volume, 4_000_000_000, 60, 0, 0, 0, 0)
+        cols = decode_frame(frame(packet))
+
+        assert cols['token'][0] == token
+        assert cols['volume'][0] == volume
+        assert cols['buy_quantity'][0] == 4_000_000_000
+        assert cols['last_price'][0] == 2450.75
+
+    def test_decode_depth_levels(self):
+        packet = full_packet(RELIANCE, 245075, 1_736_140_500)
+        depth = decode_depth(packet)
+
+        assert len(depth['bids']) == 5 and len(depth['asks']) == 5
+        assert depth['bids'][0] == (pytest.approx(2450.70), 100, 2)
+        assert depth['asks'][4][0] == pytest.approx(2451.00)
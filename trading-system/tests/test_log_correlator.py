@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Tests for log_correlator.py bulk ingestion and incremental tailing"""
+
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from infrastructure.log_correlator import LogCorrelator, LogEntry, LogLevel
+
+
+def _line(i, level='INFO'):
+    return f"2025-01-15 10:{i // 60 % 60:02d}:{i % 60:02d},{i % 1000:03d} - {level} - execution - order_id=ORD_{i % 7} - step {i}\n"
+
+
+def _indexes(db_path):
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'logs'")}
+    finally:
+        conn.close()
+
+
+def test_bulk_file_ingest_in_batches(tmp_path):
+    log = tmp_path / 'day.log'
+    log.write_text(''.join(_line(i, 'ERROR' if i % 10 == 0 else 'INFO') for i in range(1000)) + '\n')
+    correlator = LogCorrelator(str(tmp_path / 'logs.db'), batch_size=64, bulk_load_bytes=1)
+
+    assert correlator.ingest_log_file(log) == 1000
+    assert len(correlator.query_logs(level=LogLevel.ERROR, limit=5000)) == 100
+    assert len(correlator.get_correlated_logs('ORD_3').entries) == len(range(3, 1000, 7))
+    # Indexes dropped for the bulk load are back
+    assert {'idx_logs_timestamp', 'idx_logs_correlation'} <= _indexes(tmp_path / 'logs.db')
+
+    conn = sqlite3.connect(str(tmp_path / 'logs.db'))
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+    conn.close()
+
+
+def test_tail_ingests_only_appended_complete_lines(tmp_path):
+    log = tmp_path / 'live.log'
+    log.write_text(''.join(_line(i) for i in range(10)))
+    correlator = LogCorrelator(str(tmp_path / 'logs.db'), batch_size=4)
+
+    assert correlator.tail_log_file(log) == 10
+    assert correlator.tail_log_file(log) == 0
+
+    # Second line is still being written
+    with open(log, 'a') as f:
+        f.write(_line(10) + _line(11).rstrip('\n'))
+    assert correlator.tail_log_file(log) == 1
+    with open(log, 'a') as f:
+        f.write('\n')
+    assert correlator.tail_log_file(log) == 1
+    assert correlator.get_ingest_offset(log)[1] == log.stat().st_size
+    assert len(correlator.query_logs(limit=100)) == 12
+
+
+def test_tail_restarts_after_truncation(tmp_path):
+    log = tmp_path / 'rotating.log'
+    log.write_text(''.join(_line(i) for i in range(20)))
+    correlator = LogCorrelator(str(tmp_path / 'logs.db'))
+    assert correlator.tail_log_file(log) == 20
+
+    log.write_text(''.join(_line(i) for i in range(3)))
+    assert correlator.tail_log_file(log) == 3
+
+
+def test_ingest_logs_executemany_batches(tmp_path):
+    correlator = LogCorrelator(str(tmp_path / 'logs.db'), batch_size=3)
+    entries = [
+        LogEntry(datetime(2025, 1, 15, 10, 0, i), LogLevel.INFO, 'strategy', f'signal {i}',
+                 context={'i': i}, correlation_id='TRADE_1')
+        for i in range(8)
+    ]
+
+    assert correlator.ingest_logs(entries) == 8
+    assert correlator.ingest_log(entries[0])
+    correlated = correlator.get_correlated_logs('TRADE_1')
+    assert len(correlated.entries) == 9
+    assert correlated.entries[-1].context == {'i': 7}
+
+
+def test_file_ingest_holds_back_unterminated_line(tmp_path):
+    log = tmp_path / 'writing.log'
+    log.write_text(''.join(_line(i) for i in range(5)) + _line(5).rstrip('\n')[:30])
+    correlator = LogCorrelator(str(tmp_path / 'logs.db'))
+
+    assert correlator.ingest_log_file(log, final=False) == 5
+    assert correlator.get_ingest_offset(log)[1] == len(''.join(_line(i) for i in range(5)))
+
+    # The writer finishes the line; the tail picks it up whole
+    with open(log, 'a') as f:
+        f.write(_line(5)[30:])
+    assert correlator.tail_log_file(log) == 1
+    assert correlator.query_logs(search_text='step 5', limit=10)[0]['message'].endswith('step 5')
+
+
+def test_file_ingest_resumes_from_recorded_offset(tmp_path):
+    log = tmp_path / 'resume.log'
+    log.write_text(''.join(_line(i) for i in range(300)))
+    correlator = LogCorrelator(str(tmp_path / 'logs.db'), batch_size=64)
+
+    assert correlator.ingest_log_file(log) == 300
+    assert correlator.ingest_log_file(log) == 0
+    assert len(correlator.query_logs(limit=1000)) == 300
+
+
+def test_complete_file_without_trailing_newline(tmp_path):
+    log = tmp_path / 'archived.log'
+    log.write_text(_line(0) + _line(1).rstrip('\n'))
+    correlator = LogCorrelator(str(tmp_path / 'logs.db'))
+
+    assert correlator.ingest_log_file(log) == 2
+    assert correlator.get_ingest_offset(log)[1] == log.stat().st_size
+    assert correlator.tail_log_file(log) == 0
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for deep size accounting, size-aware eviction and namespace budgets
+in the memory-bounded cache
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from infrastructure.memory_bounded_cache import InstrumentCache, MemoryBoundedCache, estimate_size
+
+MB = 1024 * 1024
+
+
+def frame(rows):
+    return pd.DataFrame({
+        'open': np.random.rand(rows),
+        'close': np.random.rand(rows),
+        'symbol': ['RELIANCE'] * rows,
+    })
+
+
+class TestEstimateSize:
+
+    def test_dataframe_counts_object_columns(self):
+        df = frame(20_000)
+        assert estimate_size(df) >= df.memory_usage(deep=True).sum()
+        assert estimate_size(df) > 20_000 * 16
+
+    def test_numpy_views_count_buffer(self):
+        arr = np.zeros(100_000)
+        assert estimate_size(arr) >= arr.nbytes
+        assert estimate_size(arr[::2]) >= arr[::2].nbytes
+
+    def test_nested_containers_are_deep_and_shared_objects_counted_once(self):
+        df = frame(10_000)
+        single = estimate_size({'bars': df})
+        shared = estimate_size({'bars': df, 'same': [df, df]})
+        assert single > df.memory_usage(deep=True).sum()
+        assert shared - single < 1024
+
+
+class TestSizeAwareEviction:
+
+    def test_dataframes_respect_byte_limit(self):
+        cache = MemoryBoundedCache(max_size_mb=2, max_entries=100)
+        for i in range(10):
+            cache.set(f'bars:{i}', frame(10_000))
+
+        stats = cache.get_stats()
+        assert stats['size_mb'] <= 2 * cache.eviction_threshold
+        assert stats['evictions'] > 0
+        assert stats['evicted_mb'] > 0
+
+    def test_large_stale_entry_evicted_before_small_hot_entries(self):
+        cache = MemoryBoundedCache(max_size_mb=1, max_entries=100)
+        cache.set('bars:big', np.zeros(60_000))  # ~0.46MB
+        for i in range(5):
+            cache.set(f'quote:{i}', {'ltp': float(i)})
+            cache.get(f'quote:{i}')
+
+        cache.set('bars:new', np.zeros(60_000))
+
+        assert cache.get('bars:big') is None
+        assert all(cache.get(f'quote:{i}') is not None for i in range(5))
+
+    def test_per_entry_ttl(self):
+        cache = MemoryBoundedCache(max_size_mb=1, default_ttl=60)
+        cache.set('short', 'x', ttl=0.05)
+        cache.set('long', 'y')
+        time.sleep(0.1)
+        assert cache.get('short') is None
+        assert cache.get('long') == 'y'
+
+
+class TestNamespaceBudgets:
+
+    def test_budget_limits_only_its_namespace(self):
+        cache = MemoryBoundedCache(max_size_mb=10, namespace_budgets_mb={'bars': 1})
+        cache.set('quote:NIFTY', {'ltp': 25000})
+        for i in range(5):
+            cache.set(f'bars:{i}', np.zeros(40_000))  # ~0.3MB each
+
+        stats = cache.get_stats()
+        bars = stats['namespaces']['bars']
+        assert bars['size_mb'] <= 1
+        assert bars['budget_mb'] == 1
+        assert bars['evictions'] >= 2
+        assert stats['namespaces']['quote']['evictions'] == 0
+        assert cache.get('quote:NIFTY') == {'ltp': 25000}
+
+    def test_clear_resets_namespace_evictions(self):
+        cache = MemoryBoundedCache(max_size_mb=10, namespace_budgets_mb={'bars': 1})
+        for i in range(5):
+            cache.set(f'bars:{i}', np.zeros(40_000))
+        assert cache.get_stats()['namespaces']['bars']['evictions'] >= 2
+
+        cache.clear()
+        cache.set('bars:0', np.zeros(40_000))
+        bars = cache.get_stats()['namespaces']['bars']
+        assert (bars['entries'], bars['evictions']) == (1, 0)
+
+    def test_entry_over_namespace_budget_rejected(self):
+        cache = MemoryBoundedCache(max_size_mb=10)
+        cache.set_namespace_budget('bars', 0.1)
+        assert cache.set('bars:big', np.zeros(100_000)) is False
+        assert cache.get_stats()['rejections'] == 1
+
+    def test_instrument_cache_namespaces(self):
+        cache = InstrumentCache(max_size_mb=10, namespace_budgets_mb={'quote': 1})
+        cache.set_instrument('RELIANCE', {'exchange': 'NSE', 'lot_size': 1})
+        cache.set_quote('RELIANCE', {'ltp': 2500.0})
+
+        namespaces = cache.get_stats()['namespaces']
+        assert namespaces['instrument']['entries'] == 1
+        assert namespaces['quote']['budget_mb'] == 1
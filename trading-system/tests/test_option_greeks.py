@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Tests for the vectorized option-chain IV and Greeks engine
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fno.analytics import FNOAnalytics
+from fno.options import (
+    OptionChain,
+    OptionContract,
+    black_scholes_price_array,
+    calculate_chain_greeks,
+    implied_volatility_array,
+)
+
+NOW = datetime(2025, 1, 6, 10, 0)
+
+
+def build_chain(spot=48000.0, strikes=range(44000, 52100, 100), vol=0.18,
+                expiry=NOW + timedelta(days=10), now=NOW):
+    chain = OptionChain('BANKNIFTY', expiry.strftime('%Y-%m-%d'), 15)
+    chain.spot_price = spot
+    t = chain.time_to_expiry(now)
+    for strike in strikes:
+        for option_type in ('CE', 'PE'):
+            option = OptionContract(f'BANKNIFTY{strike}{option_type}', float(strike),
+                                    chain.expiry_date, option_type, 'BANKNIFTY', 15)
+            option.last_price = float(black_scholes_price_array(
+                spot, strike, t, vol, option_type == 'CE'))
+            chain.add_option(option)
+    return chain
+
+
+class TestImpliedVolatilityArray:
+
+    def test_recovers_known_volatility(self):
+        strikes = np.array([40000, 46000, 48000, 50000, 56000], dtype=float)
+        is_call = np.array([True, False, True, True, False])
+        prices = black_scholes_price_array(48000.0, strikes, 0.05, 0.22, is_call)
+
+        iv = implied_volatility_array(prices, 48000.0, strikes, 0.05, is_call)
+
+        np.testing.assert_allclose(iv, 0.22, atol=1e-3)
+
+    def test_deep_wings_converge_in_few_iterations(self):
+        # ITM legs are priced almost entirely by intrinsic value
+        strikes = np.array([43000, 43500, 52500, 53000, 44000, 52000], dtype=float)
+        is_call = np.array([True, False, False, True, True, False])
+        t = 7 / 365
+        prices = black_scholes_price_array(48000.0, strikes, t, 0.30, is_call)
+
+        iv = implied_volatility_array(prices, 48000.0, strikes, t, is_call, max_iterations=6)
+
+        np.testing.assert_allclose(iv, 0.30, atol=1e-3)
+
+    def test_invalid_prices_return_nan(self):
+        iv = implied_volatility_array(
+            market_price=[0.0, 60000.0, 10.0],
+            spot=48000.0, strike=[48000.0, 48000.0, 48000.0],
+            time_to_expiry=[0.05, 0.05, 0.0], is_call=[True, True, True],
+        )
+        assert np.isnan(iv).all()
+
+    def test_matches_scalar_analytics_wrapper(self):
+        option = OptionContract('NIFTY24000CE', 24000.0, '2025-01-16', 'CE', 'NIFTY', 75)
+        option.last_price = float(black_scholes_price_array(23800.0, 24000.0, 0.03, 0.15, True))
+
+        iv = FNOAnalytics().calculate_implied_volatility(option, 23800.0, 0.03)
+
+        assert iv == pytest.approx(15.0, abs=0.1)
+
+
+class TestChainGreeks:
+
+    def test_chain_greeks_match_scalar_contract_greeks(self):
+        chain = build_chain()
+        updated = chain.calculate_greeks(now=NOW)
+        assert updated == len(chain.calls) + len(chain.puts)
+
+        t = chain.time_to_expiry(NOW)
+        for option in (chain.calls[48000.0], chain.puts[46500.0], chain.calls[51000.0]):
+            assert option.implied_volatility == pytest.approx(18.0, abs=0.05)
+            reference = OptionContract(option.symbol, option.strike_price, option.expiry_date,
+                                       option.option_type, option.underlying, option.lot_size)
+            reference.calculate_greeks(chain.spot_price, t, option.implied_volatility)
+            for greek in ('delta', 'gamma', 'theta', 'vega', 'rho'):
+                assert getattr(option, greek) == pytest.approx(getattr(reference, greek), rel=1e-6, abs=1e-9)
+
+    def test_moneyness_and_intrinsic_use_chain_spot(self):
+        chain = build_chain(strikes=[47000])
+        chain.calculate_greeks(now=NOW)
+
+        call, put = chain.calls[47000.0], chain.puts[47000.0]
+        assert call.intrinsic_value == pytest.approx(1000.0)
+        assert put.intrinsic_value == 0.0
+        assert call.is_itm() and put.is_otm()
+
+    def test_default_volatility_used_when_price_missing(self):
+        chain = build_chain(strikes=[48000])
+        chain.calls[48000.0].last_price = 0.0
+        chain.calculate_greeks(default_volatility=20.0, now=NOW)
+
+        call = chain.calls[48000.0]
+        assert call.implied_volatility == 0.0
+        assert 0.4 < call.delta < 0.7
+
+    def test_multiple_expiries_in_one_pass(self):
+        near = build_chain(strikes=[48000], expiry=NOW + timedelta(days=3))
+        far = build_chain(strikes=[48000], expiry=NOW + timedelta(days=30), vol=0.25)
+
+        assert calculate_chain_greeks([near, far], now=NOW) == 4
+        assert near.calls[48000.0].implied_volatility == pytest.approx(18.0, abs=0.05)
+        assert far.calls[48000.0].implied_volatility == pytest.approx(25.0, abs=0.05)
+        assert far.calls[48000.0].vega > near.calls[48000.0].vega
+
+    def test_large_chain_is_fast(self):
+        chain = build_chain(strikes=range(40000, 56000, 50))
+        chain.calculate_greeks(now=NOW)  # warm-up
+
+        start = time.perf_counter()
+        chain.calculate_greeks(now=NOW)
+        elapsed = time.perf_counter() - start
+
+        assert len(chain.calls) == 320
+        assert elapsed < 0.05
+
+    def test_analytics_chain_iv_surface(self):
+        now = datetime.now()
+        chain = build_chain(strikes=[47000, 48000, 49000], expiry=now + timedelta(days=10), now=now)
+
+        surface = FNOAnalytics().calculate_chain_implied_volatility(chain)
+
+        assert set(surface) == {47000.0, 48000.0, 49000.0}
+        assert surface[48000.0]['CE'] == pytest.approx(surface[48000.0]['PE'], abs=0.05)
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""Tests for order_tracker.py and TradeExecutor live order submission"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.order_tracker import OrderHandle, OrderTracker
+from core.trade_executor import TradeExecutor
+
+
+class FakeKite:
+    """Broker double whose market orders complete ``fill_delay`` seconds after placement"""
+
+    VARIETY_REGULAR = 'regular'
+
+    def __init__(self, fill_delay=0.05, reject=()):
+        self.fill_delay = fill_delay
+        self.reject = set(reject)
+        self.placed = {}
+        self.orders_calls = 0
+        self.cancelled = []
+        self._lock = threading.Lock()
+
+    def place_order(self, tradingsymbol, quantity, **kwargs):
+        with self._lock:
+            order_id = f"O{len(self.placed) + 1}"
+            self.placed[order_id] = (tradingsymbol, quantity, time.monotonic())
+        return order_id
+
+    def orders(self):
+        self.orders_calls += 1
+        now = time.monotonic()
+        rows = []
+        for order_id, (symbol, quantity, placed_at) in list(self.placed.items()):
+            if order_id in self.reject:
+                rows.append({'order_id': order_id, 'status': 'REJECTED', 'status_message': 'margin'})
+            elif now - placed_at >= self.fill_delay:
+                rows.append({'order_id': order_id, 'status': 'COMPLETE',
+                             'filled_quantity': quantity, 'average_price': 101.5})
+            else:
+                rows.append({'order_id': order_id, 'status': 'OPEN', 'filled_quantity': 0})
+        return rows
+
+    def order_history(self, order_id):
+        raise AssertionError("per-order polling should not be used")
+
+    def cancel_order(self, variety, order_id):
+        self.cancelled.append(order_id)
+
+    def order_margins(self, params):
+        return [{'total': 0.0}]
+
+    def margins(self):
+        return {'equity': {'available': {'cash': 1e9}}}
+
+    def get_gtts(self):
+        return []
+
+
+def test_stream_updates_resolve_orders():
+    tracker = OrderTracker()
+    handle = tracker.track('A1', 50)
+    tracker.on_order_update({'order_id': 'A1', 'status': 'OPEN', 'filled_quantity': 25})
+    assert not handle.done()
+
+    tracker.on_order_update({'order_id': 'A1', 'status': 'COMPLETE', 'filled_quantity': 50, 'average_price': '99.5'})
+    fill = handle.wait(0)
+    assert (fill.status, fill.filled_quantity, fill.average_price) == ('COMPLETE', 50, 99.5)
+    assert tracker.pending_count == 0
+
+
+def test_update_before_track_is_applied():
+    """A stream can report the fill before place_order returns the id"""
+    tracker = OrderTracker()
+    tracker.on_order_update({'order_id': 'A2', 'status': 'REJECTED', 'status_message': 'no margin'})
+
+    fill = tracker.track('A2', 10).wait(0)
+    assert fill.status == 'FAILED'
+    assert fill.average_price is None
+    assert 'no margin' in fill.message
+
+
+def test_batched_poll_resolves_many_orders():
+    kite = FakeKite(fill_delay=0.05, reject={'O3'})
+    tracker = OrderTracker(kite, poll_interval=0.02)
+    handles = [tracker.track(kite.place_order(f"S{i}", 10 * (i + 1)), 10 * (i + 1)) for i in range(4)]
+
+    fills = [h.wait(timeout=2) for h in handles]
+    assert [f.status for f in fills] == ['COMPLETE', 'COMPLETE', 'FAILED', 'COMPLETE']
+    assert fills[1].filled_quantity == 20
+    # One orders() call per interval serves all four orders
+    assert kite.orders_calls <= 10
+
+
+def test_streaming_tracker_does_not_poll():
+    kite = FakeKite()
+    pipeline = SimpleNamespace(on_order_update=lambda callback: None)
+    tracker = OrderTracker(kite, poll_interval=0.01)
+    tracker.attach_stream(pipeline)
+
+    handle = tracker.track('X', 1)
+    time.sleep(0.05)
+    assert kite.orders_calls == 0
+    assert handle.wait(0) is None
+
+
+def _executor(kite):
+    portfolio = SimpleNamespace(
+        kite=kite,
+        trading_mode='live',
+        market_hours_manager=SimpleNamespace(can_trade=lambda: (True, '')),
+        security_context=None,
+        pricing_engine=None,
+        dashboard=None,
+        silent=True,
+        positions={},
+        position_entry_times={},
+        cash=1e7,
+        _cash_lock=threading.Lock(),
+        _position_lock=threading.Lock(),
+        total_pnl=0.0,
+        winning_trades=0,
+        losing_trades=0,
+        trades_count=0,
+        can_exit_position=lambda symbol: True,
+        record_trade=lambda symbol, side, shares, price, *args: {'symbol': symbol, 'side': side,
+                                                                 'shares': shares, 'price': price},
+    )
+    executor = TradeExecutor(portfolio)
+    executor.order_tracker.poll_interval = 0.02
+    return executor
+
+
+def test_iron_condor_legs_submitted_before_waiting():
+    kite = FakeKite(fill_delay=0.3)
+    executor = _executor(kite)
+    legs = [
+        dict(symbol='NIFTY24DEC24500CE', shares=50, price=100.0, side='sell'),
+        dict(symbol='NIFTY24DEC24700CE', shares=50, price=40.0, side='buy'),
+        dict(symbol='NIFTY24DEC23500PE', shares=50, price=90.0, side='sell'),
+        dict(symbol='NIFTY24DEC23300PE', shares=50, price=35.0, side='buy'),
+    ]
+
+    started = time.monotonic()
+    results = executor.execute_trades(legs)
+    elapsed = time.monotonic() - started
+
+    assert all(results)
+    assert [r['side'] for r in results] == ['sell', 'buy', 'sell', 'buy']
+    placed_at = [placed for _, _, placed in kite.placed.values()]
+    assert max(placed_at) - min(placed_at) < 0.1
+    # Four sequential waits would take at least 4 x fill_delay
+    assert elapsed < 2 * kite.fill_delay
+
+
+def test_wait_cancels_unfilled_order_on_timeout():
+    kite = FakeKite(fill_delay=60)
+    executor = _executor(kite)
+    handle = executor.place_live_order('RELIANCE', 10, 2500.0, 'BUY')
+    assert isinstance(handle, OrderHandle)
+
+    assert executor._wait_for_order_completion(handle, 10, timeout=0.05) == (0, None)
+    assert kite.cancelled == [handle.order_id]
+    assert executor.order_tracker.pending_count == 0
+
+
+def test_rejected_leg_returns_none():
+    kite = FakeKite(fill_delay=0.0, reject={'O2'})
+    executor = _executor(kite)
+    results = executor.execute_trades([
+        dict(symbol='NIFTY24DEC24000CE', shares=50, price=100.0, side='buy'),
+        dict(symbol='NIFTY24DEC24000PE', shares=50, price=100.0, side='buy'),
+    ])
+    assert results[0] is not None and results[1] is None
+
+
+def test_later_legs_checked_against_margin_reserved_by_earlier_legs():
+    kite = FakeKite(fill_delay=0.0)
+    kite.order_margins = lambda params: [{'total': params[0]['quantity'] * params[0]['price']}]
+    kite.margins = lambda: {'equity': {'available': {'cash': 8000.0}}}
+    executor = _executor(kite)
+
+    results = executor.execute_trades([
+        dict(symbol='NIFTY24DEC24000CE', shares=50, price=100.0, side='buy'),
+        dict(symbol='NIFTY24DEC24000PE', shares=50, price=100.0, side='buy'),
+    ])
+
+    # Each leg needs 5000; only the first fits in 8000
+    assert results[0] is not None and results[1] is None
+    assert len(kite.placed) == 1
+
+
+def test_multi_leg_dispatch_requires_explicit_capability():
+    from unittest.mock import Mock
+    from core.portfolio.portfolio import UnifiedPortfolio
+    from fno.strategy_selector import IntelligentFNOStrategySelector
+
+    legs = [dict(symbol='NIFTY24DEC24000CE', shares=50, price=100.0, side='buy')]
+    portfolio = Mock()
+    portfolio.execute_trade.return_value = {'side': 'buy'}
+
+    assert IntelligentFNOStrategySelector._execute_legs(portfolio, legs) == [{'side': 'buy'}]
+    portfolio.execute_trades.assert_not_called()
+    assert UnifiedPortfolio.supports_multi_leg_orders is True
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Tests for real strategy execution and shared-memory process pools in the
+parallel backtesting engine
+"""
+
+import pickle
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from dateutil.tz import tzoffset
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.vectorized_backtester import Strategy
+from data.candle_store import CandleStore
+from infrastructure.parallel_backtester import (
+    BacktestConfig,
+    ParallelBacktestEngine,
+    ParameterGrid,
+    SharedMarketData,
+    simulate_strategy,
+)
+
+START = datetime(2025, 1, 1)
+END = datetime(2025, 12, 31)
+
+
+def make_frame(closes, start='2025-01-01', freq='D', tz=None):
+    index = pd.date_range(start, periods=len(closes), freq=freq, tz=tz, name='date')
+    closes = np.asarray(closes, dtype=float)
+    return pd.DataFrame({'open': closes, 'high': closes, 'low': closes,
+                         'close': closes, 'volume': 1000.0}, index=index)
+
+
+def random_walk(seed, periods=300):
+    rng = np.random.default_rng(seed)
+    return make_frame(100 * np.exp(np.cumsum(rng.normal(0, 0.01, periods))))
+
+
+def config(**overrides):
+    params = dict(strategy_name='test', start_date=START, end_date=END, symbols=['AAA'],
+                  timeframe='day', commission=0.0, slippage=0.0, max_position_size=1.0,
+                  stop_loss_pct=0.0, take_profit_pct=0.0)
+    params.update(overrides)
+    return BacktestConfig(**params)
+
+
+def ma_cross(config, data):
+    """Module-level so process pools can pickle it"""
+    fast = data['close'].rolling(config.parameters['fast']).mean()
+    slow = data['close'].rolling(config.parameters['slow']).mean()
+    return np.sign(fast - slow).diff().fillna(0).clip(-1, 1)
+
+
+class Momentum(Strategy):
+
+    def __init__(self, lookback=5):
+        self.lookback = lookback
+
+    def generate_signals(self, data):
+        change = data['close'].pct_change(self.lookback)
+        return pd.DataFrame({'signal': np.sign(change).fillna(0)}, index=data.index)
+
+
+class TestSimulateStrategy:
+
+    def test_buy_and_sell_signals_produce_real_trades(self):
+        df = make_frame([100, 100, 110, 121, 121, 110, 110])
+        signals = [0, 1, 0, 0, -1, 0, 0]  # long from bar 1 close to bar 4 close
+
+        result = simulate_strategy(config(), lambda c, d: signals, {'AAA': df})
+
+        assert result.total_trades == 1
+        assert result.winning_trades == 1
+        assert result.total_return == pytest.approx(0.21)
+        assert result.final_capital == pytest.approx(1_210_000)
+        assert result.max_drawdown == 0
+
+    def test_costs_and_stop_loss(self):
+        df = make_frame([100, 100, 97, 90, 95, 100])
+        signals = [0, 1, 0, 0, 0, -1]
+
+        result = simulate_strategy(config(stop_loss_pct=0.05, commission=0.001),
+                                   lambda c, d: signals, {'AAA': df})
+
+        # Stopped out at the 90 close instead of riding to the 100 exit signal
+        assert result.total_trades == 1
+        assert result.losing_trades == 1
+        assert result.total_return == pytest.approx(0.999 * 0.97 * (90 / 97 - 0.001) - 1)
+
+    def test_strategy_class_built_from_parameters(self):
+        frames = {'AAA': random_walk(1), 'BBB': random_walk(2)}
+        result = simulate_strategy(config(symbols=['AAA', 'BBB'], parameters={'lookback': 10}),
+                                   Momentum, frames)
+        assert result.total_trades > 0
+        assert result.parameters == {'lookback': 10}
+
+    def test_no_data_raises(self):
+        with pytest.raises(ValueError):
+            simulate_strategy(config(), ma_cross, {})
+
+
+class TestSharedMarketData:
+
+    def test_roundtrip_is_read_only_view(self):
+        frames = {'AAA': make_frame([1, 2, 3], tz='Asia/Kolkata'), 'BBB': make_frame([4, 5])}
+        shared = SharedMarketData(frames)
+        try:
+            segments, attached = SharedMarketData.attach(shared.descriptor)
+            assert attached['AAA']['close'].tolist() == [1, 2, 3]
+            assert attached['AAA'].index.equals(frames['AAA'].index)
+            assert attached['BBB'].index.tz is None
+            assert not attached['BBB']['close'].to_numpy().flags.writeable
+            del attached
+            for segment in segments:
+                segment.close()
+        finally:
+            shared.close()
+
+    def test_kite_tzoffset_index_survives_workers(self):
+        frames = {'AAA': make_frame([1, 2, 3], freq='h', tz=tzoffset(None, 19800))}
+        shared = SharedMarketData(frames)
+        try:
+            segments, attached = SharedMarketData.attach(pickle.loads(pickle.dumps(shared.descriptor)))
+            assert attached['AAA'].index.equals(frames['AAA'].index)
+            del attached
+            for segment in segments:
+                segment.close()
+        finally:
+            shared.close()
+
+
+class TestParallelBacktestEngine:
+
+    GRID = [ParameterGrid('fast', [3, 5, 8]), ParameterGrid('slow', [20, 30])]
+
+    def test_process_pool_matches_threads(self):
+        data = {symbol: random_walk(seed) for seed, symbol in enumerate(['AAA', 'BBB', 'CCC'])}
+        base = config(symbols=list(data), max_position_size=0.3)
+
+        threaded = ParallelBacktestEngine(max_workers=2, cache_results=False)
+        processes = ParallelBacktestEngine(max_workers=2, use_processes=True, cache_results=False)
+        by_threads = threaded.optimize_parameters(base, ma_cross, self.GRID, market_data=data, top_n=6)
+        by_processes = processes.optimize_parameters(base, ma_cross, self.GRID, market_data=data, top_n=6)
+
+        assert len(by_processes) == 6
+        assert [p for p, _ in by_processes] == [p for p, _ in by_threads]
+        assert [r.total_return for _, r in by_processes] == pytest.approx([r.total_return for _, r in by_threads])
+        assert processes.get_statistics()['total_backtests'] == 6
+
+    def test_unpicklable_strategy_falls_back_to_threads(self):
+        engine = ParallelBacktestEngine(max_workers=2, use_processes=True, cache_results=False)
+        results = engine.optimize_parameters(config(), lambda c, d: ma_cross(c, d), self.GRID,
+                                             market_data=random_walk(3), top_n=2)
+        assert len(results) == 2
+
+    def test_market_data_loaded_from_candle_store(self, tmp_path):
+        store = CandleStore(tmp_path / 'candles')
+        store.write('AAA', 'day', random_walk(4))
+        engine = ParallelBacktestEngine(max_workers=1, candle_store=store)
+
+        result = engine.run_backtest(config(parameters={'fast': 5, 'slow': 20}), ma_cross)
+
+        assert result.total_trades > 0
+        with pytest.raises(ValueError):
+            engine.run_backtest(config(symbols=['MISSING'], parameters={'fast': 5, 'slow': 20}), ma_cross)
+
+    def test_cache_key_covers_strategy_and_data(self):
+        engine = ParallelBacktestEngine(max_workers=1)
+        cfg = config(parameters={'fast': 5, 'slow': 20})
+        first = engine.run_backtest(cfg, ma_cross, market_data=random_walk(5))
+
+        assert engine.run_backtest(cfg, ma_cross, market_data=random_walk(5)) is first
+        other_data = engine.run_backtest(cfg, ma_cross, market_data=random_walk(6))
+        assert other_data is not first
+        assert other_data.total_return != first.total_return
+        flat = engine.run_backtest(cfg, lambda c, d: np.zeros(len(d)), market_data=random_walk(5))
+        assert flat is not first and flat.total_trades == 0
+        assert engine.get_statistics()['cached_results'] == 3
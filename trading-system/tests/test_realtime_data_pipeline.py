@@ -289,6 +289,38 @@ class TestLatencyStats:
         assert len(stats.recent_latencies) == 1000
         assert stats.sample_count == 1500  # But total count is preserved
 
+    def test_histogram_percentiles_match_exact_values(self):
+        """Test streaming percentiles stay within histogram resolution"""
+        import random
+        rng = random.Random(7)
+        samples = [rng.lognormvariate(2.0, 0.6) for _ in range(20000)]
+        stats = LatencyStats()
+        for value in samples:
+            stats.update(value)
+
+        ordered = sorted(samples)
+        for q, estimate in ((0.50, stats.p50_latency_ms),
+                            (0.95, stats.p95_latency_ms),
+                            (0.99, stats.p99_latency_ms)):
+            exact = ordered[int(len(ordered) * q)]
+            assert abs(estimate - exact) / exact < 0.02
+        assert stats.avg_latency_ms == pytest.approx(sum(samples) / len(samples))
+
+    def test_window_stats_only_cover_recent_seconds(self):
+        """Test 1s/1m/5m windows drop samples older than the window"""
+        stats = LatencyStats()
+        start = 1_700_000_000.0
+        for i in range(120):
+            stats.update(100.0 if i < 60 else 5.0, now=start + i)
+
+        now = start + 119
+        assert stats.window_stats(1, now)['count'] == 1
+        assert stats.window_stats(1, now)['max_ms'] == 5.0
+        assert stats.window_stats(60, now)['count'] == 60
+        assert stats.window_stats(300, now)['count'] == 120
+        assert stats.window_stats(300, now)['p99_ms'] == pytest.approx(100.0, rel=0.02)
+        assert stats.window_stats(60, start + 1000)['count'] == 0
+
 
 # ============================================================================
 # Pipeline Initialization Tests
@@ -695,15 +727,41 @@ class TestParsing:
         assert len(order_book.asks) == 0
 
     def test_parse_binary_tick_returns_none(self, pipeline):
-        """Test that binary tick parsing returns None (placeholder)"""
+        """Test that a packet of unknown length is ignored"""
         now = datetime.now()
         binary_data = b'\x00\x01\x02\x03'
 
         tick = pipeline._parse_binary_tick(binary_data, now)
 
-        # Currently returns None as placeholder
         assert tick is None
 
+    def test_parse_binary_tick_ltp_packet(self, pipeline):
+        """Test decoding a single LTP-mode packet"""
+        import struct
+        pipeline.register_instrument_tokens({'NSE:RELIANCE': 738561})
+
+        tick = pipeline._parse_binary_tick(struct.pack('>ii', 738561, 245075), datetime.now())
+
+        assert tick.symbol == 'NSE:RELIANCE'
+        assert tick.last_price == 2450.75
+        assert tick.exchange_timestamp is None
+
+    def test_parse_binary_frame_multiple_packets(self, pipeline):
+        """Test every packet of a binary frame becomes a tick"""
+        import struct
+        packets = [struct.pack('>ii', 738561, 245075), struct.pack('>ii', 2953217, 325000)]
+        frame = struct.pack('>H', 2) + b''.join(struct.pack('>H', len(p)) + p for p in packets)
+        pipeline.register_instrument_tokens({'NSE:RELIANCE': 738561, 'NSE:TCS': 2953217})
+
+        ticks = pipeline._parse_binary_frame(frame, datetime.now())
+
+        assert [t.symbol for t in ticks] == ['NSE:RELIANCE', 'NSE:TCS']
+        assert [t.last_price for t in ticks] == [2450.75, 3250.0]
+
+    def test_parse_binary_frame_truncated(self, pipeline):
+        """Test a truncated frame yields no ticks"""
+        assert pipeline._parse_binary_frame(b'\x00\x02\x00\x08\x00', datetime.now()) == []
+
 
 # ============================================================================
 # Text Message Processing Tests
@@ -810,6 +868,8 @@ class TestStatusAndStats:
         assert 'p99_ms' in stats
         assert 'sample_count' in stats
         assert stats['sample_count'] == 20
+        assert set(stats['windows']) == {'1s', '1m', '5m'}
+        assert stats['windows']['1m']['count'] == 20
 
     def test_get_latency_stats_no_samples(self, pipeline):
         """Test getting latency stats with no samples"""
@@ -872,6 +932,82 @@ class TestStreamTicks:
         assert received_tick == tick
 
 
+# ============================================================================
+# Columnar Tick Batch Tests
+# ============================================================================
+
+def _ltp_frame(*token_prices):
+    import struct
+    packets = [struct.pack('>ii', token, price) for token, price in token_prices]
+    return struct.pack('>H', len(packets)) + b''.join(struct.pack('>H', 8) + p for p in packets)
+
+
+def _batch_pipeline(**kwargs):
+    with patch('core.realtime_data_pipeline.get_global_tracker', return_value=None):
+        with patch('core.realtime_data_pipeline.get_global_metrics', return_value=None):
+            return RealtimeDataPipeline(enable_metrics=False, **kwargs)
+
+
+class TestTickBatches:
+    """Test columnar on_tick_batch delivery"""
+
+    def test_batch_per_frame(self):
+        pipeline = _batch_pipeline(materialize_ticks=False)
+        pipeline.register_instrument_tokens({'NSE:RELIANCE': 738561, 'NSE:TCS': 2953217})
+        batches = []
+        pipeline.on_tick_batch(lambda batch: batches.append(batch.copy()))
+
+        pipeline._process_binary_frame(_ltp_frame((738561, 245075), (2953217, 325000), (738561, 245100)),
+                                       datetime.now())
+        pipeline._maybe_dispatch_batch()
+
+        assert len(batches) == 1
+        batch = batches[0]
+        assert len(batch) == 3
+        assert batch.last_price.tolist() == [2450.75, 3250.0, 2451.0]
+        assert batch.symbols == ['NSE:RELIANCE', 'NSE:TCS', 'NSE:RELIANCE']
+        assert batch.latest_prices() == {'NSE:RELIANCE': 2451.0, 'NSE:TCS': 3250.0}
+        # Batch-only consumers skip TickData materialisation
+        assert len(pipeline.tick_buffer) == 0
+
+    def test_interval_batching_accumulates_frames(self):
+        pipeline = _batch_pipeline(batch_interval_ms=10_000)
+        sizes = []
+        pipeline.on_tick_batch(lambda batch: sizes.append(len(batch)))
+
+        for price in range(5):
+            pipeline._process_binary_frame(_ltp_frame((738561, 245000 + price)), datetime.now())
+            pipeline._maybe_dispatch_batch()
+
+        assert sizes == []
+        assert pipeline.flush_tick_batch() == 5
+        assert sizes == [5]
+        assert len(pipeline.tick_buffer) == 5  # materialize_ticks defaults on
+
+    def test_capacity_overflow_splits_batches(self):
+        pipeline = _batch_pipeline(batch_capacity=4, batch_interval_ms=10_000)
+        sizes = []
+        pipeline.on_tick_batch(lambda batch: sizes.append(len(batch)))
+
+        pipeline._process_binary_frame(_ltp_frame(*[(738561, 245000 + i) for i in range(10)]), datetime.now())
+        pipeline.flush_tick_batch()
+
+        assert sizes == [4, 4, 2]
+
+    def test_json_ticks_join_batches(self, pipeline):
+        batches = []
+        pipeline.on_tick_batch(lambda batch: batches.append(batch.to_dataframe()))
+
+        pipeline._process_text_message({'type': 'tick', 'tradingsymbol': 'NSE:INFY',
+                                        'last_price': 1500.5, 'volume': 10}, datetime.now())
+        pipeline._maybe_dispatch_batch()
+
+        df = batches[0]
+        assert df['symbol'].tolist() == ['NSE:INFY']
+        assert df['last_price'].tolist() == [1500.5]
+        assert df['token'].iloc[0] < 0
+
+
 if __name__ == "__main__":
     # Run tests with: pytest test_realtime_data_pipeline.py -v
     pytest.main([__file__, "-v", "--tb=short"])
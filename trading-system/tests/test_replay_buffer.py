@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Tests for the replay buffers in rl_trading_agent.py"""
+
+import pytest
+import numpy as np
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("torch")
+
+from core.rl_trading_agent import (
+    DQNAgent,
+    PrioritizedReplayBuffer,
+    ReplayBuffer,
+    RLConfig,
+    SumTree,
+)
+
+
+def _fill(buffer, n, state_dim=4):
+    for i in range(n):
+        buffer.push(np.full(state_dim, i, dtype=np.float32), i % 3, float(i), np.full(state_dim, i + 1), i % 2 == 0)
+
+
+def test_ring_buffer_overwrites_oldest():
+    """Past capacity the oldest transitions are replaced in place"""
+    buffer = ReplayBuffer(5)
+    _fill(buffer, 8)
+
+    assert len(buffer) == 5
+    assert sorted(buffer.rewards.tolist()) == [3.0, 4.0, 5.0, 6.0, 7.0]
+
+    states, actions, rewards, next_states, dones = buffer.sample(32)
+    assert states.shape == (32, 4) and states.dtype == np.float32
+    assert actions.dtype == np.int64
+    assert np.array_equal(states[:, 0], rewards)
+    assert np.array_equal(next_states[:, 0], rewards + 1)
+    assert np.array_equal(actions, rewards.astype(int) % 3)
+    assert np.array_equal(dones, (rewards.astype(int) % 2 == 0).astype(np.float32))
+
+
+def test_push_batch_matches_individual_pushes():
+    """A batched push lands in the same slots as sequential pushes"""
+    single, batched = ReplayBuffer(6), ReplayBuffer(6)
+    _fill(single, 4)
+    _fill(batched, 4)
+
+    states = np.arange(20, dtype=np.float32).reshape(5, 4)
+    for i in range(5):
+        single.push(states[i], 1, float(i), states[i] + 1, False)
+    batched.push_batch(states, np.ones(5, dtype=int), np.arange(5.0), states + 1, np.zeros(5))
+
+    assert len(batched) == len(single) == 6
+    assert batched.position == single.position
+    assert np.array_equal(batched.states, single.states)
+    assert np.array_equal(batched.rewards, single.rewards)
+
+
+def test_float16_memmap_storage(tmp_path):
+    """States can be stored as float16 in memory-mapped files"""
+    buffer = ReplayBuffer(10, state_dtype='float16', storage_dir=str(tmp_path))
+    _fill(buffer, 3)
+
+    assert isinstance(buffer.states, np.memmap)
+    assert buffer.states.dtype == np.float16
+    assert (tmp_path / 'states.npy').exists()
+    assert np.load(tmp_path / 'rewards.npy', mmap_mode='r')[:3].tolist() == [0.0, 1.0, 2.0]
+
+
+def test_sum_tree_prefix_lookup():
+    """find() maps prefix sums onto leaves and update() keeps sums consistent"""
+    tree = SumTree(5)
+    tree.update(np.arange(5), np.array([1.0, 2.0, 3.0, 0.0, 4.0]))
+    assert tree.total == 10.0
+    assert tree.find(np.array([0.5, 1.0, 2.9, 3.0, 5.99, 6.0, 9.9])).tolist() == [0, 1, 1, 2, 2, 4, 4]
+
+    tree.update(np.array([4, 4]), np.array([1.0, 1.0]))
+    assert tree.total == 7.0
+
+
+def test_prioritized_sampling_follows_priorities():
+    """High-TD-error transitions dominate samples and get smaller IS weights"""
+    np.random.seed(0)
+    buffer = PrioritizedReplayBuffer(8, alpha=1.0, beta=1.0)
+    _fill(buffer, 8)
+    buffer.update_priorities(np.arange(8), np.array([1, 1, 1, 1, 1, 1, 1, 93.0]))
+
+    *fields, weights, indices = buffer.sample(1000)
+    assert np.mean(indices == 7) > 0.85
+    assert np.array_equal(fields[2], indices.astype(np.float32))
+    assert weights.max() == pytest.approx(1.0)
+    assert weights[indices == 7].max() < weights[indices != 7].min()
+
+
+def test_dqn_agent_trains_from_prioritized_buffer():
+    """DQN training works end to end with prioritized float16 replay"""
+    config = RLConfig(hidden_sizes=[16], batch_size=8, buffer_size=50,
+                      prioritized_replay=True, replay_state_dtype='float16')
+    agent = DQNAgent(state_dim=4, action_dim=3, config=config)
+    _fill(agent.replay_buffer, 20)
+
+    priorities_before = agent.replay_buffer.tree.tree.copy()
+    assert agent.train_step() is not None
+    assert not np.array_equal(agent.replay_buffer.tree.tree, priorities_before)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent symbol scanning in UnifiedTradingSystem.scan_batch
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.trading_system import UnifiedTradingSystem
+
+
+def make_df(base: float, rows: int = 60) -> pd.DataFrame:
+    close = base + np.arange(rows, dtype=float)
+    return pd.DataFrame({
+        'open': close, 'high': close + 1, 'low': close - 1,
+        'close': close, 'volume': np.full(rows, 1000.0),
+    }, index=pd.date_range('2025-01-06 09:15', periods=rows, freq='5min'))
+
+
+class SlowProvider:
+    """Data provider whose fetches block for a fixed latency"""
+
+    def __init__(self, frames, latency=0.1):
+        self.frames = frames
+        self.latency = latency
+        self.rate_limiter = Mock(max_per_second=4)
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def fetch_with_retry(self, symbol, interval='5minute', days=5):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.latency)
+        with self._lock:
+            self.active -= 1
+        return self.frames.get(symbol, pd.DataFrame())
+
+
+@pytest.fixture
+def system():
+    """Minimal system wired only with what scan_batch touches"""
+    system = UnifiedTradingSystem.__new__(UnifiedTradingSystem)
+    system.config = {'trend_filter_enabled': False, 'min_confidence': 0.5}
+    system.trading_mode = 'paper'
+    system.dashboard = None
+    system.portfolio = Mock(positions={})
+    system.technical_analyzer = Mock(calculate_atr=Mock(return_value=1.5))
+    system.ml_predictor = Mock(model=None)
+    system.strategies = [Mock(generate_signals=Mock(return_value={'signal': 1, 'strength': 0.9}))]
+    system.aggregator = Mock()
+    system.aggregator.aggregate_signals.side_effect = lambda sigs, symbol, is_exit=False: {
+        'action': 'buy' if symbol != 'HOLD' else 'hold', 'confidence': 0.8, 'reasons': ['test']
+    }
+    return system
+
+
+def test_scan_batch_returns_signals_and_prices_in_batch_order(system):
+    symbols = ['AAA', 'BBB', 'HOLD', 'SHORT', 'CCC']
+    frames = {s: make_df(100 * (i + 1)) for i, s in enumerate(symbols)}
+    frames['SHORT'] = make_df(50, rows=10)
+    system.dp = SlowProvider(frames, latency=0.01)
+
+    signals, prices = system.scan_batch(symbols, '5minute', 1, 1)
+
+    assert list(prices) == ['AAA', 'BBB', 'HOLD', 'CCC']
+    assert list(signals) == ['AAA', 'BBB', 'CCC']
+    assert prices['AAA'] == pytest.approx(159.0)
+    assert signals['AAA']['atr'] == 1.5
+    assert signals['AAA']['last_close'] == prices['AAA']
+
+
+def test_scan_batch_overlaps_fetches_within_rate_budget(system):
+    symbols = [f'SYM{i}' for i in range(12)]
+    system.dp = SlowProvider({s: make_df(100) for s in symbols}, latency=0.1)
+
+    start = time.perf_counter()
+    signals, prices = system.scan_batch(symbols, '5minute', 1, 1)
+    elapsed = time.perf_counter() - start
+
+    assert len(prices) == 12
+    assert system.dp.max_active == 4
+    # Sequential would take 1.2s; four concurrent fetchers need ~0.3s
+    assert elapsed < 0.8
+
+
+def test_scan_batch_isolates_symbol_failures(system):
+    system.dp = SlowProvider({'AAA': make_df(100), 'BBB': make_df(200)}, latency=0.0)
+    system.strategies[0].generate_signals.side_effect = \
+        lambda df, symbol: (_ for _ in ()).throw(ValueError('bad data')) if symbol == 'AAA' else {'signal': 1}
+
+    signals, prices = system.scan_batch(['AAA', 'BBB'], '5minute', 1, 1)
+
+    assert list(prices) == ['BBB']
+    assert list(signals) == ['BBB']
+
+
+def test_scan_batch_scores_actionable_signals_in_one_ml_call(system):
+    symbols = ['AAA', 'BBB', 'HOLD', 'CCC']
+    system.dp = SlowProvider({s: make_df(100) for s in symbols}, latency=0.0)
+    system.ml_predictor = Mock(model=object())
+    system.ml_predictor.predict_many.side_effect = lambda frames: {
+        symbol: {'probability': 0.9, 'direction': 1, 'confidence': 0.8} for symbol in frames
+    }
+
+    signals, prices = system.scan_batch(symbols, '5minute', 1, 1)
+
+    system.ml_predictor.predict_many.assert_called_once()
+    assert sorted(system.ml_predictor.predict_many.call_args[0][0]) == ['AAA', 'BBB', 'CCC']
+    assert signals['AAA']['ml_direction'] == 'UP'
+    assert signals['AAA']['confidence'] == pytest.approx(0.9)
+    assert 'ML Confirmed (90%)' in signals['AAA']['reasons']
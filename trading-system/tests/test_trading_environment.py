@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Tests for trading_environment.py observations and VectorTradingEnv"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip("gymnasium")
+
+from core.trading_environment import (
+    ActionSpace,
+    RewardFunction,
+    TradingEnvironment,
+    VectorTradingEnv,
+)
+
+
+def _ohlcv(n, seed):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    rsi = rng.uniform(0, 100, n)
+    rsi[:5] = np.nan
+    return pd.DataFrame({'open': close * 1.001, 'high': close * 1.01, 'low': close * 0.99,
+                         'close': close, 'volume': rng.uniform(1e5, 1e6, n), 'rsi': rsi})
+
+
+def test_observation_matches_row_by_row_features():
+    """Sliced observations equal the per-row normalized features plus portfolio state"""
+    data = _ohlcv(60, seed=1)
+    env = TradingEnvironment(data, lookback_window=5)
+    env.reset()
+    obs, *_ = env.step(np.array([0.5]))
+
+    expected = []
+    for _, row in data.iloc[env.current_step - 4:env.current_step + 1].iterrows():
+        close = row['close']
+        expected += [row[c] / close for c in ['open', 'high', 'low', 'close', 'volume']]
+        expected.append(0.0 if pd.isna(row['rsi']) else row['rsi'])
+        expected += [env.position, env.position * (close - env.entry_price) / env.entry_price,
+                     env.capital / env.initial_capital]
+
+    assert obs.shape == env.observation_space.shape
+    assert np.allclose(obs, np.array(expected, dtype=np.float32), rtol=1e-5)
+
+
+@pytest.mark.parametrize('action_space_type', list(ActionSpace))
+@pytest.mark.parametrize('reward_function', list(RewardFunction))
+def test_vector_env_matches_single_envs(action_space_type, reward_function):
+    """Lockstep stepping reproduces independent TradingEnvironment runs, including auto-reset"""
+    frames = [_ohlcv(80, seed=2), _ohlcv(60, seed=3), _ohlcv(100, seed=4)]
+    offsets = [0, 5, 20]
+    kwargs = dict(action_space_type=action_space_type, reward_function=reward_function, lookback_window=8)
+
+    vec = VectorTradingEnv(frames, offsets, **kwargs)
+    singles = [TradingEnvironment(df.iloc[o:].reset_index(drop=True), **kwargs)
+               for df, o in zip(frames, offsets)]
+
+    vec_obs, _ = vec.reset()
+    assert np.allclose(vec_obs, np.stack([env.reset()[0] for env in singles]), atol=1e-5)
+
+    rng = np.random.default_rng(0)
+    for _ in range(120):
+        if action_space_type == ActionSpace.DISCRETE:
+            actions = rng.integers(0, 3, vec.n_envs)
+        else:
+            actions = rng.uniform(-1, 1, (vec.n_envs, 1)).astype(np.float32)
+
+        vec_obs, rewards, dones, _, info = vec.step(actions)
+        for i, env in enumerate(singles):
+            obs, reward, done, _, single_info = env.step(actions[i])
+            assert reward == pytest.approx(rewards[i], rel=1e-6, abs=1e-8)
+            assert done == dones[i]
+            if done:
+                assert info['final_portfolio_value'][i] == pytest.approx(single_info['portfolio_value'])
+                obs, _ = env.reset()
+            assert np.allclose(obs, vec_obs[i], rtol=1e-5, atol=1e-4)
+
+
+def test_vector_env_validates_inputs():
+    """Mismatched columns and offsets past the data are rejected"""
+    data = _ohlcv(40, seed=5)
+
+    with pytest.raises(ValueError):
+        VectorTradingEnv([data, data.drop(columns=['rsi'])])
+    with pytest.raises(ValueError):
+        VectorTradingEnv(data, start_offsets=[0, 30], lookback_window=10)
+
+    vec = VectorTradingEnv(data, start_offsets=[0, 3, 6], lookback_window=10)
+    assert vec.n_envs == 3
+    assert vec.reset()[0].shape == (3, vec.observation_dim)
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 """Basic tests for vectorized_backtester.py module"""
 
+import itertools
 import pytest
 import numpy as np
+import pandas as pd
 from pathlib import Path
 import sys
 
@@ -17,5 +19,176 @@ def test_module_imports():
     except ImportError as e:
         pytest.skip(f"Module has import dependencies: {e}")
 
+
+@pytest.fixture
+def price_data():
+    rng = np.random.default_rng(7)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0003, 0.015, 600)))
+    index = pd.date_range('2022-01-01', periods=len(close), freq='D')
+    return pd.DataFrame({'open': close, 'high': close, 'low': close, 'close': close,
+                         'volume': 1.0}, index=index)
+
+
+def test_positions_exit_on_sell_signal():
+    """A sell signal closes the position; holds keep the previous state"""
+    from core.vectorized_backtester import _positions_from_signals
+
+    signals = np.array([0, 1, 0, -1, 0, 1, 1, -1])
+    assert _positions_from_signals(signals).tolist() == [0, 1, 1, 0, 0, 1, 1, 0]
+
+    matrix = np.column_stack([signals, -signals])
+    assert _positions_from_signals(matrix)[:, 1].tolist() == [0, 0, 0, 1, 1, 0, 0, 1]
+
+
+@pytest.mark.parametrize('strategy_name, grid', [
+    ('VectorizedMACrossover', {'fast_period': [3, 5, 10], 'slow_period': [20, 30]}),
+    ('VectorizedRSI', {'period': [7, 14], 'buy_threshold': [25, 30], 'sell_threshold': [70]}),
+    ('VectorizedBollingerBands', {'period': [10, 20], 'std_dev': [1.5, 2.0]}),
+])
+def test_sweep_matches_individual_runs(price_data, strategy_name, grid):
+    """Broadcast sweep metrics equal running each combination through run()"""
+    import strategies.vectorized_strategies as strategies
+    from core.vectorized_backtester import SWEEP_METRICS, VectorizedBacktester
+
+    strategy_class = getattr(strategies, strategy_name)
+    backtester = VectorizedBacktester()
+    table = backtester.sweep_parameters(strategy_class, price_data, grid)
+
+    assert len(table) == len(list(itertools.product(*grid.values())))
+    for i, combo in enumerate(itertools.product(*grid.values())):
+        results = backtester.run(strategy_class(**dict(zip(grid, combo))), price_data)
+        for metric in SWEEP_METRICS:
+            assert table[metric].iloc[i] == pytest.approx(getattr(results, metric), rel=1e-9, abs=1e-9)
+
+
+def test_optimize_parameters_sweep_and_loop_agree(price_data):
+    from core.vectorized_backtester import VectorizedBacktester
+    from strategies.vectorized_strategies import VectorizedMACrossover
+
+    backtester = VectorizedBacktester()
+    grid = {'fast_period': [5, 10, 15, 20], 'slow_period': [40, 60, 80]}
+
+    swept, swept_results = backtester.optimize_parameters(VectorizedMACrossover, price_data, grid)
+    looped, looped_results = backtester.optimize_parameters(VectorizedMACrossover, price_data, grid,
+                                                           sweep=False)
+
+    assert swept == looped
+    assert swept_results.sharpe_ratio == pytest.approx(looped_results.sharpe_ratio)
+    assert len(backtester.last_sweep) == 12
+
+
+def test_walk_forward_uses_sweep(price_data):
+    from core.vectorized_backtester import VectorizedBacktester
+    from strategies.vectorized_strategies import VectorizedRSI
+
+    backtester = VectorizedBacktester()
+    results = backtester.walk_forward_optimization(
+        VectorizedRSI, price_data, {'period': [7, 14], 'buy_threshold': [25, 30]}, n_splits=3
+    )
+
+    assert len(results) == 3
+    assert backtester.last_sweep is not None
+
+
+def test_panel_signals_match_per_symbol(price_data):
+    """Column-wise panel signals equal generate_signals run symbol by symbol"""
+    from core.vectorized_backtester import Strategy, align_panel
+    from strategies.vectorized_strategies import (
+        CombinedVectorizedStrategy, VectorizedBollingerBands, VectorizedMACrossover,
+        VectorizedMomentum, VectorizedRSI, VectorizedVolumeBreakout,
+    )
+
+    rng = np.random.default_rng(11)
+    frames = {'AAA': price_data,
+              'BBB': price_data.assign(close=price_data['close'] * rng.uniform(0.98, 1.02, len(price_data)),
+                                       volume=rng.uniform(1, 5, len(price_data)))}
+    strategy = CombinedVectorizedStrategy([
+        VectorizedMACrossover(5, 15), VectorizedRSI(14, 30, 70), VectorizedBollingerBands(20, 2),
+        VectorizedMomentum(10), VectorizedVolumeBreakout(1.5),
+    ])
+
+    panel = strategy.panel_signals(align_panel(frames))
+    fallback = Strategy.panel_signals(strategy, align_panel(frames))
+    for i, df in enumerate(frames.values()):
+        expected = strategy.generate_signals(df)['signal'].to_numpy()
+        assert panel[:, i].tolist() == expected.tolist()
+        assert fallback[:, i].tolist() == expected.tolist()
+
+
+def fixed_signals(signals):
+    """Strategy returning preset per-symbol panel signals"""
+    from core.vectorized_backtester import Strategy
+
+    class FixedSignals(Strategy):
+        def generate_signals(self, data):
+            raise NotImplementedError
+
+        def panel_signals(self, panel):
+            return np.column_stack([signals[symbol] for symbol in panel['close'].columns])
+
+    return FixedSignals()
+
+
+def test_run_portfolio_shares_capital_across_slots():
+    from core.vectorized_backtester import BacktestConfig, VectorizedBacktester
+
+    index = pd.date_range('2024-01-01', periods=5, freq='D')
+    frames = {symbol: pd.DataFrame({'close': closes, 'volume': 1.0}, index=index)
+              for symbol, closes in {'A': [100, 100, 110, 110, 110], 'B': [50, 50, 50, 60, 60],
+                                     'C': [10, 10, 10, 10, 20]}.items()}
+    strategy = fixed_signals({'A': [1, 0, -1, 0, 0], 'B': [0, 1, 0, 0, -1], 'C': [0, 1, 0, 0, 0]})
+    backtester = VectorizedBacktester(BacktestConfig(initial_capital=1000, position_size_pct=1.0,
+                                                     transaction_cost_pct=0, slippage_pct=0))
+
+    results = backtester.run_portfolio(strategy, frames, max_positions=2)
+
+    # C wants in on day 2 but both slots are taken; it enters when A exits
+    assert results.equity_curve.tolist() == [1000, 1000, 1050, 1150, 1670]
+    assert results.max_positions_held == 2
+    assert results.total_trades == 2 and results.winning_trades == 2
+    assert results.symbol_summary.loc['C', 'pnl'] == pytest.approx(520)
+    assert results.trades.set_index('symbol').loc['C', 'entry_time'] == index[2]
+    assert pd.isna(results.trades.set_index('symbol').loc['C', 'exit_time'])
+
+
+def test_run_portfolio_skips_only_unaffordable_entries():
+    from core.vectorized_backtester import BacktestConfig, VectorizedBacktester
+
+    index = pd.date_range('2024-01-01', periods=3, freq='D')
+    frames = {symbol: pd.DataFrame({'close': closes, 'volume': 1.0}, index=index)
+              for symbol, closes in {'A': [100, 1000, 1000], 'B': [800, 800, 800],
+                                     'C': [700, 700, 700]}.items()}
+    strategy = fixed_signals({'A': [1, 0, 0], 'B': [0, 1, 0], 'C': [0, 1, 0]})
+    backtester = VectorizedBacktester(BacktestConfig(initial_capital=1000, position_size_pct=1.0,
+                                                     transaction_cost_pct=0, slippage_pct=0))
+
+    results = backtester.run_portfolio(strategy, frames, max_positions=3)
+
+    # 700 cash left on day 2: B (800) does not fit, C (700) still does
+    assert sorted(results.trades['symbol']) == ['A', 'C']
+    assert results.equity_curve.tolist() == [1000, 3700, 3700]
+
+
+def test_run_portfolio_naive_start_date_on_tz_index():
+    from core.vectorized_backtester import BacktestConfig, VectorizedBacktester
+    from datetime import datetime
+
+    index = pd.date_range('2024-01-01', periods=6, freq='D', tz='Asia/Kolkata')
+    frames = {'A': pd.DataFrame({'close': np.arange(100.0, 106.0), 'volume': 1.0}, index=index)}
+    backtester = VectorizedBacktester(BacktestConfig(initial_capital=1000))
+
+    results = backtester.run_portfolio(fixed_signals({'A': [1, 0, 0, 0]}), frames,
+                                       start_date=datetime(2024, 1, 3))
+
+    assert results.equity_curve.index[0] == pd.Timestamp('2024-01-03', tz='Asia/Kolkata')
+
+
+def test_columnwise_strategy_requires_signals():
+    from strategies.vectorized_strategies import ColumnwiseStrategy
+
+    with pytest.raises(TypeError):
+        ColumnwiseStrategy()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
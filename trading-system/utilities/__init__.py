@@ -3,19 +3,20 @@ Utilities Module
 
 Trading system utilities including:
 - Logging (TradingLogger)
-- Dashboard integration (DashboardConnector)
+- Dashboard integration (DashboardConnector, DashboardPublisher)
 - Market hours validation (MarketHoursManager)
 - State management (TradingStateManager, EnhancedStateManager)
 """
 
 from utilities.logger import TradingLogger
-from utilities.dashboard import DashboardConnector
+from utilities.dashboard import DashboardConnector, DashboardPublisher
 from utilities.market_hours import MarketHoursManager
 from utilities.state_managers import TradingStateManager, EnhancedStateManager
 
 __all__ = [
     'TradingLogger',
     'DashboardConnector',
+    'DashboardPublisher',
     'MarketHoursManager',
     'TradingStateManager',
     'EnhancedStateManager',
@@ -4,12 +4,15 @@ Dashboard Connector
 API integration with trading dashboard
 """
 
+import atexit
 import os
 import sys
+import threading
 import time
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 import logging
 
 import requests
@@ -20,10 +23,187 @@ import config
 
 logger = logging.getLogger('trading_system.dashboard')
 
+# Endpoints whose payload is a snapshot: a newer update supersedes older queued ones
+SNAPSHOT_ENDPOINTS = frozenset({'portfolio', 'performance', 'status'})
+
+
+class DashboardPublisher:
+    """
+    Non-blocking, batched delivery of dashboard updates
+
+    ``publish`` only enqueues and returns; a background thread sends queued
+    events to the dashboard's ``/api/batch`` endpoint. Snapshot endpoints
+    (portfolio, performance, status) are coalesced so only the merged latest
+    update is sent. Event endpoints (signals, trades, trade history) keep
+    their order in a bounded queue that drops the oldest entries when the
+    dashboard is down for long. Failed batches are retried by the sender with
+    backoff, never on the caller's thread.
+    """
+
+    def __init__(self, connector: 'DashboardConnector', max_queue: int = 1000, batch_size: int = 100,
+                 flush_interval: float = 0.25, max_backoff: float = 30.0):
+        """
+        Args:
+            connector: Connector used for the HTTP calls
+            max_queue: Queued events kept before the oldest are dropped
+            batch_size: Maximum events per POST
+            flush_interval: Seconds the sender waits to gather a batch
+            max_backoff: Upper bound of the retry delay after failures
+        """
+        self.connector = connector
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_backoff = max_backoff
+
+        self._events: deque = deque(maxlen=max_queue)
+        self._snapshots: Dict[str, Dict[str, Any]] = {}
+        self._cond = threading.Condition()
+        self._in_flight = 0
+        self._closed = False
+        self._flush_requested = False
+        self._thread: Optional[threading.Thread] = None
+
+        self.published = 0
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.batches = 0
+        self.failures = 0
+
+    @property
+    def pending_count(self) -> int:
+        with self._cond:
+            return len(self._events) + len(self._snapshots)
+
+    def publish(self, endpoint: str, data: Dict[str, Any]) -> bool:
+        """Queue an update; False only if the publisher is closed"""
+        with self._cond:
+            if self._closed:
+                return False
+            self.published += 1
+            if endpoint in SNAPSHOT_ENDPOINTS:
+                if endpoint in self._snapshots:
+                    # The server merges dict updates, so merging here is equivalent
+                    self._snapshots[endpoint].update(data)
+                    self.coalesced += 1
+                else:
+                    self._snapshots[endpoint] = dict(data)
+            else:
+                if len(self._events) == self._events.maxlen:
+                    self.dropped += 1
+                self._events.append((endpoint, data))
+            self._cond.notify()
+
+        self._ensure_sender()
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until everything queued so far has been sent; False on timeout"""
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            try:
+                return self._cond.wait_for(
+                    lambda: not self._events and not self._snapshots and not self._in_flight,
+                    timeout=timeout,
+                )
+            finally:
+                self._flush_requested = False
+
+    def close(self, timeout: float = 5.0):
+        """Flush what can be sent within timeout and stop the sender"""
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=1.0)
+
+    def _ensure_sender(self):
+        with self._cond:
+            if self._thread is not None or self._closed:
+                return
+            thread = threading.Thread(target=self._run, name='DashboardPublisher', daemon=True)
+            thread.start()
+            self._thread = thread
+
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        """Pop up to batch_size events, events before snapshots (caller holds the lock)"""
+        batch = []
+        while self._events and len(batch) < self.batch_size:
+            endpoint, data = self._events.popleft()
+            batch.append({'type': endpoint, 'data': data})
+        while self._snapshots and len(batch) < self.batch_size:
+            endpoint = next(iter(self._snapshots))
+            batch.append({'type': endpoint, 'data': self._snapshots.pop(endpoint)})
+        self._in_flight = len(batch)
+        return batch
+
+    def _requeue(self, batch: List[Dict[str, Any]]):
+        """Put a failed batch back ahead of newer updates (caller holds the lock)"""
+        for event in reversed(batch):
+            endpoint, data = event['type'], event['data']
+            if endpoint in SNAPSHOT_ENDPOINTS:
+                # Newer fields queued meanwhile win over the failed update
+                self._snapshots[endpoint] = {**data, **self._snapshots.get(endpoint, {})}
+            elif len(self._events) < self._events.maxlen:
+                self._events.appendleft((endpoint, data))
+            else:
+                self.dropped += 1
+
+    def _run(self):
+        backoff = 0.0
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._closed or self._events or self._snapshots)
+                if not self._events and not self._snapshots:
+                    return
+                # Let a burst of updates accumulate into one batch
+                deadline = time.monotonic() + self.flush_interval + backoff
+                while not (self._closed or self._flush_requested
+                           or len(self._events) + len(self._snapshots) >= self.batch_size):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = self._take_batch()
+
+            try:
+                undelivered = self.connector.send_batch(batch)
+            except Exception as exc:
+                logger.debug(f"Dashboard batch send failed: {exc}")
+                undelivered = batch
+
+            with self._cond:
+                self._in_flight = 0
+                self.sent += len(batch) - len(undelivered)
+                if not undelivered:
+                    self.batches += 1
+                    backoff = 0.0
+                else:
+                    self.failures += 1
+                    # Only what did not arrive goes back; resending the rest would duplicate it
+                    self._requeue(undelivered)
+                    backoff = min(self.max_backoff, max(1.0, backoff * 2))
+                    if self._closed:
+                        # Shutting down: give up on the remainder
+                        self._events.clear()
+                        self._snapshots.clear()
+                self._cond.notify_all()
+
+
 class DashboardConnector:
     """Enhanced connector with better error handling"""
 
-    def __init__(self, base_url: str = None, api_key: Optional[str] = None):
+    def __init__(self, base_url: str = None, api_key: Optional[str] = None, publish_async: bool = False):
+        """
+        Args:
+            base_url: Dashboard server URL
+            api_key: Dashboard API key (falls back to DASHBOARD_API_KEY)
+            publish_async: Queue ``send_*`` updates on a DashboardPublisher instead of
+                posting them on the caller's thread
+        """
         self.base_url = base_url or "https://localhost:8080"
         self.session = requests.Session()
 
@@ -102,6 +282,13 @@ class DashboardConnector:
         # Configure session
         self.session.timeout = config.request_timeout
 
+        # False once the server answers 404 for /api/batch (older dashboard)
+        self.batch_endpoint_available = True
+        self.publisher: Optional[DashboardPublisher] = None
+        if publish_async:
+            self.publisher = DashboardPublisher(self)
+            atexit.register(self.close)
+
         # Initial connection attempt with retries to allow dashboard startup
         self.ensure_connection(force=True)
         if not self.is_connected:
@@ -219,6 +406,71 @@ class DashboardConnector:
         logger.error(f"Circuit breaker tripped after {max_retries} failed attempts")
         return False
 
+    def send_batch(self, events: List[Dict]) -> List[Dict]:
+        """
+        POST several ``{'type': endpoint, 'data': payload}`` events in one request
+
+        Makes a single attempt without sleeping; retries are up to the caller.
+        Falls back to one POST per event if the server has no batch endpoint.
+
+        Returns:
+            The events that were not delivered (empty when all were)
+        """
+        if self.is_circuit_breaker_open() or not self.ensure_connection():
+            return list(events)
+
+        if not self.batch_endpoint_available:
+            return [event for event in events
+                    if not self.send_with_retry(event['type'], event['data'], max_retries=1)]
+
+        headers = {}
+        csrf_token = self._get_csrf_token()
+        if csrf_token:
+            headers['X-CSRF-Token'] = csrf_token
+        try:
+            response = self.session.post(
+                f"{self.base_url}/api/batch",
+                json={'events': events},
+                headers=headers,
+                timeout=config.request_timeout
+            )
+        except Exception as e:
+            logger.warning(f"Dashboard batch POST failed: {e}")
+            self.circuit_breaker_failures += 1
+            if self.circuit_breaker_failures >= self.circuit_breaker_threshold:
+                self.last_circuit_breaker_trip = time.time()
+            self.is_connected = False
+            return list(events)
+
+        logger.debug(f"API POST batch ({len(events)} events) - Status: {response.status_code}")
+        if response.status_code == 404:
+            logger.info("Dashboard has no batch endpoint; sending updates individually")
+            self.batch_endpoint_available = False
+            return self.send_batch(events)
+        if response.status_code != 200:
+            logger.warning(f"Dashboard batch API returned status {response.status_code}")
+            return list(events)
+
+        self.circuit_breaker_failures = 0
+        return []
+
+    def _publish(self, endpoint: str, data: Dict) -> bool:
+        """Queue on the publisher when asynchronous, else send now"""
+        if self.publisher is not None:
+            return self.publisher.publish(endpoint, data)
+        return self.send_with_retry(endpoint, data)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait for queued asynchronous updates to be sent"""
+        if self.publisher is None:
+            return True
+        return self.publisher.flush(timeout)
+
+    def close(self, timeout: float = 5.0):
+        """Deliver what is queued within timeout and stop the publisher"""
+        if self.publisher is not None:
+            self.publisher.close(timeout)
+
     def _get_csrf_token(self) -> Optional[str]:
         """Get CSRF token from session cookie (optional security feature)"""
         if not self.api_key:
@@ -250,7 +502,7 @@ class DashboardConnector:
             'sector': sector or 'Other',
             'reasons': reasons or []
         }
-        return self.send_with_retry('signals', data)
+        return self._publish('signals', data)
 
     def send_trade(self, symbol: str, side: str, shares: int, price: float, pnl: float = None, sector: str = None, confidence: float = 0.5):
         """Send trade execution to dashboard"""
@@ -265,7 +517,7 @@ class DashboardConnector:
             'sector': sector or 'Other',
             'confidence': round(confidence, 3)
         }
-        return self.send_with_retry('trades', data)
+        return self._publish('trades', data)
 
     def send_portfolio_update(self, total_value: float, cash: float, positions_count: int, total_pnl: float, positions: Dict = None):
         """Send portfolio update to dashboard"""
@@ -277,7 +529,7 @@ class DashboardConnector:
             'total_pnl': round(total_pnl, 2),
             'positions': positions or {}
         }
-        return self.send_with_retry('portfolio', data)
+        return self._publish('portfolio', data)
 
     def send_performance_update(self, trades_count: int, win_rate: float, total_pnl: float, best_trade: float, worst_trade: float):
         """Send performance metrics to dashboard"""
@@ -290,7 +542,7 @@ class DashboardConnector:
             'worst_trade': round(worst_trade, 2),
             'avg_pnl': round(total_pnl / trades_count, 2) if trades_count > 0 else 0
         }
-        return self.send_with_retry('performance', data)
+        return self._publish('performance', data)
 
     def send_completed_trade(self, symbol: str, entry_time: str, entry_price: float, shares: int,
                            exit_time: str, exit_price: float, pnl: float, pnl_percent: float,
@@ -307,7 +559,7 @@ class DashboardConnector:
             'pnl_percent': round(pnl_percent, 2),
             'exit_reason': exit_reason or 'Manual'
         }
-        return self.send_with_retry('trade_history', data)
+        return self._publish('trade_history', data)
 
     def send_system_status(self, is_running: bool, iteration: int = 0, scan_status: str = "idle"):
         """Send system status to dashboard"""
@@ -317,7 +569,7 @@ class DashboardConnector:
             'iteration': iteration,
             'scan_status': scan_status
         }
-        return self.send_with_retry('status', data)
+        return self._publish('status', data)
 
     def debug_option_price(self, symbol: str):
         """Debug method to check option price data for a specific symbol"""